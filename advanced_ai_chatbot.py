@@ -7,13 +7,14 @@ ChatGPT/Cursor AI স্টাইলে বিস্তারিত এবং 
 
 import streamlit as st
 import pandas as pd
-import numpy as np
 from datetime import datetime
-import json
-import re
 from typing import List, Dict, Any
 import random
 
+from medicine_chatbot import MedicineChatbot
+
+DATA_FILE = 'medicine_data.xlsx'
+
 # Page configuration
 st.set_page_config(
     page_title="🤖 উন্নত AI মেডিসিন চ্যাটবট",
@@ -76,47 +77,24 @@ st.markdown("""
 
 class AdvancedMedicineChatbot:
     def __init__(self):
-        self.medicine_data = None
+        # লোড, নরমালাইজেশন, ইনডেক্স ও ক্যাশ medicine_chatbot এর শেয়ার্ড ইঞ্জিনের; এখানে শুধু উত্তর সাজানো হয়
+        self.retriever = MedicineChatbot(DATA_FILE)
         self.conversation_history = []
-        self.load_data()
         
-    def load_data(self):
-        """Load medicine data from Excel file"""
-        try:
-            self.medicine_data = pd.read_excel('medicine_data.xlsx')
-            st.success("✅ মেডিসিন ডেটা সফলভাবে লোড হয়েছে!")
-        except Exception as e:
-            st.error(f"❌ ডেটা লোড করতে সমস্যা: {e}")
-            self.medicine_data = pd.DataFrame()
-    
     def preprocess_text(self, text: str) -> str:
-        """Preprocess text for better matching"""
-        text = text.lower().strip()
-        # Remove special characters but keep Bengali text
-        text = re.sub(r'[^\w\s\u0980-\u09FF]', ' ', text)
-        return text
+        """ইঞ্জিনের একই নরমালাইজেশন"""
+        return self.retriever.clean_text(text)
     
     def find_medicine_info(self, query: str) -> Dict[str, Any]:
-        """Find medicine information based on query"""
-        if self.medicine_data.empty:
+        """শেয়ার্ড ইনডেক্স থেকে মেডিসিন খুঁজুন"""
+        if not self.retriever.engine.loaded:
             return {"found": False, "message": "ডেটা পাওয়া যায়নি"}
         
-        query_processed = self.preprocess_text(query)
-        
-        # Search in medicine names
-        matches = []
-        for idx, row in self.medicine_data.iterrows():
-            medicine_name = str(row.get('medicine_name', '')).lower()
-            generic_name = str(row.get('generic_name', '')).lower()
-            indication = str(row.get('indication', '')).lower()
-            
-            if (query_processed in medicine_name or 
-                query_processed in generic_name or 
-                query_processed in indication):
-                matches.append(row.to_dict())
+        matches = self.retriever.search_medicines(query, top_k=10)
         
         if matches:
-            return {"found": True, "data": matches}
+            return {"found": True, "data": [{key: '' if pd.isna(value) else value for key, value in match.items()}
+                                            for match in matches]}
         else:
             return {"found": False, "message": "কোন মেডিসিন পাওয়া যায়নি"}
     
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📊 PDF এক্সট্রাকশন ব্যাকএন্ডের বেঞ্চমার্ক
+'data source' ফোল্ডারের PDF গুলো প্রতিটি ইনস্টল করা ব্যাকএন্ড দিয়ে এক্সট্রাক্ট করে
+pages/sec, মেমরি (Python heap peak ও প্রসেসের peak RSS) এবং token recall দেখায়
+
+token recall: একই নামের .docx থাকলে সেটির token রেফারেন্স (Word এ যুক্তাক্ষর ভাঙে না),
+না থাকলে সব ব্যাকএন্ডের পাওয়া token এর union
+
+ব্যবহার:
+    python benchmark_pdf_extractors.py
+    python benchmark_pdf_extractors.py --folder "data source" --backend pypdf2 --backend pymupdf --json
+"""
+
+import argparse
+import hashlib
+import json
+import re
+from pathlib import Path
+
+from medicine_engine import available_pdf_backends, benchmark_backends, extract_docx_paragraphs
+from medicine_engine.data_source import split_saved_name
+
+_NON_WORD = re.compile(r'[^\w\s\u0980-\u09FF]')
+
+
+def tokenize(text):
+    """চ্যাটবটের clean_text এর মতই: লোয়ারকেস, বাংলা ছাড়া বিশেষ ক্যারেক্টার বাদ (স্টপ ওয়ার্ড রাখা হয়)"""
+    return _NON_WORD.sub(' ', text.lower()).split()
+
+
+def document_key(path):
+    """টাইমস্ট্যাম্প ও শেষের বিরামচিহ্ন বাদে নাম - PDF ও তার .docx জোড়া মেলাতে"""
+    name, _ = split_saved_name(Path(path).name)
+    return Path(name).stem.strip().rstrip('ঃ:.').strip()
+
+
+def collect_files(folder):
+    """(PDF paths - একই bytes একবার, {pdf path: .docx রেফারেন্স টেক্সট})"""
+    folder = Path(folder)
+    pdfs = []
+    seen = set()
+    for path in sorted(folder.glob('*.pdf')):
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        if digest not in seen:
+            seen.add(digest)
+            pdfs.append(path)
+
+    docx_text = {}
+    for path in sorted(folder.glob('*.docx')):
+        docx_text.setdefault(document_key(path), "\n".join(extract_docx_paragraphs(path.read_bytes())))
+    references = {str(path): docx_text[document_key(path)] for path in pdfs if document_key(path) in docx_text}
+    return pdfs, references
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF এক্সট্রাকশন ব্যাকএন্ডের গতি, মেমরি ও token recall তুলনা")
+    parser.add_argument('--folder', default='data source', help="PDF ফোল্ডার (ডিফল্ট: 'data source')")
+    parser.add_argument('--backend', action='append', help="শুধু এই ব্যাকএন্ড (একাধিকবার দেওয়া যায়)")
+    parser.add_argument('--json', action='store_true', help="ফলাফল JSON হিসেবে")
+    args = parser.parse_args()
+
+    pdfs, references = collect_files(args.folder)
+    if not pdfs:
+        print(f"❌ '{args.folder}' ফোল্ডারে কোনো PDF নেই")
+        return
+    backends = args.backend or available_pdf_backends()
+    results = benchmark_backends(pdfs, tokenize, backends=backends, references=references)
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    print(f"📄 {len(pdfs)}টি PDF ({len(references)}টির .docx রেফারেন্স আছে), ব্যাকএন্ড: {', '.join(backends)}")
+    print(f"{'ব্যাকএন্ড':<12}{'পেজ':>6}{'সেকেন্ড':>10}{'pages/sec':>12}{'heap MB':>10}{'peak RSS MB':>14}{'recall':>9}")
+    for r in sorted(results, key=lambda r: -r['pages_per_sec']):
+        rss = f"{r['peak_rss_mb']:.1f}" if r['peak_rss_mb'] is not None else '-'
+        print(f"{r['backend']:<12}{r['pages']:>6}{r['seconds']:>10.2f}{r['pages_per_sec']:>12.1f}"
+              f"{r['heap_peak_mb']:>10.1f}{rss:>14}{r['token_recall']:>9.3f}")
+        for path, error in r['errors'].items():
+            print(f"   ⚠️ {Path(path).name}: {error}")
+
+
+if __name__ == "__main__":
+    main()
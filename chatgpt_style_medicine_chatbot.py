@@ -7,14 +7,16 @@
 
 import streamlit as st
 import pandas as pd
-import numpy as np
-from datetime import datetime
-import json
-import re
-from typing import List, Dict, Any, Tuple
-import random
+from typing import List, Dict, Any
 import time
 
+from medicine_chatbot import MedicineChatbot
+
+DATA_FILE = 'medicine_data.xlsx'
+
+# উত্তর সাজাতে এই কলামগুলো লাগে; ডেটা ফাইলে না থাকলে স্যাম্পল ডেটা
+RESPONSE_COLUMNS = ('Medicine Name', 'Generic Name', 'Uses', 'Side Effects', 'Dosage', 'Price (৳)')
+
 # Page configuration
 st.set_page_config(
     page_title="🤖 ChatGPT স্টাইল মেডিসিন চ্যাটবট",
@@ -77,18 +79,16 @@ st.markdown("""
 
 class ChatGPTStyleMedicineChatbot:
     def __init__(self):
+        # লোড, নরমালাইজেশন, ইনডেক্স ও ক্যাশ medicine_chatbot এর শেয়ার্ড ইঞ্জিনের; প্রতি rerun এ নতুন অবজেক্ট হলেও ইঞ্জিন একটাই
+        self.retriever = MedicineChatbot(DATA_FILE)
         self.medicine_data = None
         self.conversation_history = []
         self.load_data()
         
     def load_data(self):
-        """Load medicine data from Excel file"""
-        try:
-            self.medicine_data = pd.read_excel('medicine_data.xlsx')
-            st.success("✅ মেডিসিন ডেটা সফলভাবে লোড হয়েছে!")
-        except Exception as e:
-            st.error(f"❌ ডেটা লোড করতে সমস্যা: {e}")
-            # Create sample data if file not found
+        """শেয়ার্ড ইঞ্জিনের ডেটায় দরকারি কলাম না থাকলে স্যাম্পল ডেটা"""
+        engine = self.retriever.engine
+        if not (engine.loaded and len(engine.records) and set(RESPONSE_COLUMNS) <= set(engine.records[0])):
             self.create_sample_data()
     
     def create_sample_data(self):
@@ -128,14 +128,16 @@ class ChatGPTStyleMedicineChatbot:
         st.info("📝 স্যাম্পল মেডিসিন ডেটা ব্যবহার করা হচ্ছে")
     
     def preprocess_text(self, text: str) -> str:
-        """Preprocess text for better matching"""
-        text = text.lower().strip()
-        # Remove special characters but keep Bengali text
-        text = re.sub(r'[^\w\s\u0980-\u09FF]', ' ', text)
-        return text
+        """ইঞ্জিনের একই নরমালাইজেশন"""
+        return self.retriever.clean_text(text)
     
     def find_medicine_info(self, query: str) -> List[Dict[str, Any]]:
         """Find medicine information based on query"""
+        if self.medicine_data is None:
+            # শেয়ার্ড ইনডেক্স থেকে
+            return self.retriever.search_medicines(query, top_k=3)
+        
+        # স্যাম্পল ডেটা (কয়েকটি সারি) সরাসরি স্ক্যান
         query = self.preprocess_text(query)
         results = []
         
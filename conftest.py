@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+pytest ফিক্সচার - প্রতিটি টেস্টের আপলোড নিজস্ব অস্থায়ী ফোল্ডারে যায়, আসল 'data source' এ নয়
+"""
+
+import pytest
+
+import medicine_chatbot
+
+# কিছু টেস্ট ফাংশনের ভেতরে এগুলো বদলায়; টেস্ট শেষে আগের মান ফিরে আসে
+RESTORED_SETTINGS = ('EXTRACTION_CACHE_DIR', 'SNAPSHOT_CACHE_DIR', 'SHARED_INDEX_DIR', 'TFIDF_MODE', '_text_store')
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_source(monkeypatch, tmp_path):
+    monkeypatch.setattr(medicine_chatbot, 'DATA_SOURCE_DIR', tmp_path)
+    for name in RESTORED_SETTINGS:
+        monkeypatch.setattr(medicine_chatbot, name, getattr(medicine_chatbot, name))
@@ -8,53 +8,32 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import re
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
 import warnings
-import requests
 import json
-from pathlib import Path
 import io
 import base64
+import importlib.util
+from collections import OrderedDict
 from datetime import datetime
-import plotly.express as px
-import plotly.graph_objects as go
-from streamlit_option_menu import option_menu
-from streamlit_chat import message
-import pywhatkit as pwk
 import time
 import os
 from dotenv import load_dotenv
+import hashlib
+from medicine_chatbot import get_shared_engine
+from medicine_engine import extract_docx_paragraphs, extract_pdf_pages, read_table, sniff_table_format
 
 # Load environment variables
 load_dotenv()
 
 warnings.filterwarnings('ignore')
 
-# PDF এবং Word ফাইল প্রসেসিং এর জন্য
-try:
-    import PyPDF2
-    import docx
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
+# plotly, streamlit_option_menu ও pywhatkit যে পেজ/ফিচারে লাগে সেখানেই import হয় (pywhatkit import এর সময় নেটওয়ার্ক চেক করে)
+# PDF এবং Word ফাইল প্রসেসিং এর জন্য - শুধু ইনস্টল আছে কিনা দেখা হয়, import হয় প্রথম আপলোডে
+PDF_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in ('PyPDF2', 'docx'))
+if not PDF_AVAILABLE:
     st.warning("PDF/Word সমর্থনের জন্য PyPDF2 এবং python-docx ইনস্টল করুন")
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
-
 # Page configuration
 st.set_page_config(
     page_title="🏥 DIGITAL SEBE CHATBOT",
@@ -638,129 +617,78 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# ওষুধের ডেটা ফাইল (medicine_chatbot এর শেয়ার্ড ইঞ্জিনে লোড হয়)
+DATA_FILE = 'medicine_data.xlsx'
+
+# টেবিল আপলোডের MIME টাইপ - আসল ফরম্যাট (xlsx/xls/ods/csv) read_table bytes দেখে ঠিক করে
+TABLE_MIME_TYPES = (
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "text/csv"
+)
+
+# একটি সেশনে সর্বোচ্চ এতগুলো প্রসেস করা আপলোড মনে রাখা হয় (পুরনোগুলো বাদ যায়)
+MAX_PROCESSED_UPLOADS = 32
+
 class DigitalSebeChatbot:
-    def __init__(self):
-        self.data = None
-        self.vectorizer = None
-        self.tfidf_matrix = None
+    """সেশনের চ্যাটবট - শুধু পড়ার ইঞ্জিন প্রসেসে শেয়ার্ড, আপলোড ও হিস্টরি এই সেশনের নিজস্ব"""
+    def __init__(self, data_file=DATA_FILE):
+        # লোড, নরমালাইজেশন, TF-IDF ইনডেক্স ও স্ন্যাপশট medicine_chatbot এর শেয়ার্ড ইঞ্জিনের
+        # একই প্রসেসে অন্য অ্যাপ চললে তারাও এই ইনডেক্সই ব্যবহার করে
+        self.data_file = data_file
+        self.engine = get_shared_engine(data_file)
         self.uploaded_files = []
-        self.all_sources = []
         self.chat_history = []
-        self.bengali_stop_words = set([
-            'এবং', 'অথবা', 'কিন্তু', 'যদি', 'তবে', 'কেন', 'কিভাবে', 'কোথায়', 'কখন', 
-            'কি', 'কোন', 'কাদের', 'কার', 'কাকে', 'হয়', 'হয়েছে', 'হবে', 'করতে', 'করে', 'করবে', 
-            'আছে', 'নেই', 'থাকবে', 'এটা', 'এটি', 'সেটা', 'সেটি', 'এই', 'সেই', 'যে', 'যা', 'যার', 'যাদের',
-            'আমি', 'আমরা', 'তুমি', 'তোমরা', 'সে', 'তারা', 'আপনি', 'আপনারা',
-            'এখানে', 'সেখানে', 'যেখানে', 'কোথায়', 'কোথাও', 'এখন', 'তখন', 'কখন', 'সবসময়', 'কখনও',
-            'ভালো', 'খারাপ', 'বড়', 'ছোট', 'নতুন', 'পুরানো', 'সুন্দর', 'কুৎসিত',
-            'সহজ', 'কঠিন', 'দ্রুত', 'ধীর', 'গরম', 'ঠান্ডা', 'উষ্ণ', 'শীতল'
-        ])
-        self.load_data()
-        self.preprocess_data()
-    
-    def load_data(self):
-        """Excel ফাইল থেকে ডেটা লোড করুন"""
-        try:
-            if os.path.exists('medicine_data.xlsx'):
-                # Try different engines for Excel file
-                try:
-                    # First try openpyxl engine
-                    self.data = pd.read_excel('medicine_data.xlsx', engine='openpyxl')
-                    st.success(f"✅ ডেটা সফলভাবে লোড হয়েছে! মোট {len(self.data)} টি ওষুধ পাওয়া গেছে।")
-                except Exception as e1:
-                    try:
-                        # Try xlrd engine for older Excel files
-                        self.data = pd.read_excel('medicine_data.xlsx', engine='xlrd')
-                        st.success(f"✅ ডেটা সফলভাবে লোড হয়েছে! মোট {len(self.data)} টি ওষুধ পাওয়া গেছে।")
-                    except Exception as e2:
-                        try:
-                            # Try odf engine for OpenDocument files
-                            self.data = pd.read_excel('medicine_data.xlsx', engine='odf')
-                            st.success(f"✅ ডেটা সফলভাবে লোড হয়েছে! মোট {len(self.data)} টি ওষুধ পাওয়া গেছে।")
-                        except Exception as e3:
-                            # If all engines fail, try reading as CSV
-                            try:
-                                self.data = pd.read_csv('medicine_data.xlsx', encoding='utf-8')
-                                st.success(f"✅ ডেটা CSV হিসেবে লোড হয়েছে! মোট {len(self.data)} টি ওষুধ পাওয়া গেছে।")
-                            except Exception as e4:
-                                st.error(f"❌ সব engine দিয়ে ডেটা লোড করতে ব্যর্থ: {str(e4)}")
-                                st.info("💡 ফাইল আপলোড পেজে নতুন ডেটা আপলোড করুন।")
-                                self.data = None
-            else:
-                st.warning("⚠️ medicine_data.xlsx ফাইল পাওয়া যায়নি। নতুন ফাইল আপলোড করুন।")
-                self.data = None
-        except Exception as e:
-            st.error(f"❌ ডেটা লোড করতে সমস্যা হয়েছে: {str(e)}")
-            self.data = None
-    
-    def preprocess_data(self):
-        """ডেটা প্রিপ্রসেসিং"""
-        if self.data is not None and len(self.data) > 0:
-            try:
-                # Combine all text columns
-                text_columns = []
-                for col in self.data.columns:
-                    if self.data[col].dtype == 'object':
-                        text_columns.append(col)
-                
-                if text_columns:
-                    combined_text = self.data[text_columns].fillna('').astype(str).agg(' '.join, axis=1)
-                    
-                    # Create TF-IDF vectorizer
-                    self.vectorizer = TfidfVectorizer(
-                        max_features=1000,
-                        stop_words=list(self.bengali_stop_words),
-                        ngram_range=(1, 2)
-                    )
-                    
-                    # Fit and transform
-                    self.tfidf_matrix = self.vectorizer.fit_transform(combined_text)
-                    st.success("✅ ডেটা প্রিপ্রসেসিং সম্পন্ন হয়েছে!")
-            except Exception as e:
-                st.error(f"❌ ডেটা প্রিপ্রসেসিং এ সমস্যা: {str(e)}")
+        # প্রসেস করা আপলোড (ফাইলের নাম ও কনটেন্ট হ্যাশ অনুযায়ী) - রিরানে আবার পার্স হয় না
+        self.processed_uploads = OrderedDict()
+        if self.engine.load_error is not None:
+            st.error(f"❌ ডেটা লোড করতে সমস্যা হয়েছে: {self.engine.load_error}")
+        if not self.engine.loaded:
+            st.info("💡 ফাইল আপলোড পেজে নতুন ডেটা আপলোড করুন।")
+    
+    def refresh_engine(self):
+        """ডেটা ফাইল বদলে গেলে নতুন শেয়ার্ড ইঞ্জিনে চলে যান"""
+        self.engine = get_shared_engine(self.data_file)
+        return self.engine
+    
+    @property
+    def data(self):
+        return self.engine.data
+    
+    @property
+    def records(self):
+        return self.engine.records
+    
+    @property
+    def vectorizer(self):
+        return self.engine.vectorizer
+    
+    @property
+    def tfidf_matrix(self):
+        return self.engine.tfidf_matrix
     
     def search_medicine(self, query, top_k=10):
         """ওষুধ অনুসন্ধান - উন্নত"""
-        if self.vectorizer is None or self.tfidf_matrix is None:
-            return []
-        
+        return self.search_medicine_batch([query], top_k=top_k)[0]
+    
+    def search_medicine_batch(self, queries, top_k=10):
+        """একাধিক প্রশ্ন একসাথে অনুসন্ধান - শেয়ার্ড ইঞ্জিনের একটি sparse matrix multiply"""
+        # এক শব্দের প্রশ্নে বেশি ফলাফল (15, থ্রেশহোল্ড 0.05), একাধিক শব্দে top_k (থ্রেশহোল্ড 0.1)
+        limits = [(15, 0.05) if len(query.split()) == 1 else (top_k, 0.1) for query in queries]
         try:
-            # Transform query
-            query_vector = self.vectorizer.transform([query])
-            
-            # Calculate similarity
-            similarities = cosine_similarity(query_vector, self.tfidf_matrix).flatten()
-            
-            # Get top matches with higher threshold for single word searches
-            if len(query.split()) == 1:  # Single word search
-                # Lower threshold for single words to get more comprehensive results
-                threshold = 0.05
-                top_k = min(15, len(similarities))  # More results for single words
-            else:  # Multi-word search
-                threshold = 0.1
-                top_k = min(top_k, len(similarities))
-            
-            # Get top matches
-            top_indices = similarities.argsort()[-top_k:][::-1]
-            
-            results = []
-            for idx in top_indices:
-                if similarities[idx] > threshold:
-                    result = {
-                        'index': idx,
-                        'similarity': similarities[idx],
-                        'data': self.data.iloc[idx].to_dict()
-                    }
-                    results.append(result)
-            
-            # Sort by similarity
-            results.sort(key=lambda x: x['similarity'], reverse=True)
-            
-            return results
-            
+            batch_hits = self.engine.search_medicines_batch(queries, top_k=max(k for k, _ in limits))
         except Exception as e:
             st.error(f"❌ অনুসন্ধানে সমস্যা: {str(e)}")
-            return []
+            return [[] for _ in queries]
+        
+        batch_results = []
+        for hits, (k, threshold) in zip(batch_hits, limits):
+            results = []
+            for hit in hits[:k]:
+                similarity = hit.pop('similarity_score')
+                if similarity >= threshold:
+                    results.append({'similarity': similarity, 'data': hit})
+            batch_results.append(results)
+        return batch_results
     
     def get_comprehensive_info(self, query):
         """কমপ্রিহেনসিভ তথ্য প্রদান - Cursor AI এর মত"""
@@ -810,6 +738,25 @@ class DigitalSebeChatbot:
             return f"দুঃখিত, একটি ত্রুটি ঘটেছে: {str(e)}"
     
     def process_file_upload(self, uploaded_file):
+        """ফাইল আপলোড প্রসেসিং এবং সেভ (একই ফাইল আগে প্রসেস হয়ে থাকলে ক্যাশ থেকে)"""
+        try:
+            file_content = uploaded_file.getvalue()
+        except Exception:
+            return self._process_file_upload(uploaded_file)
+
+        cache_key = (uploaded_file.name, hashlib.sha256(file_content).hexdigest())
+        if cache_key in self.processed_uploads:
+            self.processed_uploads.move_to_end(cache_key)
+            return self.processed_uploads[cache_key]
+
+        result = self._process_file_upload(uploaded_file)
+        if result is not None:
+            self.processed_uploads[cache_key] = result
+            while len(self.processed_uploads) > MAX_PROCESSED_UPLOADS:
+                self.processed_uploads.popitem(last=False)
+        return result
+
+    def _process_file_upload(self, uploaded_file):
         """ফাইল আপলোড প্রসেসিং এবং সেভ"""
         try:
             file_type = uploaded_file.type
@@ -820,46 +767,21 @@ class DigitalSebeChatbot:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             safe_filename = f"{timestamp}_{file_name.replace(' ', '_')}"
             
-            if file_type == "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet":
-                # Excel file - save to data_files folder
+            if file_type in TABLE_MIME_TYPES:
+                # Excel/CSV - data_files ফোল্ডারে সেভ; আসল ফরম্যাট bytes থেকে, পার্স মেমরির buffer থেকেই
                 file_path = f"uploads/data_files/{safe_filename}"
                 with open(file_path, "wb") as f:
                     f.write(file_content)
                 
-                # Try different engines for Excel file
+                file_format = sniff_table_format(file_content)
+                label = "CSV" if file_format == 'csv' else "Excel"
                 try:
-                    # First try openpyxl engine
-                    df = pd.read_excel(file_path, engine='openpyxl')
-                    st.success(f"✅ Excel ফাইল সফলভাবে আপলোড এবং সেভ হয়েছে! 📁 {file_path}")
-                    st.info(f"📊 মোট {len(df)} টি রো এবং {len(df.columns)} টি কলাম")
-                    return df
-                except Exception as e1:
-                    try:
-                        # Try xlrd engine for older Excel files
-                        df = pd.read_excel(file_path, engine='xlrd')
-                        st.success(f"✅ Excel ফাইল সফলভাবে আপলোড এবং সেভ হয়েছে! 📁 {file_path}")
-                        st.info(f"📊 মোট {len(df)} টি রো এবং {len(df.columns)} টি কলাম")
-                        return df
-                    except Exception as e2:
-                        try:
-                            # Try odf engine for OpenDocument files
-                            df = pd.read_excel(file_path, engine='odf')
-                            st.success(f"✅ Excel ফাইল সফলভাবে আপলোড এবং সেভ হয়েছে! 📁 {file_path}")
-                            st.info(f"📊 মোট {len(df)} টি রো এবং {len(df.columns)} টি কলাম")
-                            return df
-                        except Exception as e3:
-                            st.error(f"❌ Excel ফাইল পড়তে সমস্যা: {str(e3)}")
-                            st.info("💡 ফাইলটি সেভ হয়েছে কিন্তু পড়তে সমস্যা। অন্য ফরম্যাটে সেভ করে আবার চেষ্টা করুন।")
-                            return None
-                            
-            elif file_type == "text/csv":
-                # CSV file - save to data_files folder
-                file_path = f"uploads/data_files/{safe_filename}"
-                with open(file_path, "wb") as f:
-                    f.write(file_content)
-                
-                df = pd.read_csv(file_path)
-                st.success(f"✅ CSV ফাইল সফলভাবে আপলোড এবং সেভ হয়েছে! 📁 {file_path}")
+                    df = read_table(file_content)
+                except Exception as e:
+                    st.error(f"❌ {label} ফাইল পড়তে সমস্যা: {str(e)}")
+                    st.info("💡 ফাইলটি সেভ হয়েছে কিন্তু পড়তে সমস্যা। অন্য ফরম্যাটে সেভ করে আবার চেষ্টা করুন।")
+                    return None
+                st.success(f"✅ {label} ফাইল সফলভাবে আপলোড এবং সেভ হয়েছে! 📁 {file_path}")
                 st.info(f"📊 মোট {len(df)} টি রো এবং {len(df.columns)} টি কলাম")
                 return df
                 
@@ -870,10 +792,8 @@ class DigitalSebeChatbot:
                     with open(file_path, "wb") as f:
                         f.write(file_content)
                     
-                    pdf_reader = PyPDF2.PdfReader(file_path)
-                    text = ""
-                    for page in pdf_reader.pages:
-                        text += page.extract_text()
+                    # medicine_engine.DEFAULT_PDF_BACKEND অনুযায়ী এক্সট্রাক্টর (ডিফল্ট PyPDF2)
+                    text = "".join(extract_pdf_pages(file_content))
                     st.success(f"✅ PDF ফাইল সফলভাবে আপলোড এবং সেভ হয়েছে! 📁 {file_path}")
                     return {"type": "pdf", "text": text, "name": file_name, "path": file_path}
                 else:
@@ -887,10 +807,7 @@ class DigitalSebeChatbot:
                     with open(file_path, "wb") as f:
                         f.write(file_content)
                     
-                    doc = docx.Document(file_path)
-                    text = ""
-                    for paragraph in doc.paragraphs:
-                        text += paragraph.text + "\n"
+                    text = "".join(paragraph + "\n" for paragraph in extract_docx_paragraphs(file_content))
                     st.success(f"✅ Word ফাইল সফলভাবে আপলোড এবং সেভ হয়েছে! 📁 {file_path}")
                     return {"type": "docx", "text": text, "name": file_name, "path": file_path}
                 else:
@@ -921,6 +838,7 @@ class DigitalSebeChatbot:
                             phone = '+88' + phone
                     
                     # Send message using pywhatkit
+                    import pywhatkit as pwk
                     pwk.sendwhatmsg_instantly(
                         phone_no=phone,
                         message=message,
@@ -940,9 +858,23 @@ class DigitalSebeChatbot:
             st.error(f"❌ WhatsApp মেসেজ পাঠানোতে সমস্যা: {str(e)}")
             return 0, 0
 
+def get_chatbot(data_file=DATA_FILE):
+    """
+    এই সেশনের চ্যাটবট দিন (st.session_state এ থাকে, অন্য সেশন আপলোড/হিস্টরি দেখে না)
+    ইঞ্জিন প্রসেসে শেয়ার্ড; ডেটা ফাইলের path/mtime/hash বদলালে নতুন ইঞ্জিনে চলে যায়
+    """
+    chatbot = st.session_state.get('digital_sebe_chatbot')
+    if chatbot is None or chatbot.data_file != data_file:
+        chatbot = DigitalSebeChatbot(data_file)
+        st.session_state.digital_sebe_chatbot = chatbot
+    else:
+        chatbot.refresh_engine()
+    return chatbot
+
+
 def main():
-    # Initialize chatbot
-    chatbot = DigitalSebeChatbot()
+    # Initialize chatbot (রিরান ও সেশনের মধ্যে পুনরায় ব্যবহার হয়)
+    chatbot = get_chatbot()
     
     # Sidebar navigation
     with st.sidebar:
@@ -954,6 +886,7 @@ def main():
         </div>
         """, unsafe_allow_html=True)
         
+        from streamlit_option_menu import option_menu
         selected = option_menu(
             menu_title="মেনু",
             options=["🏠 হোম", "🔍 অনুসন্ধান", "💬 চ্যাট", "📱 WhatsApp Marketing", "📁 ফাইল আপলোড", "ℹ️ সাহায্য"],
@@ -1389,6 +1322,7 @@ def show_search_page(chatbot):
             with tab2:
                 if len(results) > 1:
                     # Similarity chart
+                    import plotly.express as px
                     similarities = [r['similarity'] for r in results]
                     labels = [f"ফলাফল {i+1}" for i in range(len(results))]
                     
@@ -1501,21 +1435,12 @@ def show_whatsapp_page(chatbot):
             with open(file_path, "wb") as f:
                 f.write(file_content)
             
-            if phone_file.type == "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet":
-                # Excel file - try different engines
-                try:
-                    df = pd.read_excel(file_path, engine='openpyxl')
-                except Exception as e1:
-                    try:
-                        df = pd.read_excel(file_path, engine='xlrd')
-                    except Exception as e2:
-                        try:
-                            df = pd.read_excel(file_path, engine='odf')
-                        except Exception as e3:
-                            st.error(f"❌ Excel ফাইল পড়তে সমস্যা: {str(e3)}")
-                            return
-            else:
-                df = pd.read_csv(file_path)
+            # Excel বা CSV - ফরম্যাট bytes থেকে শনাক্ত করে একবারেই পার্স
+            try:
+                df = read_table(file_content)
+            except Exception as e:
+                st.error(f"❌ ফাইল পড়তে সমস্যা: {str(e)}")
+                return
             
             # Display phone numbers
             st.success(f"✅ {len(df)} টি ফোন নম্বর লোড এবং সেভ হয়েছে! 📁 {file_path}")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+⏱️ অ্যাপ মডিউলগুলোর import সময়ের রিপোর্ট (প্রতিটি নতুন প্রসেসে, ms এ)
+প্রতিটি মডিউলের মোট সময়, সবচেয়ে ধীর মডিউলগুলো এবং কোন প্যাকেজে কত সময় গেছে দেখায়
+--budget-ms দিলে কোনো মডিউল সীমা ছাড়ালে exit code 1 (CI তে স্টার্টআপ রিগ্রেশন ধরতে)
+
+ব্যবহার:
+    python import_time_report.py
+    python import_time_report.py medicine_chatbot medicine_service --top 15
+    python import_time_report.py --budget-ms 1500 --json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from medicine_engine import measure_import_time, package_totals
+
+DEFAULT_MODULES = ('medicine_engine', 'medicine_chatbot', 'medicine_service', 'digital_sebe_chatbot')
+
+
+def report_module(module, top):
+    """একটি মডিউলের রিপোর্ট (import না হলে 'error')"""
+    try:
+        rows = measure_import_time(module, cwd=Path(__file__).resolve().parent)
+    except RuntimeError as e:
+        return {'module': module, 'error': str(e)}
+    own = [row for row in rows if row['module'] == module]
+    return {
+        'module': module,
+        'total_ms': round(own[-1]['cumulative_ms'] if own else sum(row['self_ms'] for row in rows), 1),
+        'slowest': [
+            {'module': row['module'], 'self_ms': round(row['self_ms'], 1), 'cumulative_ms': round(row['cumulative_ms'], 1)}
+            for row in sorted(rows, key=lambda row: -row['cumulative_ms'])[:top]
+        ],
+        'packages': {name: round(ms, 1) for name, ms in list(package_totals(rows).items())[:top]},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="মডিউলগুলোর import সময় (ms) - স্টার্টআপ রিগ্রেশন দেখতে")
+    parser.add_argument('modules', nargs='*', default=list(DEFAULT_MODULES), help="যে মডিউলগুলো মাপা হবে")
+    parser.add_argument('--top', type=int, default=10, help="কতগুলো ধীর মডিউল/প্যাকেজ দেখানো হবে")
+    parser.add_argument('--budget-ms', type=float, default=None, help="কোনো মডিউলের মোট সময় এর বেশি হলে exit code 1")
+    parser.add_argument('--json', action='store_true', help="ফলাফল JSON হিসেবে")
+    args = parser.parse_args()
+
+    reports = [report_module(module, args.top) for module in args.modules]
+    over_budget = [
+        report['module'] for report in reports
+        if args.budget_ms is not None and report.get('total_ms', 0) > args.budget_ms
+    ]
+
+    if args.json:
+        print(json.dumps(reports, ensure_ascii=False, indent=2))
+    else:
+        for report in reports:
+            if 'error' in report:
+                print(f"⚠️ {report['module']}: import করা যায়নি - {report['error']}\n")
+                continue
+            print(f"⏱️ {report['module']}: {report['total_ms']:.1f} ms")
+            print(f"   {'মডিউল':<52}{'self ms':>10}{'মোট ms':>10}")
+            for row in report['slowest']:
+                print(f"   {row['module']:<52}{row['self_ms']:>10.1f}{row['cumulative_ms']:>10.1f}")
+            print("   প্যাকেজ অনুযায়ী: " + ", ".join(f"{name} {ms:.0f}" for name, ms in report['packages'].items()))
+            print()
+
+    if over_budget:
+        print(f"❌ {args.budget_ms:.0f} ms সীমা ছাড়িয়েছে: {', '.join(over_budget)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
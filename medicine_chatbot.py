@@ -8,49 +8,105 @@ PDF, Word, Excel, API সমর্থন সহ
 import streamlit as st
 import pandas as pd
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import re
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
 import warnings
-import requests
 import json
+import hashlib
+import importlib.util
+import threading
+from collections import Counter
 from pathlib import Path
 import io
 import base64
 from datetime import datetime
+from medicine_engine import (
+    BlobStore, ConnectorRegistry, EngineSnapshot, ExtractionCache, FittedTfidf, IncrementalTfidf, IngestionPool, IngestJob, InvertedIndex, NameIndex,
+    DEFAULT_PDF_BACKEND, QueryCache, RowSource, SharedEngineRegistry, SharedIndex, SymSpellIndex, TextStore, extract_pdf_pages,
+    get_scorer,
+    iter_excel_rows, join_pages, l2_normalize_rows, load_document_folder, next_data_version, normalize_query,
+    extract_docx_paragraphs, read_table, sparse_top_k, split_passages, store_passages
+)
 warnings.filterwarnings('ignore')
 
-# PDF এবং Word ফাইল প্রসেসিং এর জন্য
-try:
-    import PyPDF2
-    import docx
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
+# PDF এবং Word ফাইল প্রসেসিং এর জন্য - শুধু ইনস্টল আছে কিনা দেখা হয়, import হয় প্রথম আপলোডে
+# (sklearn, requests, PyPDF2, docx কোনোটিই মডিউল লোডের সময় import হয় না; NLTK ব্যবহারই হয় না)
+PDF_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in ('PyPDF2', 'docx'))
+if not PDF_AVAILABLE:
     st.warning("PDF/Word সমর্থনের জন্য PyPDF2 এবং python-docx ইনস্টল করুন")
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
+# অ্যাপের মূল ওষুধের ডেটা ফাইল
+DATA_FILE = 'medicine_data.xlsx'
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+# আপলোড করা ফাইল সেভ করার ফোল্ডার
+DATA_SOURCE_DIR = Path(__file__).resolve().parent / "data source"
+# data source ফাইলের এক্সট্রাক্ট করা টেক্সট ও token গণনার ক্যাশ (কী: SHA-256)
+EXTRACTION_CACHE_DIR = Path(__file__).resolve().parent / ".cache" / "extracted"
 
-class MedicineChatbot:
-    def __init__(self, excel_file):
+# মূল ডেটা ফাইলের প্রিপ্রসেস করা DataFrame ও TF-IDF স্ন্যাপশট (কী: SHA-256)
+SNAPSHOT_CACHE_DIR = Path(__file__).resolve().parent / ".cache" / "snapshots"
+
+# PDF টেক্সট এক্সট্রাকশনের ব্যাকএন্ড (medicine_engine.PDF_BACKENDS; benchmark_pdf_extractors.py দিয়ে তুলনা করুন)
+PDF_BACKEND = DEFAULT_PDF_BACKEND
+
+# এক্সট্রাক্ট করা PDF/Word টেক্সটের append-only স্টোর
+TEXT_STORE_DIR = Path(__file__).resolve().parent / ".cache" / "texts"
+
+# একাধিক প্রসেসে সার্ভ করার সময় মূল ডেটার ইনডেক্স অ্যারের শেয়ার্ড ফোল্ডার (None = প্রতিটি প্রসেস নিজের কপি রাখে)
+# একটি প্রসেস তৈরি করে লেখে, বাকিরা memory-map করে attach করে
+SHARED_INDEX_DIR = None
+
+# যোগ করা API কত সেকেন্ড পরপর ব্যাকগ্রাউন্ডে (শর্তসাপেক্ষে) রিফ্রেশ হয়
+API_REFRESH_SECONDS = 15 * 60
+
+# আপলোড করা Excel এর সারি এতগুলো করে TF-IDF এ যোগ হয় (মেমরি সীমিত রাখতে)
+EXCEL_TFIDF_BATCH = 2000
+
+# preprocess_data এর যোগ করা কলাম
+DERIVED_COLUMNS = ('combined_text', 'cleaned_text')
+
+# মূল ডেটার TF-IDF: 'fit' (TfidfVectorizer, স্ন্যাপশট ও শেয়ার্ড ইনডেক্স সহ) বা 'incremental' (hashing)
+# শেয়ার্ড ইঞ্জিন তৈরির পর বদলায় না; সেশনের আপলোড করা সারি নিজস্ব overlay তে শুধু নিজেরা ভেক্টরাইজ হয়
+TFIDF_MODE = 'fit'
+
+class MedicineSearchEngine:
+    """
+    শেয়ার্ড সার্চ ইঞ্জিন - মূল Excel, TF-IDF এবং মূল ইনডেক্স; প্রতি প্রসেসে একবার তৈরি হয়
+    background=True হলে ইনডেক্স ব্যাকগ্রাউন্ড থ্রেডে তৈরি হয়; ততক্ষণ প্রশ্নের উত্তর আসে
+    নামের exact/prefix লুকআপ থেকে (status দেখুন), তৈরি শেষ হলে পূর্ণ TF-IDF র‍্যাঙ্কিং
+    """
+    def __init__(self, excel_file, data_source_dir=None, tfidf_mode=None, background=False):
         self.excel_file = excel_file
-        self.data = None
+        self.tfidf_mode = tfidf_mode or TFIDF_MODE
+        # স্টার্টআপে ইনডেক্স হওয়া আগের আপলোডের ফোল্ডার (না দিলে DATA_SOURCE_DIR)
+        self.data_source_dir = data_source_dir if data_source_dir is not None else DATA_SOURCE_DIR
+        self.data_source_files = []
+        self.data_source_hashes = set()
+        # ইঞ্জিনের ডেটা-ভার্সন (কোয়েরি ক্যাশের কী তে ব্যবহার হয়)
+        self.version = next_data_version()
+        # attach করা শেয়ার্ড ইনডেক্স (SHARED_INDEX_DIR); থাকলে DataFrame শুধু দরকার হলে লোড হয়
+        self.shared_index = None
+        self._data = None
         self.vectorizer = None
+        # fit মোডে ফিট করা ম্যাট্রিক্স; incremental মোডে None (সারিগুলো vectorizer এর ব্লকে থাকে)
         self.tfidf_matrix = None
-        self.uploaded_files = []
-        self.all_sources = []
+        # TF-IDF এর টেক্সট কলাম (পরে যোগ হওয়া সারিতেও একই কলাম ব্যবহার হয়)
+        self.text_columns = []
+        self.records = []
+        self.name_index = NameIndex()
+        self.fuzzy_index = SymSpellIndex()
+        # ইনডেক্স তৈরির অবস্থা: তৈরি শেষ হলে (সফল বা ব্যর্থ) _built সেট হয়
+        self.background = background
+        self._built = threading.Event()
+        self.build_error = None
+        # ডেটা ফাইল পড়া না গেলে তার error (ইঞ্জিন নিজে কিছু দেখায় না - অ্যাপ/সার্ভিস এটা দেখায়)
+        self.load_error = None
+        self.build_thread = None
+        # তৈরির সময়কার দ্রুত সার্চের (NameIndex, সারি) - নামের ইনডেক্স হওয়া মাত্র পাওয়া যায়, তৈরি শেষে None
+        self.catalog = None
+        # মূল Excel সারিগুলোর ইনভার্টেড ইনডেক্স (সব সেশন শেয়ার করে, শুধু পড়ার জন্য)
+        self.source_index = InvertedIndex(self.tokenize)
+        # শেয়ার্ড ইনডেক্সে attach করা থাকলে মূল সারিগুলো এখানে (memory-mapped), source_index এ শুধু data source
+        self.main_index = None
         self.bengali_stop_words = set([
             'এবং', 'অথবা', 'কিন্তু', 'যদি', 'তবে', 'কেন', 'কিভাবে', 'কোথায়', 'কখন', 
             'কি', 'কোন', 'কাদের', 'কার', 'কাকে', 'হয়', 'হয়েছে', 'হবে', 'করতে', 'করে', 'করবে', 
@@ -60,41 +116,766 @@ class MedicineChatbot:
             'ভালো', 'খারাপ', 'বড়', 'ছোট', 'নতুন', 'পুরানো', 'সুন্দর', 'কুৎসিত',
             'সহজ', 'কঠিন', 'দ্রুত', 'ধীর', 'গরম', 'ঠান্ডা', 'উষ্ণ', 'শীতল'
         ])
-        self.load_data()
-        self.preprocess_data()
-        
+        if background:
+            self.build_thread = threading.Thread(target=self.warm_up_in_background, name='engine-warm-up', daemon=True)
+            self.build_thread.start()
+        else:
+            self.warm_up()
+
+    def warm_up(self):
+        """পুরো ইনডেক্স তৈরি করুন: মূল ডেটা (শেয়ার্ড ইনডেক্স/স্ন্যাপশট/Excel) এবং data source ফোল্ডার"""
+        # অন্য প্রসেসের তৈরি শেয়ার্ড ইনডেক্স বা আগের স্টার্টআপের স্ন্যাপশট থাকলে Excel পার্স ও TF-IDF ফিট করতে হয় না
+        try:
+            if not self.load_shared_index():
+                self.build_index()
+            self.index_data_source()
+        finally:
+            self.catalog = None
+            # দ্রুত সার্চের উত্তর ক্যাশে থাকলে তা আর মিলবে না
+            self.bump_version()
+            self._built.set()
+
+    def warm_up_in_background(self):
+        """ব্যাকগ্রাউন্ড থ্রেডের কাজ - ব্যর্থ হলে error রেখে দেয় (status 'failed'), দ্রুত সার্চ চলতে থাকে"""
+        try:
+            self.warm_up()
+        except Exception as e:
+            self.build_error = e
+
+    @property
+    def ready(self):
+        """পূর্ণ ইনডেক্স তৈরি হয়ে ব্যবহারের জন্য প্রস্তুত কিনা"""
+        return self._built.is_set() and self.build_error is None
+
+    @property
+    def status(self):
+        """ইনডেক্সের অবস্থা: 'building', 'ready' অথবা 'failed'"""
+        if not self._built.is_set():
+            return 'building'
+        return 'failed' if self.build_error is not None else 'ready'
+
+    def wait_ready(self, timeout=None):
+        """ইনডেক্স তৈরি শেষ হওয়া পর্যন্ত (অথবা timeout সেকেন্ড) অপেক্ষা করুন; প্রস্তুত হলে True"""
+        self._built.wait(timeout)
+        return self.ready
+
+    def build_index(self):
+        """স্ন্যাপশট থেকে, না থাকলে Excel পড়ে ও TF-IDF ফিট করে ইনডেক্স তৈরি করুন"""
+        if self.tfidf_mode != 'fit' or not self.load_snapshot():
+            self.load_data()
+            self.preprocess_data()
+            self.save_snapshot()
+
+    @property
+    def data(self):
+        """
+        মূল DataFrame (শেয়ার্ড ইনডেক্সে attach করা থাকলে প্রথম দরকারে এই প্রসেসে আনপিকল হয় - zero-copy নয়)
+        সার্চ বা UI এর জন্য লাগে না - UI তে record_columns / filter_records / record_frame ব্যবহার করুন
+        """
+        if self._data is None and self.shared_index is not None:
+            self._data = self.shared_index.load_frame()
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+
+    @property
+    def loaded(self):
+        """মূল ডেটা লোড ও ইনডেক্স তৈরি শেষ হয়েছে কিনা (শেয়ার্ড মোডে DataFrame লোড না করেই)"""
+        return self.ready and (self.shared_index is not None or self._data is not None)
+
+    def record_columns(self):
+        """মূল ডেটার কলাম (প্রিপ্রসেসের যোগ করা কলাম বাদে) - DataFrame লোড না করেই"""
+        if not self.loaded:
+            return []
+        columns = self.shared_index.columns if self.shared_index is not None else self._data.columns
+        return [col for col in columns if col not in DERIVED_COLUMNS]
+
+    def filter_records(self, column, value):
+        """যেসব সারির column এ value আছে (case-insensitive) - শেয়ার্ড সারির টেবিল থেকে, DataFrame ছাড়া"""
+        if column not in self.record_columns():
+            return []
+        needle = str(value).casefold()
+        return [
+            dict(record) for record in self.records
+            if pd.notna(record.get(column)) and needle in str(record.get(column)).casefold()
+        ]
+
+    def record_frame(self, start=0, stop=None):
+        """মূল ডেটার start:stop সারির ছোট DataFrame (শুধু এই সারিগুলো ডিকোড হয় - পেজ দেখানো/এক্সপোর্টের জন্য)"""
+        columns = self.record_columns()
+        rows = self.records[start:stop] if columns else []
+        return pd.DataFrame([{col: row.get(col) for col in columns} for row in rows], columns=columns)
+
+    def search_indexes(self):
+        """ইঞ্জিনের সার্চ ইনডেক্সগুলো (মূল সারি আগে, তারপর data source); তৈরি চলাকালীন খালি"""
+        if not self.ready:
+            return []
+        if self.main_index is not None:
+            return [self.main_index, self.source_index]
+        return [self.source_index]
+
+    def load_shared_index(self):
+        """
+        SHARED_INDEX_DIR দেওয়া থাকলে (fit মোডে) শেয়ার্ড ইনডেক্সে attach করুন
+        প্রথম প্রসেস ইনডেক্স তৈরি করে প্রকাশ করে, একই সময়ে আসা বাকিরা অপেক্ষা করে তারপর attach করে
+        """
+        if SHARED_INDEX_DIR is None or self.tfidf_mode != 'fit':
+            return False
+        shared = SharedIndex(SHARED_INDEX_DIR)
+        with shared.build_lock(self.excel_file):
+            attached = shared.attach(self.excel_file, self.make_vectorizer())
+            if attached is None:
+                self.build_index()
+                if self.data is None or self.tfidf_matrix is None:
+                    return True
+                try:
+                    shared.publish(self.excel_file, self, self.source_index)
+                except OSError:
+                    # লিখতে না পারলে এই প্রসেস নিজের কপিতেই চলবে
+                    return True
+                attached = shared.attach(self.excel_file, self.make_vectorizer())
+                if attached is None:
+                    return True
+        self.attach_shared_index(attached)
+        return True
+
+    def attach_shared_index(self, attached):
+        """নিজের কপির বদলে শেয়ার্ড (memory-mapped) অ্যারে ব্যবহার করুন"""
+        self.shared_index = attached
+        self._data = None
+        self.vectorizer = attached.vectorizer
+        self.tfidf_matrix = attached.matrix
+        self.records = attached.records
+        self.text_columns = attached.text_columns
+        self.name_index = attached.name_index
+        self.publish_catalog()
+        self.fuzzy_index = attached.fuzzy_index
+        self.source_index.remove_where(lambda doc: doc['source'] == 'Main Excel')
+        self.main_index = attached.index(self.main_document)
+
+    def main_document(self, row):
+        """মূল ডেটার একটি সারির সোর্স dict (শেয়ার্ড ইনডেক্সের ডকুমেন্ট)"""
+        record = {key: value for key, value in self.records[row].items() if key not in DERIVED_COLUMNS}
+        return self.row_to_source(record, row, 'Main Excel', self.excel_file)
+
+    def load_snapshot(self):
+        """ডেটা ফাইলের বর্তমান কনটেন্টের স্ন্যাপশট থেকে DataFrame ও TF-IDF লোড করুন (না থাকলে False)"""
+        snapshot = EngineSnapshot(SNAPSHOT_CACHE_DIR).load(self.excel_file, self.make_vectorizer())
+        if snapshot is None:
+            return False
+        self.data, self.vectorizer, self.tfidf_matrix = snapshot
+        self.text_columns = self.find_text_columns(self.data)
+        self.records = self.data.to_dict('records')
+        self.index_main_data()
+        self.build_name_index()
+        return True
+
+    def save_snapshot(self):
+        """প্রিপ্রসেস করা ডেটা ও TF-IDF পরের স্টার্টআপের জন্য ডিস্কে রাখুন"""
+        if self.data is None or self.tfidf_matrix is None:
+            return
+        try:
+            EngineSnapshot(SNAPSHOT_CACHE_DIR).save(self.excel_file, self.data, self.vectorizer, self.tfidf_matrix)
+        except OSError:
+            # ক্যাশ লিখতে না পারলেও ইঞ্জিন চলবে, শুধু পরের স্টার্টআপ ধীর হবে
+            pass
+
+    def index_data_source(self):
+        """'data source' ফোল্ডারের PDF/Word প্যাসেজ ইনডেক্সে যোগ করুন (এক্সট্রাকশন ডিস্ক ক্যাশ থেকে)"""
+        self.source_index.remove_where(lambda doc: 'sha256' in doc)
+        documents = load_document_folder(
+            self.data_source_dir, self.tokenize, ExtractionCache(EXTRACTION_CACHE_DIR), get_text_store(),
+            PDF_BACKEND
+        )
+        for document, term_counts in documents:
+            self.source_index.add_document(document, term_counts=term_counts)
+        self.data_source_files = sorted({document['saved_path'] for document, _ in documents})
+        self.data_source_hashes = {document['sha256'] for document, _ in documents}
+
     def load_data(self):
-        """Excel ফাইল থেকে ডেটা লোড করুন"""
+        """
+        Excel ফাইল থেকে ডেটা লোড করুন (আসল ফরম্যাট bytes দেখে - নাম .xlsx হলেও ফাইলটি CSV হতে পারে)
+        ব্যাকগ্রাউন্ড থ্রেডে/হেডলেস সার্ভিসে চলে, তাই ব্যর্থ হলে load_error রাখে - কিছু দেখায় না
+        """
         try:
-            self.data = pd.read_excel(self.excel_file)
-            st.success(f"✅ ডেটা সফলভাবে লোড হয়েছে! মোট {len(self.data)} টি ওষুধ পাওয়া গেছে।")
+            self.data = read_table(self.excel_file)
+            self.load_error = None
         except Exception as e:
-            st.error(f"❌ ডেটা লোড করতে সমস্যা হয়েছে: {str(e)}")
+            self.load_error = e
             return None
-    
+        self.index_main_data()
+        self.build_name_index()
+
+    def name_columns(self):
+        """নামের কলাম: প্রথম কলাম, বাংলা নাম এবং জেনেরিক নামের কলাম (থাকলে)"""
+        if self.shared_index is not None:
+            return list(self.shared_index.name_columns)
+        columns = [self.data.columns[0]]
+        for col in ('Bengali Name', 'Generic Name'):
+            if col in self.data.columns and col not in columns:
+                columns.append(col)
+        return columns
+
+    def build_name_index(self):
+        """নামের exact/prefix ইনডেক্স এবং টাইপো-সহনশীল (SymSpell) ইনডেক্স একবার তৈরি করুন"""
+        if self.data is None or len(self.data.columns) == 0:
+            self.name_index = NameIndex()
+            self.fuzzy_index = SymSpellIndex()
+            return
+        columns = [self.data[col].tolist() for col in self.name_columns()]
+        self.name_index = NameIndex.from_columns(columns)
+        self.publish_catalog()
+        self.fuzzy_index = SymSpellIndex.from_columns(columns)
+
+    def publish_catalog(self):
+        """
+        ব্যাকগ্রাউন্ডে তৈরির সময় নামের ইনডেক্স ও সারিগুলো দ্রুত সার্চের জন্য দিন
+        সারিগুলো আলাদা কপি, তাই প্রিপ্রসেসে DataFrame বদলালেও পড়া নিরাপদ
+        """
+        if not self.background or self._built.is_set():
+            return
+        rows = self.records or self.data.drop(columns=list(DERIVED_COLUMNS), errors='ignore').to_dict('records')
+        self.catalog = (self.name_index, rows)
+
+    def tokenize(self, text):
+        """ইনডেক্সের জন্য টেক্সটকে শব্দে ভাগ করুন"""
+        return self.clean_text(str(text)).split()
+
+    def row_to_source(self, row, row_index, source, filename, upload_time=None):
+        """একটি Excel সারি থেকে সোর্স dict তৈরি করুন"""
+        item = {
+            'source': source,
+            'filename': filename,
+            'content': ' '.join([str(val) for val in row.values() if pd.notna(val)]),
+            'row_index': row_index,
+            'data': row
+        }
+        if upload_time is not None:
+            item['upload_time'] = upload_time
+        return item
+
+    def index_main_data(self):
+        """মূল Excel এর সারিগুলো ইনডেক্সে যোগ করুন (আগের মূল ডেটা সরিয়ে)"""
+        self.source_index.remove_where(lambda doc: doc['source'] == 'Main Excel')
+        if self.data is None:
+            return
+        # প্রিপ্রসেসের যোগ করা কলাম (স্ন্যাপশট থেকে লোড হলে থাকে) ইনডেক্সে যায় না
+        rows = self.data.drop(columns=list(DERIVED_COLUMNS), errors='ignore').to_dict('records')
+        for idx, row in zip(self.data.index, rows):
+            self.source_index.add_document(self.row_to_source(row, idx, 'Main Excel', self.excel_file))
+
+    def make_vectorizer(self):
+        """নতুন (ফিট না করা) TF-IDF ভেক্টরাইজার"""
+        if self.tfidf_mode == 'incremental':
+            return IncrementalTfidf(ngram_range=(1, 3))
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        return TfidfVectorizer(
+            max_features=2000,
+            ngram_range=(1, 3),
+            min_df=1,
+            stop_words=None  # বাংলা স্টপ ওয়ার্ডস ম্যানুয়ালি হ্যান্ডল করব
+        )
+
+    def bump_version(self):
+        """মূল ডেটা বা TF-IDF বদলালে ডেটা-ভার্সন বদলান (পুরনো কোয়েরি ক্যাশ আর মিলবে না)"""
+        self.version = next_data_version()
+
+    @staticmethod
+    def find_text_columns(frame):
+        """টেক্সট (object) কলামগুলো, প্রিপ্রসেসের যোগ করা কলাম বাদে"""
+        return [col for col in frame.columns if frame[col].dtype == 'object' and col not in DERIVED_COLUMNS]
+
+    def add_text_columns(self, frame):
+        """combined_text ও cleaned_text কলাম যোগ করুন (শুধু এই frame এর সারিগুলোর জন্য)"""
+        columns = [col for col in self.text_columns if col in frame.columns]
+        frame['combined_text'] = frame[columns].fillna('').astype(str).agg(' '.join, axis=1)
+        frame['cleaned_text'] = frame['combined_text'].apply(self.clean_text)
+
+    def preprocess_data(self):
+        """সার্চের জন্য ডেটা প্রিপ্রসেস করুন"""
+        if self.data is None:
+            return
+            
+        # সব টেক্সট কলাম খুঁজে বের করুন, প্রতিটি ওষুধের সম্মিলিত ও পরিষ্কার টেক্সট তৈরি করুন
+        self.text_columns = self.find_text_columns(self.data)
+        self.add_text_columns(self.data)
+        
+        # TF-IDF ভেক্টরাইজার তৈরি করুন
+        self.vectorizer = self.make_vectorizer()
+        
+        if self.tfidf_mode == 'incremental':
+            # hashing TF-IDF: পরে সারি যোগ করলে শুধু নতুন সারিগুলো ভেক্টরাইজ হয়
+            self.tfidf_matrix = None
+            self.vectorizer.add(self.data['cleaned_text'].tolist())
+        else:
+            # TF-IDF ম্যাট্রিক্স তৈরি করুন (L2-normalized CSR, যাতে cosine = dot product)
+            self.tfidf_matrix = l2_normalize_rows(self.vectorizer.fit_transform(self.data['cleaned_text']))
+        
+        # ফলাফলের জন্য সারিগুলো একবারেই dict এ রূপান্তর করুন
+        self.records = self.data.to_dict('records')
+
+    def tfidf_overlay(self):
+        """এই মডেলের IDF শেয়ার করে এমন আলাদা সারির সেট (যেমন একটি সেশনের আপলোড করা Excel)"""
+        if self.tfidf_mode == 'incremental':
+            return self.vectorizer.overlay()
+        return FittedTfidf(self.vectorizer).overlay()
+
+    def clean_text(self, text):
+        """টেক্সট পরিষ্কার এবং প্রিপ্রসেস করুন"""
+        # লোয়ারকেস করুন
+        text = text.lower()
+        
+        # বিশেষ ক্যারেক্টার সরান কিন্তু বাংলা টেক্সট রাখুন
+        text = re.sub(r'[^\w\s\u0980-\u09FF]', ' ', text)
+        
+        # অতিরিক্ত স্পেস সরান
+        text = re.sub(r'\s+', ' ', text).strip()
+        
+        # বাংলা স্টপ ওয়ার্ডস সরান
+        words = text.split()
+        filtered_words = [word for word in words if word not in self.bengali_stop_words]
+        
+        return ' '.join(filtered_words)
+
+    def search_medicines(self, query, top_k=5):
+        """প্রশ্নের ভিত্তিতে ওষুধ খুঁজুন"""
+        return self.search_medicines_batch([query], top_k=top_k)[0]
+
+    def search_medicines_batch(self, queries, top_k=5):
+        """অনেকগুলো প্রশ্ন একসাথে খুঁজুন - একটি sparse matrix multiply এ সব স্কোর"""
+        if not self.ready:
+            return [self.quick_search(query, top_k=top_k) for query in queries]
+        if not self.loaded or self.vectorizer is None:
+            return [[] for _ in queries]
+        
+        # প্রশ্ন পরিষ্কার করে TF-IDF ভেক্টরে রূপান্তর করুন
+        cleaned = [self.clean_text(query) for query in queries]
+        
+        # শীর্ষ ম্যাচগুলি পান (ন্যূনতম সিমিলারিটি থ্রেশহোল্ড 0.05)
+        if self.tfidf_mode == 'incremental':
+            batch_hits = self.vectorizer.search(cleaned, top_k, threshold=0.05)
+        else:
+            query_matrix = self.vectorizer.transform(cleaned)
+            batch_hits = sparse_top_k(query_matrix, self.tfidf_matrix, top_k, threshold=0.05)
+        
+        batch_results = []
+        for hits in batch_hits:
+            results = []
+            for idx, score in hits:
+                medicine_info = dict(self.records[idx])
+                medicine_info['similarity_score'] = score
+                results.append(medicine_info)
+            batch_results.append(results)
+        
+        return batch_results
+
+    def quick_search(self, query, top_k=5):
+        """ইনডেক্স তৈরির সময়ের সার্চ - শুধু নামের exact/prefix লুকআপ (নামের ইনডেক্স হওয়ার আগে খালি)"""
+        catalog = self.catalog
+        if catalog is None:
+            return []
+        name_index, rows = catalog
+        results = []
+        for row, score in name_index.search(query, limit=top_k):
+            medicine_info = dict(rows[row])
+            medicine_info['similarity_score'] = score
+            results.append(medicine_info)
+        return results
+
+    def get_medicine_details(self, medicine_name):
+        """নির্দিষ্ট ওষুধের বিস্তারিত তথ্য পান"""
+        if not self.ready:
+            return self.lookup_medicine_by_name(medicine_name)
+        if not self.loaded:
+            return None
+        
+        # প্রথমে নামের ইনডেক্সে খুঁজুন (exact → prefix → শব্দের prefix)
+        details = self.lookup_medicine_by_name(medicine_name)
+        if details is not None:
+            return details
+        
+        # সঠিক ম্যাচ না থাকলে TF-IDF সার্চ ব্যবহার করুন
+        results = self.search_medicines(medicine_name, top_k=1)
+        if results:
+            return results[0]
+        
+        # কিছুই না মিললে শেষে বানান ভুল ধরে নিন
+        return self.lookup_medicine_by_typo(medicine_name)
+
+    def lookup_medicine_by_name(self, medicine_name):
+        """শুধু নামের ইনডেক্স থেকে ওষুধ (TF-IDF ছাড়া), না পেলে None"""
+        if not self.ready:
+            catalog = self.catalog
+            row = None if catalog is None else catalog[0].lookup(medicine_name)
+            return None if row is None else dict(catalog[1][row])
+        if not self.loaded:
+            return None
+        return self.medicine_at(self.name_index.lookup(medicine_name))
+
+    def lookup_medicine_by_typo(self, medicine_name):
+        """
+        বানান ভুল ধরে কাছের নামের ওষুধ (SymSpell), না পেলে None
+        নামের ইনডেক্স ও TF-IDF কিছু না পেলে তবেই ডাকুন - ছোট শব্দে ভুল মিল এড়াতে দূরত্ব দৈর্ঘ্য অনুযায়ী সীমিত
+        """
+        if not self.loaded:
+            return None
+        return self.medicine_at(self.fuzzy_index.best_row(medicine_name))
+
+    def medicine_at(self, row):
+        """মূল ডেটার একটি সারি dict হিসেবে (row None হলে None)"""
+        if row is None:
+            return None
+        if self.records:
+            return dict(self.records[row])
+        return self.data.iloc[row].to_dict()
+
+    def suggest_medicine_names(self, query, limit=5):
+        """বানান ভুল হলে কাছাকাছি ওষুধের নাম সাজেস্ট করুন"""
+        if not self.ready:
+            return []
+        return self.fuzzy_index.suggest(query, limit=limit)
+
+
+# প্রসেস-ব্যাপী শেয়ার্ড ইঞ্জিন (ফাইলের path, mtime ও hash অনুযায়ী)
+_shared_engines = SharedEngineRegistry()
+
+
+def get_shared_engine(excel_file, background=False):
+    """
+    ডেটা ফাইলের বর্তমান সংস্করণের শেয়ার্ড ইঞ্জিন দিন
+    background=True হলে নতুন ইঞ্জিনের ইনডেক্স ব্যাকগ্রাউন্ডে তৈরি হয় (সাথে সাথে ফেরত দেয়, status দেখুন)
+    """
+    if background:
+        return _shared_engines.get(excel_file, lambda path: MedicineSearchEngine(path, background=True))
+    return _shared_engines.get(excel_file, MedicineSearchEngine)
+
+
+# প্রসেস-ব্যাপী কোয়েরি ফলাফল ক্যাশ (সার্চ + ফরম্যাটিং); কী তে ডেটা-ভার্সন থাকে
+query_cache = QueryCache(maxsize=512)
+
+# প্রসেস-ব্যাপী API কানেক্টর - URL প্রতি একটি রিফ্রেশ থ্রেড, কোনো সেশন না থাকলে থেমে যায়
+api_connectors = ConnectorRegistry()
+
+# PDF/Word এক্সট্রাকশনের প্রসেস-ব্যাপী ব্যাকগ্রাউন্ড পুল (প্রথম আপলোডে তৈরি হয়)
+_ingestion_pool = None
+
+
+def get_ingestion_pool():
+    """শেয়ার্ড ইনজেশন পুল দিন"""
+    global _ingestion_pool
+    if _ingestion_pool is None:
+        _ingestion_pool = IngestionPool(pdf_backend=PDF_BACKEND)
+    return _ingestion_pool
+
+
+# এক্সট্রাক্ট করা PDF/Word টেক্সটের প্রসেস-ব্যাপী স্টোর (ফাইলটি সব প্রসেস memory-map করে শেয়ার করে)
+_text_store = None
+
+
+def get_text_store():
+    """শেয়ার্ড টেক্সট স্টোর দিন"""
+    global _text_store
+    if _text_store is None:
+        _text_store = TextStore(TEXT_STORE_DIR)
+    return _text_store
+
+
+class MedicineChatbot:
+    """সেশনের চ্যাটবট - শেয়ার্ড ইঞ্জিনের উপরে শুধু সেশনের নিজস্ব আপলোড রাখে"""
+    def __init__(self, excel_file, engine=None, scorer='keyword', cache=None):
+        self.excel_file = excel_file
+        self.engine = engine if engine is not None else get_shared_engine(excel_file)
+        # সব উৎসের সার্চের স্কোরিং: 'keyword' বা 'bm25' (অথবা scorer অবজেক্ট)
+        self.scorer = get_scorer(scorer)
+        self.cache = cache if cache is not None else query_cache
+        # সেশনের আপলোডের ভার্সন; আপলোড না থাকলে 0, তাই এমন সেশনগুলো ক্যাশ শেয়ার করে
+        self.overlay_version = 0
+        self.uploaded_files = []
+        # ব্যাকগ্রাউন্ডে এক্সট্রাক্ট হচ্ছে বা হয়েছে এমন PDF/Word ফাইল
+        self.ingest_jobs = []
+        # এই সেশনের আপলোড করা ফাইল/API ডেটার ইনডেক্স
+        self.source_index = InvertedIndex(self.tokenize)
+        # আপলোড করা Excel সারির TF-IDF overlay (ইঞ্জিনের IDF শেয়ার করে) এবং সারিগুলো
+        self.upload_tfidf = None
+        self.upload_rows = []
+
+    def refresh_engine(self):
+        """ডেটা ফাইল বদলে গেলে নতুন শেয়ার্ড ইঞ্জিনে চলে যান"""
+        self.engine = get_shared_engine(self.excel_file)
+        return self.engine
+
+    @property
+    def data_version(self):
+        """শেয়ার্ড ইঞ্জিন ও এই সেশনের আপলোড মিলিয়ে ডেটা-ভার্সন"""
+        return (self.engine.version, self.overlay_version)
+
+    def bump_data_version(self):
+        """সোর্স যোগ/মুছলে ডেটা-ভার্সন বদলান (পুরনো ক্যাশ আর মিলবে না)"""
+        self.overlay_version = next_data_version() if self.uploaded_files else 0
+
+    @property
+    def data(self):
+        """শেয়ার্ড ইঞ্জিনের DataFrame - শেয়ার্ড ইনডেক্সে এটি প্রসেসে আলাদা কপি বানায়, UI তে engine.records ব্যবহার করুন"""
+        return self.engine.data
+
+    @property
+    def vectorizer(self):
+        return self.engine.vectorizer
+
+    @property
+    def tfidf_matrix(self):
+        return self.engine.tfidf_matrix
+
+    @property
+    def bengali_stop_words(self):
+        return self.engine.bengali_stop_words
+
+    @property
+    def all_sources(self):
+        """শেয়ার্ড এবং এই সেশনের সব উৎস (যোগ করার ক্রমে)"""
+        return [doc for index in self.engine.search_indexes() + [self.source_index] for doc in index.documents.values()]
+
+    def tokenize(self, text):
+        """ইনডেক্সের জন্য টেক্সটকে শব্দে ভাগ করুন"""
+        return self.engine.tokenize(text)
+
+    def clean_text(self, text):
+        """টেক্সট পরিষ্কার এবং প্রিপ্রসেস করুন"""
+        return self.engine.clean_text(text)
+
+    def index_file_item(self, file_item):
+        """আপলোড করা ফাইল/API ডেটা ইনডেক্সে যোগ করুন"""
+        if file_item['source'] == 'Excel':
+            # Excel এর প্রতিটি সারি ফাইল থেকে স্ট্রিম হয়ে সরাসরি ইনডেক্সে যায় (DataFrame ছাড়া)
+            self.index_excel_rows(file_item)
+        elif file_item['source'] in ('PDF', 'Word'):
+            # PDF/Word পুরো ফাইল নয়, ওভারল্যাপিং প্যাসেজ হিসেবে ইনডেক্স হয়
+            # টেক্সট শেয়ার্ড স্টোরে একবারই থাকে; ইনডেক্সে শুধু (doc_id, offset, length)
+            store = get_text_store()
+            text = store.read(file_item['text_id'])
+            passages = split_passages(text, file_item.get('page_starts'))
+            file_info = {
+                'source': file_item['source'],
+                'filename': file_item['filename'],
+                'upload_time': file_item['upload_time']
+            }
+            for source, passage in zip(store_passages(store, text, passages, file_info), passages):
+                self.source_index.add_document(source, term_counts=Counter(self.tokenize(passage['text'])))
+        else:
+            # API এর রেকর্ড API থেকেই আবার স্ট্রিম হয় (Excel যেমন সেভ করা ফাইল থেকে)
+            self.reindex_api_item(file_item)
+
+    def index_api_records(self, file_item):
+        """
+        API এর প্রতিটি (সমতল করা) রেকর্ড পেজ ধরে স্ট্রিম করে আলাদা সারি হিসেবে ইনডেক্সে যোগ করুন
+        (একবারে একটি পেজ মেমরিতে), রেকর্ডের সংখ্যা ফেরত দেয়
+        এই URL এর আগের রেকর্ড সরানো হয় পুরো স্ট্রিম সফল হলে তবেই; মাঝপথে ব্যর্থ হলে নতুন অংশ সরিয়ে error ছুড়ে দেয়
+        """
+        connector = file_item['connector']
+        url = file_item['url']
+        version = connector.version
+        generation = file_item.get('generation', 0) + 1
+        upload_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        count = 0
+        try:
+            for row_index, record in enumerate(connector.iter_records(conditional=False)):
+                self.source_index.add_document({
+                    'source': 'API',
+                    'filename': url,
+                    'url': url,
+                    'content': ' '.join(str(value) for value in record.values() if value is not None),
+                    'upload_time': upload_time,
+                    'row_index': row_index,
+                    'generation': generation,
+                    'data': record
+                })
+                count += 1
+        except Exception:
+            self.source_index.remove_where(lambda doc: doc.get('url') == url and doc.get('generation') == generation)
+            raise
+        self.source_index.remove_where(
+            lambda doc: doc['source'] == 'API' and doc.get('url') == url and doc.get('generation') != generation
+        )
+        file_item.update(generation=generation, version=version, record_count=count, upload_time=upload_time)
+        return count
+
+    def reindex_api_item(self, file_item):
+        """
+        API আইটেমের রেকর্ড আবার স্ট্রিম করে ইনডেক্স করুন; সফল হলে True
+        ব্যর্থ হলে আগের রেকর্ডই থাকে, ত্রুটি connector.error এ (এই version এ আর চেষ্টা হয় না)
+        """
+        import requests
+        connector = file_item['connector']
+        file_item['version'] = connector.version
+        try:
+            self.index_api_records(file_item)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            connector.error = str(e)
+            return False
+        connector.error = None
+        return True
+
+    def index_excel_rows(self, file_item):
+        """
+        আপলোড করা Excel এর সারিগুলো একটি একটি করে ইনডেক্সে যোগ করুন, সারির সংখ্যা ফেরত দেয়
+        ফাইল সেভ না হয়ে থাকলে file_item এর 'bytes' থেকে পড়া হয়
+        শিট মাঝপথে পড়া না গেলে (ভাঙা সেল, কাটা zip) এই ফাইলের যোগ হওয়া সারি সরিয়ে error ছুড়ে দেয়
+        """
+        file_info = {
+            'source': 'Uploaded Excel',
+            'filename': file_item['filename'],
+            'upload_time': file_item['upload_time']
+        }
+        upload_rows = len(self.upload_rows)
+        count = 0
+        batch = []
+        try:
+            for idx, row in iter_excel_rows(file_item.get('saved_path') or file_item['bytes']):
+                source = RowSource(file_info, idx, row)
+                self.source_index.add_document(source)
+                batch.append(source)
+                if len(batch) >= EXCEL_TFIDF_BATCH:
+                    self.add_upload_rows(batch)
+                    batch = []
+                count += 1
+        except Exception:
+            self.source_index.remove_where(lambda doc: isinstance(doc, RowSource) and doc.file is file_info)
+            if self.upload_tfidf is not None:
+                self.upload_tfidf.truncate(upload_rows)
+            del self.upload_rows[upload_rows:]
+            raise
+        self.add_upload_rows(batch)
+        return count
+
+    def add_upload_rows(self, sources):
+        """আপলোড করা Excel সারিগুলো এই সেশনের TF-IDF overlay এ যোগ করুন (মূল ম্যাট্রিক্স আবার ফিট হয় না)"""
+        if not sources or self.engine.vectorizer is None:
+            return
+        if self.upload_tfidf is None:
+            self.upload_tfidf = self.engine.tfidf_overlay()
+        self.upload_tfidf.add([self.clean_text(source['content']) for source in sources])
+        self.upload_rows.extend(source['data'] for source in sources)
+
+    def reset_upload_tfidf(self):
+        """আপলোড করা Excel সারির TF-IDF খালি করুন"""
+        self.upload_tfidf = None
+        self.upload_rows = []
+
+    def add_uploaded_item(self, file_item):
+        """আপলোড তালিকা এবং ইনডেক্স দুটোতেই যোগ করুন"""
+        self.uploaded_files.append(file_item)
+        self.index_file_item(file_item)
+        self.bump_data_version()
+
+    def clear_uploaded_files(self):
+        """সব আপলোড করা ডেটা মুছুন (মূল Excel থাকবে)"""
+        for file_item in self.uploaded_files:
+            if 'connector' in file_item:
+                api_connectors.unsubscribe(self, file_item['connector'])
+        self.uploaded_files = []
+        self.ingest_jobs = []
+        self.source_index.clear()
+        self.reset_upload_tfidf()
+        self.bump_data_version()
+
+    def has_content(self, digest):
+        """এই bytes (SHA-256) আগেই ইনডেক্সে আছে বা প্রসেস হচ্ছে কিনা"""
+        if digest in self.engine.data_source_hashes:
+            return True
+        if any(item.get('sha256') == digest for item in self.uploaded_files):
+            return True
+        return any(
+            job.metadata.get('sha256') == digest and job.status != IngestJob.FAILED
+            for job in self.ingest_jobs
+        )
+
+    def queue_file(self, uploaded_file, file_type, pool=None):
+        """
+        PDF/Word ফাইল ব্যাকগ্রাউন্ড পুলে এক্সট্রাক্ট করতে পাঠান, সাথে সাথে IngestJob ফেরত
+        শেষ হলে collect_ingested() ইনডেক্সে যোগ করে; Excel সরাসরি add_file দিয়ে যোগ হয়
+        """
+        if file_type not in ("PDF", "Word"):
+            return self.add_file(uploaded_file, file_type)
+        if not PDF_AVAILABLE:
+            st.error(f"❌ {file_type} সমর্থন নেই। PyPDF2 এবং python-docx ইনস্টল করুন।")
+            return None
+        
+        data = uploaded_file.getvalue()
+        digest = hashlib.sha256(data).hexdigest()
+        if self.has_content(digest):
+            st.info(f"ℹ️ '{uploaded_file.name}' আগেই যোগ করা আছে")
+            return None
+        saved_path = save_uploaded_file_to_data_source(uploaded_file)
+        job = (pool or get_ingestion_pool()).submit(
+            uploaded_file.name, file_type, data,
+            {'upload_time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"), 'saved_path': saved_path, 'sha256': digest}
+        )
+        self.ingest_jobs.append(job)
+        return job
+
+    @property
+    def pending_ingests(self):
+        """এখনো এক্সট্রাক্ট হচ্ছে এমন জব"""
+        return [job for job in self.ingest_jobs if not job.finished]
+
+    def collect_ingested(self):
+        """শেষ হওয়া ব্যাকগ্রাউন্ড জবগুলো এই থ্রেডেই ইনডেক্সে যোগ করুন; নতুন শেষ হওয়া জব ফেরত"""
+        finished = []
+        for job in self.ingest_jobs:
+            if job.collected or not job.finished:
+                continue
+            job.collected = True
+            finished.append(job)
+            if job.status != IngestJob.DONE:
+                continue
+            if job.file_type == "PDF":
+                text_content, page_starts = join_pages(job.pages)
+            else:
+                text_content, page_starts = "\n".join(job.pages), None
+            if not text_content.strip():
+                job.status = IngestJob.FAILED
+                job.error = "ফাইল থেকে কোন টেক্সট পাওয়া যায়নি"
+                continue
+            item = {
+                'filename': job.filename,
+                'text_id': get_text_store().put(text_content),
+                'source': job.file_type,
+                **job.metadata
+            }
+            if page_starts is not None:
+                item['page_starts'] = page_starts
+            self.add_uploaded_item(item)
+        return finished
+
     def add_file(self, uploaded_file, file_type):
-        """ফাইল যোগ করুন"""
+        """ফাইল যোগ করুন (একই bytes আগেই যোগ করা থাকলে কিছুই করা হয় না)"""
         try:
+            digest = hashlib.sha256(uploaded_file.getvalue()).hexdigest()
+            if self.has_content(digest):
+                st.info(f"ℹ️ '{uploaded_file.name}' আগেই যোগ করা আছে")
+                return True
+            
             if file_type == "PDF":
                 if not PDF_AVAILABLE:
                     st.error("❌ PDF সমর্থন নেই। PyPDF2 ইনস্টল করুন।")
                     return False
                 
-                pdf_reader = PyPDF2.PdfReader(uploaded_file)
-                text_content = ""
-                
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    text_content += page.extract_text() + "\n"
+                # পেজ অনুযায়ী টেক্সট, যাতে প্যাসেজে পেজ নম্বর রাখা যায়
+                pages = extract_pdf_pages(uploaded_file.getvalue(), backend=PDF_BACKEND)
+                text_content, page_starts = join_pages(pages)
                 
                 if text_content.strip():
                     saved_path = save_uploaded_file_to_data_source(uploaded_file)
-                    self.uploaded_files.append({
+                    self.add_uploaded_item({
                         'filename': uploaded_file.name,
-                        'content': text_content,
+                        'text_id': get_text_store().put(text_content),
+                        'page_starts': page_starts,
                         'source': 'PDF',
                         'upload_time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        'saved_path': saved_path
+                        'saved_path': saved_path,
+                        'sha256': digest
                     })
                     st.success(f"✅ PDF ফাইল '{uploaded_file.name}' সফলভাবে যোগ হয়েছে")
                     return True
@@ -107,20 +888,17 @@ class MedicineChatbot:
                     st.error("❌ Word সমর্থন নেই। python-docx ইনস্টল করুন।")
                     return False
                 
-                doc = docx.Document(uploaded_file)
-                text_content = ""
-                
-                for paragraph in doc.paragraphs:
-                    text_content += paragraph.text + "\n"
+                text_content = "\n".join(extract_docx_paragraphs(uploaded_file.getvalue()))
                 
                 if text_content.strip():
                     saved_path = save_uploaded_file_to_data_source(uploaded_file)
-                    self.uploaded_files.append({
+                    self.add_uploaded_item({
                         'filename': uploaded_file.name,
-                        'content': text_content,
+                        'text_id': get_text_store().put(text_content),
                         'source': 'Word',
                         'upload_time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        'saved_path': saved_path
+                        'saved_path': saved_path,
+                        'sha256': digest
                     })
                     st.success(f"✅ Word ফাইল '{uploaded_file.name}' সফলভাবে যোগ হয়েছে")
                     return True
@@ -129,25 +907,24 @@ class MedicineChatbot:
                     return False
                     
             elif file_type == "Excel":
-                df = pd.read_excel(uploaded_file)
+                # সারিগুলো সেভ করা ফাইল থেকে স্ট্রিম করে ইনডেক্স হয় - পুরো শিট মেমরিতে আসে না
+                saved_path = save_uploaded_file_to_data_source(uploaded_file)
+                file_item = {
+                    'filename': uploaded_file.name,
+                    'source': 'Excel',
+                    'upload_time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    'saved_path': saved_path,
+                    'sha256': digest
+                }
+                if not saved_path:
+                    file_item['bytes'] = uploaded_file.getvalue()
+                rows = self.index_excel_rows(file_item)
                 
-                if len(df) > 0:
-                    # Excel ডেটাকে টেক্সটে রূপান্তর করুন
-                    text_content = ""
-                    for idx, row in df.iterrows():
-                        row_text = " ".join([str(val) for val in row.values if pd.notna(val)])
-                        text_content += row_text + "\n"
-                    
-                    saved_path = save_uploaded_file_to_data_source(uploaded_file)
-                    self.uploaded_files.append({
-                        'filename': uploaded_file.name,
-                        'content': text_content,
-                        'dataframe': df,
-                        'source': 'Excel',
-                        'upload_time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        'saved_path': saved_path
-                    })
-                    st.success(f"✅ Excel ফাইল '{uploaded_file.name}' সফলভাবে যোগ হয়েছে ({len(df)} সারি)")
+                if rows > 0:
+                    file_item['rows'] = rows
+                    self.uploaded_files.append(file_item)
+                    self.bump_data_version()
+                    st.success(f"✅ Excel ফাইল '{uploaded_file.name}' সফলভাবে যোগ হয়েছে ({rows} সারি)")
                     return True
                 else:
                     st.warning("⚠️ Excel ফাইলে কোন ডেটা নেই")
@@ -156,171 +933,179 @@ class MedicineChatbot:
         except Exception as e:
             st.error(f"❌ {file_type} ফাইল প্রসেস করতে সমস্যা: {str(e)}")
             return False
-    
-    def add_api_data(self, api_url, api_key=None):
-        """API থেকে ডেটা সংগ্রহ করুন"""
+
+    def files_of(self, source):
+        """এই সেশনের এক ধরনের আপলোড ('PDF', 'Word', 'Excel' বা 'API')"""
+        return [file_item for file_item in self.uploaded_files if file_item['source'] == source]
+
+    # অন্য অ্যাপগুলোর (advanced/improved/professional) পুরনো ইন্টারফেস - সবই uploaded_files এর উপরে
+    @property
+    def pdf_data(self):
+        return self.files_of('PDF')
+
+    @property
+    def word_data(self):
+        return self.files_of('Word')
+
+    @property
+    def excel_data(self):
+        return self.files_of('Excel')
+
+    @property
+    def api_data(self):
+        return self.files_of('API')
+
+    def add_pdf_file(self, pdf_file):
+        return self.add_file(pdf_file, "PDF")
+
+    def add_word_file(self, word_file):
+        return self.add_file(word_file, "Word")
+
+    def add_excel_file(self, excel_file):
+        return self.add_file(excel_file, "Excel")
+
+    def add_api_data(self, api_url, api_key=None, refresh_interval=API_REFRESH_SECONDS):
+        """
+        API থেকে ডেটা সংগ্রহ করুন (সব পেজ, প্রতিটি রেকর্ড আলাদা সারি)
+        refresh_interval সেকেন্ড পরপর ব্যাকগ্রাউন্ডে শর্তসাপেক্ষ রিফ্রেশ (0/None হলে বন্ধ)
+        একই URL আগেই যোগ করা থাকলে শুধু রিফ্রেশ হয়
+        """
+        import requests
         try:
-            headers = {}
-            if api_key:
-                headers['Authorization'] = f'Bearer {api_key}'
-                headers['X-API-Key'] = api_key
-            
-            response = requests.get(api_url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # API ডেটাকে টেক্সটে রূপান্তর করুন
-            text_content = json.dumps(data, indent=2, ensure_ascii=False)
+            existing = self.find_api_item(api_url)
+            if existing is not None:
+                changed = self.refresh_api_sources([existing])
+                if existing['connector'].error:
+                    st.error(f"❌ API রিফ্রেশ করতে সমস্যা: {existing['connector'].error}")
+                    return False
+                st.info("ℹ️ API ডেটা হালনাগাদ হয়েছে" if changed else "ℹ️ API ডেটা বদলায়নি")
+                return True
             
-            self.uploaded_files.append({
+            # একই URL অন্য সেশনেও যোগ থাকলে কানেক্টর (ও রিফ্রেশ থ্রেড) শেয়ার হয়
+            connector = api_connectors.subscribe(self, api_url, api_key)
+            file_item = {
                 'url': api_url,
-                'content': text_content,
-                'raw_data': data,
+                'filename': api_url,
+                'connector': connector,
                 'source': 'API',
-                'upload_time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 'status': 'success'
-            })
+            }
+            # পেজগুলো একটি একটি করে সরাসরি ইনডেক্সে যায়
+            count = 0
+            try:
+                count = self.index_api_records(file_item)
+            finally:
+                if not count:
+                    api_connectors.unsubscribe(self, connector)
+            if not count:
+                st.warning("⚠️ API থেকে কোন ডেটা পাওয়া যায়নি")
+                return False
+            
+            self.uploaded_files.append(file_item)
+            self.bump_data_version()
+            if refresh_interval:
+                api_connectors.subscribe(self, api_url, api_key, refresh_interval)
             
-            st.success(f"✅ API ডেটা সফলভাবে যোগ হয়েছে")
+            st.success(f"✅ API ডেটা সফলভাবে যোগ হয়েছে ({count} রেকর্ড, {connector.pages_fetched} পেজ)")
             return True
             
-        except requests.exceptions.RequestException as e:
-            st.error(f"❌ API কল করতে সমস্যা: {str(e)}")
-            return False
         except json.JSONDecodeError:
+            # requests এর JSON ত্রুটিও এটি (RequestException এর আগে ধরতে হবে)
             st.error("❌ API থেকে JSON ডেটা পাওয়া যায়নি")
             return False
+        except requests.exceptions.RequestException as e:
+            st.error(f"❌ API কল করতে সমস্যা: {str(e)}")
+            return False
         except Exception as e:
             st.error(f"❌ API ডেটা প্রসেস করতে সমস্যা: {str(e)}")
             return False
-    
+
+    def find_api_item(self, api_url):
+        """এই URL এর যোগ করা API আইটেম (না থাকলে None)"""
+        for file_item in self.uploaded_files:
+            if file_item['source'] == 'API' and file_item['url'] == api_url:
+                return file_item
+        return None
+
+    def refresh_api_sources(self, items=None):
+        """
+        API উৎসগুলো এখনই শর্তসাপেক্ষে রিফেচ করুন (না বদলালে সার্ভার 304 দেয়)
+        হালনাগাদ হওয়া আইটেমের লিস্ট ফেরত দেয়
+        """
+        if items is None:
+            items = [item for item in self.uploaded_files if 'connector' in item]
+        if items:
+            import requests
+        for file_item in items:
+            connector = file_item['connector']
+            try:
+                connector.check()
+                connector.error = None
+            except (requests.exceptions.RequestException, ValueError) as e:
+                connector.error = str(e)
+        return self.collect_api_refreshes()
+
+    def collect_api_refreshes(self):
+        """
+        ব্যাকগ্রাউন্ড রিফ্রেশে বদলেছে ধরা পড়া API এর রেকর্ড এই থ্রেডেই আবার স্ট্রিম করে ইনডেক্সে বদলে দিন
+        হালনাগাদ আইটেমের লিস্ট ফেরত দেয়
+        """
+        refreshed = []
+        for file_item in self.uploaded_files:
+            if 'connector' not in file_item or file_item['version'] == file_item['connector'].version:
+                continue
+            if self.reindex_api_item(file_item):
+                refreshed.append(file_item)
+        if refreshed:
+            self.bump_data_version()
+        return refreshed
+
     def update_all_sources(self):
-        """সব উৎসের ডেটা একত্রিত করুন"""
-        self.all_sources = []
-        
-        # মূল Excel ডেটা যোগ করুন
-        if self.data is not None:
-            for idx, row in self.data.iterrows():
-                self.all_sources.append({
-                    'source': 'Main Excel',
-                    'filename': self.excel_file,
-                    'content': ' '.join([str(val) for val in row.values if pd.notna(val)]),
-                    'row_index': idx,
-                    'data': row.to_dict()
-                })
-        
-        # আপলোড করা ফাইল যোগ করুন
+        """এই সেশনের আপলোড থেকে ইনডেক্স নতুন করে তৈরি করুন"""
+        self.source_index.clear()
+        self.reset_upload_tfidf()
         for file_item in self.uploaded_files:
-            if file_item['source'] == 'Excel':
-                # Excel ফাইলের জন্য প্রতিটি সারি আলাদাভাবে যোগ করুন
-                for idx, row in file_item['dataframe'].iterrows():
-                    self.all_sources.append({
-                        'source': 'Uploaded Excel',
-                        'filename': file_item['filename'],
-                        'content': ' '.join([str(val) for val in row.values if pd.notna(val)]),
-                        'row_index': idx,
-                        'data': row.to_dict(),
-                        'upload_time': file_item['upload_time']
-                    })
-            else:
-                # PDF, Word, API এর জন্য
-                self.all_sources.append({
-                    'source': file_item['source'],
-                    'filename': file_item.get('filename', file_item.get('url', 'Unknown')),
-                    'content': file_item['content'],
-                    'upload_time': file_item['upload_time']
-                })
-    
-    def preprocess_data(self):
-        """সার্চের জন্য ডেটা প্রিপ্রসেস করুন"""
-        if self.data is None:
-            return
-            
-        # সব টেক্সট কলাম খুঁজে বের করুন
-        text_columns = []
-        for col in self.data.columns:
-            if self.data[col].dtype == 'object':  # টেক্সট কলাম
-                text_columns.append(col)
-        
-        # প্রতিটি ওষুধের জন্য সম্মিলিত টেক্সট তৈরি করুন
-        self.data['combined_text'] = self.data[text_columns].fillna('').astype(str).agg(' '.join, axis=1)
-        
-        # টেক্সট পরিষ্কার করুন
-        self.data['cleaned_text'] = self.data['combined_text'].apply(self.clean_text)
-        
-        # TF-IDF ভেক্টরাইজার তৈরি করুন
-        self.vectorizer = TfidfVectorizer(
-            max_features=2000,
-            ngram_range=(1, 3),
-            min_df=1,
-            stop_words=None  # বাংলা স্টপ ওয়ার্ডস ম্যানুয়ালি হ্যান্ডল করব
-        )
-        
-        # TF-IDF ম্যাট্রিক্স তৈরি করুন
-        self.tfidf_matrix = self.vectorizer.fit_transform(self.data['cleaned_text'])
-    
-    def clean_text(self, text):
-        """টেক্সট পরিষ্কার এবং প্রিপ্রসেস করুন"""
-        # লোয়ারকেস করুন
-        text = text.lower()
-        
-        # বিশেষ ক্যারেক্টার সরান কিন্তু বাংলা টেক্সট রাখুন
-        text = re.sub(r'[^\w\s\u0980-\u09FF]', ' ', text)
-        
-        # অতিরিক্ত স্পেস সরান
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        # বাংলা স্টপ ওয়ার্ডস সরান
-        words = text.split()
-        filtered_words = [word for word in words if word not in self.bengali_stop_words]
-        
-        return ' '.join(filtered_words)
-    
-    def search_all_sources(self, query, top_k=5, return_all=False):
+            self.index_file_item(file_item)
+        self.bump_data_version()
+
+    def search_all_sources(self, query, top_k=5, return_all=False, scorer=None):
         """সব উৎস থেকে সার্চ করুন
         return_all=True হলে যতগুলো ম্যাচ আছে সব ফেরত দেয়
+        scorer: এই কোয়েরির জন্য আলাদা scorer ('keyword'/'bm25'), না দিলে চ্যাটবটের ডিফল্ট
         """
-        self.update_all_sources()
-        
-        if not self.all_sources:
+        indexes = self.engine.search_indexes() + [self.source_index]
+        if not any(len(index) for index in indexes):
             return []
         
-        results = []
+        # শুধু কোয়েরির শব্দগুলোর postings দেখা হয়; শেয়ার্ড উৎস আগে, তারপর সেশনের আপলোড
+        query_words = self.tokenize(query)
+        active_scorer = self.scorer if scorer is None else get_scorer(scorer)
+        ranked = active_scorer.rank(indexes, query_words)
+        if not (return_all or not top_k):
+            ranked = ranked[:top_k]
         
-        for source in self.all_sources:
-            # টেক্সট পরিষ্কার করুন
-            cleaned_content = self.clean_text(source['content'])
-            cleaned_query = self.clean_text(query)
+        results = []
+        for score, order, doc_id in ranked:
+            source = indexes[order].documents[doc_id]
             
-            # সরল কীওয়ার্ড ম্যাচিং
-            query_words = cleaned_query.split()
-            content_words = cleaned_content.split()
+            # কনটেক্সট খুঁজে বের করুন (স্টোরের প্যাসেজ হলে এখানেই একবার ডিকোড হয়)
+            content = source['content']
+            context = self.extract_context(content, query, 200)
             
-            # ম্যাচ স্কোর গণনা করুন
-            matches = sum(1 for word in query_words if word in content_words)
-            if matches > 0:
-                score = matches / len(query_words)
-                
-                # কনটেক্সট খুঁজে বের করুন
-                context = self.extract_context(source['content'], query, 200)
-                
-                results.append({
-                    'source': source['source'],
-                    'filename': source.get('filename', source.get('url', 'Unknown')),
-                    'score': score,
-                    'context': context,
-                    'full_content': source['content'][:500] + "..." if len(source['content']) > 500 else source['content'],
-                    'upload_time': source.get('upload_time', ''),
-                    'data': source.get('data', {})
-                })
+            results.append({
+                'source': source['source'],
+                'filename': source.get('filename', source.get('url', 'Unknown')),
+                'score': score,
+                'context': context,
+                'full_content': content[:500] + "..." if len(content) > 500 else content,
+                'upload_time': source.get('upload_time', ''),
+                'page': source.get('page'),
+                'terms': indexes[order].doc_terms[doc_id],
+                'data': source.get('data', {})
+            })
         
-        # স্কোর অনুযায়ী সাজান
-        results.sort(key=lambda x: x['score'], reverse=True)
-        if return_all or not top_k:
-            return results
-        return results[:top_k]
-    
+        return results
+
     def extract_context(self, text, query, context_length=200):
         """কোয়েরির আশেপাশের কনটেক্সট এক্সট্র্যাক্ট করুন"""
         query_lower = query.lower()
@@ -356,13 +1141,14 @@ class MedicineChatbot:
 
     def is_single_word(self, query: str) -> bool:
         """একটি শব্দ কিনা নির্ধারণ করুন (কমপক্ষে 2 অক্ষর)"""
-        cleaned = self.clean_text(query).strip()
-        parts = cleaned.split()
+        parts = query.tokens if isinstance(query, QueryPipeline) else self.tokenize(query)
         return len(parts) == 1 and len(parts[0]) >= 2
 
-    def build_full_info_response(self, query: str) -> str:
+    def build_full_info_response(self, query) -> str:
         """এক-কথার সার্চের জন্য সব উৎস থেকে বিস্তারিত তথ্য সুন্দরভাবে সাজিয়ে রেসপন্স বানান"""
-        results = self.search_all_sources(query, return_all=True)
+        pipeline = query if isinstance(query, QueryPipeline) else self.pipeline(query)
+        query = pipeline.query
+        results = pipeline.all_source_results
         if not results:
             return (
                 "❌ **দুঃখিত, আপনার শব্দটির সাথে মিলে এমন তথ্য পাওয়া যায়নি।**\n\n"
@@ -399,54 +1185,166 @@ class MedicineChatbot:
         if count > 0:
             lines.append(f"**মোট {count}টি তথ্য পাওয়া গেছে**")
         return "\n".join(lines)
-    
+
+    def answer(self, query, mode='structured', top_k=5, source_top_k=10):
+        """
+        প্রশ্নের পূর্ণ উত্তর (সার্চ + ফরম্যাটিং), ক্যাশ থেকে সম্ভব হলে
+        mode: 'expert', 'strict', 'structured' অথবা 'full' (এক-কথার সব তথ্য)
+        """
+        # ব্যাকগ্রাউন্ডে শেষ হওয়া ফাইল ও রিফ্রেশ হওয়া API ডেটা এই প্রশ্নেই খোঁজা যাবে
+        self.collect_ingested()
+        self.collect_api_refreshes()
+        key = (
+            self.data_version, mode, normalize_query(query), top_k, source_top_k,
+            getattr(self.scorer, 'name', repr(self.scorer))
+        )
+        return self.cache.get_or_compute(key, lambda: self._answer(query, mode, top_k, source_top_k))
+
+    def _answer(self, query, mode, top_k, source_top_k):
+        pipeline = self.pipeline(query, top_k=top_k, source_top_k=source_top_k)
+        if mode == 'full':
+            return self.build_full_info_response(pipeline)
+        if mode == 'expert':
+            return format_expert_response(pipeline)
+        if mode == 'strict':
+            return format_strict_response(pipeline)
+        return format_structured_response(pipeline)
+
+    def pipeline(self, query, top_k=5, source_top_k=10):
+        """এই প্রশ্নের জন্য QueryPipeline (সব রিট্রিভাল একবারই হবে)"""
+        return QueryPipeline(self, query, top_k=top_k, source_top_k=source_top_k)
+
     def search_medicines(self, query, top_k=5):
         """প্রশ্নের ভিত্তিতে ওষুধ খুঁজুন"""
-        if self.data is None or self.vectorizer is None:
-            return []
-        
-        # প্রশ্ন পরিষ্কার করুন
-        cleaned_query = self.clean_text(query)
-        
-        # প্রশ্নকে TF-IDF ভেক্টরে রূপান্তর করুন
-        query_vector = self.vectorizer.transform([cleaned_query])
-        
-        # সিমিলারিটি গণনা করুন
-        similarities = cosine_similarity(query_vector, self.tfidf_matrix).flatten()
-        
-        # শীর্ষ ম্যাচগুলি পান
-        top_indices = similarities.argsort()[-top_k:][::-1]
-        
-        results = []
-        for idx in top_indices:
-            if similarities[idx] > 0.05:  # ন্যূনতম সিমিলারিটি থ্রেশহোল্ড
-                medicine_info = self.data.iloc[idx].to_dict()
-                medicine_info['similarity_score'] = similarities[idx]
+        return self.search_medicines_batch([query], top_k=top_k)[0]
+
+    def search_medicines_batch(self, queries, top_k=5):
+        """অনেকগুলো প্রশ্ন একসাথে খুঁজুন (এই সেশনের আপলোড করা Excel সারিও)"""
+        batch_results = self.engine.search_medicines_batch(queries, top_k=top_k)
+        if not self.upload_rows:
+            return batch_results
+        
+        # একই IDF, তাই স্কোর তুলনাযোগ্য - দুই তালিকা মিলিয়ে শীর্ষ top_k
+        cleaned = [self.clean_text(query) for query in queries]
+        upload_hits = self.upload_tfidf.search(cleaned, top_k, threshold=0.05)
+        merged = []
+        for results, hits in zip(batch_results, upload_hits):
+            for row, score in hits:
+                medicine_info = dict(self.upload_rows[row])
+                medicine_info['similarity_score'] = score
                 results.append(medicine_info)
-        
-        return results
-    
+            results.sort(key=lambda item: -item['similarity_score'])
+            merged.append(results[:top_k])
+        return merged
+
     def get_medicine_details(self, medicine_name):
         """নির্দিষ্ট ওষুধের বিস্তারিত তথ্য পান"""
-        if self.data is None:
-            return None
-        
-        # প্রথমে সঠিক ম্যাচ খুঁজুন
-        exact_match = self.data[self.data.iloc[:, 0].str.contains(medicine_name, case=False, na=False)]
-        
-        if len(exact_match) > 0:
-            return exact_match.iloc[0].to_dict()
-        
-        # সঠিক ম্যাচ না থাকলে ফাজি সার্চ ব্যবহার করুন
-        results = self.search_medicines(medicine_name, top_k=1)
-        if results:
-            return results[0]
-        
-        return None
+        return self.engine.get_medicine_details(medicine_name)
+
+    def lookup_medicine_by_name(self, medicine_name):
+        """শুধু নামের ইনডেক্স থেকে ওষুধ"""
+        return self.engine.lookup_medicine_by_name(medicine_name)
+
+    def lookup_medicine_by_typo(self, medicine_name):
+        """বানান ভুল ধরে কাছের নামের ওষুধ"""
+        return self.engine.lookup_medicine_by_typo(medicine_name)
+
+    def suggest_medicine_names(self, query, limit=5):
+        """বানান ভুল হলে কাছাকাছি ওষুধের নাম সাজেস্ট করুন"""
+        return self.engine.suggest_medicine_names(query, limit=limit)
+
+class QueryPipeline:
+    """
+    একটি প্রশ্নের সব রিট্রিভাল একবারে: নরমালাইজড প্রশ্ন, টোকেন, Excel ফলাফল,
+    সব উৎসের ফলাফল এবং নাম অনুযায়ী ওষুধ - প্রথম দরকারে গণনা হয়, তারপর সব ফরম্যাটার শেয়ার করে
+    """
+    def __init__(self, chatbot, query, top_k=5, source_top_k=10, excel_results=None, source_results=None):
+        self.chatbot = chatbot
+        self.query = query
+        self.normalized_query = normalize_query(query)
+        self.top_k = top_k
+        self.source_top_k = source_top_k
+        self._excel_results = excel_results
+        self._source_results = source_results
+        self._all_source_results = None
+        self._medicine_details = None
+        self._details_done = False
+        self.tokens = self.tokenize(query)
+        self.token_set = set(self.tokens)
+
+    def tokenize(self, text):
+        if self.chatbot is not None:
+            return self.chatbot.tokenize(text)
+        text = str(text).lower()
+        text = re.sub(r'[^\w\s\u0980-\u09FF]', ' ', text)
+        return [t for t in text.split() if t]
+
+    @property
+    def excel_results(self):
+        """মূল Excel থেকে TF-IDF ফলাফল"""
+        if self._excel_results is None:
+            self._excel_results = self.chatbot.search_medicines(self.query, top_k=self.top_k) if self.chatbot else []
+        return self._excel_results
+
+    @property
+    def all_source_results(self):
+        """সব উৎসের সব ম্যাচ"""
+        if self._all_source_results is None:
+            self._all_source_results = (
+                self.chatbot.search_all_sources(self.query, return_all=True) if self.chatbot else []
+            )
+        return self._all_source_results
+
+    @property
+    def source_results(self):
+        """সব উৎসের শীর্ষ source_top_k ম্যাচ (সব ম্যাচ আগে গণনা হয়ে থাকলে সেখান থেকেই)"""
+        if self._source_results is None:
+            if self._all_source_results is not None:
+                self._source_results = self._all_source_results[:self.source_top_k]
+            elif self.chatbot is not None:
+                self._source_results = self.chatbot.search_all_sources(self.query, top_k=self.source_top_k)
+            else:
+                self._source_results = []
+        return self._source_results
 
-def format_structured_response(query: str, excel_results, all_source_results):
+    @property
+    def medicine_details(self):
+        """নাম অনুযায়ী ওষুধ; না পেলে Excel ফলাফলের শীর্ষটি, তাও না পেলে বানান ভুল ধরে (get_medicine_details এর মত)"""
+        if not self._details_done:
+            details = None
+            if self.chatbot is not None:
+                details = self.chatbot.lookup_medicine_by_name(self.query)
+                if details is None and self.excel_results:
+                    details = self.excel_results[0]
+                if details is None:
+                    details = self.chatbot.lookup_medicine_by_typo(self.query)
+            self._medicine_details = details
+            self._details_done = True
+        return self._medicine_details
+
+    def matches_all_tokens(self, result):
+        """ফলাফলে প্রশ্নের সব টোকেন আছে কিনা (ইনডেক্সের টোকেন থাকলে আবার টোকেনাইজ করা হয় না)"""
+        terms = result.get('terms')
+        if terms is None:
+            terms = set(self.tokenize(result.get('context') or result.get('full_content') or ''))
+        return self.token_set.issubset(terms)
+
+
+def unpack_pipeline(query, excel_results, all_source_results):
+    """ফরম্যাটারের ইনপুট: QueryPipeline অথবা আগের মত (query, excel_results, all_source_results)"""
+    if isinstance(query, QueryPipeline):
+        return query
+    return QueryPipeline(
+        getattr(st.session_state, 'chatbot', None), query,
+        excel_results=excel_results or [], source_results=all_source_results or []
+    )
+
+def format_structured_response(query, excel_results=None, all_source_results=None):
     """প্রশ্নের জন্য সুন্দর detail আকারে উত্তর তৈরি করুন"""
     try:
+        pipeline = unpack_pipeline(query, excel_results, all_source_results)
+        query, excel_results, all_source_results = pipeline.query, pipeline.excel_results, pipeline.source_results
+
         # হাইলাইট ফাংশন
         def highlight(text: str, q: str) -> str:
             try:
@@ -500,9 +1398,11 @@ def format_structured_response(query: str, excel_results, all_source_results):
     except Exception as e:
         return f"❌ রেসপন্স ফরম্যাট করতে সমস্যা: {e}"
 
-def format_expert_response(query: str, excel_results, all_source_results):
+def format_expert_response(query, excel_results=None, all_source_results=None):
     """এক্সপার্ট ডেভেলপার Dibedex এর জন্য নির্দিষ্ট ফরম্যাটে উত্তর"""
     try:
+        pipeline = unpack_pipeline(query, excel_results, all_source_results)
+        query, excel_results, all_source_results = pipeline.query, pipeline.excel_results, pipeline.source_results
         parts = []
         
         if not excel_results and not all_source_results:
@@ -567,14 +1467,15 @@ def format_expert_response(query: str, excel_results, all_source_results):
     except Exception as e:
         return f"❌ এক্সপার্ট রেসপন্স তৈরি করতে সমস্যা: {e}"
     
-def format_strict_response(query: str, excel_results, all_source_results):
+def format_strict_response(query, excel_results=None, all_source_results=None):
     """স্ট্রিক্ট মোডে সুন্দর detail আকারে উত্তর"""
     try:
+        pipeline = unpack_pipeline(query, excel_results, all_source_results)
+        query, all_source_results = pipeline.query, pipeline.source_results
         parts = []
         parts.append(f"## 💊 {query} সম্পর্কে তথ্য\n")
 
-        chatbot = getattr(st.session_state, 'chatbot', None)
-        med_details = chatbot.get_medicine_details(query) if chatbot is not None else None
+        med_details = pipeline.medicine_details
         if med_details:
             for key, value in med_details.items():
                 if key in ['combined_text', 'cleaned_text', 'similarity_score']:
@@ -584,24 +1485,11 @@ def format_strict_response(query: str, excel_results, all_source_results):
                 parts.append(f"**{key}:** {value}\n")
             return "".join(parts)
 
-        def tokenize(text: str) -> list:
-            if chatbot is not None:
-                return (chatbot.clean_text(text) or '').split()
-            import re as _re
-            text = text.lower()
-            text = _re.sub(r'[^\w\s\u0980-\u09FF]', ' ', text)
-            return [t for t in text.split() if t]
-
-        q_tokens = set(tokenize(query))
-        if not q_tokens:
+        if not pipeline.token_set:
             parts.append("❌ **দুঃখিত, প্রাসঙ্গিক তথ্য পাওয়া যায়নি।**\n")
             return "".join(parts)
 
-        matches = []
-        for r in (all_source_results or []):
-            text = r.get('context') or r.get('full_content') or ''
-            if q_tokens.issubset(set(tokenize(text))):
-                matches.append(r)
+        matches = [r for r in (all_source_results or []) if pipeline.matches_all_tokens(r)]
 
         if not matches:
             parts.append("❌ **দুঃখিত, প্রাসঙ্গিক তথ্য পাওয়া যায়নি।**\n")
@@ -626,50 +1514,62 @@ def format_strict_response(query: str, excel_results, all_source_results):
     
     def get_medicine_categories(self):
         """ওষুধের ক্যাটাগরি পান"""
-        if self.data is None:
-            return []
-        
-        categories = []
-        for col in self.data.columns:
-            if col not in ['combined_text', 'cleaned_text']:
-                categories.append(col)
-        
-        return categories
+        return self.engine.record_columns()
     
     def filter_by_category(self, category, value):
         """ক্যাটাগরি অনুযায়ী ফিল্টার করুন"""
-        if self.data is None or category not in self.data.columns:
-            return []
-        
-        filtered_data = self.data[self.data[category].astype(str).str.contains(value, case=False, na=False)]
-        return filtered_data.to_dict('records')
+        return self.engine.filter_records(category, value)
+
+
+# ফোল্ডার → আপলোড স্টোর (টেস্টে DATA_SOURCE_DIR বদলালে নতুন স্টোর)
+_upload_stores = {}
+
+
+def get_upload_store():
+    """DATA_SOURCE_DIR এর কনটেন্ট-অ্যাড্রেসড আপলোড স্টোর"""
+    data_dir = str(DATA_SOURCE_DIR)
+    if data_dir not in _upload_stores:
+        _upload_stores[data_dir] = BlobStore(data_dir)
+    return _upload_stores[data_dir]
 
 def save_uploaded_file_to_data_source(uploaded_file):
-    """UploadedFile ডিস্কে সেভ করুন: <script_dir>/data source/<timestamp>_<filename>"""
+    """UploadedFile স্টোরে সেভ করুন: <script_dir>/data source/blobs/<sha256>.<ext> (একই bytes একবারই)"""
     try:
-        base_dir = Path(__file__).resolve().parent
-        data_dir = base_dir / "data source"
-        data_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_name = uploaded_file.name
-        dest_path = data_dir / f"{timestamp}_{safe_name}"
-        try:
-            bytes_data = uploaded_file.getbuffer()
-            with open(dest_path, "wb") as f:
-                f.write(bytes_data)
-        except Exception:
-            content = uploaded_file.read()
-            with open(dest_path, "wb") as f:
-                f.write(content)
-            try:
-                uploaded_file.seek(0)
-            except Exception:
-                pass
-        return str(dest_path)
+        _, blob_path, _ = get_upload_store().put(uploaded_file.getvalue(), uploaded_file.name)
+        return str(blob_path)
     except Exception as e:
         st.warning(f"ফাইল সেভ করতে সমস্যা: {e}")
         return ""
 
+def show_ingest_progress():
+    """ব্যাকগ্রাউন্ড ইনজেশনের অগ্রগতি; কাজ চলাকালীন শুধু এই অংশটি প্রতি সেকেন্ডে রিফ্রেশ হয়"""
+    chatbot = st.session_state.chatbot
+
+    @st.fragment(run_every=1 if chatbot.pending_ingests else None)
+    def progress_panel():
+        st.subheader("⏳ ফাইল প্রসেসিং")
+        for job in chatbot.ingest_jobs:
+            if job.status == IngestJob.FAILED:
+                st.error(f"❌ {job.filename}: {job.error}")
+            elif job.finished:
+                st.success(f"✅ {job.filename} সফলভাবে যোগ হয়েছে")
+            else:
+                pages = f" ({job.done_units}/{job.total_units} পেজ)" if job.file_type == "PDF" and job.total_units else ""
+                st.progress(job.progress, text=f"{job.filename}{pages}")
+        if chatbot.collect_ingested():
+            # নতুন ডেটা ইনডেক্সে যোগ হয়েছে - পুরো পেজ রিফ্রেশ
+            st.rerun()
+
+    progress_panel()
+
+def response_mode():
+    """সেশনের সেটিং অনুযায়ী উত্তরের মোড: expert > strict > structured"""
+    if st.session_state.get('expert_mode', False):
+        return 'expert'
+    if st.session_state.get('strict_mode', False):
+        return 'strict'
+    return 'structured'
+
 def main():
     st.set_page_config(
         page_title="Digital SeBa Chatbot",
@@ -678,6 +1578,9 @@ def main():
         initial_sidebar_state="expanded"
     )
     
+    # প্রসেসের প্রথম রানেই শেয়ার্ড ইঞ্জিনের ইনডেক্স ব্যাকগ্রাউন্ডে তৈরি শুরু হয়; পেজ সাথে সাথে দেখা যায়
+    get_shared_engine(DATA_FILE, background=True)
+    
     # কাস্টম CSS - সত্যিকারের চ্যাটবটের মত
     st.markdown("""
     <style>
@@ -2311,9 +3214,11 @@ def main():
     </div>
     """, unsafe_allow_html=True)
     
-    # চ্যাটবট ইনিশিয়ালাইজ করুন
+    # চ্যাটবট ইনিশিয়ালাইজ করুন (ইঞ্জিন প্রসেসে শেয়ার্ড, সেশনে শুধু আপলোড ও হিস্টরি)
     if 'chatbot' not in st.session_state:
-        st.session_state.chatbot = MedicineChatbot('medicine_data.xlsx')
+        st.session_state.chatbot = MedicineChatbot(DATA_FILE)
+    else:
+        st.session_state.chatbot.refresh_engine()
     
     # সাইডবার
     with st.sidebar:
@@ -2323,10 +3228,17 @@ def main():
         </div>
         """, unsafe_allow_html=True)
         
-        # ডেটা তথ্য দেখান (শুধু মোট ওষুধ)
-        if st.session_state.chatbot.data is not None:
+        # ডেটা তথ্য দেখান (শুধু মোট ওষুধ); ইনডেক্স তৈরি চলাকালীন তার অবস্থা
+        engine_status = st.session_state.chatbot.engine.status
+        if engine_status == 'building':
+            st.info("⏳ সার্চ ইনডেক্স তৈরি হচ্ছে - ততক্ষণ ওষুধের নাম দিয়ে দ্রুত খোঁজ থেকে উত্তর দেওয়া হচ্ছে")
+        elif engine_status == 'failed':
+            st.error(f"❌ সার্চ ইনডেক্স তৈরি করা যায়নি: {st.session_state.chatbot.engine.build_error}")
+        elif st.session_state.chatbot.engine.load_error is not None:
+            st.error(f"❌ ডেটা লোড করতে সমস্যা হয়েছে: {st.session_state.chatbot.engine.load_error}")
+        if st.session_state.chatbot.engine.loaded:
             st.markdown('<div class="stats-card">', unsafe_allow_html=True)
-            st.metric("📊 মোট ওষুধ", len(st.session_state.chatbot.data))
+            st.metric("📊 মোট ওষুধ", len(st.session_state.chatbot.engine.records))
             st.markdown('</div>', unsafe_allow_html=True)
         
         # Strict mode toggle
@@ -2334,6 +3246,14 @@ def main():
         strict_mode = st.checkbox("🔒 স্ট্রিক্ট মোড (শুধু প্রাসঙ্গিক তথ্য)", value=strict_default)
         st.session_state.strict_mode = strict_mode
         
+        # সব উৎসের সার্চের স্কোরিং (ডিফল্ট কীওয়ার্ড, চাইলে BM25)
+        scorer_labels = {'keyword': "🔤 কীওয়ার্ড", 'bm25': "📈 BM25"}
+        scorer_name = st.selectbox(
+            "🔎 সার্চ স্কোরিং", list(scorer_labels), format_func=scorer_labels.get, key='scorer_name'
+        )
+        if getattr(st.session_state.chatbot.scorer, 'name', None) != scorer_name:
+            st.session_state.chatbot.scorer = get_scorer(scorer_name)
+        
         # Expert mode toggle (Dibedex format) - FORCE ENABLED
         expert_mode = True  # Force enable for testing
         st.session_state.expert_mode = expert_mode
@@ -2341,6 +3261,9 @@ def main():
         
         # Debug info
         st.info(f"🔍 Debug: Expert Mode = {expert_mode}, Strict Mode = {strict_mode}")
+        cache_stats = st.session_state.chatbot.cache.stats()
+        st.caption(f"🗃️ ক্যাশ: {cache_stats['hits']} hit / {cache_stats['misses']} miss ({cache_stats['size']} টি ফলাফল)")
+        st.caption(f"📚 data source: {len(st.session_state.chatbot.engine.data_source_files)} টি ফাইল ইনডেক্সড")
         
         # কুইক সার্চ (সহজে এক-কথার সার্চের জন্য)
         st.subheader("⚡ কুইক সার্চ")
@@ -2352,7 +3275,7 @@ def main():
                 'content': quick_query
             })
             # সব উৎস থেকে সব তথ্য
-            response = st.session_state.chatbot.build_full_info_response(quick_query)
+            response = st.session_state.chatbot.answer(quick_query, 'full')
             st.session_state.chat_history.append({'type': 'bot', 'content': response})
 
         # ফাইল আপলোড সেকশন
@@ -2367,14 +3290,14 @@ def main():
             pdf_file = st.file_uploader("PDF ফাইল নির্বাচন করুন", type=['pdf'], key="pdf_upload")
             if pdf_file:
                 if st.button("📄 PDF যোগ করুন", key="add_pdf"):
-                    st.session_state.chatbot.add_file(pdf_file, "PDF")
+                    st.session_state.chatbot.queue_file(pdf_file, "PDF")
         
         with tab2:
             st.write("**Word ফাইল আপলোড করুন**")
             word_file = st.file_uploader("Word ফাইল নির্বাচন করুন", type=['docx', 'doc'], key="word_upload")
             if word_file:
                 if st.button("📝 Word যোগ করুন", key="add_word"):
-                    st.session_state.chatbot.add_file(word_file, "Word")
+                    st.session_state.chatbot.queue_file(word_file, "Word")
         
         with tab3:
             st.write("**Excel ফাইল আপলোড করুন**")
@@ -2388,17 +3311,30 @@ def main():
             api_url = st.text_input("API URL:", placeholder="https://api.example.com/medicines", key="api_url")
             api_key = st.text_input("API Key (ঐচ্ছিক):", type="password", placeholder="your-api-key", key="api_key")
             
+            refresh_minutes = st.number_input(
+                "স্বয়ংক্রিয় রিফ্রেশ (মিনিট, 0 = বন্ধ):", min_value=0,
+                value=API_REFRESH_SECONDS // 60, key="api_refresh_minutes"
+            )
+            
             col1, col2 = st.columns(2)
             with col1:
                 if st.button("🔗 API যোগ করুন", key="add_api") and api_url:
-                    st.session_state.chatbot.add_api_data(api_url, api_key)
+                    st.session_state.chatbot.add_api_data(api_url, api_key, refresh_minutes * 60)
+                if any(item['source'] == 'API' for item in st.session_state.chatbot.uploaded_files):
+                    if st.button("🔄 API রিফ্রেশ", key="refresh_api"):
+                        refreshed = st.session_state.chatbot.refresh_api_sources()
+                        st.success(f"✅ {len(refreshed)}টি API হালনাগাদ হয়েছে" if refreshed else "ℹ️ API ডেটা বদলায়নি")
             with col2:
                 if st.button("🗑️ সব মুছুন", key="clear_all"):
-                    st.session_state.chatbot.uploaded_files = []
+                    st.session_state.chatbot.clear_uploaded_files()
                     st.success("✅ সব ডেটা মুছে ফেলা হয়েছে")
         
         st.markdown('</div>', unsafe_allow_html=True)
         
+        # ব্যাকগ্রাউন্ডে প্রসেস হওয়া ফাইলের অগ্রগতি
+        if st.session_state.chatbot.ingest_jobs:
+            show_ingest_progress()
+        
         # আপলোড করা ফাইল দেখান
         if st.session_state.chatbot.uploaded_files:
             st.subheader("📋 যোগ করা ডেটা")
@@ -2442,6 +3378,14 @@ def main():
                         st.markdown(f"**{key}:** {value}")
             else:
                 st.warning("❌ ওষুধ পাওয়া যায়নি")
+            
+            # কাছাকাছি নাম (বানান ভুলের জন্য)
+            suggestions = [
+                name for name in st.session_state.chatbot.suggest_medicine_names(specific_medicine)
+                if not result or name != result.get(st.session_state.chatbot.engine.name_columns()[0])
+            ]
+            if suggestions:
+                st.caption("🔤 আপনি কি খুঁজছেন: " + ", ".join(suggestions))
         
         if clear_specific:
             pass
@@ -2470,15 +3414,8 @@ def main():
                 'content': q
             })
             
-            # স্ট্রাকচার্ড রেসপন্স
-            excel_results = st.session_state.chatbot.search_medicines(q, top_k=5)
-            all_source_results = st.session_state.chatbot.search_all_sources(q, top_k=10)
-            if st.session_state.get('expert_mode', False):
-                response = format_expert_response(q, excel_results, all_source_results)
-            elif st.session_state.get('strict_mode', False):
-                response = format_strict_response(q, excel_results, all_source_results)
-            else:
-                response = format_structured_response(q, excel_results, all_source_results)
+            # স্ট্রাকচার্ড রেসপন্স (ক্যাশ সহ)
+            response = st.session_state.chatbot.answer(q, response_mode())
             st.session_state.chat_history.append({'type': 'bot', 'content': response})
 
     if 'recent_queries' in st.session_state and st.session_state.recent_queries:
@@ -2493,15 +3430,8 @@ def main():
                     'content': q
                 })
                 
-                # স্ট্রাকচার্ড রেসপন্স (রিসেন্ট কুয়েরি)
-                excel_results = st.session_state.chatbot.search_medicines(q, top_k=5)
-                all_source_results = st.session_state.chatbot.search_all_sources(q, top_k=10)
-                if st.session_state.get('expert_mode', False):
-                    response = format_expert_response(q, excel_results, all_source_results)
-                elif st.session_state.get('strict_mode', False):
-                    response = format_strict_response(q, excel_results, all_source_results)
-                else:
-                    response = format_structured_response(q, excel_results, all_source_results)
+                # স্ট্রাকচার্ড রেসপন্স (রিসেন্ট কুয়েরি, ক্যাশ সহ)
+                response = st.session_state.chatbot.answer(q, response_mode())
                 st.session_state.chat_history.append({'type': 'bot', 'content': response})
     
     # Clear and chat management buttons
@@ -2539,15 +3469,8 @@ def main():
         rq.insert(0, qtext)
         st.session_state.recent_queries = rq[:12]
 
-        # স্ট্রাকচার্ড রেসপন্স (মেইন সার্চ)
-        excel_results = st.session_state.chatbot.search_medicines(qtext, top_k=5)
-        all_source_results = st.session_state.chatbot.search_all_sources(qtext, top_k=10)
-        if st.session_state.get('expert_mode', False):
-            response = format_expert_response(qtext, excel_results, all_source_results)
-        elif st.session_state.get('strict_mode', False):
-            response = format_strict_response(qtext, excel_results, all_source_results)
-        else:
-            response = format_structured_response(qtext, excel_results, all_source_results)
+        # স্ট্রাকচার্ড রেসপন্স (মেইন সার্চ, ক্যাশ সহ)
+        response = st.session_state.chatbot.answer(qtext, response_mode())
         # বটের উত্তর হিস্টরিতে যোগ করুন
         st.session_state.chat_history.append({
             'type': 'bot',
@@ -5,398 +5,29 @@
 PDF, Word, API সমর্থন সহ
 """
 
-import streamlit as st
-import pandas as pd
-import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import re
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
 import warnings
-import requests
-import json
-from pathlib import Path
-import io
-import base64
-from datetime import datetime
-warnings.filterwarnings('ignore')
 
-# PDF এবং Word ফাইল প্রসেসিং এর জন্য
-try:
-    import PyPDF2
-    import docx
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
-    st.warning("PDF/Word সমর্থনের জন্য PyPDF2 এবং python-docx ইনস্টল করুন")
+import pandas as pd
+import streamlit as st
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
+from medicine_chatbot import MedicineChatbot
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+warnings.filterwarnings('ignore')
+
+class AdvancedMedicineChatbot(MedicineChatbot):
+    """
+    উন্নত চ্যাটবট (PDF, Word, API) এবং ক্যাটাগরি ফিল্টার
+    লোড, নরমালাইজেশন, ইনডেক্স ও ক্যাশ medicine_chatbot এর শেয়ার্ড ইঞ্জিনের - একই প্রসেসের সব অ্যাপ একটি ইনডেক্স ব্যবহার করে
+    """
 
-class AdvancedMedicineChatbot:
-    def __init__(self, excel_file):
-        self.excel_file = excel_file
-        self.data = None
-        self.vectorizer = None
-        self.tfidf_matrix = None
-        self.pdf_data = []
-        self.word_data = []
-        self.api_data = []
-        self.all_sources = []
-        self.bengali_stop_words = set([
-            'এবং', 'অথবা', 'কিন্তু', 'যদি', 'তবে', 'কেন', 'কিভাবে', 'কোথায়', 'কখন', 
-            'কি', 'কোন', 'কাদের', 'কার', 'কাকে', 'কি', 'কি', 'কি', 'কি', 'কি', 
-            'হয়', 'হয়েছে', 'হবে', 'করতে', 'করে', 'করবে', 'আছে', 'নেই', 'থাকবে',
-            'এটা', 'এটি', 'সেটা', 'সেটি', 'এই', 'সেই', 'যে', 'যা', 'যার', 'যাদের',
-            'আমি', 'আমরা', 'তুমি', 'তোমরা', 'সে', 'তারা', 'আপনি', 'আপনারা',
-            'এখানে', 'সেখানে', 'যেখানে', 'কোথায়', 'কোথাও', 'কোথাও', 'কোথাও',
-            'এখন', 'তখন', 'কখন', 'সবসময়', 'কখনও', 'কখনও', 'কখনও', 'কখনও',
-            'ভালো', 'খারাপ', 'বড়', 'ছোট', 'নতুন', 'পুরানো', 'সুন্দর', 'কুৎসিত',
-            'সহজ', 'কঠিন', 'দ্রুত', 'ধীর', 'গরম', 'ঠান্ডা', 'উষ্ণ', 'শীতল'
-        ])
-        self.load_data()
-        self.preprocess_data()
-        
-    def load_data(self):
-        """Excel ফাইল থেকে ডেটা লোড করুন"""
-        try:
-            self.data = pd.read_excel(self.excel_file)
-            st.success(f"✅ ডেটা সফলভাবে লোড হয়েছে! মোট {len(self.data)} টি ওষুধ পাওয়া গেছে।")
-        except Exception as e:
-            st.error(f"❌ ডেটা লোড করতে সমস্যা হয়েছে: {str(e)}")
-            return None
-    
-    def add_pdf_file(self, pdf_file):
-        """PDF ফাইল থেকে টেক্সট এক্সট্র্যাক্ট করুন"""
-        if not PDF_AVAILABLE:
-            st.error("❌ PDF সমর্থন নেই। PyPDF2 ইনস্টল করুন।")
-            return False
-            
-        try:
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            text_content = ""
-            
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                text_content += page.extract_text() + "\n"
-            
-            if text_content.strip():
-                self.pdf_data.append({
-                    'filename': pdf_file.name,
-                    'content': text_content,
-                    'source': 'PDF',
-                    'upload_time': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                })
-                st.success(f"✅ PDF ফাইল '{pdf_file.name}' সফলভাবে যোগ হয়েছে")
-                return True
-            else:
-                st.warning("⚠️ PDF ফাইল থেকে কোন টেক্সট পাওয়া যায়নি")
-                return False
-                
-        except Exception as e:
-            st.error(f"❌ PDF ফাইল প্রসেস করতে সমস্যা: {str(e)}")
-            return False
-    
-    def add_word_file(self, word_file):
-        """Word ফাইল থেকে টেক্সট এক্সট্র্যাক্ট করুন"""
-        if not PDF_AVAILABLE:
-            st.error("❌ Word সমর্থন নেই। python-docx ইনস্টল করুন।")
-            return False
-            
-        try:
-            doc = docx.Document(word_file)
-            text_content = ""
-            
-            for paragraph in doc.paragraphs:
-                text_content += paragraph.text + "\n"
-            
-            if text_content.strip():
-                self.word_data.append({
-                    'filename': word_file.name,
-                    'content': text_content,
-                    'source': 'Word',
-                    'upload_time': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                })
-                st.success(f"✅ Word ফাইল '{word_file.name}' সফলভাবে যোগ হয়েছে")
-                return True
-            else:
-                st.warning("⚠️ Word ফাইল থেকে কোন টেক্সট পাওয়া যায়নি")
-                return False
-                
-        except Exception as e:
-            st.error(f"❌ Word ফাইল প্রসেস করতে সমস্যা: {str(e)}")
-            return False
-    
-    def add_api_data(self, api_url, api_key=None):
-        """API থেকে ডেটা সংগ্রহ করুন"""
-        try:
-            headers = {}
-            if api_key:
-                headers['Authorization'] = f'Bearer {api_key}'
-                headers['X-API-Key'] = api_key
-            
-            response = requests.get(api_url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # API ডেটাকে টেক্সটে রূপান্তর করুন
-            text_content = json.dumps(data, indent=2, ensure_ascii=False)
-            
-            self.api_data.append({
-                'url': api_url,
-                'content': text_content,
-                'source': 'API',
-                'upload_time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                'status': 'success'
-            })
-            
-            st.success(f"✅ API ডেটা সফলভাবে যোগ হয়েছে")
-            return True
-            
-        except requests.exceptions.RequestException as e:
-            st.error(f"❌ API কল করতে সমস্যা: {str(e)}")
-            return False
-        except json.JSONDecodeError:
-            st.error("❌ API থেকে JSON ডেটা পাওয়া যায়নি")
-            return False
-        except Exception as e:
-            st.error(f"❌ API ডেটা প্রসেস করতে সমস্যা: {str(e)}")
-            return False
-    
-    def update_all_sources(self):
-        """সব উৎসের ডেটা একত্রিত করুন"""
-        self.all_sources = []
-        
-        # Excel ডেটা যোগ করুন
-        if self.data is not None:
-            for idx, row in self.data.iterrows():
-                self.all_sources.append({
-                    'source': 'Excel',
-                    'filename': self.excel_file,
-                    'content': ' '.join([str(val) for val in row.values if pd.notna(val)]),
-                    'row_index': idx,
-                    'data': row.to_dict()
-                })
-        
-        # PDF ডেটা যোগ করুন
-        for pdf_item in self.pdf_data:
-            self.all_sources.append({
-                'source': 'PDF',
-                'filename': pdf_item['filename'],
-                'content': pdf_item['content'],
-                'upload_time': pdf_item['upload_time']
-            })
-        
-        # Word ডেটা যোগ করুন
-        for word_item in self.word_data:
-            self.all_sources.append({
-                'source': 'Word',
-                'filename': word_item['filename'],
-                'content': word_item['content'],
-                'upload_time': word_item['upload_time']
-            })
-        
-        # API ডেটা যোগ করুন
-        for api_item in self.api_data:
-            self.all_sources.append({
-                'source': 'API',
-                'url': api_item['url'],
-                'content': api_item['content'],
-                'upload_time': api_item['upload_time']
-            })
-    
-    def preprocess_data(self):
-        """সার্চের জন্য ডেটা প্রিপ্রসেস করুন"""
-        if self.data is None:
-            return
-            
-        # সব টেক্সট কলাম খুঁজে বের করুন
-        text_columns = []
-        for col in self.data.columns:
-            if self.data[col].dtype == 'object':  # টেক্সট কলাম
-                text_columns.append(col)
-        
-        # প্রতিটি ওষুধের জন্য সম্মিলিত টেক্সট তৈরি করুন
-        self.data['combined_text'] = self.data[text_columns].fillna('').astype(str).agg(' '.join, axis=1)
-        
-        # টেক্সট পরিষ্কার করুন
-        self.data['cleaned_text'] = self.data['combined_text'].apply(self.clean_text)
-        
-        # TF-IDF ভেক্টরাইজার তৈরি করুন
-        self.vectorizer = TfidfVectorizer(
-            max_features=2000,
-            ngram_range=(1, 3),
-            min_df=1,
-            stop_words=None  # বাংলা স্টপ ওয়ার্ডস ম্যানুয়ালি হ্যান্ডল করব
-        )
-        
-        # TF-IDF ম্যাট্রিক্স তৈরি করুন
-        self.tfidf_matrix = self.vectorizer.fit_transform(self.data['cleaned_text'])
-    
-    def clean_text(self, text):
-        """টেক্সট পরিষ্কার এবং প্রিপ্রসেস করুন"""
-        # লোয়ারকেস করুন
-        text = text.lower()
-        
-        # বিশেষ ক্যারেক্টার সরান কিন্তু বাংলা টেক্সট রাখুন
-        text = re.sub(r'[^\w\s\u0980-\u09FF]', ' ', text)
-        
-        # অতিরিক্ত স্পেস সরান
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        # বাংলা স্টপ ওয়ার্ডস সরান
-        words = text.split()
-        filtered_words = [word for word in words if word not in self.bengali_stop_words]
-        
-        return ' '.join(filtered_words)
-    
-    def search_all_sources(self, query, top_k=5):
-        """সব উৎস থেকে সার্চ করুন"""
-        self.update_all_sources()
-        
-        if not self.all_sources:
-            return []
-        
-        results = []
-        
-        for source in self.all_sources:
-            # টেক্সট পরিষ্কার করুন
-            cleaned_content = self.clean_text(source['content'])
-            cleaned_query = self.clean_text(query)
-            
-            # সরল কীওয়ার্ড ম্যাচিং
-            query_words = cleaned_query.split()
-            content_words = cleaned_content.split()
-            
-            # ম্যাচ স্কোর গণনা করুন
-            matches = sum(1 for word in query_words if word in content_words)
-            if matches > 0:
-                score = matches / len(query_words)
-                
-                # কনটেক্সট খুঁজে বের করুন
-                context = self.extract_context(source['content'], query, 200)
-                
-                results.append({
-                    'source': source['source'],
-                    'filename': source.get('filename', source.get('url', 'Unknown')),
-                    'score': score,
-                    'context': context,
-                    'full_content': source['content'][:500] + "..." if len(source['content']) > 500 else source['content'],
-                    'upload_time': source.get('upload_time', ''),
-                    'data': source.get('data', {})
-                })
-        
-        # স্কোর অনুযায়ী সাজান
-        results.sort(key=lambda x: x['score'], reverse=True)
-        return results[:top_k]
-    
-    def extract_context(self, text, query, context_length=200):
-        """কোয়েরির আশেপাশের কনটেক্সট এক্সট্র্যাক্ট করুন"""
-        query_lower = query.lower()
-        text_lower = text.lower()
-        
-        # কোয়েরির প্রথম ম্যাচ খুঁজুন
-        start_pos = text_lower.find(query_lower)
-        
-        if start_pos == -1:
-            # কোয়েরি শব্দগুলি খুঁজুন
-            query_words = query_lower.split()
-            for word in query_words:
-                pos = text_lower.find(word)
-                if pos != -1:
-                    start_pos = pos
-                    break
-        
-        if start_pos == -1:
-            return text[:context_length] + "..." if len(text) > context_length else text
-        
-        # কনটেক্সট এক্সট্র্যাক্ট করুন
-        start = max(0, start_pos - context_length // 2)
-        end = min(len(text), start_pos + len(query) + context_length // 2)
-        
-        context = text[start:end]
-        
-        if start > 0:
-            context = "..." + context
-        if end < len(text):
-            context = context + "..."
-        
-        return context
-    
-    def search_medicines(self, query, top_k=5):
-        """প্রশ্নের ভিত্তিতে ওষুধ খুঁজুন"""
-        if self.data is None or self.vectorizer is None:
-            return []
-        
-        # প্রশ্ন পরিষ্কার করুন
-        cleaned_query = self.clean_text(query)
-        
-        # প্রশ্নকে TF-IDF ভেক্টরে রূপান্তর করুন
-        query_vector = self.vectorizer.transform([cleaned_query])
-        
-        # সিমিলারিটি গণনা করুন
-        similarities = cosine_similarity(query_vector, self.tfidf_matrix).flatten()
-        
-        # শীর্ষ ম্যাচগুলি পান
-        top_indices = similarities.argsort()[-top_k:][::-1]
-        
-        results = []
-        for idx in top_indices:
-            if similarities[idx] > 0.05:  # ন্যূনতম সিমিলারিটি থ্রেশহোল্ড
-                medicine_info = self.data.iloc[idx].to_dict()
-                medicine_info['similarity_score'] = similarities[idx]
-                results.append(medicine_info)
-        
-        return results
-    
-    def get_medicine_details(self, medicine_name):
-        """নির্দিষ্ট ওষুধের বিস্তারিত তথ্য পান"""
-        if self.data is None:
-            return None
-        
-        # প্রথমে সঠিক ম্যাচ খুঁজুন
-        exact_match = self.data[self.data.iloc[:, 0].str.contains(medicine_name, case=False, na=False)]
-        
-        if len(exact_match) > 0:
-            return exact_match.iloc[0].to_dict()
-        
-        # সঠিক ম্যাচ না থাকলে ফাজি সার্চ ব্যবহার করুন
-        results = self.search_medicines(medicine_name, top_k=1)
-        if results:
-            return results[0]
-        
-        return None
-    
     def get_medicine_categories(self):
-        """ওষুধের ক্যাটাগরি পান"""
-        if self.data is None:
-            return []
-        
-        categories = []
-        for col in self.data.columns:
-            if col not in ['combined_text', 'cleaned_text']:
-                categories.append(col)
-        
-        return categories
-    
+        """ওষুধের ক্যাটাগরি পান (শেয়ার্ড সারির টেবিল থেকে)"""
+        return self.engine.record_columns()
+
     def filter_by_category(self, category, value):
-        """ক্যাটাগরি অনুযায়ী ফিল্টার করুন"""
-        if self.data is None or category not in self.data.columns:
-            return []
-        
-        filtered_data = self.data[self.data[category].astype(str).str.contains(value, case=False, na=False)]
-        return filtered_data.to_dict('records')
+        """ক্যাটাগরি অনুযায়ী ফিল্টার করুন (শেয়ার্ড সারির টেবিল থেকে)"""
+        return self.engine.filter_records(category, value)
+
 
 def main():
     st.set_page_config(
@@ -489,13 +120,13 @@ def main():
         st.header("🔧 অতিরিক্ত অপশন")
         
         # ডেটা তথ্য দেখান
-        if st.session_state.chatbot.data is not None:
+        if st.session_state.chatbot.engine.loaded:
             st.markdown('<div class="stats-card">', unsafe_allow_html=True)
-            st.metric("📊 মোট ওষুধ", len(st.session_state.chatbot.data))
+            st.metric("📊 মোট ওষুধ", len(st.session_state.chatbot.engine.records))
             st.markdown('</div>', unsafe_allow_html=True)
             
             st.markdown('<div class="stats-card">', unsafe_allow_html=True)
-            st.metric("📋 কলাম সংখ্যা", len(st.session_state.chatbot.data.columns))
+            st.metric("📋 কলাম সংখ্যা", len(st.session_state.chatbot.engine.record_columns()))
             st.markdown('</div>', unsafe_allow_html=True)
         
         # ফাইল আপলোড সেকশন
@@ -524,9 +155,7 @@ def main():
                 st.session_state.chatbot.add_api_data(api_url, api_key)
         with col2:
             if st.button("🗑️ সব মুছুন"):
-                st.session_state.chatbot.pdf_data = []
-                st.session_state.chatbot.word_data = []
-                st.session_state.chatbot.api_data = []
+                st.session_state.chatbot.clear_uploaded_files()
                 st.success("✅ সব ডেটা মুছে ফেলা হয়েছে")
         
         # আপলোড করা ফাইল দেখান
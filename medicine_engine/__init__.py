@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+💊 Medicine Engine - চ্যাটবটের সার্চ ইঞ্জিনের সাধারণ অংশ
+Streamlit ছাড়াই ব্যবহারযোগ্য ইনডেক্স ও সার্চ টুলস
+"""
+
+from .api_connector import ApiConnector, ConnectorRegistry, find_records, flatten_record
+from .blob_store import BlobStore
+from .cache import QueryCache, next_data_version, normalize_query
+from .data_source import ExtractionCache, load_document_folder
+from .excel_stream import ExcelRow, RowSource, iter_excel_rows
+from .fuzzy import SymSpellIndex, edit_distance
+from .import_timing import measure_import_time, package_totals, parse_importtime
+from .incremental import FittedTfidf, IncrementalTfidf, TfidfOverlay
+from .ingest import IngestionPool, IngestJob, extract_docx_paragraphs, extract_pdf_pages
+from .inverted_index import InvertedIndex
+from .name_index import NameIndex, normalize_name
+from .passages import join_pages, split_passages
+from .pdf_backends import (
+    DEFAULT_PDF_BACKEND, PDF_BACKENDS, PdfBackend, available_pdf_backends, benchmark_backends, get_pdf_backend
+)
+from .retrieval import l2_normalize_rows, sparse_top_k, top_k_rows
+from .scoring import SCORERS, BM25Scorer, KeywordScorer, get_scorer
+from .service import JsonService, LatencyStats, ServiceError, to_jsonable
+from .shared import SharedEngineRegistry, file_fingerprint
+from .shared_index import FrozenIndex, FrozenMap, FrozenPairs, RecordTable, SharedIndex
+from .snapshot import EngineSnapshot
+from .table_format import read_table, sniff_table_format
+from .text_store import StoredPassage, TextStore, byte_spans, store_passages
+
+__all__ = [
+    'DEFAULT_PDF_BACKEND',
+    'PDF_BACKENDS',
+    'SCORERS',
+    'ApiConnector',
+    'BM25Scorer',
+    'BlobStore',
+    'ConnectorRegistry',
+    'EngineSnapshot',
+    'ExcelRow',
+    'ExtractionCache',
+    'FittedTfidf',
+    'FrozenIndex',
+    'FrozenMap',
+    'FrozenPairs',
+    'IncrementalTfidf',
+    'IngestJob',
+    'IngestionPool',
+    'InvertedIndex',
+    'JsonService',
+    'KeywordScorer',
+    'LatencyStats',
+    'NameIndex',
+    'PdfBackend',
+    'QueryCache',
+    'RecordTable',
+    'RowSource',
+    'ServiceError',
+    'SharedEngineRegistry',
+    'SharedIndex',
+    'StoredPassage',
+    'SymSpellIndex',
+    'TextStore',
+    'TfidfOverlay',
+    'available_pdf_backends',
+    'benchmark_backends',
+    'byte_spans',
+    'edit_distance',
+    'extract_docx_paragraphs',
+    'extract_pdf_pages',
+    'file_fingerprint',
+    'find_records',
+    'flatten_record',
+    'get_pdf_backend',
+    'get_scorer',
+    'iter_excel_rows',
+    'join_pages',
+    'l2_normalize_rows',
+    'load_document_folder',
+    'measure_import_time',
+    'next_data_version',
+    'normalize_name',
+    'normalize_query',
+    'package_totals',
+    'parse_importtime',
+    'read_table',
+    'sparse_top_k',
+    'sniff_table_format',
+    'split_passages',
+    'store_passages',
+    'to_jsonable',
+    'top_k_rows',
+]
@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+"""
+🌐 API ডেটা কানেক্টর
+- প্রসেস-ব্যাপী একটি pooled keep-alive requests.Session (প্রতি কলে নতুন TCP/TLS সংযোগ নয়)
+- ETag / Last-Modified দিয়ে শর্তসাপেক্ষ রিফেচ: ডেটা না বদলালে সার্ভার 304 দেয়, কিছুই ডাউনলোড বা পার্স হয় না
+- পেজিনেশন: Link হেডার, JSON এর next URL অথবা cursor - একবারে একটি পেজ মেমরিতে
+  (next URL অন্য হোস্টে গেলে সেখানে API key/Authorization পাঠানো হয় না)
+- JSON রেকর্ডগুলো সমতল (flatten) করে আলাদা সারি হিসেবে ইনডেক্স করা যায়
+- ব্যাকগ্রাউন্ড থ্রেডে নির্দিষ্ট সময় পরপর শুধু প্রথম পেজ দিয়ে পরিবর্তন যাচাই (version বাড়ে);
+  নতুন রেকর্ড পরে iter_records দিয়ে সরাসরি ইনডেক্সে স্ট্রিম করা হয়, পুরো লিস্ট কোথাও জমে না
+- ConnectorRegistry: প্রসেসে URL প্রতি একটি কানেক্টর ও একটি রিফ্রেশ থ্রেড, কোনো সেশন না থাকলে থেমে যায়
+"""
+
+import threading
+import weakref
+from urllib.parse import urljoin, urlsplit
+
+# প্রতিটি রিকোয়েস্টের টাইমআউট (সেকেন্ড)
+DEFAULT_TIMEOUT = 10
+
+# একটি ফেচে সর্বোচ্চ কতগুলো পেজ (ভুল next লিংকে অসীম লুপ এড়াতে)
+MAX_PAGES = 1000
+
+# হোস্ট প্রতি কতগুলো keep-alive সংযোগ রাখা হয়
+POOL_SIZE = 10
+
+# রেকর্ডের লিস্ট সাধারণত এই কী গুলোর নিচে থাকে
+RECORD_KEYS = ('data', 'results', 'items', 'records', 'medicines')
+
+# পরের পেজের URL / cursor এর কী (সরাসরি অথবা 'links', 'meta', 'pagination' এর ভেতরে)
+NEXT_URL_KEYS = ('next', 'next_url', 'nextUrl', 'next_page_url')
+CURSOR_KEYS = ('next_cursor', 'nextCursor')
+PAGINATION_KEYS = ('links', 'meta', 'pagination', 'paging')
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """প্রসেস-ব্যাপী pooled requests.Session (প্রথম কলে তৈরি হয়)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            retry = Retry(
+                total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(['GET'])
+            )
+            adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry)
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _session = session
+        return _session
+
+
+def flatten_record(value, prefix='', out=None):
+    """
+    নেস্টেড JSON → এক স্তরের dict: {'price': {'mrp': 10}} → {'price.mrp': 10}
+    স্কেলারের লিস্ট কমা দিয়ে জোড়া লাগে, dict এর লিস্ট ইনডেক্স সহ ('brands.0.name')
+    """
+    out = {} if out is None else out
+    if isinstance(value, dict):
+        for key, item in value.items():
+            flatten_record(item, f"{prefix}.{key}" if prefix else str(key), out)
+    elif isinstance(value, list):
+        if all(not isinstance(item, (dict, list)) for item in value):
+            out[prefix or 'value'] = ', '.join(str(item) for item in value if item is not None)
+        else:
+            for position, item in enumerate(value):
+                flatten_record(item, f"{prefix}.{position}" if prefix else str(position), out)
+    else:
+        out[prefix or 'value'] = value
+    return out
+
+
+def find_records(payload):
+    """একটি পেজের JSON থেকে রেকর্ডের লিস্ট (লিস্ট না পেলে পুরো পেজটিই একটি রেকর্ড)"""
+    if isinstance(payload, list):
+        return payload
+    if not isinstance(payload, dict):
+        return [payload]
+    for key in RECORD_KEYS:
+        value = payload.get(key)
+        if isinstance(value, list):
+            return value
+        if isinstance(value, dict):
+            # যেমন {'data': {'items': [...]}} অথবা {'data': {একটি রেকর্ড}}
+            return find_records(value)
+    for value in payload.values():
+        if isinstance(value, list) and value and all(isinstance(item, dict) for item in value):
+            return value
+    return [payload]
+
+
+def _pagination_value(payload, keys):
+    if not isinstance(payload, dict):
+        return None
+    for container in [payload] + [payload.get(key) for key in PAGINATION_KEYS]:
+        if not isinstance(container, dict):
+            continue
+        for key in keys:
+            value = container.get(key)
+            if isinstance(value, (str, int)) and not isinstance(value, bool) and value != '':
+                return value
+    return None
+
+
+def same_origin(url, other):
+    """দুটি URL এর scheme, হোস্ট ও পোর্ট একই কিনা (ক্রেডেনশিয়াল শুধু একই origin এ যায়)"""
+    first, second = urlsplit(url), urlsplit(other)
+    return (first.scheme, first.hostname, first.port) == (second.scheme, second.hostname, second.port)
+
+
+def next_page(response, payload, url, params):
+    """পরের পেজের (url, params) অথবা None"""
+    link = response.links.get('next', {}).get('url')
+    if link:
+        return urljoin(response.url or url, link), None
+    next_url = _pagination_value(payload, NEXT_URL_KEYS)
+    if isinstance(next_url, str):
+        return urljoin(response.url or url, next_url), None
+    cursor = _pagination_value(payload, CURSOR_KEYS)
+    if cursor is not None:
+        return url, {**(params or {}), 'cursor': cursor}
+    return None
+
+
+class ApiConnector:
+    """
+    একটি API endpoint এর ডেটা ফেচ/রিফ্রেশ করে
+    শর্তসাপেক্ষ রিকোয়েস্ট শুধু প্রথম পেজে: প্রথম পেজ না বদলালে (304) পুরো ডেটা অপরিবর্তিত ধরা হয়
+    version: check() নতুন ডেটা পেলে বাড়ে - ইনডেক্স যে version থেকে তৈরি তার সাথে মিলিয়ে রিস্ট্রিম করুন
+    """
+
+    def __init__(self, url, api_key=None, session=None, timeout=DEFAULT_TIMEOUT, max_pages=MAX_PAGES):
+        self.url = url
+        self.api_key = api_key
+        self.session = session
+        self.timeout = timeout
+        self.max_pages = max_pages
+        self.etag = None
+        self.last_modified = None
+        self.last_status = None   # শেষ ফেচের প্রথম পেজের HTTP স্ট্যাটাস
+        self.pages_fetched = 0    # শেষ ফেচে কতগুলো পেজ ডাউনলোড হয়েছে
+        self.error = None         # শেষ ব্যাকগ্রাউন্ড রিফ্রেশের ত্রুটি
+        self.version = 0
+        self._lock = threading.Lock()
+        self._stop = None
+        self._thread = None
+
+    def headers(self, conditional=False, credentials=True):
+        """রিকোয়েস্টের হেডার; conditional হলে আগের ETag/Last-Modified সহ, credentials=False হলে API key ছাড়া"""
+        headers = {'Accept': 'application/json'}
+        if self.api_key and credentials:
+            headers['Authorization'] = f'Bearer {self.api_key}'
+            headers['X-API-Key'] = self.api_key
+        if conditional:
+            if self.etag:
+                headers['If-None-Match'] = self.etag
+            if self.last_modified:
+                headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def iter_pages(self, conditional=True):
+        """
+        প্রতিটি পেজের রেকর্ডের লিস্ট একটি একটি করে (ডেটা না বদলালে কিছুই yield হয় না)
+        সব পেজ সফলভাবে পড়া শেষ হলে তবেই নতুন ETag/Last-Modified রাখা হয়
+        """
+        session = self.session or get_session()
+        url, params = self.url, None
+        validators = None
+        self.pages_fetched = 0
+        for page in range(self.max_pages):
+            headers = self.headers(conditional and page == 0, credentials=same_origin(self.url, url))
+            response = session.get(url, params=params, headers=headers, timeout=self.timeout)
+            if page == 0:
+                self.last_status = response.status_code
+                if response.status_code == 304:
+                    return
+            response.raise_for_status()
+            if page == 0:
+                validators = (response.headers.get('ETag'), response.headers.get('Last-Modified'))
+            payload = response.json()
+            self.pages_fetched += 1
+            yield find_records(payload)
+            following = next_page(response, payload, url, params)
+            if following is None or following == (url, params):
+                break
+            url, params = following
+        self.etag, self.last_modified = validators
+
+    def iter_records(self, conditional=True):
+        """সমতল করা রেকর্ডগুলো একটি একটি করে"""
+        for records in self.iter_pages(conditional):
+            for record in records:
+                yield flatten_record(record)
+
+    def check(self):
+        """
+        শর্তসাপেক্ষে শুধু প্রথম পেজ চেয়ে দেখুন ডেটা বদলেছে কিনা (না বদলালে সার্ভার 304 দেয়, কিছু পার্স হয় না)
+        বদলালে নতুন ETag/Last-Modified রেখে version বাড়ায় এবং True ফেরত দেয়
+        """
+        session = self.session or get_session()
+        response = session.get(self.url, headers=self.headers(conditional=True), timeout=self.timeout)
+        self.last_status = response.status_code
+        if response.status_code == 304:
+            return False
+        response.raise_for_status()
+        with self._lock:
+            self.etag, self.last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+            self.version += 1
+        return True
+
+    def start_refresh(self, interval, keep_running=None):
+        """
+        interval সেকেন্ড পরপর ব্যাকগ্রাউন্ড থ্রেডে check() (আগে চলতে থাকলে সেটি বন্ধ হয়)
+        keep_running: প্রতিবার check এর আগে ডাকা হয়, False দিলে থ্রেড থেমে যায়
+        """
+        self.stop_refresh()
+        stop = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                if keep_running is not None and not keep_running():
+                    break
+                try:
+                    self.check()
+                    self.error = None
+                except Exception as e:
+                    self.error = str(e)
+
+        self._stop = stop
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+
+    def stop_refresh(self):
+        """ব্যাকগ্রাউন্ড রিফ্রেশ বন্ধ করুন"""
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
+            self._thread = None
+
+    @property
+    def refreshing(self):
+        return self._thread is not None and self._thread.is_alive()
+
+
+class ConnectorRegistry:
+    """
+    প্রসেস-ব্যাপী API কানেক্টর: একই (URL, API key) এর জন্য একটি কানেক্টর ও একটি রিফ্রেশ থ্রেড
+    সেশনগুলো subscribe করে (weakref হিসেবে রাখা হয়); শেষ সেশন unsubscribe করলে সাথে সাথে,
+    আর সেশন মুছে গেলে (garbage collect) পরের রিফ্রেশের সময় থ্রেড থেমে যায় -
+    তাই পরিত্যক্ত ব্রাউজার সেশন আপস্ট্রিম API পোল করতে থাকে না
+    """
+
+    def __init__(self, factory=ApiConnector):
+        self.factory = factory
+        self._lock = threading.Lock()
+        self._entries = {}   # (url, api_key) -> (connector, subscriber WeakSet)
+
+    def subscribe(self, owner, url, api_key=None, refresh_interval=None):
+        """
+        owner এর জন্য URL এর শেয়ার্ড কানেক্টর দিন (না থাকলে তৈরি হয়)
+        refresh_interval দিলে এবং রিফ্রেশ না চললে ব্যাকগ্রাউন্ড রিফ্রেশ শুরু হয়; আবার ডাকলে ক্ষতি নেই
+        """
+        key = (url, api_key or None)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = (self.factory(url, api_key), weakref.WeakSet())
+            connector, owners = entry
+            owners.add(owner)
+            if refresh_interval and not connector.refreshing:
+                connector.start_refresh(refresh_interval, keep_running=lambda: self._active(key, connector))
+        return connector
+
+    def unsubscribe(self, owner, connector):
+        """owner আর এই কানেক্টর ব্যবহার করে না; কেউ না থাকলে রিফ্রেশ বন্ধ ও কানেক্টর সরানো হয়"""
+        with self._lock:
+            for key, (registered, owners) in list(self._entries.items()):
+                if registered is connector:
+                    owners.discard(owner)
+                    if not owners:
+                        self._remove(key)
+
+    def _active(self, key, connector):
+        """রিফ্রেশ থ্রেড চলবে কিনা - সব subscriber চলে গেলে কানেক্টর সরিয়ে False"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] is not connector:
+                return False
+            if not entry[1]:
+                self._remove(key)
+                return False
+            return True
+
+    def _remove(self, key):
+        connector, _ = self._entries.pop(key)
+        connector.stop_refresh()
+
+    def subscribers(self, connector):
+        """এই কানেক্টরের বর্তমান subscriber সংখ্যা"""
+        with self._lock:
+            for registered, owners in self._entries.values():
+                if registered is connector:
+                    return len(owners)
+        return 0
+
+    def __len__(self):
+        return len(self._entries)
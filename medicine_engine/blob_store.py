@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+🗄️ কনটেন্ট-অ্যাড্রেসড আপলোড স্টোর
+প্রতিটি ফাইলের bytes একবারই সেভ হয়: blobs/<sha256 এর প্রথম ২ অক্ষর>/<sha256><ext>
+manifest.json এ প্রতিটি blob এর জন্য আপলোডের নাম ও সময়ের তালিকা থাকে
+একই bytes আবার আপলোড হলে শুধু manifest এ নাম/সময় যোগ হয়, নতুন ফাইল লেখা হয় না
+একাধিক প্রসেস একই ফোল্ডারে লিখতে পারে: প্রতিটি put ফাইল লক ধরে ডিস্কের manifest আবার পড়ে, মিলিয়ে লেখে
+
+পুরনো '<timestamp>_<name>' ফাইলগুলো স্টোরে আনতে:
+    python -m medicine_engine.blob_store migrate "data source"
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: শুধু এই প্রসেসের থ্রেডগুলোর মধ্যে লক
+    fcntl = None
+
+MANIFEST_VERSION = 1
+MANIFEST_NAME = 'manifest.json'
+LOCK_NAME = 'manifest.lock'
+BLOB_DIR = 'blobs'
+
+
+def _atomic_write(path, data):
+    """tmp ফাইলে লিখে os.replace (অর্ধেক লেখা ফাইল কখনো দেখা যাবে না)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class BlobStore:
+    """SHA-256 দিয়ে সাজানো আপলোড ফাইল এবং নাম/সময়ের manifest"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.manifest_path = self.root / MANIFEST_NAME
+        self._lock = threading.Lock()
+        self._manifest = None
+        self._stamp = None   # পড়া manifest ফাইলের (inode, mtime, size)
+
+    def _file_stamp(self):
+        try:
+            stat = os.stat(self.manifest_path)
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _load(self):
+        """manifest; ডিস্কের ফাইল বদলে থাকলে (অন্য প্রসেসের put) আবার পড়া হয়"""
+        stamp = self._file_stamp()
+        if self._manifest is None or stamp != self._stamp:
+            try:
+                with open(self.manifest_path, encoding='utf-8') as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                manifest = {}
+            if manifest.get('version') != MANIFEST_VERSION:
+                manifest = {'version': MANIFEST_VERSION, 'blobs': {}}
+            self._manifest = manifest
+            self._stamp = stamp
+        return self._manifest
+
+    def _save(self):
+        data = json.dumps(self._manifest, ensure_ascii=False, indent=1).encode('utf-8')
+        _atomic_write(self.manifest_path, data)
+        self._stamp = self._file_stamp()
+
+    @contextmanager
+    def _manifest_lock(self):
+        """manifest পড়া-মেলানো-লেখার সময় অন্য প্রসেসকে অপেক্ষা করান (fcntl না থাকলে শুধু থ্রেড লক)"""
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / LOCK_NAME, 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def blob_path(self, digest):
+        """blob এর absolute path (manifest এ না থাকলে None)"""
+        with self._lock:
+            entry = self._load()['blobs'].get(digest)
+        return self.root / entry['path'] if entry else None
+
+    def __contains__(self, digest):
+        return self.blob_path(digest) is not None
+
+    def entries(self):
+        """[(sha256, manifest এন্ট্রি)] - প্রথম আপলোডের সময় অনুযায়ী সাজানো"""
+        with self._lock:
+            blobs = dict(self._load()['blobs'])
+        return sorted(blobs.items(), key=lambda item: (item[1]['uploads'][0]['uploaded_at'], item[0]))
+
+    def put(self, data, name, uploaded_at=None):
+        """
+        bytes সেভ করুন (না থাকলে), manifest এ নাম/সময় যোগ করুন
+        লক ধরে ডিস্কের সর্বশেষ manifest এর উপর যোগ হয়, তাই অন্য প্রসেসের একই সময়ের put হারায় না
+        ফেরত দেয়: (sha256, blob path, নতুন কিনা)
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        uploaded_at = uploaded_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock, self._manifest_lock():
+            blobs = self._load()['blobs']
+            entry = blobs.get(digest)
+            created = entry is None
+            if created:
+                ext = Path(name).suffix.lower()
+                entry = {
+                    'path': f"{BLOB_DIR}/{digest[:2]}/{digest}{ext}",
+                    'size': len(data),
+                    'uploads': []
+                }
+                _atomic_write(self.root / entry['path'], data)
+                blobs[digest] = entry
+            upload = {'name': name, 'uploaded_at': uploaded_at}
+            if upload not in entry['uploads']:
+                entry['uploads'].append(upload)
+            self._save()
+        return digest, self.root / entry['path'], created
+
+    def migrate(self, folder, name_parser):
+        """
+        ফোল্ডারের পুরনো ফাইলগুলো স্টোরে সরান; হুবহু একই bytes এর কপিগুলো একটি blob হয়ে যায়
+        name_parser: ফাইলের নাম → (আসল নাম, আপলোডের সময় অথবা None)
+        ফেরত দেয়: (সরানো ফাইল, মুছে ফেলা ডুপ্লিকেট) সংখ্যা
+        """
+        moved = duplicates = 0
+        for path in sorted(Path(folder).iterdir()):
+            if not path.is_file() or path.name in (MANIFEST_NAME, LOCK_NAME):
+                continue
+            name, uploaded_at = name_parser(path.name)
+            if uploaded_at is None:
+                uploaded_at = datetime.fromtimestamp(path.stat().st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+            data = path.read_bytes()
+            _, blob, created = self.put(data, name, uploaded_at)
+            # blob লেখা/যাচাই হওয়ার পরেই আসল ফাইল সরানো হয়
+            if blob.read_bytes() == data:
+                path.unlink()
+                if created:
+                    moved += 1
+                else:
+                    duplicates += 1
+        return moved, duplicates
+
+
+def main(argv=None):
+    from .data_source import split_saved_name
+
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2 or argv[0] != 'migrate':
+        print('ব্যবহার: python -m medicine_engine.blob_store migrate <ফোল্ডার>')
+        return 2
+    moved, duplicates = BlobStore(argv[1]).migrate(argv[1], split_saved_name)
+    print(f"✅ {moved} টি ফাইল স্টোরে সরানো হয়েছে, {duplicates} টি ডুপ্লিকেট মুছে ফেলা হয়েছে")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+🗃️ কোয়েরি রেজাল্ট ক্যাশ (LRU)
+কী তে ডেটা-ভার্সন থাকে, তাই সোর্স যোগ/মুছলে পুরনো ফলাফল আর মেলে না
+"""
+
+import itertools
+import threading
+import unicodedata
+from collections import OrderedDict
+
+# প্রসেস-ব্যাপী ডেটা-ভার্সন কাউন্টার; প্রতিটি পরিবর্তনে নতুন (ইউনিক) নম্বর
+_versions = itertools.count(1)
+
+
+def next_data_version():
+    """নতুন ডেটা-ভার্সন নম্বর দিন"""
+    return next(_versions)
+
+
+def normalize_query(query):
+    """ক্যাশ কী এর জন্য কোয়েরি: Unicode NFC এবং অতিরিক্ত স্পেস বাদ"""
+    return ' '.join(unicodedata.normalize('NFC', str(query)).split())
+
+
+class QueryCache:
+    """থ্রেড-সেফ সীমিত আকারের LRU ক্যাশ, hit/miss কাউন্টার সহ"""
+
+    def __init__(self, maxsize=512):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def get_or_compute(self, key, compute):
+        """ক্যাশে থাকলে সেটাই, না থাকলে compute() চালিয়ে রাখুন"""
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def stats(self):
+        """hit/miss পরিসংখ্যান"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._items),
+                'maxsize': self.maxsize,
+                'hit_rate': self.hits / total if total else 0.0,
+            }
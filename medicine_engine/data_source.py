@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+📚 'data source' ফোল্ডারের PDF/Word ফাইল স্টার্টআপে ইনডেক্স করা
+এক্সট্রাক্ট করা প্যাসেজ ও token গণনা ডিস্কে ক্যাশ হয় (কী: ফাইলের SHA-256)
+তাই প্রতিটি ফাইল একবারই পার্স হয়, পরের রিস্টার্টে শুধু ক্যাশ পড়া হয়
+একই bytes এর একাধিক কপি (স্টোরের blob বা পুরনো ফাইল) একবারই ইনডেক্স হয়
+"""
+
+import json
+import os
+import re
+import tempfile
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+from .blob_store import BlobStore
+from .ingest import extract_docx_paragraphs
+from .passages import join_pages, split_passages
+from .pdf_backends import get_pdf_backend
+from .shared import file_fingerprint
+from .text_store import store_passages
+
+# ক্যাশের ফরম্যাট বা টোকেনাইজার বদলালে বাড়ান - পুরনো এন্ট্রি আবার তৈরি হবে
+CACHE_VERSION = 2
+
+DOCUMENT_TYPES = {'.pdf': 'PDF', '.docx': 'Word'}
+
+# save_uploaded_file_to_data_source এর নাম: <YYYYmmdd_HHMMSS>_<আসল নাম>
+_TIMESTAMP_PREFIX = re.compile(r'^(\d{8}_\d{6})_(.+)$')
+
+
+def split_saved_name(filename):
+    """সেভ করা ফাইলের নাম থেকে (আসল নাম, আপলোডের সময় অথবা None)"""
+    match = _TIMESTAMP_PREFIX.match(filename)
+    if not match:
+        return filename, None
+    try:
+        stamp = datetime.strptime(match.group(1), "%Y%m%d_%H%M%S")
+    except ValueError:
+        return filename, None
+    return match.group(2), stamp.strftime("%Y-%m-%d %H:%M:%S")
+
+
+class ExtractionCache:
+    """SHA-256 → এক্সট্রাক্ট করা প্যাসেজ ও token গণনা (প্রতি ফাইলে একটি JSON)"""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+
+    def path_for(self, digest):
+        return self.cache_dir / f"{digest}.json"
+
+    def get(self, digest):
+        """ক্যাশ এন্ট্রি, না থাকলে বা পুরনো ভার্সন হলে None"""
+        try:
+            with open(self.path_for(digest), encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('version') != CACHE_VERSION:
+            return None
+        return entry
+
+    def put(self, digest, entry):
+        """অ্যাটমিকভাবে লিখুন (অর্ধেক লেখা ফাইল কখনো পড়া হবে না)"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path_for(digest))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+def extract_document(path, file_type, tokenize, pdf_backend=None):
+    """
+    একটি PDF/Word ফাইল পার্স করে ক্যাশ এন্ট্রি: পুরো টেক্সট + প্যাসেজের অবস্থান ও token গণনা
+    (প্যাসেজগুলো ওভারল্যাপ করে, তাই টেক্সট একবারই রাখা হয়)
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    backend = None
+    if file_type == 'PDF':
+        backend = get_pdf_backend(pdf_backend)
+        pages = backend.extract_pages(data)
+        text, page_starts = join_pages(pages)
+    else:
+        pages = extract_docx_paragraphs(data)
+        text, page_starts = "\n".join(pages), None
+
+    passages = []
+    if text.strip():
+        for passage in split_passages(text, page_starts):
+            passage['terms'] = dict(Counter(tokenize(passage.pop('text'))))
+            passages.append(passage)
+    return {
+        'version': CACHE_VERSION, 'file_type': file_type, 'pdf_backend': backend and backend.name,
+        'text': text, 'passages': passages
+    }
+
+
+def folder_files(folder):
+    """
+    ফোল্ডারের PDF/Word ফাইল: [(path, sha256, আসল নাম, আপলোডের সময়)]
+    আগে কনটেন্ট-অ্যাড্রেসড স্টোরের blob, তারপর পুরনো '<timestamp>_<name>' ফাইল;
+    একই bytes এর একাধিক কপি হলে শুধু প্রথমটি
+    """
+    folder = Path(folder)
+    files = []
+    seen = set()
+    for digest, entry in BlobStore(folder).entries():
+        first = entry['uploads'][0]
+        if digest not in seen:
+            seen.add(digest)
+            files.append((folder / entry['path'], digest, first['name'], first['uploaded_at']))
+
+    for path in sorted(folder.iterdir()):
+        if path.suffix.lower() not in DOCUMENT_TYPES or not path.is_file():
+            continue
+        digest = file_fingerprint(path)[2]
+        if digest in seen:
+            continue
+        seen.add(digest)
+        name, upload_time = split_saved_name(path.name)
+        if upload_time is None:
+            upload_time = datetime.fromtimestamp(path.stat().st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+        files.append((path, digest, name, upload_time))
+    return files
+
+
+def load_document_folder(folder, tokenize, cache, text_store=None, pdf_backend=None):
+    """
+    ফোল্ডারের সব PDF/Word ফাইলের প্যাসেজ (প্রতিটি কনটেন্ট একবারই)
+    ফেরত দেয়: [(সোর্স, token গণনা)] - ইনডেক্সে সরাসরি যোগ করার মত
+    text_store দিলে টেক্সট শেয়ার্ড স্টোরে থাকে এবং সোর্সগুলো StoredPassage; না দিলে 'content' সহ dict
+    pdf_backend বদলালে PDF গুলো নতুন ব্যাকএন্ড দিয়ে আবার এক্সট্রাক্ট হয়
+    """
+    if not Path(folder).is_dir():
+        return []
+
+    documents = []
+    for path, digest, name, upload_time in folder_files(folder):
+        file_type = DOCUMENT_TYPES.get(Path(name).suffix.lower()) or DOCUMENT_TYPES.get(path.suffix.lower())
+        if file_type is None:
+            continue
+        entry = cache.get(digest)
+        if entry is not None and file_type == 'PDF' and entry.get('pdf_backend') != get_pdf_backend(pdf_backend).name:
+            entry = None
+        if entry is None:
+            try:
+                entry = extract_document(path, file_type, tokenize, pdf_backend)
+            except Exception:
+                # নষ্ট ফাইল বাকি ফোল্ডারের লোড আটকাবে না
+                continue
+            cache.put(digest, entry)
+
+        file = {
+            'source': file_type,
+            'filename': name,
+            'upload_time': upload_time,
+            'saved_path': str(path),
+            'sha256': digest
+        }
+        passages = entry['passages']
+        if text_store is not None:
+            sources = store_passages(text_store, entry['text'], passages, file)
+        else:
+            sources = [{
+                **file,
+                'content': entry['text'][passage['offset']:passage['offset'] + passage['length']],
+                'page': passage['page'],
+                'offset': passage['offset'],
+                'length': passage['length'],
+                'passage_index': passage_index
+            } for passage_index, passage in enumerate(passages)]
+        documents.extend((source, passage['terms']) for source, passage in zip(sources, passages))
+    return documents
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+📊 স্ট্রিমিং Excel রিডার
+শিটের XML থেকে সারি একটি একটি করে পড়া হয় - পুরো DataFrame, টেক্সট blob বা
+প্রতি সারির dict কখনো একসাথে মেমরিতে থাকে না
+প্রতিটি সারি একটি ছোট ExcelRow: সব সারি একই হেডার tuple শেয়ার করে, সারিতে শুধু মানের tuple
+"""
+
+import io
+import math
+from collections.abc import Mapping
+
+from .table_format import read_table, sniff_table_format
+
+
+def is_blank(value):
+    """খালি সেল: None, NaN বা শুধু স্পেস"""
+    if value is None:
+        return True
+    if isinstance(value, float) and math.isnan(value):
+        return True
+    return isinstance(value, str) and not value.strip()
+
+
+class ExcelRow(Mapping):
+    """শুধু-পড়ার সারি: হেডার → মান (dict এর মত ব্যবহার করা যায়, কিন্তু সারিপ্রতি dict নেই)"""
+
+    __slots__ = ('header', 'cells')
+
+    def __init__(self, header, cells):
+        self.header = header
+        self.cells = cells
+
+    def __getitem__(self, key):
+        try:
+            return self.cells[self.header.index(key)]
+        except ValueError:
+            raise KeyError(key) from None
+
+    def __iter__(self):
+        return iter(self.header)
+
+    def __len__(self):
+        return len(self.header)
+
+    def items(self):
+        return zip(self.header, self.cells)
+
+    def text(self):
+        """সারির খালি নয় এমন মানগুলো স্পেস দিয়ে জোড়া (ইনডেক্সের content)"""
+        return ' '.join(str(value) for value in self.cells if not is_blank(value))
+
+    def __repr__(self):
+        return f"ExcelRow({dict(self.items())!r})"
+
+
+
+class RowSource(Mapping):
+    """
+    ইনডেক্সে রাখা একটি Excel সারি - সোর্স dict এর মত পড়া যায়
+    ফাইলের তথ্য (source, filename, upload_time) সব সারি একটি dict শেয়ার করে
+    content জমা থাকে না, যখন দরকার data থেকে তৈরি হয় (সারির মান একবারই মেমরিতে)
+    """
+
+    __slots__ = ('file', 'row_index', 'data')
+
+    KEYS = ('source', 'filename', 'upload_time', 'row_index', 'data', 'content')
+
+    def __init__(self, file, row_index, data):
+        self.file = file
+        self.row_index = row_index
+        self.data = data
+
+    @property
+    def content(self):
+        """ইনডেক্সের টেক্সট (সারির খালি নয় এমন মানগুলো)"""
+        return self.data.text()
+
+    def __getitem__(self, key):
+        if key in ('row_index', 'data', 'content'):
+            return getattr(self, key)
+        return self.file[key]
+
+    def __iter__(self):
+        return (key for key in self.KEYS if key in self)
+
+    def __contains__(self, key):
+        return key in ('row_index', 'data', 'content') or key in self.file
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+def make_header(cells):
+    """হেডার সারি থেকে কলামের নাম (pandas এর মত: খালি হলে 'Unnamed: i', ডুপ্লিকেট হলে 'নাম.1')"""
+    names = []
+    seen = {}
+    for position, cell in enumerate(cells):
+        name = f"Unnamed: {position}" if is_blank(cell) else str(cell).strip()
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return tuple(names)
+
+
+MAIN_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+PKG_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+
+def _part_path(target):
+    """relationship এর Target → zip এর ভেতরের path"""
+    return target.lstrip('/') if target.startswith('/') else f"xl/{target}"
+
+
+def _workbook_parts(archive):
+    """প্রথম শিট, shared strings ও styles এর path এবং 1904 তারিখ-পদ্ধতি কিনা"""
+    from xml.etree.ElementTree import fromstring
+
+    workbook = fromstring(archive.read('xl/workbook.xml'))
+    rels = fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+    targets = {rel.get('Id'): rel for rel in rels.iter(f'{PKG_REL_NS}Relationship')}
+    by_type = {rel.get('Type').rsplit('/', 1)[-1]: _part_path(rel.get('Target')) for rel in targets.values()}
+
+    first_sheet = next(workbook.iter(f'{MAIN_NS}sheet'))
+    sheet = _part_path(targets[first_sheet.get(f'{REL_NS}id')].get('Target'))
+    properties = workbook.find(f'{MAIN_NS}workbookPr')
+    date1904 = properties is not None and properties.get('date1904') in ('1', 'true')
+    return sheet, by_type.get('sharedStrings'), by_type.get('styles'), date1904
+
+
+def _shared_strings(archive, path):
+    """shared strings টেবিল (সব শিট এই লিস্টের index ব্যবহার করে)"""
+    from xml.etree.ElementTree import iterparse
+
+    strings = []
+    if path is None or path not in archive.namelist():
+        return strings
+    with archive.open(path) as f:
+        for _, element in iterparse(f):
+            if element.tag == f'{MAIN_NS}si':
+                # rich text এর run গুলো জোড়া লাগে, ফোনেটিক (rPh) অংশ বাদ
+                strings.append(''.join(
+                    (child.text if child.tag == f'{MAIN_NS}t' else child.findtext(f'{MAIN_NS}t')) or ''
+                    for child in element if child.tag in (f'{MAIN_NS}t', f'{MAIN_NS}r')
+                ))
+                element.clear()
+    return strings
+
+
+def _date_styles(archive, path):
+    """যেসব cell style index তারিখ/সময় ফরম্যাট"""
+    from xml.etree.ElementTree import fromstring
+    from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format
+
+    if path is None or path not in archive.namelist():
+        return set()
+    styles = fromstring(archive.read(path))
+    formats = dict(BUILTIN_FORMATS)
+    for fmt in styles.iter(f'{MAIN_NS}numFmt'):
+        formats[int(fmt.get('numFmtId'))] = fmt.get('formatCode', '')
+    cell_xfs = styles.find(f'{MAIN_NS}cellXfs')
+    if cell_xfs is None:
+        return set()
+    return {
+        index for index, xf in enumerate(cell_xfs.findall(f'{MAIN_NS}xf'))
+        if is_date_format(formats.get(int(xf.get('numFmtId', 0)), ''))
+    }
+
+
+def _cell_value(cell, strings, date_styles, epoch):
+    """একটি <c> এলিমেন্টের মান (ফর্মুলা হলে শেষ হিসাব করা মান)"""
+    kind = cell.get('t', 'n')
+    if kind == 'inlineStr':
+        return ''.join(t.text or '' for t in cell.iter(f'{MAIN_NS}t'))
+    value = cell.findtext(f'{MAIN_NS}v')
+    if not value:
+        # হিসাব না করা ফর্মুলার <v> খালি থাকে
+        return None
+    if kind == 's':
+        return strings[int(value)]
+    if kind == 'b':
+        return value == '1'
+    if kind in ('str', 'e'):
+        return value
+    number = float(value) if any(c in value for c in '.eE') else int(value)
+    if int(cell.get('s', 0)) in date_styles:
+        from openpyxl.utils.datetime import from_excel
+        return from_excel(number, epoch)
+    return number
+
+
+def _iter_sheet_rows(source):
+    """
+    .xlsx এর প্রথম শিট iterparse দিয়ে পড়া; প্রতিটি সারি পড়া শেষে sheetData থেকে সরানো হয়,
+    তাই সারির সংখ্যা যত বড়ই হোক মেমরি প্রায় একই থাকে (শুধু shared strings টেবিল পুরো লোড হয়)
+    """
+    import zipfile
+    from xml.etree.ElementTree import iterparse
+    from openpyxl.utils.cell import column_index_from_string, coordinate_from_string
+    from openpyxl.utils.datetime import CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900
+
+    with zipfile.ZipFile(source) as archive:
+        sheet, strings_path, styles_path, date1904 = _workbook_parts(archive)
+        strings = _shared_strings(archive, strings_path)
+        date_styles = _date_styles(archive, styles_path)
+        epoch = CALENDAR_MAC_1904 if date1904 else CALENDAR_WINDOWS_1900
+
+        with archive.open(sheet) as f:
+            sheet_data = None
+            for event, element in iterparse(f, events=('start', 'end')):
+                if event == 'start':
+                    if element.tag == f'{MAIN_NS}sheetData':
+                        sheet_data = element
+                    continue
+                if element.tag != f'{MAIN_NS}row':
+                    continue
+                cells = []
+                for cell in element.iter(f'{MAIN_NS}c'):
+                    ref = cell.get('r')
+                    position = column_index_from_string(coordinate_from_string(ref)[0]) - 1 if ref else len(cells)
+                    if position > len(cells):
+                        cells.extend([None] * (position - len(cells)))
+                    cells.append(_cell_value(cell, strings, date_styles, epoch))
+                element.clear()
+                if sheet_data is not None:
+                    sheet_data.remove(element)
+                yield tuple(cells)
+
+
+def _iter_raw_rows(source):
+    """(হেডার সহ) প্রতিটি সারির মানের tuple"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    if sniff_table_format(source) == 'xlsx':
+        yield from _iter_sheet_rows(source)
+        return
+    # xls/ods/csv এর জন্য স্ট্রিমিং রিডার নেই - এখানেই শুধু pandas এর পুরো-ফাইল রিডার
+    df = read_table(source, header=None)
+    yield from df.itertuples(index=False, name=None)
+
+
+def iter_excel_rows(source):
+    """
+    প্রথম শিটের সারিগুলো একটি একটি করে: (ডেটা সারির ক্রমিক নম্বর, ExcelRow)
+    source: ফাইলের path, bytes বা file-like; প্রথম খালি নয় এমন সারি হেডার, সম্পূর্ণ খালি সারি বাদ
+    """
+    header = None
+    row_index = 0
+    for cells in _iter_raw_rows(source):
+        if all(is_blank(cell) for cell in cells):
+            continue
+        if header is None:
+            # শেষের খালি হেডার কলামগুলো বাদ
+            width = max(i for i, cell in enumerate(cells) if not is_blank(cell)) + 1
+            header = make_header(cells[:width])
+            continue
+        values = tuple(cells[:len(header)])
+        if len(values) < len(header):
+            values += (None,) * (len(header) - len(values))
+        yield row_index, ExcelRow(header, values)
+        row_index += 1
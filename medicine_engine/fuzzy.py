@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+🔤 টাইপো-সহনশীল নাম খোঁজা (SymSpell পদ্ধতি)
+ইনডেক্স তৈরির সময় প্রতিটি নাম/শব্দের deletion (অক্ষর বাদ দেওয়া রূপ) আগেই হিসাব করে রাখা হয়;
+কোয়েরির deletion গুলোর সাথে মিলিয়ে অল্প কয়েকটি candidate এর প্রকৃত edit distance যাচাই করা হয়
+ল্যাটিন ও বাংলা দুই লিপিতেই কাজ করে (Unicode code point ভিত্তিক)
+"""
+
+from .name_index import normalize_name
+
+MIN_WORD_LENGTH = 3
+
+# কোয়েরির দৈর্ঘ্য অনুযায়ী সর্বোচ্চ edit distance: ছোট শব্দে ১-২ অক্ষর বদলালেই অন্য শব্দ হয়ে যায়
+# (যেমন 'gas' → 'gram'), তাই ৪ অক্ষর পর্যন্ত শুধু হুবহু, ৬ পর্যন্ত ১, তার বেশি হলে ২
+DISTANCE_BY_LENGTH = ((4, 0), (6, 1))
+
+
+def allowed_distance(term):
+    """এই দৈর্ঘ্যের কোয়েরিতে কত edit distance পর্যন্ত মিল গ্রহণযোগ্য"""
+    for max_length, distance in DISTANCE_BY_LENGTH:
+        if len(term) <= max_length:
+            return distance
+    return 2
+
+
+def edit_distance(a, b, max_distance):
+    """
+    Damerau-Levenshtein (optimal string alignment) দূরত্ব
+    max_distance এর বেশি হলে max_distance + 1 ফেরত দেয় (আগেই থেমে যায়)
+    """
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    # মিলে যাওয়া শুরু ও শেষের অংশ বাদ দিয়ে ছোট অংশে DP
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < len(a) - start and end < len(b) - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    a = a[start:len(a) - end]
+    b = b[start:len(b) - end]
+    if not a or not b:
+        return min(max(len(a), len(b)), max_distance + 1)
+
+    prev_prev = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(prev[j] + 1, current[j - 1] + 1, prev[j - 1] + cost)
+            if (prev_prev is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                value = min(value, prev_prev[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return max_distance + 1
+        prev_prev, prev = prev, current
+    return min(prev[-1], max_distance + 1)
+
+
+def deletes(term, max_distance):
+    """term থেকে সর্বোচ্চ max_distance টি অক্ষর বাদ দিয়ে পাওয়া সব রূপ (term সহ)"""
+    results = {term}
+    frontier = {term}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for word in frontier:
+            if len(word) <= 1:
+                continue
+            for i in range(len(word)):
+                next_frontier.add(word[:i] + word[i + 1:])
+        next_frontier -= results
+        results |= next_frontier
+        frontier = next_frontier
+    return results
+
+
+class SymSpellIndex:
+    """
+    নাম ও নামের শব্দগুলোর precomputed deletion dictionary
+    prefix_length: শুধু প্রথম এতগুলো অক্ষরের deletion রাখা হয় (মেমরি কম রাখতে)
+    """
+
+    def __init__(self, max_distance=2, prefix_length=7):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.deletes = {}        # delete রূপ -> {term, ...}
+        self.term_rows = {}      # term -> [row, ...]
+        self.name_rows = {}      # পুরো নাম হিসেবে আসা term -> [row, ...]
+        self.display = {}        # term -> দেখানোর মত আসল নাম (পুরো নাম হলে সেটাই)
+
+    @classmethod
+    def from_columns(cls, columns, max_distance=2, prefix_length=7):
+        """columns: প্রতিটি নাম কলামের মানের sequence (index = সারি নম্বর)"""
+        index = cls(max_distance=max_distance, prefix_length=prefix_length)
+        for values in columns:
+            for row, value in enumerate(values):
+                if value is None or (isinstance(value, float) and value != value):
+                    continue
+                index.add(value, row)
+        return index
+
+    def __len__(self):
+        return len(self.term_rows)
+
+    def _add_term(self, term, row, display, full_name):
+        rows = self.term_rows.get(term)
+        if rows is None:
+            self.term_rows[term] = [row]
+            self.display[term] = display
+            for delete in deletes(term[:self.prefix_length], self.max_distance):
+                self.deletes.setdefault(delete, set()).add(term)
+        elif row not in rows:
+            rows.append(row)
+            rows.sort()
+
+        if full_name:
+            name_rows = self.name_rows.setdefault(term, [])
+            if not name_rows:
+                self.display[term] = display
+            if row not in name_rows:
+                name_rows.append(row)
+                name_rows.sort()
+
+    def add(self, name, row):
+        """একটি নাম যোগ করুন - পুরো নাম এবং নামের প্রতিটি শব্দ আলাদা term"""
+        key = normalize_name(name)
+        if not key:
+            return
+        display = str(name).strip()
+        self._add_term(key, row, display, full_name=True)
+        for word in key.split(' '):
+            if len(word) >= MIN_WORD_LENGTH and word != key:
+                self._add_term(word, row, display, full_name=False)
+
+    def lookup(self, query, max_distance=None, limit=5):
+        """
+        query এর কাছাকাছি term গুলো (দূরত্ব query এর দৈর্ঘ্য অনুযায়ী সীমিত, allowed_distance দেখুন)
+        ফেরত দেয়: [(term, distance, rows), ...] দূরত্ব অনুযায়ী, সমান হলে বেশি সারির term আগে
+        """
+        key = normalize_name(query)
+        if not key:
+            return []
+        max_distance = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        max_distance = min(max_distance, allowed_distance(key))
+
+        candidates = set()
+        for delete in deletes(key[:self.prefix_length], max_distance):
+            candidates |= self.deletes.get(delete, set())
+
+        matches = []
+        for term in candidates:
+            distance = edit_distance(key, term, max_distance)
+            if distance <= max_distance:
+                matches.append((term, distance, self.term_rows[term]))
+        matches.sort(key=lambda item: (item[1], -len(item[2]), item[0]))
+        return matches[:limit] if limit else matches
+
+    def best_row(self, query, max_distance=None):
+        """সবচেয়ে কাছের নামের প্রথম সারি, না পেলে None"""
+        matches = self.lookup(query, max_distance=max_distance, limit=1)
+        if not matches:
+            return None
+        # term টি কোনো ওষুধের পুরো নাম হলে সেই সারি আগে
+        term, _, rows = matches[0]
+        return self.name_rows.get(term, rows)[0]
+
+    def suggest(self, query, limit=5):
+        """ব্যবহারকারীকে দেখানোর জন্য কাছাকাছি আসল নামগুলো (ডুপ্লিকেট ছাড়া)"""
+        names = []
+        for term, _, _ in self.lookup(query, limit=None):
+            name = self.display[term]
+            if name not in names:
+                names.append(name)
+            if len(names) >= limit:
+                break
+        return names
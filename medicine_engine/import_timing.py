@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+⏱️ import সময়ের রিপোর্ট
+আলাদা Python প্রসেসে `-X importtime` চালিয়ে প্রতিটি মডিউলের নিজস্ব (self) ও মোট (cumulative) সময় ms এ
+প্রসেসটি নতুন, তাই আগের কোনো import এর ক্যাশ ফলাফলে প্রভাব ফেলে না
+স্টার্টআপ ধীর হলে কোন মডিউল (বা কোন প্যাকেজ, যেমন sklearn) দায়ী তা দেখা যায়
+"""
+
+import subprocess
+import sys
+
+_PREFIX = 'import time:'
+
+
+def parse_importtime(output):
+    """
+    `-X importtime` এর stderr → [{'module', 'self_ms', 'cumulative_ms', 'depth'}, ...] (import শেষ হওয়ার ক্রমে)
+    depth: কোন মডিউল কাকে import করেছে তার স্তর (0 = সরাসরি import)
+    """
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith(_PREFIX):
+            continue
+        parts = line[len(_PREFIX):].split('|')
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            # হেডার লাইন (self [us] | cumulative | ...)
+            continue
+        name = parts[2].rstrip()
+        module = name.lstrip()
+        rows.append({
+            'module': module,
+            'self_ms': self_us / 1000,
+            'cumulative_ms': cumulative_us / 1000,
+            'depth': (len(name) - len(module) - 1) // 2,
+        })
+    return rows
+
+
+def measure_import_time(module, python=None, cwd=None):
+    """
+    নতুন প্রসেসে `import module` এর সময়; parse_importtime এর সারিগুলো ফেরত দেয়
+    import ব্যর্থ হলে RuntimeError (stderr এর শেষ লাইন সহ)
+    """
+    result = subprocess.run(
+        [python or sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, cwd=cwd
+    )
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if line and not line.startswith(_PREFIX)]
+        raise RuntimeError(errors[-1] if errors else f"'{module}' import করা যায়নি")
+    return parse_importtime(result.stderr)
+
+
+def package_totals(rows):
+    """শীর্ষ-স্তরের প্যাকেজ অনুযায়ী self সময়ের যোগফল {package: ms}, বড় থেকে ছোট"""
+    totals = {}
+    for row in rows:
+        package = row['module'].split('.', 1)[0]
+        totals[package] = totals.get(package, 0.0) + row['self_ms']
+    return dict(sorted(totals.items(), key=lambda item: -item[1]))
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""
+➕ ইনক্রিমেন্টাল TF-IDF
+শব্দ → কলাম ম্যাপিং hashing দিয়ে (vocabulary ফিট করতে হয় না), document frequency চলমান টেবিলে
+নতুন সারি/প্যাসেজ যোগ করতে শুধু নতুন ডেটার সমান সময় লাগে - পুরো ম্যাট্রিক্স আবার ফিট হয় না
+
+IDF দুই refit এর মাঝে স্থির থাকে: নতুন সারি শেষ refit এর IDF দিয়ে ওজন পায়
+refit() (অথবা ব্যাকগ্রাউন্ডে refit_async()) চলমান document frequency থেকে IDF নতুন করে হিসাব করে
+সব সারি আবার ওজন দেয়; সার্চ চলতে থাকে, শেষ হলে নতুন ম্যাট্রিক্স একবারে বদলে যায়
+
+FittedTfidf: fit মোডের ফিট করা TfidfVectorizer কে একই ইন্টারফেস দেয়, তাই TfidfOverlay দুই মোডেই চলে
+"""
+
+import threading
+
+import numpy as np
+
+from .retrieval import top_k_rows
+
+# scipy/sklearn ফাংশনের ভেতরে প্রথম ব্যবহারে import হয় (দুটো মিলে ~১-২ সেকেন্ড, স্টার্টআপে নয়)
+DEFAULT_FEATURES = 2 ** 20
+
+
+def _vstack(blocks):
+    if len(blocks) == 1:
+        return blocks[0]
+    from scipy import sparse
+    return sparse.vstack(blocks, format='csr')
+
+
+def _rows_from(blocks, start):
+    """সারি start থেকে শেষ পর্যন্ত যে ব্লকগুলো (প্রথমটি দরকার হলে কাটা)"""
+    tail = []
+    offset = 0
+    for block in blocks:
+        end = offset + block.shape[0]
+        if end > start:
+            tail.append(block if offset >= start else block[start - offset:])
+        offset = end
+    return tail
+
+
+class IncrementalTfidf:
+    """
+    HashingVectorizer + চলমান document frequency এর TF-IDF
+    সারিগুলো ব্লকে থাকে; ছোট ব্লক জমলে (binary counter এর মত) একত্র হয়, তাই যোগ করার খরচ amortized O(নতুন ডেটা)
+    refit_every: এতগুলো নতুন ডকুমেন্ট যোগ হলে ব্যাকগ্রাউন্ডে refit (None হলে কখনো নিজে থেকে নয়)
+    on_refit: refit শেষে ডাকা হয় (যেমন কোয়েরি ক্যাশের ডেটা-ভার্সন বদলাতে)
+    """
+
+    def __init__(self, n_features=DEFAULT_FEATURES, ngram_range=(1, 1), refit_every=None, on_refit=None):
+        from sklearn.feature_extraction.text import HashingVectorizer
+
+        self.hasher = HashingVectorizer(
+            n_features=n_features, ngram_range=ngram_range, alternate_sign=False, norm=None
+        )
+        self.refit_every = refit_every
+        self.on_refit = on_refit
+        self.doc_freq = np.zeros(n_features, dtype=np.int64)
+        self.n_docs = 0
+        self.idf_ = None
+        # IDF যতবার বদলেছে (overlay গুলো এটা দেখে নিজেদের সারি আবার ওজন দেয়)
+        self.idf_generation = 0
+        self._raw = []           # কাঁচা term count ব্লক (refit এর জন্য)
+        self._weighted = []      # L2-normalized TF-IDF ব্লক (সার্চের জন্য)
+        self._rows = 0
+        self._added_since_refit = 0
+        self._lock = threading.Lock()
+        self._refit_thread = None
+
+    def __len__(self):
+        return self._rows
+
+    def compute_idf(self, doc_freq, n_docs):
+        """smooth IDF (TfidfVectorizer এর মতই): log((1 + n) / (1 + df)) + 1"""
+        return np.log((1.0 + n_docs) / (1.0 + doc_freq)) + 1.0
+
+    def counts(self, texts):
+        """টেক্সট → কাঁচা term count (CSR)"""
+        return self.hasher.transform(texts)
+
+    def weigh(self, counts, idf=None):
+        """term count → L2-normalized TF-IDF (শুধু non-zero গুলো গুণ হয়)"""
+        from sklearn.preprocessing import normalize
+
+        idf = self.idf_ if idf is None else idf
+        weighted = counts.copy()
+        weighted.data = weighted.data * idf[weighted.indices]
+        return normalize(weighted, norm='l2', copy=False)
+
+    def transform(self, texts):
+        """কোয়েরি/টেক্সট → বর্তমান IDF দিয়ে TF-IDF ভেক্টর"""
+        return self.weigh(self.counts(texts))
+
+    def add(self, texts):
+        """
+        নতুন ডকুমেন্ট যোগ করুন, তাদের সারি নম্বরের range ফেরত দেয়
+        খরচ নতুন টেক্সটের সমানুপাতিক (প্রথমবার ছাড়া IDF আবার হিসাব হয় না)
+        """
+        counts = self.counts(texts)
+        with self._lock:
+            np.add.at(self.doc_freq, counts.indices, 1)
+            self.n_docs += counts.shape[0]
+            if self.idf_ is None:
+                self.idf_ = self.compute_idf(self.doc_freq, self.n_docs)
+                self.idf_generation += 1
+            raw = self._raw + [counts]
+            weighted = self._weighted + [self.weigh(counts)]
+            self._merge_small_blocks(raw, weighted)
+            start = self._rows
+            self._raw, self._weighted = raw, weighted
+            self._rows += counts.shape[0]
+            self._added_since_refit += counts.shape[0]
+            due = self.refit_every is not None and self._added_since_refit >= self.refit_every
+        if due:
+            self.refit_async()
+        return range(start, start + counts.shape[0])
+
+    @staticmethod
+    def _merge_small_blocks(raw, weighted):
+        """শেষ ব্লক আগেরটির অর্ধেকের বেশি হলে দুটি একত্র (log সংখ্যক ব্লক থাকে)"""
+        while len(raw) > 1 and raw[-1].shape[0] * 2 >= raw[-2].shape[0]:
+            raw[-2:] = [_vstack(raw[-2:])]
+            weighted[-2:] = [_vstack(weighted[-2:])]
+
+    @property
+    def matrix(self):
+        """সব সারির TF-IDF ম্যাট্রিক্স (n x n_features)"""
+        from scipy import sparse
+
+        blocks = self._weighted
+        if not blocks:
+            return sparse.csr_matrix((0, self.hasher.n_features))
+        return _vstack(blocks)
+
+    def scores(self, query_matrix):
+        """(q x n) cosine স্কোর - প্রতিটি ব্লকের সাথে আলাদা গুণ, ম্যাট্রিক্স জোড়া লাগাতে হয় না"""
+        from scipy import sparse
+
+        blocks = self._weighted
+        query_matrix = sparse.csr_matrix(query_matrix)
+        if not blocks:
+            return sparse.csr_matrix((query_matrix.shape[0], 0))
+        return sparse.hstack([query_matrix @ block.T for block in blocks], format='csr')
+
+    def search(self, texts, top_k, threshold=0.0):
+        """প্রতিটি টেক্সটের জন্য শীর্ষ [(সারি, স্কোর), ...]"""
+        if not self._rows:
+            return [[] for _ in texts]
+        scores = self.scores(self.transform(texts))
+        return [top_k_rows(scores.getrow(i), top_k, threshold) for i in range(scores.shape[0])]
+
+    def refit(self):
+        """চলমান document frequency থেকে IDF নতুন করে হিসাব করে সব সারি আবার ওজন দিন"""
+        with self._lock:
+            raw = list(self._raw)
+            rows = self._rows
+            idf = self.compute_idf(self.doc_freq, self.n_docs)
+            self._added_since_refit = 0
+        if not raw:
+            return
+        merged = _vstack(raw)
+        reweighted = self.weigh(merged, idf)
+
+        with self._lock:
+            # refit চলাকালীন যোগ হওয়া সারিগুলোও নতুন IDF পায়
+            tail = _rows_from(self._raw, rows)
+            self._raw = [merged] + tail
+            self._weighted = [reweighted] + [self.weigh(block, idf) for block in tail]
+            self.idf_ = idf
+            self.idf_generation += 1
+        if self.on_refit is not None:
+            self.on_refit()
+
+    def refit_async(self):
+        """ব্যাকগ্রাউন্ড থ্রেডে refit (একটি চলতে থাকলে নতুন শুরু হয় না), থ্রেড ফেরত দেয়"""
+        with self._lock:
+            if self._refit_thread is not None and self._refit_thread.is_alive():
+                return self._refit_thread
+            self._refit_thread = threading.Thread(target=self.refit, daemon=True)
+            self._refit_thread.start()
+            return self._refit_thread
+
+    def overlay(self):
+        """এই মডেলের IDF শেয়ার করে এমন আলাদা সারির সেট (যেমন একটি সেশনের আপলোড)"""
+        return TfidfOverlay(self)
+
+
+class TfidfOverlay:
+    """
+    মূল মডেলের (IncrementalTfidf বা FittedTfidf) উপরে নিজস্ব সারি - মূল মডেল বদলায় না, স্কোর একই স্কেলে
+    শুধু term count ব্লক রাখে, টেক্সট নয়; মূল মডেল refit হলে পরের সার্চে ব্লকগুলো নতুন IDF দিয়ে আবার ওজন পায়
+    """
+
+    def __init__(self, base):
+        self.base = base
+        self._raw = []
+        self._weighted = []
+        self._rows = 0
+        self._generation = base.idf_generation
+
+    def __len__(self):
+        return self._rows
+
+    def add(self, texts):
+        """নতুন ডকুমেন্ট যোগ করুন, সারি নম্বরের range ফেরত দেয়"""
+        counts = self.base.counts(texts)
+        self._raw.append(counts)
+        self._weighted.append(self.base.weigh(counts))
+        IncrementalTfidf._merge_small_blocks(self._raw, self._weighted)
+        start = self._rows
+        self._rows += counts.shape[0]
+        return range(start, start + counts.shape[0])
+
+    def truncate(self, rows):
+        """প্রথম rows টি সারি রেখে পরেরগুলো বাদ দিন (যেমন মাঝপথে ব্যর্থ হওয়া আপলোডের অংশ)"""
+        raw, weighted = [], []
+        offset = 0
+        for counts, block in zip(self._raw, self._weighted):
+            if offset >= rows:
+                break
+            raw.append(counts[:rows - offset])
+            weighted.append(block[:rows - offset])
+            offset += counts.shape[0]
+        self._raw, self._weighted = raw, weighted
+        self._rows = min(self._rows, rows)
+
+    def search(self, texts, top_k, threshold=0.0):
+        """প্রতিটি টেক্সটের জন্য এই overlay এর শীর্ষ [(সারি, স্কোর), ...]"""
+        from scipy import sparse
+
+        if not self._rows:
+            return [[] for _ in texts]
+        if self._generation != self.base.idf_generation:
+            self._generation = self.base.idf_generation
+            self._weighted = [self.base.weigh(block) for block in self._raw]
+        query_matrix = self.base.transform(texts)
+        scores = sparse.hstack([query_matrix @ block.T for block in self._weighted], format='csr')
+        return [top_k_rows(scores.getrow(i), top_k, threshold) for i in range(scores.shape[0])]
+
+
+
+class FittedTfidf:
+    """
+    ফিট করা TfidfVectorizer (fit মোড) - IncrementalTfidf এর counts/weigh/transform ইন্টারফেসে, TfidfOverlay এর base
+    vocabulary ও IDF মূল মডেলের এবং বদলায় না; নতুন সারি শুধু গোনা হয়, vocabulary তে নেই এমন শব্দ বাদ পড়ে
+    """
+
+    # ফিট করা মডেলের IDF কখনো বদলায় না
+    idf_generation = 0
+
+    def __init__(self, vectorizer):
+        self.vectorizer = vectorizer
+
+    @property
+    def idf_(self):
+        return self.vectorizer.idf_
+
+    def counts(self, texts):
+        """টেক্সট → ফিট করা vocabulary তে কাঁচা term count (CSR)"""
+        from sklearn.feature_extraction.text import CountVectorizer
+
+        return CountVectorizer.transform(self.vectorizer, texts)
+
+    def weigh(self, counts, idf=None):
+        """term count → L2-normalized TF-IDF (vectorizer.transform এর সমান)"""
+        return IncrementalTfidf.weigh(self, counts, idf)
+
+    def transform(self, texts):
+        """কোয়েরি/টেক্সট → TF-IDF ভেক্টর"""
+        return self.vectorizer.transform(texts)
+
+    def overlay(self):
+        """এই মডেলের IDF শেয়ার করে এমন আলাদা সারির সেট (যেমন একটি সেশনের আপলোড)"""
+        return TfidfOverlay(self)
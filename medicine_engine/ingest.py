@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+📥 ব্যাকগ্রাউন্ড ফাইল ইনজেশন
+PDF এর পেজগুলো প্রসেস পুলে সমান্তরালে এক্সট্রাক্ট হয়, ফলাফল পেজের লিস্ট হিসেবে জোড়া লাগে
+রিকোয়েস্ট থ্রেড আটকায় না - প্রতিটি ফাইলের অগ্রগতি IngestJob থেকে পড়া যায়
+"""
+
+import io
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from .pdf_backends import get_pdf_backend
+
+# প্রতি ওয়ার্কারে গড়ে কতগুলো টাস্ক (বেশি হলে অগ্রগতি মসৃণ, কম হলে PDF কম বার পার্স হয়)
+TASKS_PER_WORKER = 2
+
+
+def count_pdf_pages(data, backend=None):
+    """PDF bytes এ কতগুলো পেজ"""
+    return get_pdf_backend(backend).count_pages(data)
+
+
+def extract_pdf_pages(data, start=0, stop=None, backend=None):
+    """
+    PDF এর [start, stop) পেজগুলোর টেক্সট লিস্ট (প্রসেস পুলের ওয়ার্কার)
+    backend: PDF_BACKENDS এর নাম, None হলে DEFAULT_PDF_BACKEND
+    """
+    return get_pdf_backend(backend).extract_pages(data, start, stop)
+
+
+def extract_docx_paragraphs(data):
+    """Word (.docx) bytes থেকে প্যারাগ্রাফগুলোর টেক্সট লিস্ট"""
+    import docx
+    return [paragraph.text for paragraph in docx.Document(io.BytesIO(data)).paragraphs]
+
+
+class IngestJob:
+    """একটি ফাইলের ব্যাকগ্রাউন্ড এক্সট্রাকশন: অবস্থা, অগ্রগতি এবং ফলাফল"""
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    def __init__(self, filename, file_type, data, metadata=None):
+        self.filename = filename
+        self.file_type = file_type
+        self.data = data
+        self.metadata = dict(metadata or {})
+        self.status = self.QUEUED
+        self.done_units = 0      # PDF: শেষ হওয়া পেজ, Word: 0/1
+        self.total_units = 0
+        self.pages = None        # PDF: পেজের টেক্সট লিস্ট, Word: প্যারাগ্রাফ লিস্ট
+        self.error = None
+        self.collected = False   # চ্যাটবটের ইনডেক্সে যোগ হয়েছে কিনা
+        self._finished = threading.Event()
+
+    @property
+    def progress(self):
+        """0.0 - 1.0"""
+        if self.finished:
+            return 1.0
+        if not self.total_units:
+            return 0.0
+        return min(self.done_units / self.total_units, 1.0)
+
+    @property
+    def finished(self):
+        return self._finished.is_set()
+
+    def wait(self, timeout=None):
+        """শেষ হওয়া পর্যন্ত অপেক্ষা; শেষ হলে True"""
+        return self._finished.wait(timeout)
+
+
+class IngestionPool:
+    """
+    ফাইল ইনজেশন পুল: একটি কো-অর্ডিনেটর থ্রেড প্রতিটি ফাইলকে পেজের টুকরোয় ভাগ করে
+    ওয়ার্কার প্রসেসে পাঠায় এবং অগ্রগতি আপডেট করে
+    use_processes=False হলে থ্রেড পুল (টেস্ট বা যেখানে নতুন প্রসেস চালানো যায় না)
+    pdf_backend: PDF এক্সট্রাকশনের ব্যাকএন্ডের নাম (None হলে ডিফল্ট)
+    """
+
+    def __init__(self, max_workers=None, use_processes=True, pdf_backend=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.use_processes = use_processes
+        self.pdf_backend = pdf_backend
+        self._workers = None
+        self._lock = threading.Lock()
+        self._coordinator = ThreadPoolExecutor(max_workers=2, thread_name_prefix='ingest')
+
+    def _executor(self):
+        with self._lock:
+            if self._workers is None:
+                if self.use_processes:
+                    # Streamlit থ্রেড চালু থাকা প্রসেসে fork নিরাপদ নয়, তাই spawn
+                    self._workers = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context('spawn')
+                    )
+                else:
+                    self._workers = ThreadPoolExecutor(max_workers=self.max_workers)
+            return self._workers
+
+    def submit(self, filename, file_type, data, metadata=None):
+        """ফাইল ('PDF' বা 'Word') ব্যাকগ্রাউন্ডে এক্সট্রাক্ট করার জন্য পাঠান, সাথে সাথে IngestJob ফেরত"""
+        job = IngestJob(filename, file_type, data, metadata)
+        self._coordinator.submit(self._run, job)
+        return job
+
+    def _run(self, job):
+        try:
+            job.status = IngestJob.RUNNING
+            executor = self._executor()
+            if job.file_type == 'PDF':
+                total = count_pdf_pages(job.data, self.pdf_backend)
+                job.total_units = total
+                step = max(1, -(-total // (self.max_workers * TASKS_PER_WORKER)))
+                futures = {
+                    executor.submit(extract_pdf_pages, job.data, start, start + step, self.pdf_backend): start
+                    for start in range(0, total, step)
+                }
+                chunks = {}
+                for future in as_completed(futures):
+                    pages = future.result()
+                    chunks[futures[future]] = pages
+                    job.done_units += len(pages)
+                job.pages = [page for start in sorted(chunks) for page in chunks[start]]
+            elif job.file_type == 'Word':
+                job.total_units = 1
+                job.pages = executor.submit(extract_docx_paragraphs, job.data).result()
+                job.done_units = 1
+            else:
+                raise ValueError(f"অসমর্থিত ফাইল টাইপ: {job.file_type}")
+            job.status = IngestJob.DONE
+        except Exception as e:
+            job.error = str(e)
+            job.status = IngestJob.FAILED
+        finally:
+            job.data = None
+            job._finished.set()
+
+    def shutdown(self, wait=True):
+        self._coordinator.shutdown(wait=wait)
+        with self._lock:
+            if self._workers is not None:
+                self._workers.shutdown(wait=wait)
+                self._workers = None
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+🔎 ইনভার্টেড ইনডেক্স - token → postings
+সোর্স যোগ করার সময় ইনডেক্স আপডেট হয়, সার্চের সময় শুধু কোয়েরির শব্দগুলোর postings দেখা হয়
+"""
+
+from collections import Counter
+
+import numpy as np
+
+
+class InvertedIndex:
+    """ইনক্রিমেন্টাল token → {doc_id: term frequency} ইনডেক্স"""
+
+    def __init__(self, tokenize):
+        # tokenize: টেক্সট → শব্দের লিস্ট (চ্যাটবটের clean_text অনুযায়ী)
+        self.tokenize = tokenize
+        self.documents = {}      # doc_id -> সোর্স dict
+        self.postings = {}       # token -> {doc_id: tf}
+        self.doc_terms = {}      # doc_id -> ডকুমেন্টের ইউনিক token গুলোর frozenset
+        self.doc_lengths = {}    # doc_id -> মোট token সংখ্যা
+        self.total_length = 0
+        # doc_id দিয়ে ইনডেক্স করা দৈর্ঘ্যের অ্যারে এবং token -> (doc_ids, tfs) অ্যারে ক্যাশ
+        # (postings গুলোই sparse term-document ম্যাট্রিক্সের কলাম; BM25 এর মত vectorized স্কোরিং এর জন্য)
+        self._length_array = np.zeros(64, dtype=np.float64)
+        self._term_arrays = {}
+        self._next_id = 0
+
+    def __len__(self):
+        return len(self.documents)
+
+    def add_document(self, document, term_counts=None):
+        """
+        একটি সোর্স dict ইনডেক্সে যোগ করুন, doc_id ফেরত দেয়
+        term_counts: আগে থেকে গণনা করা {token: tf} (যেমন ডিস্ক ক্যাশ থেকে), না দিলে content টোকেনাইজ হয়
+        """
+        doc_id = self._next_id
+        self._next_id += 1
+
+        if term_counts is None:
+            term_counts = Counter(self.tokenize(document.get('content', '')))
+        for token, tf in term_counts.items():
+            self.postings.setdefault(token, {})[doc_id] = tf
+            self._term_arrays.pop(token, None)
+
+        length = sum(term_counts.values())
+        self.documents[doc_id] = document
+        self.doc_terms[doc_id] = frozenset(term_counts)
+        self.doc_lengths[doc_id] = length
+        self.total_length += length
+        if doc_id >= len(self._length_array):
+            self._length_array = np.resize(self._length_array, max(doc_id + 1, 2 * len(self._length_array)))
+        self._length_array[doc_id] = length
+        return doc_id
+
+    def add_documents(self, documents):
+        """একাধিক সোর্স একসাথে যোগ করুন"""
+        return [self.add_document(doc) for doc in documents]
+
+    def remove_document(self, doc_id):
+        """একটি ডকুমেন্ট ইনডেক্স থেকে সরান"""
+        if doc_id not in self.documents:
+            return
+        for token in self.doc_terms.pop(doc_id, ()):
+            self._term_arrays.pop(token, None)
+            docs = self.postings.get(token)
+            if docs is None:
+                continue
+            docs.pop(doc_id, None)
+            if not docs:
+                del self.postings[token]
+        del self.documents[doc_id]
+        self.total_length -= self.doc_lengths.pop(doc_id, 0)
+        self._length_array[doc_id] = 0
+
+    def remove_where(self, predicate):
+        """যে ডকুমেন্টগুলোর জন্য predicate(doc) True সেগুলো সরান"""
+        for doc_id in [d for d, doc in self.documents.items() if predicate(doc)]:
+            self.remove_document(doc_id)
+
+    def clear(self):
+        """পুরো ইনডেক্স খালি করুন"""
+        self.documents.clear()
+        self.postings.clear()
+        self.doc_terms.clear()
+        self.doc_lengths.clear()
+        self.total_length = 0
+        self._length_array[:] = 0
+        self._term_arrays.clear()
+
+    def document_frequency(self, token):
+        """কতগুলো ডকুমেন্টে token আছে"""
+        return len(self.postings.get(token, ()))
+
+    def term_arrays(self, token):
+        """token এর postings কে (doc_ids, tfs) numpy অ্যারে হিসেবে দিন (ক্যাশ করা)"""
+        arrays = self._term_arrays.get(token)
+        if arrays is None:
+            docs = self.postings.get(token, {})
+            arrays = (
+                np.fromiter(docs.keys(), dtype=np.int64, count=len(docs)),
+                np.fromiter(docs.values(), dtype=np.float64, count=len(docs)),
+            )
+            self._term_arrays[token] = arrays
+        return arrays
+
+    def lengths_of(self, doc_ids):
+        """doc_id অ্যারের জন্য ডকুমেন্টের দৈর্ঘ্য"""
+        return self._length_array[doc_ids]
+
+    def match(self, query_tokens):
+        """
+        কোয়েরির শব্দগুলোর postings থেকে ম্যাচ স্কোর গণনা করুন
+        স্কোর = ম্যাচ করা কোয়েরি শব্দ / মোট কোয়েরি শব্দ (আগের কীওয়ার্ড ম্যাচিং এর মতই)
+        ফেরত দেয়: [(doc_id, score), ...] স্কোর অনুযায়ী সাজানো, সমান হলে যোগ করার ক্রমে
+        """
+        if not query_tokens:
+            return []
+
+        matches = Counter()
+        for token in query_tokens:
+            docs = self.postings.get(token)
+            if docs:
+                matches.update(docs.keys())
+
+        total = len(query_tokens)
+        ranked = [(doc_id, count / total) for doc_id, count in matches.items()]
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+        return ranked
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+🏷️ ওষুধের নামের ইনডেক্স
+- exact: নরমালাইজড নাম → সারি (hash map, O(1))
+- prefix: সাজানো নামের লিস্টে bisect (O(log n))
+- word prefix: নামের প্রতিটি শব্দের শুরু থেকে মিল (যেমন 'capsules' → 'Dibedex 60 capsules')
+- search: উপরের তিনটি মিলিয়ে স্কোরসহ কয়েকটি সারি (TF-IDF তৈরি হওয়ার আগের দ্রুত সার্চ)
+ইউজারের ইনপুট regex হিসেবে ব্যবহার হয় না, তাই '(', '+', '*' ইত্যাদি নিরাপদ
+"""
+
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+
+_SPACES = re.compile(r'\s+')
+
+# search এর স্কোর: পুরো নাম মিললে, নামের শুরু মিললে, আর শব্দের prefix মিললে (মিলে যাওয়া শব্দের অনুপাতে)
+EXACT_SCORE = 1.0
+PREFIX_SCORE = 0.8
+WORD_PREFIX_SCORE = 0.6
+
+
+def normalize_name(name):
+    """নাম নরমালাইজ করুন: Unicode NFC, casefold, অতিরিক্ত স্পেস বাদ"""
+    if name is None:
+        return ''
+    text = unicodedata.normalize('NFC', str(name)).casefold()
+    return _SPACES.sub(' ', text).strip()
+
+
+class NameIndex:
+    """এক বা একাধিক নাম কলামের উপর exact ও prefix লুকআপ"""
+
+    def __init__(self):
+        self.exact_map = {}      # normalized name -> [row, ...] (সারির ক্রমে)
+        self.sorted_names = []   # [(normalized name, row), ...] সাজানো
+        self.sorted_words = []   # [(name word, row), ...] সাজানো
+
+    @classmethod
+    def from_columns(cls, columns):
+        """columns: প্রতিটি কলামের মানের sequence (সব কলামের দৈর্ঘ্য সমান, index = সারি নম্বর)"""
+        index = cls()
+        names = []
+        words = []
+        for values in columns:
+            for row, value in enumerate(values):
+                if value is None or (isinstance(value, float) and value != value):
+                    continue
+                key = normalize_name(value)
+                if not key:
+                    continue
+                index.exact_map.setdefault(key, []).append(row)
+                names.append((key, row))
+                words.extend((word, row) for word in set(key.split(' ')))
+        for rows in index.exact_map.values():
+            rows.sort()
+        index.sorted_names = sorted(set(names))
+        index.sorted_words = sorted(set(words))
+        return index
+
+    def __len__(self):
+        return len(self.sorted_names)
+
+    def exact(self, name):
+        """ঠিক একই নামের সারিগুলো"""
+        return list(self.exact_map.get(normalize_name(name), ()))
+
+    @staticmethod
+    def _prefix_rows(entries, prefix, limit=None):
+        rows = []
+        pos = bisect_left(entries, (prefix,))
+        while pos < len(entries) and entries[pos][0].startswith(prefix):
+            rows.append(entries[pos][1])
+            pos += 1
+            if limit and len(rows) >= limit:
+                break
+        return rows
+
+    def prefix(self, name, limit=None):
+        """যে নামগুলো এই prefix দিয়ে শুরু হয় তাদের সারি (সারির ক্রমে, ডুপ্লিকেট ছাড়া)"""
+        key = normalize_name(name)
+        if not key:
+            return []
+        return sorted(set(self._prefix_rows(self.sorted_names, key, limit)))
+
+    def word_prefix(self, name, limit=None):
+        """নামের যেকোনো শব্দ এই prefix দিয়ে শুরু হলে সেই সারিগুলো"""
+        key = normalize_name(name)
+        if not key or ' ' in key:
+            return []
+        return sorted(set(self._prefix_rows(self.sorted_words, key, limit)))
+
+    def lookup(self, name):
+        """সবচেয়ে ভালো একটি সারি: exact → prefix → word prefix; না পেলে None"""
+        for finder in (self.exact, self.prefix, self.word_prefix):
+            rows = finder(name)
+            if rows:
+                return rows[0]
+        return None
+
+    def search(self, name, limit=5):
+        """
+        exact → prefix → শব্দের prefix ক্রমে শীর্ষ সারিগুলো [(row, score), ...]
+        একাধিক শব্দের প্রশ্নে যে নামে বেশি শব্দ মেলে তার স্কোর বেশি; এক অক্ষরের শব্দ বাদ
+        """
+        key = normalize_name(name)
+        if not key:
+            return []
+        scores = {}
+        for row in self.exact_map.get(key, ()):
+            scores.setdefault(row, EXACT_SCORE)
+        for row in self._prefix_rows(self.sorted_names, key):
+            scores.setdefault(row, PREFIX_SCORE)
+        words = {word for word in key.split(' ') if len(word) > 1}
+        matches = Counter()
+        for word in words:
+            matches.update(set(self._prefix_rows(self.sorted_words, word)))
+        for row, count in matches.items():
+            scores.setdefault(row, WORD_PREFIX_SCORE * count / len(words))
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+📄 PDF/Word ডকুমেন্টকে ওভারল্যাপিং প্যাসেজে ভাগ করা
+প্রতিটি প্যাসেজের সাথে মূল টেক্সটে offset এবং পেজ নম্বর রাখা হয়
+"""
+
+from bisect import bisect_right
+
+PASSAGE_CHARS = 1000
+PASSAGE_OVERLAP = 200
+
+
+def join_pages(pages):
+    """
+    পেজগুলোর টেক্সট '\\n' দিয়ে জোড়া দিন
+    ফেরত দেয়: (পুরো টেক্সট, প্রতিটি পেজের শুরুর offset)
+    """
+    page_starts = []
+    pos = 0
+    for text in pages:
+        page_starts.append(pos)
+        pos += len(text) + 1
+    return "\n".join(pages), page_starts
+
+
+def _break_point(text, start, end):
+    """end এর আগে সুবিধাজনক জায়গায় (লাইন/স্পেস) কাটুন, না পেলে end"""
+    if end >= len(text):
+        return len(text)
+    floor = start + (end - start) // 2
+    for sep in ("\n", " "):
+        cut = text.rfind(sep, floor, end)
+        if cut != -1:
+            return cut + 1
+    return end
+
+
+def split_passages(text, page_starts=None, passage_chars=PASSAGE_CHARS, overlap=PASSAGE_OVERLAP):
+    """
+    টেক্সটকে ওভারল্যাপিং প্যাসেজে ভাগ করুন
+    ফেরত দেয়: [{'text', 'offset', 'length', 'page'}, ...]; page 1 থেকে শুরু, পেজ না থাকলে None
+    """
+    if overlap >= passage_chars:
+        raise ValueError("overlap অবশ্যই passage_chars এর চেয়ে ছোট হতে হবে")
+
+    passages = []
+    start = 0
+    length = len(text)
+    while start < length:
+        end = _break_point(text, start, min(start + passage_chars, length))
+        chunk = text[start:end]
+        if chunk.strip():
+            page = bisect_right(page_starts, start) if page_starts else None
+            passages.append({'text': chunk, 'offset': start, 'length': end - start, 'page': page})
+        if end >= length:
+            break
+
+        # পরের প্যাসেজ overlap পরিমাণ পিছন থেকে, শব্দের শুরুতে
+        next_start = max(end - overlap, start + 1)
+        space = text.find(" ", next_start, end)
+        if space != -1:
+            next_start = space + 1
+        start = next_start
+    return passages
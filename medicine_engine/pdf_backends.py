@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""
+📑 PDF টেক্সট এক্সট্রাকশনের বদলযোগ্য ব্যাকএন্ড
+সব জায়গা (আপলোড, ব্যাকগ্রাউন্ড পুল, 'data source' ফোল্ডার) একই ইন্টারফেস ব্যবহার করে:
+    backend.count_pages(data) এবং backend.extract_pages(data, start, stop) → পেজের টেক্সট লিস্ট
+ডিফল্ট PyPDF2; অন্য লাইব্রেরি (pypdf, PyMuPDF, pdfminer.six, pypdfium2) ইনস্টল থাকলে নাম দিয়ে বেছে নেওয়া যায়
+কোনটি দ্রুত ও যথেষ্ট নির্ভুল তা benchmark_backends() (অথবা benchmark_pdf_extractors.py) দিয়ে মাপা যায়
+"""
+
+import importlib.util
+import io
+import os
+import time
+import tracemalloc
+
+# ডিফল্ট ব্যাকএন্ড (বেঞ্চমার্ক দেখে বদলান)
+DEFAULT_PDF_BACKEND = 'pypdf2'
+
+
+class PdfBackend:
+    """একটি PDF লাইব্রেরির উপর এক্সট্রাক্টর; সাবক্লাস count_pages ও _extract লিখে"""
+
+    name = None
+    module = None  # ইনস্টল আছে কিনা দেখার জন্য import নাম
+
+    def available(self):
+        return importlib.util.find_spec(self.module) is not None
+
+    def count_pages(self, data):
+        raise NotImplementedError
+
+    def _extract(self, data, start, stop):
+        raise NotImplementedError
+
+    def extract_pages(self, data, start=0, stop=None):
+        """PDF bytes এর [start, stop) পেজগুলোর টেক্সট লিস্ট"""
+        total = self.count_pages(data)
+        stop = total if stop is None else min(stop, total)
+        if start >= stop:
+            return []
+        return [text or "" for text in self._extract(data, start, stop)]
+
+
+class PyPDF2Backend(PdfBackend):
+    name = 'pypdf2'
+    module = 'PyPDF2'
+
+    def count_pages(self, data):
+        import PyPDF2
+        return len(PyPDF2.PdfReader(io.BytesIO(data)).pages)
+
+    def _extract(self, data, start, stop):
+        import PyPDF2
+        pages = PyPDF2.PdfReader(io.BytesIO(data)).pages
+        return [pages[i].extract_text() for i in range(start, stop)]
+
+
+class PypdfBackend(PdfBackend):
+    """PyPDF2 এর নতুন ভার্সন (pypdf) - একই API"""
+    name = 'pypdf'
+    module = 'pypdf'
+
+    def count_pages(self, data):
+        import pypdf
+        return len(pypdf.PdfReader(io.BytesIO(data)).pages)
+
+    def _extract(self, data, start, stop):
+        import pypdf
+        pages = pypdf.PdfReader(io.BytesIO(data)).pages
+        return [pages[i].extract_text() for i in range(start, stop)]
+
+
+class PyMuPDFBackend(PdfBackend):
+    """MuPDF (C) - সাধারণত সবচেয়ে দ্রুত"""
+    name = 'pymupdf'
+    module = 'fitz'
+
+    def count_pages(self, data):
+        import fitz
+        with fitz.open(stream=data, filetype='pdf') as document:
+            return document.page_count
+
+    def _extract(self, data, start, stop):
+        import fitz
+        with fitz.open(stream=data, filetype='pdf') as document:
+            return [document[i].get_text() for i in range(start, stop)]
+
+
+class PdfminerBackend(PdfBackend):
+    """pdfminer.six - ধীর, কিন্তু লেআউট বিশ্লেষণ করে"""
+    name = 'pdfminer'
+    module = 'pdfminer'
+
+    def count_pages(self, data):
+        from pdfminer.pdfpage import PDFPage
+        return sum(1 for _ in PDFPage.get_pages(io.BytesIO(data)))
+
+    def _extract(self, data, start, stop):
+        from pdfminer.high_level import extract_text
+        return [extract_text(io.BytesIO(data), page_numbers=[i]) for i in range(start, stop)]
+
+
+class PdfiumBackend(PdfBackend):
+    """pypdfium2 (Chrome এর PDFium)"""
+    name = 'pypdfium2'
+    module = 'pypdfium2'
+
+    def count_pages(self, data):
+        import pypdfium2
+        document = pypdfium2.PdfDocument(data)
+        try:
+            return len(document)
+        finally:
+            document.close()
+
+    def _extract(self, data, start, stop):
+        import pypdfium2
+        document = pypdfium2.PdfDocument(data)
+        try:
+            return [document[i].get_textpage().get_text_range() for i in range(start, stop)]
+        finally:
+            document.close()
+
+
+PDF_BACKENDS = {
+    backend.name: backend
+    for backend in (PyPDF2Backend, PypdfBackend, PyMuPDFBackend, PdfminerBackend, PdfiumBackend)
+}
+
+
+def get_pdf_backend(backend=None):
+    """নাম বা ব্যাকএন্ড অবজেক্ট থেকে ব্যাকএন্ড দিন (None হলে DEFAULT_PDF_BACKEND)"""
+    if backend is None:
+        backend = DEFAULT_PDF_BACKEND
+    if not isinstance(backend, str):
+        return backend
+    try:
+        return PDF_BACKENDS[backend]()
+    except KeyError:
+        raise ValueError(f"অজানা PDF ব্যাকএন্ড: {backend}")
+
+
+def available_pdf_backends():
+    """এই মেশিনে ইনস্টল থাকা ব্যাকএন্ডগুলোর নাম"""
+    return [name for name, backend in PDF_BACKENDS.items() if backend().available()]
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Linux এ KB, macOS এ bytes
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if os.uname().sysname == 'Darwin' else peak / 1024
+
+
+def _extract_all(backend, paths):
+    texts = {}
+    errors = {}
+    pages = 0
+    for path in paths:
+        with open(path, 'rb') as f:
+            data = f.read()
+        try:
+            extracted = backend.extract_pages(data)
+        except Exception as e:
+            errors[str(path)] = str(e)
+            continue
+        pages += len(extracted)
+        texts[str(path)] = "\n".join(extracted)
+    return texts, errors, pages
+
+
+def measure_backend(backend, paths):
+    """
+    একটি ব্যাকএন্ড দিয়ে সব ফাইল এক্সট্রাক্ট করে মাপ: পেজ, সময়, Python heap এর peak, প্রসেসের peak RSS
+    সময় ও মেমরি আলাদা দুই পাসে মাপা হয় (tracemalloc চালু থাকলে Python-ভিত্তিক লাইব্রেরি ধীর হয়ে যায়)
+    heap peak C লাইব্রেরির (যেমন MuPDF) নিজস্ব মেমরি দেখে না - সেজন্য peak RSS;
+    আলাদা প্রসেসে চালালে (benchmark_backends) peak RSS শুধু এই ব্যাকএন্ডের
+    """
+    backend = get_pdf_backend(backend)
+    start = time.perf_counter()
+    texts, errors, pages = _extract_all(backend, paths)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    _extract_all(backend, paths)
+    heap_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        'backend': backend.name,
+        'pages': pages,
+        'seconds': seconds,
+        'pages_per_sec': pages / seconds if seconds else 0.0,
+        'heap_peak_mb': heap_peak / (1024 * 1024),
+        'peak_rss_mb': _peak_rss_mb(),
+        'texts': texts,
+        'errors': errors
+    }
+
+
+def benchmark_backends(paths, tokenize, backends=None, references=None, isolate=True):
+    """
+    প্রতিটি ব্যাকএন্ড দিয়ে paths এর PDF গুলো এক্সট্রাক্ট করে তুলনা
+    tokenize: টেক্সট → token লিস্ট (চ্যাটবটের ইনডেক্সের মতই)
+    references: {pdf path: রেফারেন্স টেক্সট} (যেমন একই ডকুমেন্টের .docx); যে ফাইলের রেফারেন্স নেই
+        তার রেফারেন্স সব ব্যাকএন্ডের token এর union (pooling) - অর্থাৎ অন্যরা যা পেয়েছে তার কতটা এটি পেয়েছে
+    isolate=True হলে প্রতিটি ব্যাকএন্ড আলাদা প্রসেসে চলে (মেমরির মাপ একে অপরকে প্রভাবিত করে না)
+    ফেরত দেয়: [{'backend', 'pages', 'seconds', 'pages_per_sec', 'heap_peak_mb', 'peak_rss_mb',
+                'token_recall', 'errors'}, ...]
+    """
+    paths = [str(path) for path in paths]
+    backends = available_pdf_backends() if backends is None else list(backends)
+    references = {str(path): text for path, text in (references or {}).items()}
+
+    if isolate:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        context = multiprocessing.get_context('spawn')
+        measurements = []
+        for name in backends:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                measurements.append(executor.submit(measure_backend, name, paths).result())
+    else:
+        measurements = [measure_backend(name, paths) for name in backends]
+
+    tokens = {
+        m['backend']: {path: set(tokenize(text)) for path, text in m['texts'].items()}
+        for m in measurements
+    }
+    reference_tokens = {}
+    for path in paths:
+        if path in references:
+            reference_tokens[path] = set(tokenize(references[path]))
+        else:
+            reference_tokens[path] = set().union(*(found.get(path, set()) for found in tokens.values()))
+
+    results = []
+    for m in measurements:
+        # মাইক্রো-গড়: সব ফাইলের রেফারেন্স token এর মোট কত অংশ পাওয়া গেছে
+        found = tokens[m['backend']]
+        hits = sum(len(reference_tokens[path] & found.get(path, set())) for path in paths)
+        total = sum(len(reference_tokens[path]) for path in paths)
+        result = {key: value for key, value in m.items() if key != 'texts'}
+        result['token_recall'] = hits / total if total else 1.0
+        results.append(result)
+    return results
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+⚡ স্পার্স top-k রিট্রিভাল
+TF-IDF সারিগুলো L2-normalized, তাই cosine similarity = sparse dot product
+পুরো similarity ভেক্টর argsort না করে শুধু non-zero স্কোরগুলোর উপর argpartition
+"""
+
+import numpy as np
+
+
+def l2_normalize_rows(matrix):
+    """সারিগুলো L2-normalize করুন (TfidfVectorizer এর ডিফল্ট norm='l2' হলে কিছু বদলায় না)"""
+    from scipy import sparse
+    from sklearn.preprocessing import normalize
+
+    return normalize(sparse.csr_matrix(matrix), norm='l2', copy=False)
+
+
+def top_k_rows(scores, top_k, threshold=0.0):
+    """
+    একটি স্পার্স স্কোর সারি (1 x n) থেকে শীর্ষ top_k (index, score)
+    শুধু threshold এর বেশি স্কোর রাখা হয়; স্কোর সমান হলে ছোট index আগে
+    """
+    scores = scores.tocsr()
+    indices = scores.indices
+    values = scores.data
+    keep = values > threshold
+    indices, values = indices[keep], values[keep]
+    if top_k and len(values) > top_k:
+        part = np.argpartition(-values, top_k - 1)[:top_k]
+        indices, values = indices[part], values[part]
+    order = np.lexsort((indices, -values))
+    return [(int(indices[i]), values[i]) for i in order]
+
+
+def sparse_top_k(query_matrix, doc_matrix, top_k, threshold=0.0):
+    """
+    অনেকগুলো কোয়েরি একসাথে স্কোর করুন - একটি sparse matrix multiply
+    query_matrix: (q x f), doc_matrix: (n x f), দুটোই L2-normalized
+    ফেরত দেয়: প্রতিটি কোয়েরির জন্য [(row index, score), ...]
+    """
+    from scipy import sparse
+
+    scores = sparse.csr_matrix(query_matrix) @ sparse.csr_matrix(doc_matrix).T
+    scores = scores.tocsr()
+    return [top_k_rows(scores.getrow(i), top_k, threshold) for i in range(scores.shape[0])]
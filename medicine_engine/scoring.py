@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+📊 সব উৎসের সার্চের স্কোরিং ইঞ্জিন
+- KeywordScorer: ম্যাচ করা কোয়েরি শব্দ / মোট কোয়েরি শব্দ (আগের পদ্ধতি)
+- BM25Scorer: শব্দের দুর্লভতা (IDF) ও ডকুমেন্টের দৈর্ঘ্য বিবেচনা করে, postings এর উপর vectorized
+
+দুটোই একাধিক ইনডেক্স (যেমন শেয়ার্ড মূল ইনডেক্স + সেশনের আপলোড) একসাথে র‍্যাঙ্ক করে
+ফেরত দেয়: [(score, index_position, doc_id), ...] স্কোর অনুযায়ী সাজানো
+"""
+
+import math
+
+import numpy as np
+
+
+def _sort_ranked(ranked):
+    # স্কোর সমান হলে আগের ইনডেক্স ও আগে যোগ করা ডকুমেন্ট আগে
+    ranked.sort(key=lambda item: (-item[0], item[1], item[2]))
+    return ranked
+
+
+class KeywordScorer:
+    """সরল কীওয়ার্ড ম্যাচিং স্কোর"""
+
+    name = 'keyword'
+
+    def rank(self, indexes, query_tokens):
+        ranked = []
+        for order, index in enumerate(indexes):
+            ranked.extend((score, order, doc_id) for doc_id, score in index.match(query_tokens))
+        return _sort_ranked(ranked)
+
+
+class BM25Scorer:
+    """
+    Okapi BM25 স্কোর
+    k1: term frequency কতটা দ্রুত স্যাচুরেট হবে, b: ডকুমেন্টের দৈর্ঘ্য নরমালাইজেশনের মাত্রা
+    """
+
+    name = 'bm25'
+
+    def __init__(self, k1=1.5, b=0.75):
+        self.k1 = k1
+        self.b = b
+
+    def idf(self, doc_count, doc_freq):
+        """BM25 IDF (সবসময় ধনাত্মক)"""
+        return math.log(1.0 + (doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    def rank(self, indexes, query_tokens):
+        terms = list(dict.fromkeys(query_tokens))
+        doc_count = sum(len(index) for index in indexes)
+        if not terms or doc_count == 0:
+            return []
+
+        # সব ইনডেক্স মিলিয়ে গ্লোবাল পরিসংখ্যান, যাতে স্কোর তুলনাযোগ্য হয়
+        avgdl = sum(index.total_length for index in indexes) / doc_count or 1.0
+        idf = {
+            term: self.idf(doc_count, sum(index.document_frequency(term) for index in indexes))
+            for term in terms
+        }
+
+        ranked = []
+        for order, index in enumerate(indexes):
+            doc_parts = []
+            score_parts = []
+            for term in terms:
+                doc_ids, tfs = index.term_arrays(term)
+                if not len(doc_ids):
+                    continue
+                norm = self.k1 * (1.0 - self.b + self.b * index.lengths_of(doc_ids) / avgdl)
+                doc_parts.append(doc_ids)
+                score_parts.append(idf[term] * tfs * (self.k1 + 1.0) / (tfs + norm))
+            if not doc_parts:
+                continue
+
+            # একই ডকুমেন্টের বিভিন্ন শব্দের স্কোর যোগ করুন
+            doc_ids, inverse = np.unique(np.concatenate(doc_parts), return_inverse=True)
+            scores = np.bincount(inverse, weights=np.concatenate(score_parts))
+            ranked.extend(zip(scores.tolist(), [order] * len(doc_ids), doc_ids.tolist()))
+        return _sort_ranked(ranked)
+
+
+SCORERS = {
+    KeywordScorer.name: KeywordScorer,
+    BM25Scorer.name: BM25Scorer,
+}
+
+
+def get_scorer(scorer='keyword', **params):
+    """নাম বা scorer অবজেক্ট থেকে scorer দিন"""
+    if not isinstance(scorer, str):
+        return scorer
+    try:
+        return SCORERS[scorer](**params)
+    except KeyError:
+        raise ValueError(f"অজানা scorer: {scorer}")
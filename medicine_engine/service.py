@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+🛰️ হেডলেস JSON HTTP সার্ভিস (শুধু asyncio, বাইরের লাইব্রেরি ছাড়া)
+- HTTP/1.1 keep-alive: একটি সংযোগে অনেক রিকোয়েস্ট (কিয়স্ক/SMS গেটওয়ে প্রতিবার নতুন TCP খোলে না)
+- হ্যান্ডলারগুলো থ্রেড পুলে চলে, তাই ধীর রিকোয়েস্টে ইভেন্ট লুপ আটকায় না
+  সার্চ/স্কোরিং (নরমালাইজেশন, postings, CSR গুণ) GIL ধরে চলে - থ্রেড বাড়ালে CPU থ্রুপুট বাড়ে না,
+  তার জন্য একাধিক প্রসেস (medicine_service.py --processes, শেয়ার্ড ইনডেক্স সহ)
+- প্রতিটি এন্ডপয়েন্টের লেটেন্সি (গড়, p50/p95/p99) /stats এ
+
+হ্যান্ডলার: handler(params) → JSON-যোগ্য মান; params = query string + JSON বডি একসাথে
+ভুল ইনপুটে হ্যান্ডলার ServiceError(status, message) তুলতে পারে
+"""
+
+import asyncio
+import json
+import math
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from urllib.parse import parse_qsl, urlsplit
+
+# রিকোয়েস্ট হেডার ও বডির সর্বোচ্চ আকার
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 1024 * 1024
+
+# keep-alive সংযোগ কত সেকেন্ড নিষ্ক্রিয় থাকলে বন্ধ হয়
+IDLE_TIMEOUT = 15
+
+# লেটেন্সির পার্সেন্টাইল হিসাবের জন্য প্রতি এন্ডপয়েন্টে শেষ কতগুলো মাপ রাখা হয়
+LATENCY_WINDOW = 2048
+
+REASONS = {
+    200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    413: 'Payload Too Large', 500: 'Internal Server Error', 501: 'Not Implemented',
+}
+
+
+class ServiceError(Exception):
+    """হ্যান্ডলার থেকে HTTP ত্রুটি (status, বার্তা)"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def to_jsonable(value):
+    """সার্চের ফলাফল (numpy/pandas মান, NaN, Mapping, set) → JSON-যোগ্য Python মান"""
+    if value is None or isinstance(value, (str, bool, int)):
+        return value
+    if isinstance(value, float):
+        return None if math.isnan(value) or math.isinf(value) else value
+    if isinstance(value, Mapping):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(to_jsonable(item) for item in value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, 'item') and callable(value.item):
+        # numpy স্কেলার (np.float64, np.int64, ...)
+        try:
+            return to_jsonable(value.item())
+        except (TypeError, ValueError):
+            pass
+    if hasattr(value, 'isoformat'):
+        # pandas.Timestamp; NaT এর isoformat 'NaT'
+        text = value.isoformat()
+        return None if text == 'NaT' else text
+    return str(value)
+
+
+class LatencyStats:
+    """এন্ডপয়েন্ট প্রতি রিকোয়েস্ট সংখ্যা, ত্রুটি ও লেটেন্সি (থ্রেড-সেফ)"""
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples = {}   # endpoint -> deque[ms]
+        self._counts = {}    # endpoint -> [মোট, ত্রুটি, মোট ms]
+
+    def record(self, endpoint, millis, error=False):
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+                self._counts[endpoint] = [0, 0, 0.0]
+            samples.append(millis)
+            counts = self._counts[endpoint]
+            counts[0] += 1
+            counts[1] += int(error)
+            counts[2] += millis
+
+    def snapshot(self):
+        """{endpoint: {'count', 'errors', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'}}"""
+        with self._lock:
+            data = {endpoint: (sorted(samples), list(self._counts[endpoint]))
+                    for endpoint, samples in self._samples.items()}
+
+        def percentile(ordered, q):
+            return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+        report = {}
+        for endpoint, (ordered, (count, errors, total)) in data.items():
+            report[endpoint] = {
+                'count': count,
+                'errors': errors,
+                'mean_ms': round(total / count, 3),
+                'p50_ms': round(percentile(ordered, 0.50), 3),
+                'p95_ms': round(percentile(ordered, 0.95), 3),
+                'p99_ms': round(percentile(ordered, 0.99), 3),
+                'max_ms': round(ordered[-1], 3),
+            }
+        return report
+
+
+class JsonService:
+    """
+    path → handler রাউটিং সহ asyncio HTTP সার্ভার
+    threads: হ্যান্ডলার চালানোর থ্রেড সংখ্যা (একসাথে কতগুলো রিকোয়েস্ট চলতে পারে; CPU স্কেল করে না)
+    """
+
+    def __init__(self, threads=None):
+        self.routes = {}
+        self.stats = LatencyStats()
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='service')
+        # খোলা সংযোগের হ্যান্ডলার টাস্ক → writer (বন্ধ করার সময় দরকার)
+        self.connections = {}
+        self.route('/stats', lambda params: self.stats.snapshot())
+
+    def route(self, path, handler, methods=('GET', 'POST')):
+        """path এ handler(params) যোগ করুন"""
+        self.routes[path] = (handler, frozenset(methods))
+
+    async def dispatch(self, method, target, body):
+        """একটি রিকোয়েস্ট → (status, JSON-যোগ্য বডি); লেটেন্সি রেকর্ড হয়"""
+        url = urlsplit(target)
+        route = self.routes.get(url.path)
+        if route is None:
+            return 404, {'error': f"অজানা এন্ডপয়েন্ট: {url.path}"}
+        handler, methods = route
+        if method not in methods:
+            return 405, {'error': f"{method} সমর্থিত নয়"}
+
+        start = time.perf_counter()
+        status = 200
+        try:
+            params = dict(parse_qsl(url.query))
+            if body:
+                payload = json.loads(body)
+                if not isinstance(payload, dict):
+                    raise ServiceError(400, "JSON বডি অবশ্যই অবজেক্ট হতে হবে")
+                params.update(payload)
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self.executor, lambda: to_jsonable(handler(params)))
+        except ServiceError as e:
+            status, result = e.status, {'error': e.message}
+        except ValueError as e:
+            # JSON পার্স বা প্যারামিটার রূপান্তরের ত্রুটি
+            status, result = 400, {'error': str(e)}
+        except Exception as e:
+            traceback.print_exc()
+            status, result = 500, {'error': str(e)}
+        self.stats.record(url.path, (time.perf_counter() - start) * 1000, error=status >= 500)
+        return status, result
+
+    async def handle_connection(self, reader, writer):
+        """একটি TCP সংযোগের সব রিকোয়েস্ট (keep-alive)"""
+        task = asyncio.current_task()
+        self.connections[task] = writer
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), IDLE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self.respond(writer, 413, {'error': "হেডার অনেক বড়"}, keep_alive=False)
+                    break
+
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ', 2)
+                except ValueError:
+                    await self.respond(writer, 400, {'error': "ভুল রিকোয়েস্ট লাইন"}, keep_alive=False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    if ':' in line:
+                        name, value = line.split(':', 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+                if 'chunked' in headers.get('transfer-encoding', '').lower():
+                    await self.respond(writer, 501, {'error': "chunked বডি সমর্থিত নয়"}, keep_alive=False)
+                    break
+                try:
+                    length = int(headers.get('content-length', 0))
+                except ValueError:
+                    length = -1
+                if length < 0 or length > MAX_BODY_BYTES:
+                    await self.respond(writer, 413, {'error': "বডি অনেক বড়"}, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                status, result = await self.dispatch(method.upper(), target, body)
+                await self.respond(writer, status, result, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.connections.pop(task, None)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def respond(self, writer, status, result, keep_alive=True):
+        data = json.dumps(result, ensure_ascii=False).encode('utf-8')
+        head = (
+            f"HTTP/1.1 {status} {REASONS.get(status, 'OK')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode('latin-1') + data)
+        await writer.drain()
+
+    async def start(self, host='127.0.0.1', port=8000, reuse_port=False):
+        """সার্ভার চালু করুন (asyncio.Server ফেরত দেয়; port=0 হলে OS পোর্ট বেছে নেয়)"""
+        return await asyncio.start_server(
+            self.handle_connection, host, port, limit=MAX_HEADER_BYTES, reuse_port=reuse_port or None
+        )
+
+    async def shutdown(self, server):
+        """নতুন সংযোগ নেওয়া বন্ধ করে খোলা সংযোগগুলোও বন্ধ করুন"""
+        server.close()
+        for writer in list(self.connections.values()):
+            # অপেক্ষমাণ readuntil IncompleteReadError পায়, হ্যান্ডলার নিজেই শেষ হয়
+            writer.transport.close()
+        await asyncio.gather(*list(self.connections), return_exceptions=True)
+        self.executor.shutdown(wait=False)
+
+    def serve_forever(self, host='127.0.0.1', port=8000, reuse_port=False):
+        """ব্লকিং: সার্ভার চালান যতক্ষণ না বন্ধ করা হয় (Ctrl+C)"""
+        async def run():
+            server = await self.start(host, port, reuse_port)
+            try:
+                await server.serve_forever()
+            finally:
+                await self.shutdown(server)
+        try:
+            asyncio.run(run())
+        except KeyboardInterrupt:
+            pass
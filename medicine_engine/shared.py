@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+🔗 প্রসেস-ব্যাপী শেয়ার্ড ইঞ্জিন রেজিস্ট্রি
+একটি ডেটা ফাইলের জন্য ইঞ্জিন প্রতি প্রসেসে একবারই তৈরি হয়
+কী (key): ফাইলের path, mtime এবং SHA-256 হ্যাশ - ফাইল বদলালে নতুন ইঞ্জিন তৈরি হয়
+"""
+
+import hashlib
+import os
+import threading
+
+_HASH_CHUNK = 1024 * 1024
+
+# (path, mtime_ns, size) -> sha256, যাতে প্রতি রানে পুরো ফাইল আবার হ্যাশ করতে না হয়
+_hash_memo = {}
+_hash_memo_lock = threading.Lock()
+
+
+def file_sha256(path):
+    """ফাইলের SHA-256 হ্যাশ (চাঙ্ক করে পড়া)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_fingerprint(path):
+    """
+    ডেটা ফাইলের পরিচয়: (absolute path, mtime_ns, sha256)
+    ফাইল না থাকলে mtime ও hash None হয়
+    """
+    abs_path = os.path.abspath(path)
+    try:
+        stat = os.stat(abs_path)
+    except OSError:
+        return (abs_path, None, None)
+
+    memo_key = (abs_path, stat.st_mtime_ns, stat.st_size)
+    with _hash_memo_lock:
+        digest = _hash_memo.get(memo_key)
+    if digest is None:
+        digest = file_sha256(abs_path)
+        with _hash_memo_lock:
+            _hash_memo[memo_key] = digest
+    return (abs_path, stat.st_mtime_ns, digest)
+
+
+class SharedEngineRegistry:
+    """
+    ফাইল-ভিত্তিক শেয়ার্ড (read-only) ইঞ্জিনের ক্যাশ
+    একই ফাইলের জন্য একসাথে অনেক সেশন এলে শুধু একটি থ্রেড ইঞ্জিন তৈরি করে, বাকিরা অপেক্ষা করে
+    """
+
+    def __init__(self):
+        self._engines = {}       # fingerprint -> engine
+        self._lock = threading.Lock()
+        self._path_locks = {}    # abs path -> build lock
+
+    def _path_lock(self, abs_path):
+        with self._lock:
+            return self._path_locks.setdefault(abs_path, threading.Lock())
+
+    def get(self, path, factory):
+        """path এর বর্তমান সংস্করণের ইঞ্জিন দিন, না থাকলে factory(path) দিয়ে তৈরি করুন"""
+        key = file_fingerprint(path)
+        engine = self._engines.get(key)
+        if engine is not None:
+            return engine
+
+        with self._path_lock(key[0]):
+            engine = self._engines.get(key)
+            if engine is None:
+                engine = factory(path)
+                with self._lock:
+                    # একই ফাইলের পুরনো সংস্করণ সরিয়ে ফেলুন
+                    for old_key in [k for k in self._engines if k[0] == key[0]]:
+                        del self._engines[old_key]
+                    self._engines[key] = engine
+        return engine
+
+    def clear(self):
+        """সব ক্যাশ করা ইঞ্জিন সরান"""
+        with self._lock:
+            self._engines.clear()
+
+    def __len__(self):
+        return len(self._engines)
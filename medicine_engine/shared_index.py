@@ -0,0 +1,446 @@
+# -*- coding: utf-8 -*-
+"""
+🧩 মাল্টি-প্রসেস সার্ভিংয়ের শেয়ার্ড (memory-mapped) ইনডেক্স
+একটি বিল্ডার প্রসেস মূল ডেটার ইনডেক্স অ্যারেগুলো একটি ফোল্ডারে লেখে (publish)
+বাকি প্রসেসগুলো সেগুলো read-only memory-map করে (attach) - কপি নেই, বিল্ড নেই
+সব প্রসেস OS এর একই পেজ ক্যাশ শেয়ার করে, তাই নতুন ওয়ার্কার প্রায় কোনো বাড়তি RSS নেয় না
+
+ফোল্ডার: <root>/<ডেটা ফাইলের sha256>-<vectorizer প্যারামিটারের হ্যাশ>/
+    tfidf_*.npy, idf.npy         - L2-normalized TF-IDF এর CSR data/indices/indptr এবং IDF
+    records.bin + records.npy    - সারির টেবিল: প্রতিটি সারি আলাদা pickle, offset অ্যারে দিয়ে খোঁজা
+    terms.bin + terms.npy        - মূল সারিগুলোর ইনভার্টেড ইনডেক্সের token (UTF-8, সাজানো)
+    postings_*.npy               - token id → (doc_ids, tfs) (CSR আকারে)
+    doc_*.npy                    - ডকুমেন্টের সারি নম্বর, দৈর্ঘ্য এবং token id গুলো
+    names.*, words.*, exact.*    - নামের ইনডেক্স: সাজানো (নাম, সারি) ও (শব্দ, সারি) জোড়া, নাম → সারি
+    fuzzy_*                      - SymSpell: term → সারি, পুরো নাম → সারি, deletion → term id, দেখানোর নাম
+    vocabulary.*                 - TF-IDF vocabulary: সাজানো term ও তার কলাম
+    frame.pkl                    - পুরো DataFrame (সার্চে লাগে না; কেউ চাইলে তখনই এই প্রসেসে লোড হয় - zero-copy নয়)
+    meta.json                    - ভার্সন, vectorizer ও SymSpell প্যারামিটার, কলামের নাম
+dict/set এর বদলে সাজানো key (BlobArray) এ bisect, তাই attach এ কোনো hash map তৈরি হয় না
+"""
+
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import shutil
+import tempfile
+from collections.abc import Mapping, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+from .fuzzy import SymSpellIndex
+from .name_index import NameIndex
+from .shared import file_fingerprint
+from .snapshot import vectorizer_params
+
+try:
+    import fcntl
+except ImportError:  # Windows: বিল্ড লক নেই, একসাথে দুই প্রসেস বিল্ড করলে শেষেরটি থাকে
+    fcntl = None
+
+# ফরম্যাট বদলালে বাড়ান - পুরনো ফোল্ডার আর attach হবে না
+SHARED_INDEX_VERSION = 2
+
+_CSR_PARTS = ('data', 'indices', 'indptr')
+
+
+def _map_file(path):
+    """ফাইলের read-only memory map (খালি ফাইল mmap করা যায় না, তাই b'')"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _write_blobs(folder, name, blobs):
+    """bytes গুলো পরপর <name>.bin এ, শুরুর offset গুলো <name>.npy তে (শেষে মোট দৈর্ঘ্য)"""
+    offsets = np.zeros(len(blobs) + 1, dtype=np.int64)
+    with open(folder / f'{name}.bin', 'wb') as f:
+        for i, blob in enumerate(blobs):
+            f.write(blob)
+            offsets[i + 1] = offsets[i] + len(blob)
+    np.save(folder / f'{name}.npy', offsets)
+
+
+def _write_pairs(folder, name, pairs):
+    """সাজানো (str, সারি) জোড়া: str গুলো <name>.bin/.npy তে, সারিগুলো <name>_rows.npy তে"""
+    _write_blobs(folder, name, [key.encode('utf-8') for key, _ in pairs])
+    np.save(folder / f'{name}_rows.npy', np.asarray([row for _, row in pairs], dtype=np.int64))
+
+
+def _write_list_map(folder, name, mapping):
+    """str → int এর list: সাজানো key <name>.bin/.npy তে, মানগুলো CSR আকারে; key এর ক্রম ফেরত দেয়"""
+    keys = sorted(mapping)
+    _write_blobs(folder, name, [key.encode('utf-8') for key in keys])
+    values = [mapping[key] for key in keys]
+    np.save(folder / f'{name}_indptr.npy', np.cumsum([0] + [len(items) for items in values], dtype=np.int64))
+    np.save(folder / f'{name}_values.npy', np.asarray([item for items in values for item in items], dtype=np.int64))
+    return keys
+
+
+def _find(blobs, key):
+    """সাজানো BlobArray তে key (bytes) এর অবস্থান (বাইনারি সার্চ), না থাকলে None"""
+    position = bisect.bisect_left(blobs, key)
+    if position < len(blobs) and blobs[position] == key:
+        return position
+    return None
+
+
+class BlobArray(Sequence):
+    """memory-mapped bytes এর সিকোয়েন্স: item i = blob[offsets[i]:offsets[i + 1]]"""
+
+    def __init__(self, folder, name):
+        self.blob = _map_file(Path(folder) / f'{name}.bin')
+        self.offsets = np.load(Path(folder) / f'{name}.npy', mmap_mode='r')
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if not -len(self) <= i < len(self):
+            raise IndexError(i)
+        i %= len(self)
+        return self.blob[int(self.offsets[i]):int(self.offsets[i + 1])]
+
+
+class RecordTable(Sequence):
+    """সারির টেবিল - records[i] পড়লে তখনই সেই সারির dict ডিকোড হয় (বাকিগুলো শুধু পেজ ক্যাশে)"""
+
+    def __init__(self, folder):
+        self.blobs = BlobArray(folder, 'records')
+
+    def __len__(self):
+        return len(self.blobs)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return pickle.loads(self.blobs[i])
+
+
+class FrozenMap(Mapping):
+    """
+    memory-mapped str → মান, dict এর জায়গায় শুধু পড়ার জন্য (UTF-8 এর ক্রম = str এর ক্রম)
+    keys: সাজানো key এর BlobArray; value_of(অবস্থান) → সেই key এর মান
+    """
+
+    def __init__(self, keys, value_of):
+        self.key_blobs = keys
+        self.value_of = value_of
+
+    def __len__(self):
+        return len(self.key_blobs)
+
+    def __iter__(self):
+        return (key.decode('utf-8') for key in self.key_blobs)
+
+    def __getitem__(self, key):
+        position = _find(self.key_blobs, key.encode('utf-8')) if isinstance(key, str) else None
+        if position is None:
+            raise KeyError(key)
+        return self.value_of(position)
+
+
+class FrozenPairs(Sequence):
+    """সাজানো (str, সারি) জোড়ার memory-mapped লিস্ট (NameIndex এর sorted_names/sorted_words এর জায়গায়)"""
+
+    def __init__(self, folder, name):
+        self.keys = BlobArray(folder, name)
+        self.rows = np.load(Path(folder) / f'{name}_rows.npy', mmap_mode='r')
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return self.keys[i].decode('utf-8'), int(self.rows[i])
+
+
+def _list_map(folder, name, decode=None):
+    """_write_list_map এ লেখা str → list এর FrozenMap; decode দিলে list টি তা দিয়ে রূপান্তর"""
+    indptr = np.load(Path(folder) / f'{name}_indptr.npy', mmap_mode='r')
+    values = np.load(Path(folder) / f'{name}_values.npy', mmap_mode='r')
+
+    def value_of(position):
+        items = values[int(indptr[position]):int(indptr[position + 1])].tolist()
+        return items if decode is None else decode(items)
+    return FrozenMap(BlobArray(folder, name), value_of)
+
+
+class _LazyDocuments(Mapping):
+    """doc_id → সোর্স dict, দরকারের সময় তৈরি"""
+
+    def __init__(self, count, make):
+        self.count = count
+        self.make = make
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(range(self.count))
+
+    def __getitem__(self, doc_id):
+        if not (isinstance(doc_id, (int, np.integer)) and 0 <= doc_id < self.count):
+            raise KeyError(doc_id)
+        return self.make(int(doc_id))
+
+
+class FrozenIndex:
+    """
+    memory-mapped, শুধু পড়ার ইনভার্টেড ইনডেক্স - InvertedIndex এর সার্চ ইন্টারফেস
+    (scorer গুলো কোনো পার্থক্য দেখে না); ডকুমেন্ট যোগ/মোছা যায় না
+    make_document(row) → সারি নম্বর থেকে সোর্স dict
+    """
+
+    def __init__(self, folder, make_document):
+        folder = Path(folder)
+        self.terms = BlobArray(folder, 'terms')
+        for name in ('postings_indptr', 'postings_docs', 'postings_tfs', 'doc_rows', 'doc_lengths',
+                     'doc_terms_indptr', 'doc_term_ids'):
+            setattr(self, name, np.load(folder / f'{name}.npy', mmap_mode='r'))
+        self.total_length = float(self.doc_lengths.sum())
+        count = len(self.doc_rows)
+        self.documents = _LazyDocuments(count, lambda doc_id: make_document(int(self.doc_rows[doc_id])))
+        self.doc_terms = _LazyDocuments(count, self.terms_of)
+
+    def __len__(self):
+        return len(self.doc_rows)
+
+    def term_id(self, token):
+        """token এর id (সাজানো token টেবিলে বাইনারি সার্চ), না থাকলে None"""
+        return _find(self.terms, token.encode('utf-8'))
+
+    def terms_of(self, doc_id):
+        start, stop = self.doc_terms_indptr[doc_id], self.doc_terms_indptr[doc_id + 1]
+        return frozenset(self.terms[int(i)].decode('utf-8') for i in self.doc_term_ids[start:stop])
+
+    def document_frequency(self, token):
+        term = self.term_id(token)
+        if term is None:
+            return 0
+        return int(self.postings_indptr[term + 1] - self.postings_indptr[term])
+
+    def term_arrays(self, token):
+        """token এর (doc_ids, tfs) - mmap অ্যারের slice, কপি নয়"""
+        term = self.term_id(token)
+        if term is None:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+        start, stop = self.postings_indptr[term], self.postings_indptr[term + 1]
+        return self.postings_docs[start:stop], self.postings_tfs[start:stop]
+
+    def lengths_of(self, doc_ids):
+        return self.doc_lengths[doc_ids]
+
+    def match(self, query_tokens):
+        """InvertedIndex.match এর মতই: ম্যাচ করা কোয়েরি শব্দ / মোট কোয়েরি শব্দ"""
+        if not query_tokens:
+            return []
+        parts = [self.term_arrays(token)[0] for token in query_tokens]
+        parts = [doc_ids for doc_ids in parts if len(doc_ids)]
+        if not parts:
+            return []
+        doc_ids, counts = np.unique(np.concatenate(parts), return_counts=True)
+        total = len(query_tokens)
+        ranked = [(doc_id, count / total) for doc_id, count in zip(doc_ids.tolist(), counts.tolist())]
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+        return ranked
+
+
+def attach_name_index(folder):
+    """NameIndex যার dict/লিস্টগুলো memory-mapped (exact, prefix, word prefix একই কোডে চলে)"""
+    index = NameIndex()
+    index.exact_map = _list_map(folder, 'exact')
+    index.sorted_names = FrozenPairs(folder, 'names')
+    index.sorted_words = FrozenPairs(folder, 'words')
+    return index
+
+
+def attach_fuzzy_index(folder, max_distance, prefix_length):
+    """SymSpellIndex যার deletion dictionary ও term টেবিল memory-mapped"""
+    index = SymSpellIndex(max_distance=max_distance, prefix_length=prefix_length)
+    terms = BlobArray(folder, 'fuzzy_terms')
+    display = BlobArray(folder, 'fuzzy_display')
+    index.term_rows = _list_map(folder, 'fuzzy_terms')
+    index.name_rows = _list_map(folder, 'fuzzy_names')
+    index.deletes = _list_map(folder, 'fuzzy_deletes', lambda ids: frozenset(terms[i].decode('utf-8') for i in ids))
+    index.display = FrozenMap(terms, lambda position: display[position].decode('utf-8'))
+    return index
+
+
+class AttachedIndex:
+    """attach করা একটি শেয়ার্ড ইনডেক্স ফোল্ডার"""
+
+    def __init__(self, folder, vectorizer, meta):
+        from scipy import sparse
+
+        self.folder = Path(folder)
+        self.meta = meta
+        self.columns = meta['columns']
+        self.name_columns = meta['name_columns']
+        self.text_columns = meta['text_columns']
+        arrays = [np.load(self.folder / f'tfidf_{part}.npy', mmap_mode='r') for part in _CSR_PARTS]
+        self.matrix = sparse.csr_matrix(tuple(arrays), shape=tuple(meta['shape']), copy=False)
+        columns = np.load(self.folder / 'vocabulary_columns.npy', mmap_mode='r')
+        vectorizer.vocabulary_ = FrozenMap(BlobArray(self.folder, 'vocabulary'), lambda position: int(columns[position]))
+        vectorizer.idf_ = np.load(self.folder / 'idf.npy', mmap_mode='r')
+        self.vectorizer = vectorizer
+        self.records = RecordTable(self.folder)
+        self.name_index = attach_name_index(self.folder)
+        self.fuzzy_index = attach_fuzzy_index(self.folder, *meta['fuzzy'])
+
+    def index(self, make_document):
+        """মূল সারিগুলোর FrozenIndex"""
+        return FrozenIndex(self.folder, make_document)
+
+    def load_frame(self):
+        """পুরো DataFrame - zero-copy নয়, এই প্রসেসে পুরো ফাইল unpickle হয় (সার্চ বা UI এর জন্য নয়)"""
+        with open(self.folder / 'frame.pkl', 'rb') as f:
+            return pickle.load(f)
+
+
+class SharedIndex:
+    """(ডেটা ফাইলের SHA-256, vectorizer প্যারামিটার) → শেয়ার্ড ইনডেক্স ফোল্ডার"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def path_for(self, digest, vectorizer):
+        params = hashlib.sha256(vectorizer_params(vectorizer).encode('utf-8')).hexdigest()[:16]
+        return self.root / f"{digest}-{params}"
+
+    @contextmanager
+    def build_lock(self, source):
+        """
+        একই ডেটা ফাইলের জন্য একসাথে একটি প্রসেসই বিল্ড করে; বাকিরা অপেক্ষা করে তারপর attach করে
+        (লক ধরে attach চেষ্টা করুন, না পেলে বিল্ড করে publish)
+        """
+        digest = file_fingerprint(source)[2] or 'missing'
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / f'{digest}.lock', 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def attach(self, source, vectorizer):
+        """
+        source ফাইলের বর্তমান কনটেন্টের শেয়ার্ড ইনডেক্সে attach করুন
+        vectorizer: নতুন (ফিট না করা) vectorizer; ফোল্ডার না থাকলে বা প্যারামিটার না মিললে None
+        """
+        digest = file_fingerprint(source)[2]
+        if digest is None:
+            return None
+        folder = self.path_for(digest, vectorizer)
+        try:
+            with open(folder / 'meta.json', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('version') != SHARED_INDEX_VERSION or meta.get('params') != vectorizer_params(vectorizer):
+                return None
+            return AttachedIndex(folder, vectorizer, meta)
+        except (OSError, ValueError, KeyError, EOFError, ImportError, AttributeError, pickle.UnpicklingError):
+            return None
+
+    def publish(self, source, engine, index):
+        """
+        ইঞ্জিনের ইনডেক্স অ্যারেগুলো অ্যাটমিকভাবে লিখুন (অস্থায়ী ফোল্ডারে লিখে rename)
+        engine: data, vectorizer, tfidf_matrix, records, name_index, fuzzy_index, text_columns, name_columns()
+        index: শুধু মূল সারিগুলোর InvertedIndex ডকুমেন্ট (প্রতিটির 'row_index' = সারি নম্বর)
+        """
+        fingerprint = file_fingerprint(source)
+        if fingerprint[2] is None:
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(dir=self.root, prefix='.tmp'))
+        try:
+            matrix = engine.tfidf_matrix
+            for part in _CSR_PARTS:
+                np.save(tmp_dir / f'tfidf_{part}.npy', getattr(matrix, part))
+            np.save(tmp_dir / 'idf.npy', engine.vectorizer.idf_)
+            _write_blobs(tmp_dir, 'records', [
+                pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL) for record in engine.records
+            ])
+            self._write_index(tmp_dir, index)
+            self._write_names(tmp_dir, engine.name_index, engine.fuzzy_index)
+            vocabulary = sorted(engine.vectorizer.vocabulary_.items())
+            _write_blobs(tmp_dir, 'vocabulary', [term.encode('utf-8') for term, _ in vocabulary])
+            np.save(tmp_dir / 'vocabulary_columns.npy', np.asarray([column for _, column in vocabulary], dtype=np.int64))
+            with open(tmp_dir / 'frame.pkl', 'wb') as f:
+                pickle.dump(engine.data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            meta = {
+                'version': SHARED_INDEX_VERSION,
+                'source': fingerprint[0],
+                'params': vectorizer_params(engine.vectorizer),
+                'shape': list(matrix.shape),
+                'fuzzy': [engine.fuzzy_index.max_distance, engine.fuzzy_index.prefix_length],
+                'columns': [str(col) for col in engine.data.columns],
+                'name_columns': list(engine.name_columns()),
+                'text_columns': list(engine.text_columns),
+            }
+            with open(tmp_dir / 'meta.json', 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+            target = self.path_for(fingerprint[2], engine.vectorizer)
+            shutil.rmtree(target, ignore_errors=True)
+            try:
+                os.rename(tmp_dir, target)
+            except OSError:
+                # অন্য প্রসেস এর মধ্যেই লিখে ফেলেছে
+                pass
+        finally:
+            if tmp_dir.exists():
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    @staticmethod
+    def _write_names(folder, name_index, fuzzy_index):
+        """NameIndex ও SymSpellIndex → সাজানো key এর অ্যারে (attach এ bisect দিয়ে পড়া হয়)"""
+        _write_pairs(folder, 'names', name_index.sorted_names)
+        _write_pairs(folder, 'words', name_index.sorted_words)
+        _write_list_map(folder, 'exact', name_index.exact_map)
+
+        terms = _write_list_map(folder, 'fuzzy_terms', fuzzy_index.term_rows)
+        term_ids = {term: i for i, term in enumerate(terms)}
+        _write_blobs(folder, 'fuzzy_display', [fuzzy_index.display[term].encode('utf-8') for term in terms])
+        _write_list_map(folder, 'fuzzy_names', fuzzy_index.name_rows)
+        _write_list_map(folder, 'fuzzy_deletes', {
+            delete: sorted(term_ids[term] for term in matched) for delete, matched in fuzzy_index.deletes.items()
+        })
+
+    @staticmethod
+    def _write_index(folder, index):
+        """InvertedIndex → সাজানো token টেবিল + postings ও ডকুমেন্টের CSR অ্যারে"""
+        doc_ids = list(index.documents)
+        position = {doc_id: i for i, doc_id in enumerate(doc_ids)}
+        terms = sorted(index.postings, key=lambda term: term.encode('utf-8'))
+        term_ids = {term: i for i, term in enumerate(terms)}
+        _write_blobs(folder, 'terms', [term.encode('utf-8') for term in terms])
+
+        indptr = np.zeros(len(terms) + 1, dtype=np.int64)
+        docs, tfs = [], []
+        for i, term in enumerate(terms):
+            # postings ডকুমেন্ট যোগের ক্রমে, তাই doc position বাড়তে থাকে
+            postings = sorted((position[doc_id], tf) for doc_id, tf in index.postings[term].items())
+            docs.extend(doc for doc, _ in postings)
+            tfs.extend(tf for _, tf in postings)
+            indptr[i + 1] = len(docs)
+        np.save(folder / 'postings_indptr.npy', indptr)
+        np.save(folder / 'postings_docs.npy', np.asarray(docs, dtype=np.int64))
+        np.save(folder / 'postings_tfs.npy', np.asarray(tfs, dtype=np.float64))
+
+        doc_terms = [sorted(term_ids[term] for term in index.doc_terms[doc_id]) for doc_id in doc_ids]
+        np.save(folder / 'doc_rows.npy', np.asarray(
+            [index.documents[doc_id]['row_index'] for doc_id in doc_ids], dtype=np.int64
+        ))
+        np.save(folder / 'doc_lengths.npy', np.asarray(
+            [index.doc_lengths[doc_id] for doc_id in doc_ids], dtype=np.float64
+        ))
+        np.save(folder / 'doc_terms_indptr.npy', np.cumsum([0] + [len(t) for t in doc_terms], dtype=np.int64))
+        np.save(folder / 'doc_term_ids.npy', np.asarray([t for terms in doc_terms for t in terms], dtype=np.int64))
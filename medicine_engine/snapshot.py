@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+📦 মূল ডেটা ফাইলের স্টার্টআপ স্ন্যাপশট
+প্রথম লোডে প্রিপ্রসেস করা DataFrame এবং ফিট করা TF-IDF (vocabulary, IDF, CSR অ্যারে) ডিস্কে রাখা হয়
+পরের স্টার্টআপে Excel পার্স বা TF-IDF ফিট করতে হয় না - অ্যারেগুলো memory-map করে পড়া হয়
+
+ফোল্ডার: <cache_dir>/<ডেটা ফাইলের sha256>-<vectorizer প্যারামিটারের হ্যাশ>/
+    frame.pkl      - DataFrame (pickle, কলাম ব্লক হিসেবে)
+    idf.npy        - IDF ভেক্টর
+    tfidf_*.npy    - CSR ম্যাট্রিক্সের data/indices/indptr
+    meta.json      - ভার্সন, ফাইলের path/mtime, vectorizer প্যারামিটার, vocabulary
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from .shared import file_fingerprint
+
+# স্ন্যাপশটের ফরম্যাট বা প্রিপ্রসেসিং বদলালে বাড়ান - পুরনো স্ন্যাপশট আবার তৈরি হবে
+SNAPSHOT_VERSION = 1
+
+_CSR_PARTS = ('data', 'indices', 'indptr')
+
+
+def vectorizer_params(vectorizer):
+    """vectorizer এর প্যারামিটার (তুলনার জন্য স্থির টেক্সট)"""
+    return repr(sorted(vectorizer.get_params().items()))
+
+
+class EngineSnapshot:
+    """(ডেটা ফাইলের SHA-256, vectorizer প্যারামিটার) → প্রিপ্রসেস করা DataFrame + TF-IDF স্ন্যাপশট"""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+
+    def path_for(self, digest, vectorizer):
+        """একই ফাইল ভিন্ন vectorizer দিয়ে (ভিন্ন চ্যাটবটে) ব্যবহার হলে আলাদা স্ন্যাপশট"""
+        params = hashlib.sha256(vectorizer_params(vectorizer).encode('utf-8')).hexdigest()[:16]
+        return self.cache_dir / f"{digest}-{params}"
+
+    def load(self, source, vectorizer):
+        """
+        source ফাইলের বর্তমান কনটেন্টের স্ন্যাপশট: (DataFrame, vectorizer, CSR ম্যাট্রিক্স)
+        vectorizer: নতুন (ফিট না করা) vectorizer - প্যারামিটার না মিললে বা স্ন্যাপশট না থাকলে None
+        """
+        from scipy import sparse
+
+        digest = file_fingerprint(source)[2]
+        if digest is None:
+            return None
+        folder = self.path_for(digest, vectorizer)
+        try:
+            with open(folder / 'meta.json', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('version') != SNAPSHOT_VERSION or meta.get('params') != vectorizer_params(vectorizer):
+                return None
+            with open(folder / 'frame.pkl', 'rb') as f:
+                data = pickle.load(f)
+            arrays = [np.load(folder / f'tfidf_{part}.npy', mmap_mode='r') for part in _CSR_PARTS]
+            idf = np.load(folder / 'idf.npy', mmap_mode='r')
+            vocabulary = meta['vocabulary']
+            shape = tuple(meta['shape'])
+        except (OSError, ValueError, KeyError, EOFError, ImportError, AttributeError, pickle.UnpicklingError):
+            return None
+
+        vectorizer.vocabulary_ = vocabulary
+        vectorizer.idf_ = idf
+        matrix = sparse.csr_matrix(tuple(arrays), shape=shape, copy=False)
+        return data, vectorizer, matrix
+
+    def save(self, source, data, vectorizer, matrix):
+        """
+        অ্যাটমিকভাবে লিখুন: অস্থায়ী ফোল্ডারে সব লিখে তারপর rename
+        (অর্ধেক লেখা স্ন্যাপশট কখনো পড়া হবে না)
+        """
+        fingerprint = file_fingerprint(source)
+        if fingerprint[2] is None:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(dir=self.cache_dir, prefix='.tmp'))
+        try:
+            with open(tmp_dir / 'frame.pkl', 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            for part in _CSR_PARTS:
+                np.save(tmp_dir / f'tfidf_{part}.npy', getattr(matrix, part))
+            np.save(tmp_dir / 'idf.npy', vectorizer.idf_)
+            meta = {
+                'version': SNAPSHOT_VERSION,
+                'source': fingerprint[0],
+                'mtime_ns': fingerprint[1],
+                'params': vectorizer_params(vectorizer),
+                'shape': list(matrix.shape),
+                'vocabulary': {term: int(column) for term, column in vectorizer.vocabulary_.items()}
+            }
+            with open(tmp_dir / 'meta.json', 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+            target = self.path_for(fingerprint[2], vectorizer)
+            # পুরনো ভার্সন/প্যারামিটারের স্ন্যাপশট থাকলে সরিয়ে দিন
+            shutil.rmtree(target, ignore_errors=True)
+            try:
+                os.rename(tmp_dir, target)
+            except OSError:
+                # অন্য প্রসেস এর মধ্যেই একই স্ন্যাপশট লিখে ফেলেছে
+                pass
+        finally:
+            if tmp_dir.exists():
+                shutil.rmtree(tmp_dir, ignore_errors=True)
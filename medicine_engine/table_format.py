@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+🧾 টেবিল ফাইলের ফরম্যাট শনাক্তকরণ
+ফাইলের নাম/MIME নয়, প্রথম কয়েকটি bytes দেখে আসল ফরম্যাট (xlsx/xls/ods/csv) বের করা হয়
+তারপর একবারেই সঠিক রিডার দিয়ে মেমরির buffer থেকে পার্স - একের পর এক engine চেষ্টা করতে হয় না
+"""
+
+import io
+import re
+import zipfile
+
+ZIP_MAGIC = b'PK\x03\x04'
+OLE2_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+ODS_MIMETYPE = b'application/vnd.oasis.opendocument.spreadsheet'
+
+# CSV কিনা বুঝতে শুরুর কতটুকু দেখা হয়
+SNIFF_BYTES = 4096
+
+# টেক্সটে থাকে না এমন কন্ট্রোল bytes (ট্যাব, নতুন লাইন, form feed, escape বাদে) - থাকলে বাইনারি ফাইল
+BINARY_BYTES = re.compile(rb'[\x00-\x08\x0b\x0e-\x1a\x1c-\x1f]')
+
+# UTF-8 হিসেবে ডিকোড না হলে CSV এই এনকোডিংগুলোতে পড়া হয় (পুরনো Windows/Excel এক্সপোর্ট)
+# cp1252 এ অসংজ্ঞায়িত কয়েকটি byte আছে; latin-1 সব byte ডিকোড করে, তাই শেষে
+LEGACY_ENCODINGS = ('cp1252', 'latin-1')
+
+# ফরম্যাট → pandas.read_excel এর engine
+EXCEL_ENGINES = {'xlsx': 'openpyxl', 'xls': 'xlrd', 'ods': 'odf'}
+
+
+def _read_head(source, size):
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source[:size])
+    if hasattr(source, 'read'):
+        position = source.tell()
+        head = source.read(size)
+        source.seek(position)
+        return head
+    with open(source, 'rb') as f:
+        return f.read(size)
+
+
+def _zip_format(source):
+    """ZIP কন্টেইনারের ভেতরে দেখে xlsx না ods"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    position = source.tell() if hasattr(source, 'tell') else None
+    try:
+        with zipfile.ZipFile(source) as archive:
+            names = set(archive.namelist())
+            if 'mimetype' in names and archive.read('mimetype').strip() == ODS_MIMETYPE:
+                return 'ods'
+            if 'xl/workbook.xml' in names:
+                return 'xlsx'
+    except zipfile.BadZipFile:
+        return None
+    finally:
+        if position is not None:
+            source.seek(position)
+    return None
+
+
+def _looks_like_text(head):
+    """
+    বাইনারি কন্ট্রোল bytes ছাড়া টেক্সট কিনা - এনকোডিং দেখা হয় না
+    (UTF-8 নয় এমন cp1252/latin-1 CSV ও টেক্সট; পড়ার সময় read_table এনকোডিং বেছে নেয়)
+    """
+    return BINARY_BYTES.search(head) is None
+
+
+def sniff_table_format(source):
+    """
+    'xlsx', 'xls', 'ods', 'csv' অথবা None (চেনা যায়নি)
+    source: bytes, file-like (অবস্থান বদলায় না) অথবা ফাইলের path
+    """
+    head = _read_head(source, SNIFF_BYTES)
+    if head.startswith(ZIP_MAGIC):
+        return _zip_format(source)
+    if head.startswith(OLE2_MAGIC):
+        return 'xls'
+    if head and _looks_like_text(head):
+        return 'csv'
+    return None
+
+
+def read_table(source, **kwargs):
+    """
+    ফরম্যাট একবার শনাক্ত করে সঠিক pandas রিডার দিয়ে DataFrame
+    source: bytes, file-like অথবা path; kwargs সরাসরি রিডারে যায়
+    চেনা না গেলে ValueError
+    """
+    import pandas as pd
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    fmt = sniff_table_format(source)
+    if fmt == 'csv':
+        return _read_csv(source, **kwargs)
+    if fmt in EXCEL_ENGINES:
+        return pd.read_excel(source, engine=EXCEL_ENGINES[fmt], **kwargs)
+    raise ValueError("অচেনা ফাইল ফরম্যাট (xlsx/xls/ods/csv নয়)")
+
+
+def _read_csv(source, **kwargs):
+    """
+    CSV: প্রথমে UTF-8 (BOM সহ বা ছাড়া), পুরো ফাইল UTF-8 না হলে LEGACY_ENCODINGS একে একে
+    (শুধু শুরুর অংশ UTF-8 হলেও ফাইলের মাঝে ডিকোড ব্যর্থ হলে আবার পড়া হয়); encoding দিলে শুধু সেটি
+    """
+    import pandas as pd
+
+    encodings = [kwargs.pop('encoding')] if 'encoding' in kwargs else ['utf-8-sig', *LEGACY_ENCODINGS]
+    position = source.tell() if hasattr(source, 'tell') else None
+    for encoding in encodings[:-1]:
+        try:
+            return pd.read_csv(source, encoding=encoding, **kwargs)
+        except UnicodeDecodeError:
+            if position is not None:
+                source.seek(position)
+    return pd.read_csv(source, encoding=encodings[-1], **kwargs)
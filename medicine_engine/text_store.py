@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+🗄️ শেয়ার্ড ডকুমেন্ট টেক্সট স্টোর
+এক্সট্রাক্ট করা PDF/Word টেক্সট একটি append-only UTF-8 ফাইলে একবারই থাকে, সাথে offset টেবিল
+ফাইলটি memory-map করে পড়া হয় - সব সেশন ও প্রসেস একই পেজ ক্যাশ শেয়ার করে
+ইনডেক্স ও স্নিপেট Python স্ট্রিং নয়, (doc_id, byte offset, byte length) রাখে; টেক্সট লাগলে তখনই ডিকোড হয়
+
+ফোল্ডার:
+    texts.bin  - সব ডকুমেন্টের UTF-8 bytes পরপর
+    texts.idx  - প্রতি doc_id তে একটি রেকর্ড: (offset, length, SHA-256)
+একই টেক্সট (SHA-256) দ্বিতীয়বার যোগ হলে আগের doc_id ফেরত দেয়
+"""
+
+import hashlib
+import mmap
+import struct
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: শুধু এই প্রসেসের থ্রেডগুলোর মধ্যে লক
+    fcntl = None
+
+# texts.idx এর রেকর্ড: offset, length (little-endian uint64), SHA-256
+RECORD = struct.Struct('<QQ32s')
+
+
+def byte_spans(text, spans):
+    """টেক্সটের অক্ষর (offset, length) গুলো → UTF-8 byte (offset, length); প্রতিটি অংশ একবারই এনকোড হয়"""
+    positions = sorted({pos for offset, length in spans for pos in (offset, offset + length)})
+    byte_at = {}
+    previous = 0
+    total = 0
+    for pos in positions:
+        total += len(text[previous:pos].encode('utf-8'))
+        byte_at[pos] = total
+        previous = pos
+    return [(byte_at[offset], byte_at[offset + length] - byte_at[offset]) for offset, length in spans]
+
+
+class TextStore:
+    """append-only, memory-mapped টেক্সট স্টোর (একাধিক প্রসেস একই ফোল্ডার খুলতে পারে)"""
+
+    def __init__(self, folder):
+        self.folder = Path(folder)
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.data_path = self.folder / 'texts.bin'
+        self.index_path = self.folder / 'texts.idx'
+        for path in (self.data_path, self.index_path):
+            path.touch(exist_ok=True)
+        self._spans = []     # doc_id -> (offset, length)
+        self._ids = {}       # SHA-256 -> doc_id
+        self._map = None
+        self._lock = threading.Lock()
+        with self._lock:
+            self._load_index()
+
+    def __len__(self):
+        return len(self._spans)
+
+    def _load_index(self):
+        """অন্য প্রসেসের যোগ করা নতুন রেকর্ডগুলো পড়ুন (লক ধরে ডাকতে হবে)"""
+        with open(self.index_path, 'rb') as f:
+            f.seek(len(self._spans) * RECORD.size)
+            data = f.read()
+        for start in range(0, len(data) - RECORD.size + 1, RECORD.size):
+            offset, length, digest = RECORD.unpack_from(data, start)
+            self._ids.setdefault(digest, len(self._spans))
+            self._spans.append((offset, length))
+
+    def put(self, text):
+        """টেক্সট যোগ করুন (আগে থেকে থাকলে কিছু লেখা হয় না), doc_id ফেরত দেয়"""
+        data = text.encode('utf-8')
+        digest = hashlib.sha256(data).digest()
+        with self._lock:
+            doc_id = self._ids.get(digest)
+            if doc_id is not None:
+                return doc_id
+            with open(self.index_path, 'ab') as index_file:
+                # প্রসেসগুলোর মধ্যে: একবারে একজনই লেখে, লক পেয়ে আগে অন্যদের রেকর্ড পড়ে নেয়
+                if fcntl is not None:
+                    fcntl.flock(index_file, fcntl.LOCK_EX)
+                try:
+                    self._load_index()
+                    doc_id = self._ids.get(digest)
+                    if doc_id is not None:
+                        return doc_id
+                    with open(self.data_path, 'ab') as data_file:
+                        offset = data_file.seek(0, 2)
+                        data_file.write(data)
+                    # টেক্সট লেখা শেষ হলে তবেই রেকর্ড - অর্ধেক লেখা টেক্সট কখনো পড়া হয় না
+                    index_file.write(RECORD.pack(offset, len(data), digest))
+                    index_file.flush()
+                    doc_id = len(self._spans)
+                    self._spans.append((offset, len(data)))
+                    self._ids[digest] = doc_id
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(index_file, fcntl.LOCK_UN)
+        return doc_id
+
+    def span(self, doc_id):
+        """ডকুমেন্টের (offset, length) bytes এ"""
+        if doc_id >= len(self._spans):
+            with self._lock:
+                self._load_index()
+        return self._spans[doc_id]
+
+    def _view(self, end):
+        """ফাইলের memory map, দরকার হলে (ফাইল বড় হলে) নতুন করে ম্যাপ করা"""
+        view = self._map
+        if view is not None and len(view) >= end:
+            return view
+        with self._lock:
+            if self._map is None or len(self._map) < end:
+                with open(self.data_path, 'rb') as f:
+                    # পুরনো map বন্ধ করা হয় না - অন্য থ্রেড হয়তো এখনো পড়ছে
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return self._map
+
+    def read(self, doc_id, start=0, length=None):
+        """ডকুমেন্টের [start, start + length) bytes এর টেক্সট (length না দিলে শেষ পর্যন্ত)"""
+        offset, size = self.span(doc_id)
+        if length is None:
+            length = size - start
+        if length <= 0:
+            return ''
+        begin = offset + start
+        return self._view(begin + length)[begin:begin + length].decode('utf-8', errors='replace')
+
+
+class StoredPassage(Mapping):
+    """
+    ইনডেক্সে রাখা একটি প্যাসেজ - সোর্স dict এর মত পড়া যায়, কিন্তু টেক্সট রাখে না
+    'content' পড়লে তখনই স্টোর থেকে ডিকোড হয়; 'offset'/'length' ডকুমেন্টের ভেতরে byte হিসেবে
+    ফাইলের তথ্য (source, filename, upload_time, ...) সব প্যাসেজ একটি dict শেয়ার করে
+    """
+
+    __slots__ = ('store', 'file', 'doc_id', 'offset', 'length', 'page', 'passage_index')
+
+    OWN_KEYS = ('doc_id', 'offset', 'length', 'page', 'passage_index', 'content')
+
+    def __init__(self, store, file, doc_id, offset, length, page, passage_index):
+        self.store = store
+        self.file = file
+        self.doc_id = doc_id
+        self.offset = offset
+        self.length = length
+        self.page = page
+        self.passage_index = passage_index
+
+    @property
+    def content(self):
+        return self.store.read(self.doc_id, self.offset, self.length)
+
+    def __getitem__(self, key):
+        if key in self.OWN_KEYS:
+            return getattr(self, key)
+        return self.file[key]
+
+    def __iter__(self):
+        yield from self.file
+        yield from self.OWN_KEYS
+
+    def __contains__(self, key):
+        return key in self.OWN_KEYS or key in self.file
+
+    def __len__(self):
+        return len(self.file) + len(self.OWN_KEYS)
+
+
+def store_passages(store, text, passages, file):
+    """
+    পুরো টেক্সট স্টোরে রেখে split_passages এর প্যাসেজগুলোর StoredPassage লিস্ট
+    file: সব প্যাসেজের শেয়ার করা তথ্য (source, filename, upload_time, ...)
+    """
+    doc_id = store.put(text)
+    spans = byte_spans(text, [(passage['offset'], passage['length']) for passage in passages])
+    return [
+        StoredPassage(store, file, doc_id, offset, length, passage['page'], passage_index)
+        for passage_index, (passage, (offset, length)) in enumerate(zip(passages, spans))
+    ]
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🛰️ মেডিসিন সার্চের হেডলেস JSON সার্ভিস (Streamlit ছাড়া)
+কিয়স্ক, SMS গেটওয়ে ইত্যাদি ব্রাউজার ছাড়াই সরাসরি HTTP তে প্রশ্ন করতে পারে
+প্রতিটি প্রসেস চালুর সময় ব্যাকগ্রাউন্ডে একবার ইনডেক্স তৈরি করে (warm), তারপর সব রিকোয়েস্ট সেটিই ব্যবহার করে
+ইনডেক্স তৈরি চলাকালীন (/health এ "index": "building") উত্তর আসে ওষুধের নামের exact/prefix লুকআপ থেকে
+
+এন্ডপয়েন্ট (GET query string অথবা POST JSON বডি):
+    /health                          ইনডেক্সের অবস্থা
+    /search?q=napa&top_k=5           Excel থেকে ওষুধ (search_medicines); POST {"queries": [...]} এ একসাথে অনেক
+    /sources?q=kidney&scorer=bm25    সব উৎস (PDF/Word/API) থেকে (search_all_sources)
+    /medicine?name=Napa              একটি ওষুধের বিস্তারিত (get_medicine_details)
+    /answer?q=napa&mode=expert       চ্যাটবটের মতই ফরম্যাট করা উত্তর
+    /stats                           প্রতিটি এন্ডপয়েন্টের রিকোয়েস্ট সংখ্যা ও লেটেন্সি
+
+ব্যবহার:
+    python medicine_service.py --port 8000
+    python medicine_service.py --host 0.0.0.0 --port 8000 --processes 4 --threads 8 --shared-index .cache/shared
+    python medicine_service.py --wait-ready      # ইনডেক্স তৈরি শেষ হওয়ার পরই পোর্ট খোলে
+
+সার্চ CPU-bound এবং GIL ধরে চলে: CPU থ্রুপুট বাড়ে শুধু --processes দিয়ে (--shared-index দিলে প্রসেসগুলো
+একটি memory-mapped ইনডেক্স শেয়ার করে); --threads শুধু একই প্রসেসে একসাথে চলা রিকোয়েস্টের সংখ্যা
+"""
+
+import argparse
+import multiprocessing
+import os
+import socket
+
+import medicine_chatbot
+from medicine_chatbot import MedicineChatbot, get_shared_engine
+from medicine_engine.service import JsonService, ServiceError
+
+# ডিফল্ট ডেটা ফাইল ও স্কোরিং (Streamlit অ্যাপের মতই)
+DEFAULT_EXCEL_FILE = medicine_chatbot.DATA_FILE
+DEFAULT_SCORER = 'keyword'
+
+# একটি রিকোয়েস্টে সর্বোচ্চ কতগুলো ফলাফল ও কতগুলো প্রশ্ন (batch)
+MAX_TOP_K = 50
+MAX_BATCH = 256
+
+ANSWER_MODES = ('expert', 'strict', 'structured', 'full')
+
+
+def text_param(params, name):
+    """খালি নয় এমন টেক্সট প্যারামিটার, না থাকলে 400"""
+    value = params.get(name)
+    if not isinstance(value, str) or not value.strip():
+        raise ServiceError(400, f"'{name}' প্যারামিটার দরকার")
+    return value
+
+
+def int_param(params, name, default, maximum):
+    """1..maximum সীমার পূর্ণসংখ্যা প্যারামিটার"""
+    value = params.get(name, default)
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise ServiceError(400, f"'{name}' অবশ্যই পূর্ণসংখ্যা হতে হবে")
+    if not 1 <= value <= maximum:
+        raise ServiceError(400, f"'{name}' 1 থেকে {maximum} এর মধ্যে হতে হবে")
+    return value
+
+
+def build_service(chatbot, threads=None):
+    """চ্যাটবটের সার্চ ফাংশনগুলোকে এন্ডপয়েন্ট হিসেবে যুক্ত করা JsonService"""
+    service = JsonService(threads=threads)
+
+    def health(params):
+        return {
+            'status': 'ok',
+            'index': chatbot.engine.status,
+            'load_error': None if chatbot.engine.load_error is None else str(chatbot.engine.load_error),
+            'medicines': len(chatbot.engine.records),
+            'shared_index': chatbot.engine.shared_index is not None,
+            'sources': sum(len(index) for index in chatbot.engine.search_indexes()),
+            'data_version': list(chatbot.data_version),
+            'pid': os.getpid(),
+        }
+
+    def search(params):
+        top_k = int_param(params, 'top_k', 5, MAX_TOP_K)
+        if 'queries' in params:
+            queries = params['queries']
+            if (not isinstance(queries, list) or not 0 < len(queries) <= MAX_BATCH
+                    or not all(isinstance(query, str) for query in queries)):
+                raise ServiceError(400, f"'queries' অবশ্যই 1-{MAX_BATCH}টি টেক্সটের লিস্ট হতে হবে")
+            batch = chatbot.search_medicines_batch(queries, top_k=top_k)
+            return {'results': [{'query': query, 'results': results} for query, results in zip(queries, batch)]}
+        query = text_param(params, 'q')
+        return {'query': query, 'results': chatbot.search_medicines(query, top_k=top_k)}
+
+    def sources(params):
+        query = text_param(params, 'q')
+        top_k = int_param(params, 'top_k', 5, MAX_TOP_K)
+        try:
+            results = chatbot.search_all_sources(query, top_k=top_k, scorer=params.get('scorer'))
+        except ValueError as e:
+            # অজানা scorer
+            raise ServiceError(400, str(e))
+        return {'query': query, 'results': results}
+
+    def medicine(params):
+        name = text_param(params, 'name')
+        details = chatbot.get_medicine_details(name)
+        if details is None:
+            raise ServiceError(404, f"'{name}' নামের কোনো ওষুধ পাওয়া যায়নি")
+        return {'name': name, 'medicine': details}
+
+    def answer(params):
+        query = text_param(params, 'q')
+        mode = params.get('mode', 'expert')
+        if mode not in ANSWER_MODES:
+            raise ServiceError(400, f"'mode' অবশ্যই {', '.join(ANSWER_MODES)} এর একটি হতে হবে")
+        top_k = int_param(params, 'top_k', 5, MAX_TOP_K)
+        source_top_k = int_param(params, 'source_top_k', 10, MAX_TOP_K)
+        return {
+            'query': query,
+            'mode': mode,
+            'answer': chatbot.answer(query, mode=mode, top_k=top_k, source_top_k=source_top_k),
+        }
+
+    service.route('/health', health, methods=('GET',))
+    service.route('/search', search)
+    service.route('/sources', sources)
+    service.route('/medicine', medicine)
+    service.route('/answer', answer)
+    return service
+
+
+def serve(args):
+    """একটি প্রসেস: ব্যাকগ্রাউন্ডে warm ইনডেক্স তৈরি করে (অথবা শেয়ার্ড ইনডেক্সে attach করে) সাথে সাথে সার্ভ করে"""
+    if args.shared_index:
+        medicine_chatbot.SHARED_INDEX_DIR = args.shared_index
+    engine = get_shared_engine(args.excel, background=True)
+    if args.wait_ready:
+        engine.wait_ready()
+    chatbot = MedicineChatbot(args.excel, engine=engine, scorer=args.scorer)
+    service = build_service(chatbot, threads=args.threads)
+    loaded = f"{len(engine.records)}টি ওষুধ লোড হয়েছে" if engine.ready else f"ইনডেক্স: {engine.status}"
+    print(f"🛰️ [{os.getpid()}] http://{args.host}:{args.port} - {loaded}")
+    service.serve_forever(args.host, args.port, reuse_port=args.processes > 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="মেডিসিন সার্চের JSON HTTP সার্ভিস")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--excel', default=DEFAULT_EXCEL_FILE, help="ওষুধের ডেটা ফাইল")
+    parser.add_argument('--scorer', default=DEFAULT_SCORER, help="সব উৎসের স্কোরিং: keyword বা bm25")
+    parser.add_argument('--threads', type=int, default=None,
+                        help="প্রতি প্রসেসে একসাথে কতগুলো রিকোয়েস্ট চলবে (GIL এর কারণে CPU থ্রুপুট বাড়ে না)")
+    parser.add_argument('--processes', type=int, default=1,
+                        help="একই পোর্টে কতগুলো প্রসেস - CPU থ্রুপুট বাড়ানোর একমাত্র উপায় (SO_REUSEPORT দরকার)")
+    parser.add_argument('--shared-index', default=None,
+                        help="প্রসেসগুলো এই ফোল্ডারের একটি memory-mapped ইনডেক্স শেয়ার করে (একবারই তৈরি হয়)")
+    parser.add_argument('--wait-ready', action='store_true',
+                        help="ইনডেক্স তৈরি শেষ হলে তবেই সার্ভ শুরু (না দিলে তৈরির সময় নামের দ্রুত খোঁজ থেকে উত্তর)")
+    args = parser.parse_args()
+
+    if args.processes <= 1:
+        serve(args)
+        return
+    if not hasattr(socket, 'SO_REUSEPORT'):
+        parser.error("এই প্ল্যাটফর্মে SO_REUSEPORT নেই - --processes 1 ব্যবহার করুন")
+
+    # OS নতুন সংযোগগুলো প্রসেসগুলোর মধ্যে ভাগ করে দেয়
+    processes = [multiprocessing.Process(target=serve, args=(args,)) for _ in range(args.processes)]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+
+
+if __name__ == "__main__":
+    main()
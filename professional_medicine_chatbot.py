@@ -5,257 +5,21 @@
 Modern এবং Professional Frontend Design with Better UX
 """
 
-import streamlit as st
-import pandas as pd
-import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import re
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
 import warnings
-import requests
-import json
-from pathlib import Path
-import io
-import base64
-from datetime import datetime
-warnings.filterwarnings('ignore')
-
-# PDF এবং Word ফাইল প্রসেসিং এর জন্য
-try:
-    import PyPDF2
-    import docx
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
-
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
-
-class ProfessionalMedicineChatbot:
-    def __init__(self, excel_file):
-        self.excel_file = excel_file
-        self.data = None
-        self.vectorizer = None
-        self.tfidf_matrix = None
-        self.pdf_data = []
-        self.word_data = []
-        self.excel_data = []
-        self.api_data = []
-        self.all_sources = []
-        self.bengali_stop_words = set([
-            'এবং', 'অথবা', 'কিন্তু', 'যদি', 'তবে', 'কেন', 'কিভাবে', 'কোথায়', 'কখন', 
-            'কি', 'কোন', 'কাদের', 'কার', 'কাকে', 'হয়', 'হয়েছে', 'হবে', 'করতে', 'করে', 
-            'করবে', 'আছে', 'নেই', 'থাকবে', 'এটা', 'এটি', 'সেটা', 'সেটি', 'এই', 'সেই'
-        ])
-        self.load_data()
-        self.preprocess_data()
 
-    def save_uploaded_file_to_data_source(self, uploaded_file):
-        """UploadedFile ডিস্কে সেভ করুন"""
-        try:
-            data_dir = Path("data source")
-            data_dir.mkdir(parents=True, exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_name = uploaded_file.name
-            dest_path = data_dir / f"{timestamp}_{safe_name}"
-            
-            try:
-                bytes_data = uploaded_file.getbuffer()
-                with open(dest_path, "wb") as f:
-                    f.write(bytes_data)
-            except Exception:
-                content = uploaded_file.read()
-                with open(dest_path, "wb") as f:
-                    f.write(content)
-                try:
-                    uploaded_file.seek(0)
-                except Exception:
-                    pass
-            return str(dest_path)
-        except Exception as e:
-            st.warning(f"ফাইল সেভ করতে সমস্যা: {e}")
-            return ""
-
-    def load_data(self):
-        """Excel ফাইল থেকে ডেটা লোড করুন"""
-        try:
-            self.data = pd.read_excel(self.excel_file)
-            return True
-        except Exception as e:
-            st.error(f"❌ ডেটা লোড করতে সমস্যা হয়েছে: {str(e)}")
-            return False
-
-    def add_pdf_file(self, pdf_file):
-        """PDF ফাইল থেকে টেক্সট এক্সট্র্যাক্ট করুন"""
-        if not PDF_AVAILABLE:
-            st.error("❌ PDF সমর্থন নেই। PyPDF2 ইনস্টল করুন।")
-            return False
-            
-        try:
-            saved_path = self.save_uploaded_file_to_data_source(pdf_file)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            text_content = ""
-            
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                text_content += page.extract_text() + "\n"
-            
-            if text_content.strip():
-                self.pdf_data.append({
-                    'filename': pdf_file.name,
-                    'content': text_content,
-                    'source': 'PDF',
-                    'upload_time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    'saved_path': saved_path
-                })
-                return True
-            else:
-                st.warning("⚠️ PDF ফাইল থেকে কোন টেক্সট পাওয়া যায়নি")
-                return False
-                
-        except Exception as e:
-            st.error(f"❌ PDF ফাইল প্রসেস করতে সমস্যা: {str(e)}")
-            return False
-
-    def add_word_file(self, word_file):
-        """Word ফাইল থেকে টেক্সট এক্সট্র্যাক্ট করুন"""
-        if not PDF_AVAILABLE:
-            st.error("❌ Word সমর্থন নেই। python-docx ইনস্টল করুন।")
-            return False
-            
-        try:
-            saved_path = self.save_uploaded_file_to_data_source(word_file)
-            doc = docx.Document(word_file)
-            text_content = ""
-            
-            for paragraph in doc.paragraphs:
-                text_content += paragraph.text + "\n"
-            
-            if text_content.strip():
-                self.word_data.append({
-                    'filename': word_file.name,
-                    'content': text_content,
-                    'source': 'Word',
-                    'upload_time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    'saved_path': saved_path
-                })
-                return True
-            else:
-                st.warning("⚠️ Word ফাইল থেকে কোন টেক্সট পাওয়া যায়নি")
-                return False
-                
-        except Exception as e:
-            st.error(f"❌ Word ফাইল প্রসেস করতে সমস্যা: {str(e)}")
-            return False
+import pandas as pd
+import streamlit as st
 
-    def add_excel_file(self, excel_file):
-        """Excel ফাইল থেকে ডেটা লোড করুন"""
-        try:
-            saved_path = self.save_uploaded_file_to_data_source(excel_file)
-            df = pd.read_excel(excel_file)
-            
-            if len(df) > 0:
-                text_content = ""
-                for idx, row in df.iterrows():
-                    row_text = " ".join([str(val) for val in row.values if pd.notna(val)])
-                    text_content += row_text + "\n"
-                
-                self.excel_data.append({
-                    'filename': excel_file.name,
-                    'content': text_content,
-                    'dataframe': df,
-                    'source': 'Excel',
-                    'upload_time': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    'saved_path': saved_path
-                })
-                return True
-            else:
-                st.warning("⚠️ Excel ফাইলে কোন ডেটা নেই")
-                return False
-                
-        except Exception as e:
-            st.error(f"❌ Excel ফাইল প্রসেস করতে সমস্যা: {str(e)}")
-            return False
+from medicine_chatbot import MedicineChatbot
 
-    def clean_text(self, text):
-        """টেক্সট পরিষ্কার এবং প্রিপ্রসেস করুন"""
-        text = text.lower()
-        text = re.sub(r'[^\w\s\u0980-\u09FF]', ' ', text)
-        text = re.sub(r'\s+', ' ', text).strip()
-        words = text.split()
-        filtered_words = [word for word in words if word not in self.bengali_stop_words]
-        return ' '.join(filtered_words)
+warnings.filterwarnings('ignore')
 
-    def preprocess_data(self):
-        """সার্চের জন্য ডেটা প্রিপ্রসেস করুন"""
-        if self.data is None:
-            return
-            
-        text_columns = []
-        for col in self.data.columns:
-            if self.data[col].dtype == 'object':
-                text_columns.append(col)
-        
-        self.data['combined_text'] = self.data[text_columns].fillna('').astype(str).agg(' '.join, axis=1)
-        self.data['cleaned_text'] = self.data['combined_text'].apply(self.clean_text)
-        
-        self.vectorizer = TfidfVectorizer(
-            max_features=2000,
-            ngram_range=(1, 3),
-            min_df=1,
-            stop_words=None
-        )
-        
-        self.tfidf_matrix = self.vectorizer.fit_transform(self.data['cleaned_text'])
+class ProfessionalMedicineChatbot(MedicineChatbot):
+    """
+    প্রফেশনাল ইন্টারফেসের চ্যাটবট
+    লোড, নরমালাইজেশন, ইনডেক্স ও ক্যাশ medicine_chatbot এর শেয়ার্ড ইঞ্জিনের - একই প্রসেসের সব অ্যাপ একটি ইনডেক্স ব্যবহার করে
+    """
 
-    def search_medicines(self, query, top_k=5):
-        """প্রশ্নের ভিত্তিতে ওষুধ খুঁজুন"""
-        if self.data is None or self.vectorizer is None:
-            return []
-        
-        cleaned_query = self.clean_text(query)
-        query_vector = self.vectorizer.transform([cleaned_query])
-        similarities = cosine_similarity(query_vector, self.tfidf_matrix).flatten()
-        top_indices = similarities.argsort()[-top_k:][::-1]
-        
-        results = []
-        for idx in top_indices:
-            if similarities[idx] > 0.05:
-                medicine_info = self.data.iloc[idx].to_dict()
-                medicine_info['similarity_score'] = similarities[idx]
-                results.append(medicine_info)
-        
-        return results
-    
-    def get_medicine_details(self, medicine_name):
-        """নির্দিষ্ট ওষুধের বিস্তারিত তথ্য খুঁজুন"""
-        if self.data is None:
-            return None
-        
-        # Search for exact match first
-        for col in self.data.columns:
-            if self.data[col].dtype == 'object':
-                matches = self.data[self.data[col].str.contains(medicine_name, case=False, na=False)]
-                if len(matches) > 0:
-                    return matches.iloc[0].to_dict()
-        
-        # If no exact match, use similarity search
-        results = self.search_medicines(medicine_name, top_k=1)
-        if results:
-            return results[0]
-        
-        return None
 
 def create_professional_sidebar():
     """Professional sidebar with organized layout"""
@@ -277,14 +41,14 @@ def create_professional_sidebar():
         )
         
         # Quick stats with professional layout
-        if 'chatbot' in st.session_state and st.session_state.chatbot.data is not None:
+        if 'chatbot' in st.session_state and st.session_state.chatbot.engine.loaded:
             st.markdown("---")
             st.markdown("### 📊 পরিসংখ্যান")
             col1, col2 = st.columns(2)
             with col1:
-                st.metric("মোট ওষুধ", len(st.session_state.chatbot.data))
+                st.metric("মোট ওষুধ", len(st.session_state.chatbot.engine.records))
             with col2:
-                st.metric("কলাম", len(st.session_state.chatbot.data.columns))
+                st.metric("কলাম", len(st.session_state.chatbot.engine.record_columns()))
         
         # Quick search with professional styling
         st.markdown("---")
@@ -307,10 +71,7 @@ def create_professional_sidebar():
         if st.button("🗑️ সব ফাইল মুছুন", key="clear_all_files"):
             if 'chatbot' in st.session_state:
                 chatbot = st.session_state.chatbot
-                chatbot.pdf_data = []
-                chatbot.word_data = []
-                chatbot.excel_data = []
-                chatbot.api_data = []
+                chatbot.clear_uploaded_files()
                 st.success("✅ সব ফাইল মুছে ফেলা হয়েছে")
         
         return page
@@ -403,7 +164,7 @@ def create_professional_main_interface():
             st.rerun()
     
     # System status section with professional organization
-    if 'chatbot' in st.session_state and st.session_state.chatbot.data is not None:
+    if 'chatbot' in st.session_state and st.session_state.chatbot.engine.loaded:
         st.markdown("---")
         st.markdown("### 📊 সিস্টেম স্ট্যাটাস")
         st.markdown("---")
@@ -411,10 +172,10 @@ def create_professional_main_interface():
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("💊 মোট ওষুধ", len(st.session_state.chatbot.data))
+            st.metric("💊 মোট ওষুধ", len(st.session_state.chatbot.engine.records))
         
         with col2:
-            st.metric("📋 কলাম সংখ্যা", len(st.session_state.chatbot.data.columns))
+            st.metric("📋 কলাম সংখ্যা", len(st.session_state.chatbot.engine.record_columns()))
         
         with col3:
             st.metric("📁 আপলোড ফাইল", 
@@ -826,8 +587,8 @@ def main():
     if 'chatbot' not in st.session_state:
         try:
             st.session_state.chatbot = ProfessionalMedicineChatbot('medicine_data.xlsx')
-            if st.session_state.chatbot.data is not None:
-                st.success(f"✅ ডেটা সফলভাবে লোড হয়েছে! মোট {len(st.session_state.chatbot.data)} টি ওষুধ পাওয়া গেছে।")
+            if st.session_state.chatbot.engine.loaded:
+                st.success(f"✅ ডেটা সফলভাবে লোড হয়েছে! মোট {len(st.session_state.chatbot.engine.records)} টি ওষুধ পাওয়া গেছে।")
         except Exception as e:
             st.error(f"❌ চ্যাটবট লোড করতে সমস্যা: {str(e)}")
             st.stop()
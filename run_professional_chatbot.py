@@ -27,7 +27,6 @@ def check_requirements():
         'streamlit',
         'pandas',
         'scikit-learn',
-        'nltk',
         'openpyxl'
     ]
     
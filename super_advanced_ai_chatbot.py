@@ -7,13 +7,14 @@ ChatGPT/Cursor AI স্টাইলে সর্বোচ্চ মানের
 
 import streamlit as st
 import pandas as pd
-import numpy as np
 from datetime import datetime
-import json
-import re
 from typing import List, Dict, Any
 import random
 
+from medicine_chatbot import MedicineChatbot
+
+DATA_FILE = 'medicine_data.xlsx'
+
 # Page configuration
 st.set_page_config(
     page_title="🚀 সুপার উন্নত AI মেডিসিন চ্যাটবট",
@@ -61,58 +62,38 @@ st.markdown("""
 
 class SuperAdvancedMedicineChatbot:
     def __init__(self):
-        self.medicine_data = None
+        # লোড, নরমালাইজেশন, ইনডেক্স ও ক্যাশ medicine_chatbot এর শেয়ার্ড ইঞ্জিনের; এখানে শুধু উত্তর সাজানো হয়
+        self.retriever = MedicineChatbot(DATA_FILE)
         self.conversation_history = []
         self.search_analytics = {}
         self.load_data()
         
     def load_data(self):
-        """Load medicine data with enhanced error handling"""
-        try:
-            self.medicine_data = pd.read_excel('medicine_data.xlsx')
-            self.medicine_data = self.medicine_data.fillna('')
-            st.success("✅ মেডিসিন ডেটা সফলভাবে লোড হয়েছে!")
-            st.info(f"📊 **ডেটা পরিসংখ্যান:** {len(self.medicine_data)}টি মেডিসিন লোড হয়েছে")
-        except Exception as e:
-            st.error(f"❌ ডেটা লোড করতে সমস্যা: {e}")
-            self.medicine_data = pd.DataFrame()
+        """শেয়ার্ড ইঞ্জিনের ডেটার পরিসংখ্যান দেখান (ইঞ্জিন প্রসেসে একবারই লোড হয়)"""
+        if self.retriever.engine.loaded:
+            st.info(f"📊 **ডেটা পরিসংখ্যান:** {len(self.retriever.engine.records)}টি মেডিসিন লোড হয়েছে")
     
     def preprocess_text(self, text: str) -> str:
-        """Enhanced text preprocessing"""
-        text = text.lower().strip()
-        text = re.sub(r'[^\w\s\u0980-\u09FF]', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
-        return text
+        """ইঞ্জিনের একই নরমালাইজেশন"""
+        return self.retriever.clean_text(text)
     
     def find_medicine_info(self, query: str) -> Dict[str, Any]:
-        """Enhanced medicine search with multiple strategies"""
-        if self.medicine_data.empty:
+        """শেয়ার্ড ইনডেক্স থেকে মেডিসিন খুঁজুন"""
+        if not self.retriever.engine.loaded:
             return {"found": False, "message": "ডেটা পাওয়া যায়নি"}
         
         query_processed = self.preprocess_text(query)
         self.search_analytics[query_processed] = self.search_analytics.get(query_processed, 0) + 1
         
-        matches = []
-        
-        # Multiple search strategies
-        for idx, row in self.medicine_data.iterrows():
-            medicine_name = str(row.get('medicine_name', '')).lower()
-            generic_name = str(row.get('generic_name', '')).lower()
-            indication = str(row.get('indication', '')).lower()
-            
-            if (query_processed in medicine_name or 
-                query_processed in generic_name or 
-                query_processed in indication):
-                matches.append(row.to_dict())
-        
-        # Remove duplicates
+        # একই নামের সারি একবারই; ফাঁকা ঘর '' (আগের fillna('') এর মতই)
+        name_column = self.retriever.engine.name_columns()[0]
         unique_matches = []
         seen = set()
-        for match in matches:
-            medicine_id = match.get('medicine_name', '')
+        for match in self.retriever.search_medicines(query, top_k=10):
+            medicine_id = match.get(name_column, '')
             if medicine_id not in seen:
                 seen.add(medicine_id)
-                unique_matches.append(match)
+                unique_matches.append({key: '' if pd.isna(value) else value for key, value in match.items()})
         
         if unique_matches:
             return {"found": True, "data": unique_matches[:5]}
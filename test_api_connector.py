@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - API কানেক্টর (লোকাল HTTP স্টাব সার্ভার দিয়ে)
+"""
+
+import gc
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from medicine_chatbot import MedicineChatbot
+from medicine_engine import ApiConnector, ConnectorRegistry, find_records, flatten_record
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+
+MEDICINES = [
+    {'name': 'Zyloxin', 'price': {'mrp': 12, 'unit': 'tablet'}, 'uses': ['জ্বর', 'সংক্রমণ']},
+    {'name': 'Brufen', 'price': {'mrp': 5, 'unit': 'tablet'}, 'uses': ['ব্যথা']},
+    {'name': 'Seclo', 'price': {'mrp': 7, 'unit': 'capsule'}, 'uses': ['গ্যাস্ট্রিক']},
+]
+
+
+class StubApi(BaseHTTPRequestHandler):
+    """
+    /link?page=N   - Link হেডারে পরের পেজ
+    /body?page=N   - JSON এর 'next' এ পরের পেজ
+    /cursor        - {'meta': {'next_cursor': ...}}
+    /away?to=URL   - Link হেডারে অন্য সার্ভারের URL
+    সব পেজে ETag; If-None-Match মিললে 304
+    """
+    protocol_version = 'HTTP/1.1'
+    server_state = None
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        state = self.server_state
+        state['ports'].add(self.client_address[1])
+        state['keys'].append(self.headers.get('X-API-Key'))
+        state['auth'].append(self.headers.get('Authorization'))
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        items = state['items']
+        page = int(query.get('page', ['0'])[0])
+        cursor = query.get('cursor', [None])[0]
+        position = int(cursor) if cursor else page
+
+        records = items[position:position + 1]
+        more = position + 1 < len(items)
+        etag = '"' + hashlib.sha256(json.dumps(items).encode()).hexdigest()[:16] + '"'
+        if position == 0 and self.headers.get('If-None-Match') == etag:
+            state['not_modified'] += 1
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        headers = {'ETag': etag, 'Content-Type': 'application/json'}
+        if url.path == '/away':
+            body = records
+            headers['Link'] = f'<{query["to"][0]}>; rel="next"'
+        elif url.path == '/link':
+            body = records
+            if more:
+                headers['Link'] = f'</link?page={position + 1}>; rel="next"'
+        elif url.path == '/body':
+            body = {'results': records, 'next': f'/body?page={position + 1}' if more else None}
+        else:
+            body = {'data': records, 'meta': {'next_cursor': str(position + 1) if more else None}}
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        state['bodies'] += 1
+        self.send_response(200)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def start_stub():
+    state = {'items': list(MEDICINES), 'bodies': 0, 'not_modified': 0, 'ports': set(), 'keys': [], 'auth': []}
+    handler = type('Handler', (StubApi,), {'server_state': state})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_flatten_and_find_records():
+    assert flatten_record(MEDICINES[0]) == {
+        'name': 'Zyloxin', 'price.mrp': 12, 'price.unit': 'tablet', 'uses': 'জ্বর, সংক্রমণ'
+    }
+    assert flatten_record({'brands': [{'name': 'Napa'}]}) == {'brands.0.name': 'Napa'}
+    assert find_records({'data': {'items': MEDICINES}}) == MEDICINES
+    assert find_records({'count': 3, 'rows': MEDICINES}) == MEDICINES
+    assert find_records({'name': 'Napa'}) == [{'name': 'Napa'}]
+
+
+def test_pagination_styles():
+    server, state, base = start_stub()
+    try:
+        for path in ('/link', '/body', '/cursor'):
+            connector = ApiConnector(base + path)
+            records = list(connector.iter_records())
+            assert [r['name'] for r in records] == ['Zyloxin', 'Brufen', 'Seclo'], path
+            assert connector.pages_fetched == 3
+    finally:
+        server.shutdown()
+
+
+def test_credentials_stay_on_origin():
+    server, state, base = start_stub()
+    other, other_state, other_base = start_stub()
+    try:
+        connector = ApiConnector(f"{base}/away?to={other_base}/link?page=2", api_key='secret')
+        assert [r['name'] for r in connector.iter_records()] == ['Zyloxin', 'Seclo']
+        assert state['keys'] == ['secret'] and state['auth'] == ['Bearer secret']
+        # অন্য হোস্ট/পোর্টের পরের পেজে key যায় না
+        assert other_state['keys'] == [None] and other_state['auth'] == [None]
+
+        connector = ApiConnector(base + '/link', api_key='secret')
+        list(connector.iter_records())
+        assert state['keys'][1:] == ['secret'] * 3
+    finally:
+        server.shutdown()
+        other.shutdown()
+
+
+def test_conditional_refetch_and_keep_alive():
+    server, state, base = start_stub()
+    try:
+        connector = ApiConnector(base + '/link')
+        assert len(list(connector.iter_records())) == 3
+        bodies = state['bodies']
+
+        # ডেটা বদলায়নি: শুধু একটি 304, কোনো বডি নয়
+        assert list(connector.iter_records()) == []
+        assert connector.last_status == 304 and state['bodies'] == bodies
+        assert connector.check() is False and connector.version == 0
+
+        # বদলালে check শুধু প্রথম পেজ আনে ও version বাড়ায়; রেকর্ড পরে স্ট্রিম হয়
+        state['items'].append({'name': 'Napa', 'price': {'mrp': 1, 'unit': 'tablet'}})
+        assert connector.check() is True and connector.version == 1
+        assert state['bodies'] == bodies + 1
+        assert connector.check() is False and connector.version == 1
+        assert [r['name'] for r in connector.iter_records(conditional=False)][-1] == 'Napa'
+
+        # সব রিকোয়েস্ট একটি keep-alive সংযোগে
+        assert len(state['ports']) == 1
+    finally:
+        server.shutdown()
+
+
+def test_failed_page_keeps_old_validators():
+    server, state, base = start_stub()
+    try:
+        connector = ApiConnector(base + '/link')
+        list(connector.iter_records())
+        etag = connector.etag
+        state['items'].append({'name': 'Napa'})
+        original = StubApi.do_GET
+
+        def broken(handler):
+            if 'page=3' in handler.path:
+                handler.send_response(500)
+                handler.send_header('Content-Length', '0')
+                handler.end_headers()
+                return
+            original(handler)
+
+        StubApi.do_GET = broken
+        try:
+            list(connector.iter_records())
+        except Exception:
+            pass
+        else:
+            raise AssertionError("HTTPError আশা করা হয়েছিল")
+        finally:
+            StubApi.do_GET = original
+        # অর্ধেক ফেচের পর পুরনো ETag থাকে, তাই পরের রিফ্রেশ আবার পুরো ডেটা আনে
+        assert connector.etag == etag
+        assert len(list(connector.iter_records())) == 4
+    finally:
+        server.shutdown()
+
+
+class Session:
+    pass
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.02)
+
+
+def test_registry_one_refresher_per_url():
+    server, state, base = start_stub()
+    try:
+        registry = ConnectorRegistry()
+        first, second = Session(), Session()
+        connector = registry.subscribe(first, base + '/link', refresh_interval=0.05)
+        thread = connector._thread
+        assert registry.subscribe(second, base + '/link', refresh_interval=0.05) is connector
+        assert connector._thread is thread and connector.refreshing
+        assert len(registry) == 1 and registry.subscribers(connector) == 2
+        # অন্য API key হলে আলাদা কানেক্টর
+        assert registry.subscribe(first, base + '/link', api_key='other') is not connector
+
+        registry.unsubscribe(first, connector)
+        assert connector.refreshing and registry.subscribers(connector) == 1
+
+        # শেষ সেশনটি unsubscribe না করেই হারিয়ে গেলে (garbage collect) পরের টিকে রিফ্রেশ থামে
+        del second
+        gc.collect()
+        wait_until(lambda: not connector.refreshing)
+        assert registry.subscribers(connector) == 0 and len(registry) == 1
+    finally:
+        server.shutdown()
+
+
+def test_chatbot_indexes_records_and_refreshes():
+    server, state, base = start_stub()
+    try:
+        chatbot = MedicineChatbot(REAL_EXCEL)
+        assert chatbot.add_api_data(base + '/cursor', refresh_interval=0.05)
+        item = chatbot.uploaded_files[0]
+        assert item['record_count'] == 3 and 'records' not in item and item['connector'].refreshing
+
+        results = chatbot.search_all_sources('Brufen', return_all=True)
+        api_hits = [r for r in results if r['source'] == 'API']
+        assert len(api_hits) == 1
+        assert api_hits[0]['data']['price.mrp'] == 5
+        assert '**price.unit:** tablet' in chatbot.build_full_info_response('Zyloxin')
+
+        # আপস্ট্রিমে নতুন রেকর্ড → ব্যাকগ্রাউন্ড রিফ্রেশ → পরের প্রশ্নে ইনডেক্সে
+        state['items'].append({'name': 'Napa Extra', 'price': {'mrp': 3, 'unit': 'tablet'}})
+        version = chatbot.data_version
+        deadline = time.time() + 5
+        while not chatbot.collect_api_refreshes():
+            assert time.time() < deadline, "ব্যাকগ্রাউন্ড রিফ্রেশ হয়নি"
+            time.sleep(0.02)
+        assert chatbot.data_version != version
+        api_docs = [d for d in chatbot.source_index.documents.values() if d['source'] == 'API']
+        assert len(api_docs) == 4
+        assert any(r['source'] == 'API' for r in chatbot.search_all_sources('Napa Extra', return_all=True))
+
+        # রিস্ট্রিম মাঝপথে ব্যর্থ হলে আগের রেকর্ডগুলোই থাকে
+        original = StubApi.do_GET
+
+        def broken(handler):
+            if 'cursor=2' in handler.path:
+                handler.send_response(500)
+                handler.send_header('Content-Length', '0')
+                handler.end_headers()
+                return
+            original(handler)
+
+        StubApi.do_GET = broken
+        try:
+            assert chatbot.reindex_api_item(item) is False and item['connector'].error
+        finally:
+            StubApi.do_GET = original
+        api_docs = [d for d in chatbot.source_index.documents.values() if d['source'] == 'API']
+        assert len(api_docs) == 4 and item['record_count'] == 4
+
+        # একই URL আবার যোগ করলে ডুপ্লিকেট হয় না
+        assert chatbot.add_api_data(base + '/cursor')
+        assert len(chatbot.uploaded_files) == 1
+
+        # অন্য সেশন একই URL যোগ করলে কানেক্টর ও রিফ্রেশ থ্রেড শেয়ার হয়, ইনডেক্স আলাদা
+        other = MedicineChatbot(REAL_EXCEL)
+        assert other.add_api_data(base + '/cursor', refresh_interval=0.05)
+        assert other.uploaded_files[0]['connector'] is item['connector']
+        assert other.uploaded_files[0]['record_count'] == 4
+
+        chatbot.clear_uploaded_files()
+        assert item['connector'].refreshing
+        other.clear_uploaded_files()
+        assert not item['connector'].refreshing
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    test_flatten_and_find_records()
+    test_pagination_styles()
+    test_credentials_stay_on_origin()
+    test_conditional_refetch_and_keep_alive()
+    test_failed_page_keeps_old_validators()
+    test_registry_one_refresher_per_url()
+    test_chatbot_indexes_records_and_refreshes()
+    print("✅ API কানেক্টর টেস্ট সম্পন্ন!")
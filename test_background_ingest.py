@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - ব্যাকগ্রাউন্ড PDF/Word ইনজেশন
+"""
+
+import glob
+import io
+import tempfile
+
+import medicine_chatbot
+from medicine_chatbot import MedicineChatbot
+from medicine_engine import IngestionPool, IngestJob, extract_pdf_pages
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+PDF_FILE = sorted(glob.glob('data source/*.pdf'))[0]
+DOCX_FILE = sorted(glob.glob('data source/*.docx'))[0]
+
+
+def upload(path, name):
+    buffer = io.BytesIO(open(path, 'rb').read())
+    buffer.name = name
+    return buffer
+
+
+def test_process_pool_pages_in_order():
+    data = open(PDF_FILE, 'rb').read()
+    pool = IngestionPool(max_workers=2)
+    try:
+        job = pool.submit('a.pdf', 'PDF', data)
+        assert job.wait(120)
+        assert job.status == IngestJob.DONE, job.error
+        assert job.pages == extract_pdf_pages(data)
+        assert job.done_units == job.total_units == len(job.pages)
+        assert job.progress == 1.0 and job.data is None
+    finally:
+        pool.shutdown()
+
+
+def test_queue_file_indexes_on_collect():
+    pool = IngestionPool(max_workers=2, use_processes=False)
+    chatbot = MedicineChatbot(REAL_EXCEL)
+    pdf_job = chatbot.queue_file(upload(PDF_FILE, 'kidney.pdf'), 'PDF', pool=pool)
+    word_job = chatbot.queue_file(upload(DOCX_FILE, 'diet.docx'), 'Word', pool=pool)
+    assert pdf_job.wait(60) and word_job.wait(60)
+
+    # শেষ না হওয়া পর্যন্ত ইনডেক্স অপরিবর্তিত; collect এর পরে যোগ হয়
+    assert chatbot.uploaded_files == []
+    finished = chatbot.collect_ingested()
+    assert set(finished) == {pdf_job, word_job}
+    assert [item['filename'] for item in chatbot.uploaded_files] == ['kidney.pdf', 'diet.docx']
+    assert 'page_starts' in chatbot.uploaded_files[0]
+    assert chatbot.uploaded_files[0]['saved_path']
+    assert chatbot.collect_ingested() == []
+    assert chatbot.pending_ingests == []
+    pool.shutdown()
+
+
+def test_failed_job_reports_error():
+    pool = IngestionPool(max_workers=1, use_processes=False)
+    job = pool.submit('broken.pdf', 'PDF', b'not a pdf')
+    assert job.wait(30)
+    assert job.status == IngestJob.FAILED and job.error
+    pool.shutdown()
+
+
+if __name__ == "__main__":
+    # pytest ছাড়া চালালে আপলোড আসল 'data source' ফোল্ডারে সেভ হবে না
+    medicine_chatbot.DATA_SOURCE_DIR = tempfile.mkdtemp()
+    test_process_pool_pages_in_order()
+    test_queue_file_indexes_on_collect()
+    test_failed_job_reports_error()
+    print("✅ ব্যাকগ্রাউন্ড ইনজেশন টেস্ট সম্পন্ন!")
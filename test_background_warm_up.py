@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - ব্যাকগ্রাউন্ডে ইনডেক্স তৈরি (readiness) এবং তৈরির সময় নামের দ্রুত সার্চ
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+import medicine_chatbot
+from medicine_chatbot import MedicineChatbot, MedicineSearchEngine, get_shared_engine
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+
+
+class GatedEngine(MedicineSearchEngine):
+    """gate খোলা না পর্যন্ত TF-IDF ফিট আটকে থাকে (নামের ইনডেক্স তার আগেই তৈরি হয়)"""
+    def __init__(self, *args, gate=None, **kwargs):
+        self.gate = gate
+        super().__init__(*args, **kwargs)
+
+    def preprocess_data(self):
+        self.gate.wait(60)
+        super().preprocess_data()
+
+
+class BrokenEngine(MedicineSearchEngine):
+    def build_index(self):
+        raise OSError("disk error")
+
+
+def wait_for(condition, timeout=30):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_quick_answers_while_building():
+    # স্ন্যাপশট নেই, তাই Excel পড়ে TF-IDF ফিট হবে
+    medicine_chatbot.SNAPSHOT_CACHE_DIR = tempfile.mkdtemp()
+    gate = threading.Event()
+    engine = GatedEngine(REAL_EXCEL, data_source_dir=tempfile.mkdtemp(), background=True, gate=gate)
+    try:
+        assert engine.status == 'building' and not engine.ready and not engine.loaded
+        wait_for(lambda: engine.catalog is not None)
+
+        quick = engine.search_medicines('dibedex', top_k=3)
+        assert [item['Name'] for item in quick] == ['Dibedex 60 capsules', 'Dibedex 30 capsules']
+        assert quick[0]['similarity_score'] == 0.8 and 'cleaned_text' not in quick[0]
+        assert engine.get_medicine_details('bhidex')['Name'] == 'Bhidex'
+        assert engine.get_medicine_details('nothing-matches-this') is None
+        assert engine.search_indexes() == [] and engine.suggest_medicine_names('Dibedx') == []
+
+        # চ্যাটবটের পুরো পাইপলাইন (সব উৎস সহ) তৈরির সময়েও উত্তর দেয়
+        chatbot = MedicineChatbot(REAL_EXCEL, engine=engine)
+        assert 'Dibedex' in chatbot.answer('Dibedex', mode='expert')
+        assert chatbot.search_all_sources('Dibedex') == []
+        building_version = chatbot.data_version
+    finally:
+        gate.set()
+
+    assert engine.wait_ready(60) and engine.status == 'ready' and engine.loaded
+    assert engine.catalog is None and chatbot.data_version != building_version
+    ranked = engine.search_medicines('Dibedex capsules', top_k=3)
+    assert ranked[0]['Name'].startswith('Dibedex') and 'cleaned_text' in ranked[0]
+    assert {r['source'] for r in chatbot.search_all_sources('Dibedex', return_all=True)} == {'Main Excel'}
+    assert engine.suggest_medicine_names('Dibedx')
+
+
+def test_failed_build_keeps_serving():
+    engine = BrokenEngine(REAL_EXCEL, data_source_dir=tempfile.mkdtemp(), background=True)
+    assert not engine.wait_ready(30)
+    assert engine.status == 'failed' and isinstance(engine.build_error, OSError)
+    assert engine.search_medicines('dibedex') == [] and engine.get_medicine_details('Dibedex') is None
+
+
+def test_build_leaves_rendering_to_caller():
+    # ব্যাকগ্রাউন্ড থ্রেডে/হেডলেস সার্ভিসে ScriptRunContext নেই - ইঞ্জিন নিজে Streamlit এ কিছু দেখায় না
+    rendered = []
+    originals = {name: getattr(medicine_chatbot.st, name) for name in ('success', 'error')}
+    for name in originals:
+        setattr(medicine_chatbot.st, name, lambda *args, **kwargs: rendered.append(args))
+    try:
+        medicine_chatbot.SNAPSHOT_CACHE_DIR = tempfile.mkdtemp()
+        engine = MedicineSearchEngine(REAL_EXCEL, data_source_dir=tempfile.mkdtemp(), background=True)
+        assert engine.wait_ready(60) and engine.loaded and engine.load_error is None
+        missing = os.path.join(tempfile.mkdtemp(), 'missing.xlsx')
+        broken = MedicineSearchEngine(missing, data_source_dir=tempfile.mkdtemp(), background=True)
+        assert broken.wait_ready(60) and not broken.loaded
+        assert isinstance(broken.load_error, FileNotFoundError)
+    finally:
+        for name, original in originals.items():
+            setattr(medicine_chatbot.st, name, original)
+    assert rendered == []
+
+
+def test_sync_engine_is_ready_immediately():
+    engine = MedicineSearchEngine(REAL_EXCEL, data_source_dir=tempfile.mkdtemp())
+    assert engine.status == 'ready' and engine.build_thread is None and engine.catalog is None
+
+
+def test_shared_engine_warm_up():
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, 'warm_up.xlsx')
+    shutil.copy(REAL_EXCEL, path)
+    engine = get_shared_engine(path, background=True)
+    # পরের সেশনগুলো একই (তৈরি হতে থাকা) ইঞ্জিন পায়, আবার তৈরি করে না
+    assert get_shared_engine(path) is engine and MedicineChatbot(path).engine is engine
+    assert engine.build_thread is not None and engine.wait_ready(60)
+    assert MedicineChatbot(path).search_medicines('Dibedex capsules', top_k=1)[0]['Name'].startswith('Dibedex')
+
+
+if __name__ == "__main__":
+    # pytest ছাড়া চালালে আপলোড আসল 'data source' ফোল্ডারে সেভ হবে না
+    medicine_chatbot.DATA_SOURCE_DIR = tempfile.mkdtemp()
+    test_quick_answers_while_building()
+    test_failed_build_keeps_serving()
+    test_build_leaves_rendering_to_caller()
+    test_sync_engine_is_ready_immediately()
+    test_shared_engine_warm_up()
+    print("✅ ব্যাকগ্রাউন্ড ইনডেক্স তৈরি টেস্ট সম্পন্ন!")
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - কনটেন্ট-অ্যাড্রেসড আপলোড স্টোর এবং ডুপ্লিকেট আপলোড শনাক্তকরণ
+"""
+
+import glob
+import io
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+import medicine_chatbot
+from medicine_chatbot import MedicineChatbot, MedicineSearchEngine
+from medicine_engine import BlobStore, data_source
+from medicine_engine.data_source import split_saved_name
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+PDF_FILE = sorted(glob.glob('data source/*.pdf'))[0]
+
+
+class FakeUpload(io.BytesIO):
+    def __init__(self, data, name):
+        super().__init__(data)
+        self.name = name
+
+
+def test_same_bytes_stored_once():
+    folder = tempfile.mkdtemp()
+    store = BlobStore(folder)
+    digest, path, created = store.put(b'abc', 'a.pdf', '2025-08-19 16:17:09')
+    again, same_path, created_again = store.put(b'abc', 'b.pdf', '2025-08-19 16:23:52')
+    assert created and not created_again
+    assert digest == again and path == same_path
+    assert path.read_bytes() == b'abc'
+    assert len(list((path.parent).iterdir())) == 1
+
+    # manifest ডিস্ক থেকে আবার পড়লেও দুটি নামই থাকে
+    entries = BlobStore(folder).entries()
+    assert len(entries) == 1
+    assert [u['name'] for u in entries[0][1]['uploads']] == ['a.pdf', 'b.pdf']
+
+
+def put_many(folder, worker):
+    """আলাদা প্রসেসের নিজস্ব BlobStore (নিজস্ব manifest ক্যাশ) থেকে আপলোড"""
+    store = BlobStore(folder)
+    for i in range(10):
+        store.put(f'{worker}-{i}'.encode(), f'w{worker}_{i}.pdf')
+
+
+def test_concurrent_processes_keep_all_entries():
+    folder = tempfile.mkdtemp()
+    # এই প্রসেসের স্টোর আগে manifest পড়ে ক্যাশ করে রাখে
+    store = BlobStore(folder)
+    store.put(b'first', 'first.pdf')
+    workers = [multiprocessing.Process(target=put_many, args=(folder, worker)) for worker in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert all(worker.exitcode == 0 for worker in workers)
+
+    # পুরনো ক্যাশ থাকা স্টোরের put অন্যদের এন্ট্রি মুছে দেয় না
+    store.put(b'last', 'last.pdf')
+    names = {entry['uploads'][0]['name'] for _, entry in BlobStore(folder).entries()}
+    assert len(names) == 42 and {'first.pdf', 'last.pdf', 'w3_9.pdf'} <= names
+    assert len(store.entries()) == 42
+
+
+def test_migrate_merges_duplicates():
+    folder = tempfile.mkdtemp()
+    shutil.copy(PDF_FILE, os.path.join(folder, '20250819_161709_kidney.pdf'))
+    shutil.copy(PDF_FILE, os.path.join(folder, '20250819_162352_kidney.pdf'))
+    moved, duplicates = BlobStore(folder).migrate(folder, split_saved_name)
+    assert (moved, duplicates) == (1, 1)
+    assert not glob.glob(os.path.join(folder, '*.pdf'))
+
+    files = data_source.folder_files(folder)
+    assert len(files) == 1
+    assert files[0][2] == 'kidney.pdf'
+    assert files[0][3] == '2025-08-19 16:17:09'
+
+
+def test_reupload_is_noop():
+    medicine_chatbot.DATA_SOURCE_DIR = tempfile.mkdtemp()
+    medicine_chatbot.EXTRACTION_CACHE_DIR = tempfile.mkdtemp()
+    engine = MedicineSearchEngine(REAL_EXCEL, data_source_dir=tempfile.mkdtemp())
+    chatbot = MedicineChatbot(REAL_EXCEL, engine=engine)
+    with open(PDF_FILE, 'rb') as f:
+        data = f.read()
+
+    assert chatbot.add_file(FakeUpload(data, 'kidney.pdf'), 'PDF')
+    indexed = len(chatbot.source_index)
+    version = chatbot.data_version
+    assert chatbot.add_file(FakeUpload(data, 'kidney copy.pdf'), 'PDF')
+    assert len(chatbot.uploaded_files) == 1
+    assert len(chatbot.source_index) == indexed
+    assert chatbot.data_version == version
+
+    blobs = glob.glob(os.path.join(str(medicine_chatbot.DATA_SOURCE_DIR), 'blobs', '*', '*'))
+    assert len(blobs) == 1
+
+
+def test_folder_duplicates_indexed_once():
+    folder = tempfile.mkdtemp()
+    shutil.copy(PDF_FILE, os.path.join(folder, '20250819_161709_kidney.pdf'))
+    shutil.copy(PDF_FILE, os.path.join(folder, '20250819_162352_kidney.pdf'))
+    medicine_chatbot.EXTRACTION_CACHE_DIR = tempfile.mkdtemp()
+    engine = MedicineSearchEngine(REAL_EXCEL, data_source_dir=folder)
+    assert len(engine.data_source_files) == 1
+    assert len(engine.data_source_hashes) == 1
+
+
+if __name__ == "__main__":
+    test_same_bytes_stored_once()
+    test_concurrent_processes_keep_all_entries()
+    test_migrate_merges_duplicates()
+    test_reupload_is_noop()
+    test_folder_duplicates_indexed_once()
+    print("✅ blob store টেস্ট সম্পন্ন!")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - BM25 স্কোরিং ইঞ্জিন
+"""
+
+import math
+
+import medicine_service
+from medicine_chatbot import MedicineChatbot
+from medicine_engine import BM25Scorer, InvertedIndex, KeywordScorer, get_scorer
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+
+DOCS = [
+    'jor matha betha',
+    'jor ' + 'kashi sordi pet betha gas ' * 40,
+    'diabetes insulin',
+    'jor jor paracetamol',
+]
+
+
+def make_index(docs):
+    index = InvertedIndex(lambda text: text.split())
+    index.add_documents({'content': doc} for doc in docs)
+    return index
+
+
+def reference_bm25(docs, query, k1=1.5, b=0.75):
+    tokenized = [doc.split() for doc in docs]
+    n = len(docs)
+    avgdl = sum(len(t) for t in tokenized) / n
+    scores = {}
+    for doc_id, tokens in enumerate(tokenized):
+        score = 0.0
+        for term in dict.fromkeys(query):
+            tf = tokens.count(term)
+            if not tf:
+                continue
+            df = sum(1 for t in tokenized if term in t)
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            score += idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len(tokens) / avgdl))
+        if score:
+            scores[doc_id] = score
+    return scores
+
+
+def test_bm25_matches_reference():
+    index = make_index(DOCS)
+    for query in (['jor'], ['jor', 'betha'], ['insulin', 'jor'], ['missing']):
+        for k1, b in ((1.5, 0.75), (1.2, 0.0), (2.0, 1.0)):
+            ranked = BM25Scorer(k1=k1, b=b).rank([index], query)
+            expected = reference_bm25(DOCS, query, k1, b)
+            assert {doc_id: round(score, 9) for score, _, doc_id in ranked} == \
+                {doc_id: round(score, 9) for doc_id, score in expected.items()}
+            assert [s for s, _, _ in ranked] == sorted((s for s, _, _ in ranked), reverse=True)
+
+
+def test_long_documents_do_not_dominate():
+    index = make_index(DOCS)
+    keyword_top = KeywordScorer().rank([index], ['jor'])
+    bm25_top = BM25Scorer().rank([index], ['jor'])
+    # কীওয়ার্ড স্কোরে সব সমান; BM25 এ ছোট ও বেশিবার উল্লেখ করা ডকুমেন্ট আগে
+    assert len({s for s, _, _ in keyword_top}) == 1
+    assert bm25_top[0][2] == 3 and bm25_top[-1][2] == 1
+
+
+def test_scores_are_global_across_indexes():
+    whole = make_index(DOCS)
+    first, second = make_index(DOCS[:2]), make_index(DOCS[2:])
+    split_scores = sorted(round(s, 9) for s, _, _ in BM25Scorer().rank([first, second], ['jor', 'betha']))
+    whole_scores = sorted(round(s, 9) for s, _, _ in BM25Scorer().rank([whole], ['jor', 'betha']))
+    assert split_scores == whole_scores
+
+
+def test_removed_documents_leave_scoring():
+    index = make_index(DOCS)
+    index.remove_document(3)
+    assert 3 not in {doc_id for _, _, doc_id in BM25Scorer().rank([index], ['jor'])}
+    assert index.total_length == sum(len(d.split()) for d in DOCS[:3])
+
+
+def test_search_all_sources_scorer_selection():
+    # ডিফল্ট র‍্যাঙ্কিং কীওয়ার্ড; BM25 বেছে নিতে হয়
+    assert isinstance(MedicineChatbot(REAL_EXCEL).scorer, KeywordScorer)
+    assert medicine_service.DEFAULT_SCORER == 'keyword'
+    chatbot = MedicineChatbot(REAL_EXCEL, scorer='bm25')
+    assert isinstance(chatbot.scorer, BM25Scorer)
+    bm25 = chatbot.search_all_sources('ডায়াবেটিস কার্যকর', return_all=True)
+    keyword = chatbot.search_all_sources('ডায়াবেটিস কার্যকর', return_all=True, scorer='keyword')
+    assert {r['filename'] for r in bm25} == {r['filename'] for r in keyword}
+    assert bm25[0]['score'] > 1.0 >= keyword[0]['score']
+
+    try:
+        get_scorer('tfidf')
+        assert False, "অজানা scorer এ ValueError হওয়া উচিত"
+    except ValueError:
+        pass
+
+
+if __name__ == "__main__":
+    test_bm25_matches_reference()
+    test_long_documents_do_not_dominate()
+    test_scores_are_global_across_indexes()
+    test_removed_documents_leave_scoring()
+    test_search_all_sources_scorer_selection()
+    print("✅ BM25 টেস্ট সম্পন্ন!")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - স্টার্টআপে 'data source' ফোল্ডার ইনডেক্স এবং এক্সট্রাকশন ডিস্ক ক্যাশ
+"""
+
+import glob
+import os
+import shutil
+import tempfile
+import time
+
+import medicine_chatbot
+from medicine_chatbot import MedicineChatbot, MedicineSearchEngine
+from medicine_engine import data_source
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+DOCX_FILE = sorted(glob.glob('data source/*.docx'))[0]
+PDF_FILE = sorted(glob.glob('data source/*.pdf'))[0]
+
+
+def make_folder():
+    folder = tempfile.mkdtemp()
+    shutil.copy(DOCX_FILE, os.path.join(folder, '20250819_163356_diet.docx'))
+    shutil.copy(PDF_FILE, os.path.join(folder, 'kidney.pdf'))
+    return folder
+
+
+def test_folder_parsed_once_then_cached():
+    folder = make_folder()
+    medicine_chatbot.EXTRACTION_CACHE_DIR = tempfile.mkdtemp()
+    calls = []
+    original = data_source.extract_document
+    data_source.extract_document = lambda *args: calls.append(args[0]) or original(*args)
+    try:
+        engine = MedicineSearchEngine(REAL_EXCEL, data_source_dir=folder)
+        assert len(calls) == 2
+        assert len(engine.data_source_files) == 2
+
+        warm = MedicineSearchEngine(REAL_EXCEL, data_source_dir=folder)
+        assert len(calls) == 2                        # আবার পার্স হয়নি
+        assert len(warm.source_index) == len(engine.source_index)
+        warm_docs = sorted(len(d) for d in warm.source_index.doc_terms.values())
+        assert warm_docs == sorted(len(d) for d in engine.source_index.doc_terms.values())
+
+        start = time.perf_counter()
+        warm.index_data_source()
+        assert time.perf_counter() - start < 0.5
+    finally:
+        data_source.extract_document = original
+
+
+def test_folder_documents_are_searchable():
+    folder = make_folder()
+    medicine_chatbot.EXTRACTION_CACHE_DIR = tempfile.mkdtemp()
+    engine = MedicineSearchEngine(REAL_EXCEL, data_source_dir=folder)
+    chatbot = MedicineChatbot(REAL_EXCEL, engine=engine)
+    assert chatbot.uploaded_files == []
+
+    docs = [d for d in engine.source_index.documents.values() if d['source'] == 'Word']
+    assert docs and docs[0]['filename'] == 'diet.docx'
+    assert docs[0]['upload_time'] == '2025-08-19 16:33:56'
+
+    word = engine.tokenize(docs[0]['content'])[0]
+    results = chatbot.search_all_sources(word, return_all=True)
+    assert any(r['filename'] == 'diet.docx' for r in results)
+
+
+if __name__ == "__main__":
+    # pytest ছাড়া চালালে আপলোড আসল 'data source' ফোল্ডারে সেভ হবে না
+    medicine_chatbot.DATA_SOURCE_DIR = tempfile.mkdtemp()
+    test_folder_parsed_once_then_cached()
+    test_folder_documents_are_searchable()
+    print("✅ data source ক্যাশ টেস্ট সম্পন্ন!")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - মূল ডেটা ফাইলের DataFrame ও TF-IDF স্ন্যাপশট
+"""
+
+import os
+import shutil
+import tempfile
+
+import pandas as pd
+
+import medicine_chatbot
+from medicine_chatbot import MedicineSearchEngine
+from medicine_engine import EngineSnapshot, file_fingerprint
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+
+
+def build(excel_file):
+    return MedicineSearchEngine(excel_file, data_source_dir=tempfile.mkdtemp())
+
+
+def count_excel_reads(func):
+    calls = []
+    original = pd.read_excel
+    pd.read_excel = lambda *args, **kwargs: calls.append(args) or original(*args, **kwargs)
+    try:
+        return func(), len(calls)
+    finally:
+        pd.read_excel = original
+
+
+def test_warm_start_uses_snapshot():
+    medicine_chatbot.SNAPSHOT_CACHE_DIR = tempfile.mkdtemp()
+    cold, cold_reads = count_excel_reads(lambda: build(REAL_EXCEL))
+    warm, warm_reads = count_excel_reads(lambda: build(REAL_EXCEL))
+    assert cold_reads == 1 and warm_reads == 0
+
+    # CSR অ্যারেগুলো ডিস্ক থেকে memory-map করা (কপি নয়, শুধু-পড়ার view)
+    for part in (warm.tfidf_matrix.data, warm.tfidf_matrix.indices, warm.tfidf_matrix.indptr):
+        assert not part.flags.owndata and not part.flags.writeable
+    assert (warm.tfidf_matrix != cold.tfidf_matrix).nnz == 0
+    assert warm.vectorizer.vocabulary_ == cold.vectorizer.vocabulary_
+
+    queries = ['Napa', 'জ্বর ব্যথা', 'Dibedex tablet']
+    name = cold.data.columns[0]
+
+    def ranked(engine):
+        return [[(r[name], r['similarity_score']) for r in hits] for hits in engine.search_medicines_batch(queries)]
+
+    assert ranked(warm) == ranked(cold)
+    assert [d['content'] for d in warm.source_index.documents.values()] == \
+        [d['content'] for d in cold.source_index.documents.values()]
+    assert warm.get_medicine_details('Bacicure')[name] == cold.get_medicine_details('Bacicure')[name]
+
+
+def test_changed_file_rebuilds_snapshot():
+    medicine_chatbot.SNAPSHOT_CACHE_DIR = tempfile.mkdtemp()
+    path = os.path.join(tempfile.mkdtemp(), 'medicine_data.xlsx')
+    shutil.copy(REAL_EXCEL, path)
+    build(path)
+
+    df = pd.read_excel(REAL_EXCEL).head(20)
+    df.to_excel(path, index=False)
+    engine, reads = count_excel_reads(lambda: build(path))
+    assert reads == 1
+    assert len(engine.data) == 20
+    assert len(os.listdir(medicine_chatbot.SNAPSHOT_CACHE_DIR)) == 2
+
+
+def test_broken_snapshot_is_ignored():
+    medicine_chatbot.SNAPSHOT_CACHE_DIR = tempfile.mkdtemp()
+    engine = build(REAL_EXCEL)
+    folder = EngineSnapshot(medicine_chatbot.SNAPSHOT_CACHE_DIR).path_for(
+        file_fingerprint(REAL_EXCEL)[2], engine.make_vectorizer()
+    )
+    with open(folder / 'frame.pkl', 'wb') as f:
+        f.write(b'not a pickle')
+
+    rebuilt, reads = count_excel_reads(lambda: build(REAL_EXCEL))
+    assert reads == 1
+    assert len(rebuilt.data) == len(engine.data)
+
+
+if __name__ == "__main__":
+    test_warm_start_uses_snapshot()
+    test_changed_file_rebuilds_snapshot()
+    test_broken_snapshot_is_ignored()
+    print("✅ স্ন্যাপশট টেস্ট সম্পন্ন!")
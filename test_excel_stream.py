@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - স্ট্রিমিং Excel ইনজেশন (DataFrame ছাড়া, সীমিত মেমরিতে)
+"""
+
+import io
+import tempfile
+import tracemalloc
+import zipfile
+
+import pandas as pd
+from openpyxl import Workbook
+
+import medicine_chatbot
+from medicine_chatbot import MedicineChatbot
+from medicine_engine import ExcelRow, RowSource, iter_excel_rows
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+
+
+def workbook_bytes(rows):
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    for row in rows:
+        sheet.append(row)
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def test_rows_match_pandas():
+    df = pd.read_excel(REAL_EXCEL)
+    rows = list(iter_excel_rows(REAL_EXCEL))
+    assert len(rows) == len(df)
+    assert rows[0][1].header == tuple(df.columns)
+    first = df.columns[0]
+    assert [row[first] for _, row in rows] == df[first].tolist()
+    assert [idx for idx, _ in rows] == list(range(len(df)))
+
+
+def test_blank_rows_and_header():
+    data = workbook_bytes([
+        [None, None],
+        ['Name', None, 'Name', None],
+        ['Napa', 5, 'x'],
+        [None, None, None],
+        ['Ace', None, None, None],
+    ])
+    rows = list(iter_excel_rows(data))
+    assert [idx for idx, _ in rows] == [0, 1]
+    row = rows[0][1]
+    assert isinstance(row, ExcelRow)
+    assert row.header == ('Name', 'Unnamed: 1', 'Name.1')
+    assert dict(row.items()) == {'Name': 'Napa', 'Unnamed: 1': 5, 'Name.1': 'x'}
+    assert row.text() == 'Napa 5 x'
+    assert rows[1][1].text() == 'Ace'
+
+
+def streaming_peak(count):
+    """
+    count সারির শিট স্ট্রিম করার সময় সর্বোচ্চ মেমরি
+    (xlsx এর shared strings টেবিল আগেই পুরো লোড হয়, তাই স্ট্রিং গুলো পুনরাবৃত্ত)
+    """
+    data = workbook_bytes(
+        [['Medicine Name', 'Generic Name', 'Price']] +
+        [[f'Medicine {i % 89}', f'Generic {i % 97}', i * 1.5] for i in range(count)]
+    )
+    tracemalloc.start()
+    try:
+        assert sum(1 for _ in iter_excel_rows(data)) == count
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_streaming_memory_is_flat():
+    # ৪ গুণ সারিতেও সর্বোচ্চ মেমরি প্রায় একই থাকে
+    small, large = streaming_peak(2000), streaming_peak(8000)
+    assert large < small * 1.5
+
+
+def test_upload_streams_into_index():
+    chatbot = MedicineChatbot(REAL_EXCEL)
+    upload = io.BytesIO(workbook_bytes([
+        ['Medicine Name', 'Uses'],
+        ['Zyloxin', 'জ্বর'],
+        ['Brufen', 'ব্যথা'],
+    ]))
+    upload.name = 'stream.xlsx'
+    assert chatbot.add_file(upload, "Excel")
+    item = chatbot.uploaded_files[0]
+    assert item['rows'] == 2 and 'dataframe' not in item and 'content' not in item
+
+    results = chatbot.search_all_sources('Zyloxin', return_all=True)
+    assert [r['source'] for r in results] == ['Uploaded Excel']
+    assert dict(results[0]['data'].items()) == {'Medicine Name': 'Zyloxin', 'Uses': 'জ্বর'}
+    assert chatbot.build_full_info_response('Zyloxin').count('**Uses:** জ্বর') == 1
+
+    # সেভ করা blob থেকে আবার স্ট্রিম করে ইনডেক্স তৈরি হয়
+    before = len(chatbot.source_index)
+    chatbot.update_all_sources()
+    assert len(chatbot.source_index) == before
+    assert chatbot.search_all_sources('Brufen', return_all=True)[0]['filename'] == 'stream.xlsx'
+
+
+def with_bad_cell(data, marker):
+    """marker মানের সেলটি সংখ্যা নয় এমন মানে বদলানো workbook (শিট মাঝপথে পড়া যায় না)"""
+    source = zipfile.ZipFile(io.BytesIO(data))
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as target:
+        for info in source.infolist():
+            part = source.read(info.filename)
+            if info.filename.startswith('xl/worksheets/'):
+                part = part.replace(f'<v>{marker}</v>'.encode(), b'<v>bad</v>')
+            target.writestr(info, part)
+    return buffer.getvalue()
+
+
+def test_failed_sheet_is_rolled_back():
+    chatbot = MedicineChatbot(REAL_EXCEL)
+    before = len(chatbot.source_index)
+    # প্রথম TF-IDF ব্যাচ যোগ হওয়ার পরে ভাঙা সেল
+    count = medicine_chatbot.EXCEL_TFIDF_BATCH + 10
+    rows = [['Medicine Name', 'Price']] + [[f'Zyloxin {i}', i] for i in range(count)] + [['Broken', 987654321]]
+    upload = io.BytesIO(with_bad_cell(workbook_bytes(rows), 987654321))
+    upload.name = 'broken.xlsx'
+    assert not chatbot.add_file(upload, "Excel")
+    assert not chatbot.uploaded_files and len(chatbot.source_index) == before
+    assert not chatbot.upload_rows and len(chatbot.upload_tfidf) == 0
+    assert not chatbot.search_all_sources('Zyloxin', return_all=True)
+
+    # ঠিক করা ফাইল আবার আপলোড করলে সারি একবারই থাকে
+    upload = io.BytesIO(workbook_bytes(rows[:-1]))
+    upload.name = 'fixed.xlsx'
+    assert chatbot.add_file(upload, "Excel")
+    assert len(chatbot.source_index) == before + count
+    assert len(chatbot.upload_rows) == len(chatbot.upload_tfidf) == count
+    assert len(chatbot.search_all_sources('Zyloxin', return_all=True)) == count
+    # সারির টেক্সট জমা থাকে না, data থেকে তৈরি হয়
+    source = next(doc for doc in chatbot.source_index.documents.values() if isinstance(doc, RowSource))
+    assert 'content' not in RowSource.__slots__
+    assert source['content'] == 'Zyloxin 0 0'
+
+
+if __name__ == "__main__":
+    # pytest ছাড়া চালালে আপলোড আসল 'data source' ফোল্ডারে সেভ হবে না
+    medicine_chatbot.DATA_SOURCE_DIR = tempfile.mkdtemp()
+    test_rows_match_pandas()
+    test_blank_rows_and_header()
+    test_streaming_memory_is_flat()
+    test_upload_streams_into_index()
+    test_failed_sheet_is_rolled_back()
+    print("✅ স্ট্রিমিং Excel টেস্ট সম্পন্ন!")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - টাইপো-সহনশীল ওষুধের নাম খোঁজা (SymSpell)
+"""
+
+import random
+import time
+
+from medicine_chatbot import MedicineChatbot
+from medicine_engine import SymSpellIndex, edit_distance
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+
+NAMES = ['Paracetamol', 'Omeprazole', 'Metformin', 'Napa Extra', 'Amoxicillin']
+BENGALI = ['প্যারাসিটামল', 'ওমিপ্রাজল', 'মেটফরমিন', 'নাপা এক্সট্রা', 'অ্যামোক্সিসিলিন']
+GENERIC = ['Acetaminophen', 'Omeprazole', 'Metformin HCl', 'Paracetamol + Caffeine', 'Amoxicillin']
+
+
+def test_edit_distance():
+    assert edit_distance('napa', 'napa', 2) == 0
+    assert edit_distance('napa', 'nppa', 2) == 1
+    assert edit_distance('napa', 'anpa', 2) == 1          # পাশাপাশি অক্ষর বদল
+    assert edit_distance('paracetamol', 'parcetmol', 2) == 2
+    assert edit_distance('paracetamol', 'omeprazole', 2) == 3
+
+
+def test_latin_and_bengali_typos():
+    index = SymSpellIndex.from_columns([NAMES, BENGALI, GENERIC])
+    assert index.best_row('paracetmol') == 0
+    assert index.best_row('omeprazol') == 1
+    assert index.best_row('metformn') == 2
+    assert index.best_row('প্যারাসিটামোল') == 0
+    assert index.best_row('ওমিপ্রাজোল') == 1
+    assert index.best_row('acetaminofen') == 0
+    assert index.best_row('extre') == 3               # নামের একটি শব্দ
+    assert index.best_row('zzzzzz') is None
+
+    ranked = index.lookup('paracetamo', limit=None)
+    assert ranked[0][:2] == ('paracetamol', 1)
+    assert all(a[1] <= b[1] for a, b in zip(ranked, ranked[1:]))
+
+
+def test_short_words_need_exact_match():
+    index = SymSpellIndex.from_columns([['Toxin Out 200 Gram', 'Fiber Seed', 'Napa Extra']])
+    # ৪ অক্ষর পর্যন্ত শুধু হুবহু, ৬ পর্যন্ত ১ অক্ষরের ভুল
+    assert index.best_row('gas') is None and index.best_row('gram') == 0
+    assert index.best_row('fever') is None and index.best_row('fiber') == 1
+    assert index.best_row('fibar') == 1 and index.best_row('fibbar') is None
+    assert index.best_row('extre') == 2
+
+
+def test_suggestions_are_display_names():
+    index = SymSpellIndex.from_columns([NAMES])
+    assert index.suggest('amoxcilin') == ['Amoxicillin']
+
+
+def test_lookup_is_fast():
+    rng = random.Random(7)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    names = [''.join(rng.choice(letters) for _ in range(rng.randint(6, 11))) for _ in range(10000)]
+    index = SymSpellIndex.from_columns([names])
+
+    queries = [name[:2] + name[3:] for name in names[:200]]
+    start = time.perf_counter()
+    for query in queries:
+        index.lookup(query, limit=3)
+    per_lookup = (time.perf_counter() - start) / len(queries)
+    assert per_lookup < 0.001
+
+
+def test_get_medicine_details_with_typo():
+    chatbot = MedicineChatbot(REAL_EXCEL)
+    assert chatbot.get_medicine_details('Dibedx')['Name'].startswith('Dibedex')
+    assert chatbot.get_medicine_details('Carmidx')['Name'] == 'Carmidex'
+    assert chatbot.get_medicine_details('Bhidx')['Name'] == 'Bhidex'
+    assert 'Bhidex' in chatbot.suggest_medicine_names('Bhidx')
+
+
+def test_short_queries_do_not_match_unrelated_medicines():
+    chatbot = MedicineChatbot(REAL_EXCEL)
+    for query in ('gas', 'fever'):
+        assert chatbot.search_medicines(query) == []
+        assert chatbot.get_medicine_details(query) is None
+        assert chatbot.pipeline(query).medicine_details is None
+    assert 'Toxin Out' not in chatbot.answer('gas', mode='strict')
+
+
+if __name__ == "__main__":
+    test_edit_distance()
+    test_latin_and_bengali_typos()
+    test_short_words_need_exact_match()
+    test_suggestions_are_display_names()
+    test_lookup_is_fast()
+    test_get_medicine_details_with_typo()
+    test_short_queries_do_not_match_unrelated_medicines()
+    print("✅ টাইপো-সহনশীল খোঁজা টেস্ট সম্পন্ন!")
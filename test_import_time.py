@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - দ্রুত স্টার্টআপ (ভারী লাইব্রেরি lazy import, NLTK ডাউনলোড নেই) ও import সময়ের রিপোর্ট
+"""
+
+import os
+import subprocess
+import sys
+
+from medicine_engine import measure_import_time, package_totals, parse_importtime
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# মডিউল লোডের সময় এগুলোর কোনোটিই import হওয়া উচিত নয় (প্রথম ব্যবহারে হয়)
+HEAVY_MODULES = ('sklearn', 'scipy', 'nltk', 'requests', 'PyPDF2', 'docx', 'plotly', 'pywhatkit')
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2500 |       2500 |     numpy._core
+import time:      1500 |       4000 |   numpy
+import time:       300 |       4420 | medicine_engine
+something else on stderr
+"""
+
+
+def loaded_heavy_modules(module):
+    script = f"import sys, {module}; print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    output = subprocess.run(
+        [sys.executable, '-c', script], capture_output=True, text=True, check=True, cwd=HERE
+    ).stdout
+    return output.split()
+
+
+def test_parse_importtime():
+    rows = parse_importtime(SAMPLE)
+    assert [row['module'] for row in rows] == ['_io', 'numpy._core', 'numpy', 'medicine_engine']
+    assert [row['depth'] for row in rows] == [1, 2, 1, 0]
+    assert rows[-1]['self_ms'] == 0.3 and rows[-1]['cumulative_ms'] == 4.42
+    assert package_totals(rows) == {'numpy': 4.0, 'medicine_engine': 0.3, '_io': 0.12}
+
+
+def test_no_heavy_imports_at_startup():
+    for module in ('medicine_engine', 'medicine_chatbot', 'medicine_service', 'advanced_medicine_chatbot'):
+        assert loaded_heavy_modules(module) == [], module
+
+
+def test_measure_import_time():
+    rows = measure_import_time('medicine_engine', cwd=HERE)
+    own = [row for row in rows if row['module'] == 'medicine_engine']
+    assert len(own) == 1 and own[0]['depth'] == 0
+    assert own[0]['cumulative_ms'] >= own[0]['self_ms'] > 0
+    assert 'sklearn' not in package_totals(rows)
+    try:
+        measure_import_time('no_such_module_here', cwd=HERE)
+    except RuntimeError as e:
+        assert 'no_such_module_here' in str(e)
+    else:
+        raise AssertionError("RuntimeError আশা করা হয়েছিল")
+
+
+if __name__ == "__main__":
+    test_parse_importtime()
+    test_no_heavy_imports_at_startup()
+    test_measure_import_time()
+    print("✅ import সময় টেস্ট সম্পন্ন!")
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - ইনক্রিমেন্টাল TF-IDF (পুরো ম্যাট্রিক্স আবার ফিট না করে নতুন সারি যোগ)
+"""
+
+import io
+import tempfile
+
+import numpy as np
+from openpyxl import Workbook
+
+import medicine_chatbot
+from medicine_chatbot import MedicineChatbot, MedicineSearchEngine
+from medicine_engine import FittedTfidf, IncrementalTfidf
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+
+DOCS = ['napa paracetamol fever', 'brufen ibuprofen pain', 'seclo omeprazole acid',
+        'ace paracetamol pain', 'maxpro esomeprazole acid', 'fexo fexofenadine allergy']
+
+
+def build_engine(tfidf_mode='incremental'):
+    return MedicineSearchEngine(REAL_EXCEL, data_source_dir=tempfile.mkdtemp(), tfidf_mode=tfidf_mode)
+
+
+def excel_upload(rows, name):
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    for row in rows:
+        sheet.append(row)
+    upload = io.BytesIO()
+    workbook.save(upload)
+    upload.seek(0)
+    upload.name = name
+    return upload
+
+
+def test_add_matches_rebuilt_model():
+    model = IncrementalTfidf(n_features=2 ** 12)
+    for doc in DOCS:
+        model.add([doc])
+    assert len(model) == len(DOCS)
+
+    model.refit()
+    rebuilt = IncrementalTfidf(n_features=2 ** 12)
+    rebuilt.add(DOCS)
+    assert np.allclose(model.idf_, rebuilt.idf_)
+    assert abs(model.matrix - rebuilt.matrix).max() < 1e-12
+    assert model.search(['paracetamol'], 2) == rebuilt.search(['paracetamol'], 2)
+    # ছোট ব্লকগুলো একত্র হয়েছে
+    assert len(model._weighted) <= 2
+
+
+def test_idf_frozen_until_refit():
+    model = IncrementalTfidf(n_features=2 ** 12)
+    model.add(DOCS)
+    idf = model.idf_.copy()
+    rows = model.add(['paracetamol syrup'] * 10)
+    assert list(rows) == list(range(len(DOCS), len(DOCS) + 10))
+    assert np.array_equal(model.idf_, idf)
+
+    generation = model.idf_generation
+    model.refit()
+    assert model.idf_generation == generation + 1
+    column = model.counts(['paracetamol']).indices[0]
+    assert model.idf_[column] < idf[column]
+
+
+def test_background_refit_keeps_new_rows():
+    refits = []
+    model = IncrementalTfidf(n_features=2 ** 12, refit_every=4, on_refit=lambda: refits.append(1))
+    model.add(DOCS[:3])
+    model.add(DOCS[3:])
+    thread = model._refit_thread
+    assert thread is not None
+    model.add(['zyloxin levofloxacin infection'])
+    thread.join()
+    model.refit_async().join()
+    assert refits and len(model) == len(DOCS) + 1
+    assert model.search(['zyloxin'], 1)[0][0][0] == len(DOCS)
+
+
+def test_overlay_reweighs_after_base_refit():
+    model = IncrementalTfidf(n_features=2 ** 12)
+    model.add(DOCS)
+    overlay = model.overlay()
+    assert list(overlay.add(['zyloxin paracetamol'])) == [0]
+    before = overlay.search(['paracetamol'], 1)[0][0][1]
+
+    # মূল মডেল refit হলে overlay এর সারি পরের সার্চে নতুন IDF দিয়ে ওজন পায়
+    model.add(['paracetamol syrup'] * 10)
+    model.refit()
+    after = overlay.search(['paracetamol'], 1)[0][0][1]
+    assert overlay._generation == model.idf_generation and after != before
+    expected = (model.transform(['paracetamol']) @ model.transform(['zyloxin paracetamol']).T).toarray()[0, 0]
+    assert abs(after - expected) < 1e-12
+
+
+def test_fitted_overlay_keeps_counts_only():
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    vectorizer = TfidfVectorizer(ngram_range=(1, 3)).fit(DOCS)
+    model = FittedTfidf(vectorizer)
+    texts = ['napa paracetamol syrup', 'seclo acid unknownword']
+    # গোনা ব্লক ওজন দিলে vectorizer.transform এর সমান
+    assert abs(model.weigh(model.counts(texts)) - vectorizer.transform(texts)).max() < 1e-12
+
+    overlay = model.overlay()
+    overlay.add(texts)
+    assert not hasattr(overlay, '_texts') and overlay._raw[0].data.min() >= 1
+    assert overlay.search(['paracetamol'], 1)[0][0][0] == 0
+
+
+def test_engine_incremental_mode():
+    engine = build_engine()
+    assert engine.tfidf_matrix is None and len(engine.vectorizer) == len(engine.records)
+    name = engine.name_columns()[0]
+    assert engine.search_medicines('Dibedex capsules')[0][name].startswith('Dibedex')
+
+
+def test_uploaded_excel_rows_are_searched():
+    chatbot = MedicineChatbot(REAL_EXCEL, engine=build_engine())
+    upload = excel_upload([['Medicine Name', 'Uses'], ['Zyloxin', 'জ্বর'], ['Brufen', 'ব্যথা']], 'incremental.xlsx')
+    assert chatbot.add_file(upload, "Excel")
+    assert len(chatbot.upload_tfidf) == 2
+
+    hits = chatbot.search_medicines('Zyloxin')
+    assert hits[0]['Medicine Name'] == 'Zyloxin'
+    # মূল ইঞ্জিনের ম্যাট্রিক্সে আপলোড যায়নি
+    assert not chatbot.engine.search_medicines('Zyloxin')
+
+    # অন্য সেশন এই আপলোড দেখে না
+    assert not MedicineChatbot(REAL_EXCEL, engine=chatbot.engine).search_medicines('Zyloxin')
+
+    chatbot.clear_uploaded_files()
+    assert chatbot.upload_tfidf is None and not chatbot.upload_rows
+
+
+def test_default_mode_uploaded_excel_rows_are_searched():
+    chatbot = MedicineChatbot(REAL_EXCEL, engine=build_engine(tfidf_mode=None))
+    vectorizer = chatbot.engine.vectorizer
+    upload = excel_upload([['Medicine Name', 'Uses'], ['Dibedex 90 capsules', 'ডায়াবেটিস']], 'fit.xlsx')
+    assert chatbot.add_file(upload, "Excel")
+    assert len(chatbot.upload_tfidf) == 1 and chatbot.engine.vectorizer is vectorizer
+
+    names = [hit.get('Medicine Name') for hit in chatbot.search_medicines('Dibedex')]
+    assert 'Dibedex 90 capsules' in names
+    # মূল ইঞ্জিনের ম্যাট্রিক্সে আপলোড যায়নি
+    assert len(chatbot.engine.search_medicines('Dibedex')) == len(names) - 1
+
+
+if __name__ == "__main__":
+    # pytest ছাড়া চালালে আপলোড আসল 'data source' ফোল্ডারে সেভ হবে না
+    medicine_chatbot.DATA_SOURCE_DIR = tempfile.mkdtemp()
+    test_add_matches_rebuilt_model()
+    test_idf_frozen_until_refit()
+    test_background_refit_keeps_new_rows()
+    test_overlay_reweighs_after_base_refit()
+    test_fitted_overlay_keeps_counts_only()
+    test_engine_incremental_mode()
+    test_uploaded_excel_rows_are_searched()
+    test_default_mode_uploaded_excel_rows_are_searched()
+    print("✅ ইনক্রিমেন্টাল TF-IDF টেস্ট সম্পন্ন!")
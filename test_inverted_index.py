@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - সব উৎসের ইনভার্টেড ইনডেক্স সার্চ
+"""
+
+import io
+
+from medicine_chatbot import MedicineChatbot
+from medicine_engine import InvertedIndex
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+
+
+def brute_force_scores(chatbot, query):
+    """আগের মত প্রতিটি সোর্স স্ক্যান করে স্কোর"""
+    query_words = chatbot.clean_text(query).split()
+    scores = []
+    for source in chatbot.all_sources:
+        content_words = chatbot.clean_text(source['content']).split()
+        matches = sum(1 for word in query_words if word in content_words)
+        if matches > 0:
+            scores.append((source['filename'], matches / len(query_words)))
+    scores.sort(key=lambda x: x[1], reverse=True)
+    return scores
+
+
+def test_index_matches_keyword_scan():
+    chatbot = MedicineChatbot(REAL_EXCEL)
+    assert len(chatbot.all_sources) == len(chatbot.engine.records)
+
+    for query in ['ডায়াবেটিস', 'Dibedex capsules', 'হারবাল ওষুধ', 'nothing-here']:
+        results = chatbot.search_all_sources(query, return_all=True)
+        got = [(r['filename'], r['score']) for r in results]
+        assert got == brute_force_scores(chatbot, query)
+        for r in results:
+            assert set(r) >= {'source', 'filename', 'score', 'context', 'data'}
+
+
+def test_uploads_are_indexed_and_cleared():
+    chatbot = MedicineChatbot(REAL_EXCEL)
+    base = len(chatbot.all_sources)
+
+    upload = io.BytesIO(open(REAL_EXCEL, 'rb').read())
+    upload.name = 'extra.xlsx'
+    assert chatbot.add_file(upload, "Excel")
+    assert len(chatbot.all_sources) == base * 2
+
+    results = chatbot.search_all_sources('Dibedex', return_all=True)
+    assert {'Main Excel', 'Uploaded Excel'} <= {r['source'] for r in results}
+
+    chatbot.clear_uploaded_files()
+    assert len(chatbot.all_sources) == base
+    assert all(r['source'] == 'Main Excel' for r in chatbot.search_all_sources('Dibedex', return_all=True))
+
+
+def test_remove_document_cleans_postings():
+    index = InvertedIndex(lambda text: text.lower().split())
+    a = index.add_document({'content': 'jor matha betha'})
+    index.add_document({'content': 'jor kashi'})
+    assert [doc_id for doc_id, _ in index.match(['jor'])] == [0, 1]
+
+    index.remove_document(a)
+    assert 'matha' not in index.postings
+    assert index.match(['jor', 'kashi']) == [(1, 1.0)]
+
+
+if __name__ == "__main__":
+    test_index_matches_keyword_scan()
+    test_uploads_are_indexed_and_cleared()
+    test_remove_document_cleans_postings()
+    print("✅ ইনভার্টেড ইনডেক্স টেস্ট সম্পন্ন!")
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - হেডলেস JSON সার্ভিস (asyncio HTTP, keep-alive, লেটেন্সি রিপোর্ট)
+"""
+
+import asyncio
+import http.client
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from medicine_chatbot import MedicineChatbot
+from medicine_engine.service import JsonService, to_jsonable
+from medicine_service import build_service
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+
+
+def start_in_thread(service):
+    """আলাদা থ্রেডের ইভেন্ট লুপে সার্ভিস চালু করে (port, বন্ধ করার ফাংশন) ফেরত দেয়"""
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(service.start('127.0.0.1', 0))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    def stop():
+        asyncio.run_coroutine_threadsafe(service.shutdown(server), loop).result(10)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(5)
+        loop.close()
+    return server.sockets[0].getsockname()[1], stop
+
+
+def request(connection, method, path, payload=None):
+    body = None if payload is None else json.dumps(payload)
+    connection.request(method, path, body=body, headers={'Content-Type': 'application/json'})
+    response = connection.getresponse()
+    return response.status, json.loads(response.read().decode('utf-8'))
+
+
+_chatbot = None
+
+
+def get_chatbot():
+    global _chatbot
+    if _chatbot is None:
+        _chatbot = MedicineChatbot(REAL_EXCEL, scorer='bm25')
+    return _chatbot
+
+
+def test_to_jsonable():
+    value = {'score': np.float64(0.5), 'rank': np.int64(2), 'price': float('nan'), 'tags': {'b', 'a'}, 1: (1, 2)}
+    assert to_jsonable(value) == {'score': 0.5, 'rank': 2, 'price': None, 'tags': ['a', 'b'], '1': [1, 2]}
+    json.dumps(to_jsonable(value))
+
+
+def test_routes_errors_and_stats():
+    service = JsonService(threads=2)
+    service.route('/echo', lambda params: params)
+    service.route('/fail', lambda params: 1 / 0, methods=('GET',))
+    port, stop = start_in_thread(service)
+    try:
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        # একই সংযোগে (keep-alive) একাধিক রিকোয়েস্ট
+        assert request(connection, 'GET', '/echo?q=napa') == (200, {'q': 'napa'})
+        assert request(connection, 'POST', '/echo?q=napa', {'top_k': 3}) == (200, {'q': 'napa', 'top_k': 3})
+        assert request(connection, 'GET', '/missing')[0] == 404
+        assert request(connection, 'POST', '/fail', {})[0] == 405
+        assert request(connection, 'GET', '/fail')[0] == 500
+        connection.request('POST', '/echo', body='[1, 2')
+        assert connection.getresponse().status == 400
+        connection.close()
+
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        status, stats = request(connection, 'GET', '/stats')
+        assert status == 200
+        assert stats['/echo']['count'] == 3 and stats['/echo']['errors'] == 0
+        assert stats['/fail'] == {**stats['/fail'], 'count': 1, 'errors': 1}
+        assert '/missing' not in stats
+        assert 0 <= stats['/echo']['p50_ms'] <= stats['/echo']['p99_ms'] <= stats['/echo']['max_ms']
+    finally:
+        stop()
+
+
+def test_medicine_endpoints():
+    chatbot = get_chatbot()
+    port, stop = start_in_thread(build_service(chatbot, threads=4))
+    try:
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        status, health = request(connection, 'GET', '/health')
+        assert status == 200 and health['medicines'] == len(chatbot.engine.records)
+
+        status, body = request(connection, 'GET', '/search?q=dibedex&top_k=3')
+        expected = chatbot.search_medicines('dibedex', top_k=3)
+        assert status == 200 and len(body['results']) == len(expected) > 0
+        assert body['results'][0]['similarity_score'] == float(expected[0]['similarity_score'])
+
+        status, body = request(connection, 'POST', '/search', {'queries': ['dibedex', 'seclo 20'], 'top_k': 2})
+        assert status == 200 and [item['query'] for item in body['results']] == ['dibedex', 'seclo 20']
+        assert all(item['results'] for item in body['results'])
+
+        status, body = request(connection, 'GET', '/medicine?name=Dibedex%2060%20capsules')
+        assert status == 200 and body['medicine']['Name'] == 'Dibedex 60 capsules'
+        # NaN দাম JSON এ null
+        assert body['medicine']['Discount Price'] is None
+
+        status, body = request(connection, 'POST', '/sources', {'q': 'napa', 'scorer': 'keyword'})
+        assert status == 200 and isinstance(body['results'], list)
+        assert request(connection, 'POST', '/sources', {'q': 'napa', 'scorer': 'nope'})[0] == 400
+
+        status, body = request(connection, 'POST', '/answer', {'q': 'napa'})
+        assert status == 200 and body['mode'] == 'expert'
+        assert body['answer'] == chatbot.answer('napa', mode='expert')
+
+        assert request(connection, 'GET', '/search')[0] == 400
+        assert request(connection, 'GET', '/search?q=napa&top_k=0')[0] == 400
+        assert request(connection, 'POST', '/answer', {'q': 'napa', 'mode': 'poem'})[0] == 400
+        connection.close()
+    finally:
+        stop()
+
+
+def test_concurrent_clients():
+    port, stop = start_in_thread(build_service(get_chatbot(), threads=4))
+
+    def client(index):
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        statuses = [request(connection, 'GET', f'/search?q=napa{index % 3}')[0] for _ in range(10)]
+        connection.close()
+        return statuses
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            statuses = [status for result in executor.map(client, range(8)) for status in result]
+        assert statuses == [200] * 80
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        assert request(connection, 'GET', '/stats')[1]['/search']['count'] == 80
+        connection.close()
+    finally:
+        stop()
+
+
+if __name__ == "__main__":
+    test_to_jsonable()
+    test_routes_errors_and_stats()
+    test_medicine_endpoints()
+    test_concurrent_clients()
+    print("✅ JSON সার্ভিস টেস্ট সম্পন্ন!")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - ওষুধের নামের exact/prefix ইনডেক্স
+"""
+
+from medicine_chatbot import MedicineChatbot
+from medicine_engine import NameIndex, normalize_name
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+
+NAMES = ['Paracetamol', 'Paracetamol Plus', 'Napa (500mg)', 'Omeprazole', None, 'Dibedex 60 capsules']
+BENGALI = ['প্যারাসিটামল', 'প্যারাসিটামল প্লাস', 'নাপা', 'ওমিপ্রাজল', 'খালি', 'ডায়াবেডেক্স']
+
+
+def test_exact_and_prefix_lookup():
+    index = NameIndex.from_columns([NAMES, BENGALI])
+    assert index.exact('  PARACETAMOL ') == [0]
+    assert index.exact('ওমিপ্রাজল') == [3]
+    assert index.prefix('para') == [0, 1]
+    assert index.prefix('প্যারা') == [0, 1]
+    assert index.word_prefix('caps') == [5]
+    assert index.lookup('paracetamol plus') == 1
+    assert index.lookup('অজানা') is None
+
+
+def test_ranked_search():
+    index = NameIndex.from_columns([NAMES, BENGALI])
+    assert index.search('paracetamol') == [(0, 1.0), (1, 0.8)]
+    assert index.search('para', limit=1) == [(0, 0.8)]
+    # শব্দের prefix: বেশি শব্দ মিললে আগে
+    assert index.search('dibedex caps') == [(5, 0.6)]
+    assert index.search('plus paracetamol') == [(1, 0.6), (0, 0.3)]
+    assert index.search('x') == [] and index.search('  ') == []
+
+
+def test_regex_metacharacters_are_literal():
+    index = NameIndex.from_columns([NAMES])
+    assert index.lookup('Napa (500mg)') == 2
+    assert index.lookup('napa (') == 2
+    assert index.lookup('.*') is None
+    assert index.lookup('[') is None
+
+
+def test_normalize_name():
+    assert normalize_name('  Napa\t Extra ') == 'napa extra'
+    assert normalize_name(None) == ''
+
+
+def test_get_medicine_details_uses_name_index():
+    chatbot = MedicineChatbot(REAL_EXCEL)
+    assert chatbot.get_medicine_details('dibedex 30 capsules')['Name'] == 'Dibedex 30 capsules'
+    assert chatbot.get_medicine_details('Dibedex')['Name'] == 'Dibedex 60 capsules'
+    assert chatbot.get_medicine_details('Bhidex')['Name'] == 'Bhidex'
+    # regex অক্ষর থাকলেও কোনো error হয় না
+    chatbot.get_medicine_details('Dibedex (60')
+    chatbot.get_medicine_details('*')
+
+
+if __name__ == "__main__":
+    test_exact_and_prefix_lookup()
+    test_ranked_search()
+    test_regex_metacharacters_are_literal()
+    test_normalize_name()
+    test_get_medicine_details_uses_name_index()
+    print("✅ নামের ইনডেক্স টেস্ট সম্পন্ন!")
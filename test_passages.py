@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - PDF/Word প্যাসেজ ইনডেক্স
+"""
+
+import glob
+import io
+import tempfile
+
+import medicine_chatbot
+from medicine_chatbot import MedicineChatbot
+from medicine_engine import join_pages, split_passages
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+
+
+def upload(path, name):
+    file = io.BytesIO(open(path, 'rb').read())
+    file.name = name
+    return file
+
+
+def test_split_passages_offsets_and_pages():
+    pages = ['প্রথম পেজ ' * 150, 'দ্বিতীয় পেজ ' * 150]
+    text, page_starts = join_pages(pages)
+    passages = split_passages(text, page_starts, passage_chars=500, overlap=100)
+
+    assert len(passages) > 2
+    for p in passages:
+        assert text[p['offset']:p['offset'] + p['length']] == p['text']
+        assert len(p['text']) <= 500
+    # ওভারল্যাপ: পরের প্যাসেজ আগেরটা শেষ হওয়ার আগে শুরু হয়
+    assert all(b['offset'] < a['offset'] + a['length'] for a, b in zip(passages, passages[1:]))
+    assert passages[0]['page'] == 1 and passages[-1]['page'] == 2
+    assert split_passages('শুধু এক লাইন')[0]['page'] is None
+
+
+def test_pdf_is_indexed_as_passages():
+    chatbot = MedicineChatbot(REAL_EXCEL)
+    pdf_path = sorted(glob.glob('data source/*.pdf'))[0]
+    assert chatbot.add_file(upload(pdf_path, 'kidney.pdf'), "PDF")
+
+    content = medicine_chatbot.get_text_store().read(chatbot.uploaded_files[0]['text_id'])
+    passages = [s for s in chatbot.all_sources if s['source'] == 'PDF']
+    assert len(passages) > 1
+    assert all(len(p['content']) < len(content) for p in passages)
+
+    query = passages[-1]['content'].split()[-1]
+    results = [r for r in chatbot.search_all_sources(query, return_all=True) if r['source'] == 'PDF']
+    assert results
+    assert all(r['page'] for r in results)
+    assert all(len(r['context']) <= 250 for r in results)
+
+
+def test_word_is_indexed_as_passages():
+    chatbot = MedicineChatbot(REAL_EXCEL)
+    docx_path = sorted(glob.glob('data source/*.docx'))[0]
+    assert chatbot.add_file(upload(docx_path, 'routine.docx'), "Word")
+
+    passages = [s for s in chatbot.all_sources if s['source'] == 'Word']
+    assert passages and all(p['page'] is None for p in passages)
+    assert chatbot.search_all_sources(passages[0]['content'].split()[0], return_all=True)
+
+
+if __name__ == "__main__":
+    # pytest ছাড়া চালালে আপলোড আসল 'data source' ফোল্ডারে সেভ হবে না
+    medicine_chatbot.DATA_SOURCE_DIR = tempfile.mkdtemp()
+    test_split_passages_offsets_and_pages()
+    test_pdf_is_indexed_as_passages()
+    test_word_is_indexed_as_passages()
+    print("✅ প্যাসেজ ইনডেক্স টেস্ট সম্পন্ন!")
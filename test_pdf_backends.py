@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - বদলযোগ্য PDF এক্সট্রাকশন ব্যাকএন্ড ও বেঞ্চমার্ক
+"""
+
+import glob
+import shutil
+import tempfile
+
+import PyPDF2
+
+from medicine_engine import (
+    DEFAULT_PDF_BACKEND, ExtractionCache, IngestionPool, IngestJob, PdfBackend, available_pdf_backends,
+    benchmark_backends, extract_pdf_pages, get_pdf_backend, load_document_folder
+)
+from medicine_engine import data_source
+
+PDF_FILE = sorted(glob.glob('data source/*.pdf'))[0]
+
+
+class UpperBackend(PdfBackend):
+    """টেস্টের ব্যাকএন্ড: PyPDF2 এর টেক্সট বড় হাতের অক্ষরে"""
+    name = 'upper'
+    module = 'PyPDF2'
+
+    def count_pages(self, data):
+        return get_pdf_backend('pypdf2').count_pages(data)
+
+    def _extract(self, data, start, stop):
+        return [text.upper() for text in get_pdf_backend('pypdf2').extract_pages(data, start, stop)]
+
+
+class EmptyBackend(UpperBackend):
+    name = 'empty'
+
+    def _extract(self, data, start, stop):
+        return [None] * (stop - start)
+
+
+def tokenize(text):
+    return text.lower().split()
+
+
+def test_default_backend_matches_pypdf2():
+    assert DEFAULT_PDF_BACKEND == 'pypdf2' and 'pypdf2' in available_pdf_backends()
+    reader = PyPDF2.PdfReader(PDF_FILE)
+    expected = [page.extract_text() for page in reader.pages]
+    data = open(PDF_FILE, 'rb').read()
+    assert extract_pdf_pages(data) == expected
+    assert extract_pdf_pages(data, 1, 2, backend='pypdf2') == expected[1:2]
+    assert extract_pdf_pages(data, len(expected), None) == []
+    try:
+        get_pdf_backend('no-such-backend')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("ValueError আশা করা হয়েছিল")
+
+
+def test_pool_uses_configured_backend():
+    data = open(PDF_FILE, 'rb').read()
+    pool = IngestionPool(max_workers=2, use_processes=False, pdf_backend=UpperBackend())
+    try:
+        job = pool.submit('a.pdf', 'PDF', data)
+        assert job.wait(60) and job.status == IngestJob.DONE, job.error
+        assert job.pages == [text.upper() for text in extract_pdf_pages(data)]
+    finally:
+        pool.shutdown()
+
+
+def test_folder_reextracts_when_backend_changes():
+    folder = tempfile.mkdtemp()
+    shutil.copy(PDF_FILE, folder)
+    cache = ExtractionCache(tempfile.mkdtemp())
+    calls = []
+    original = data_source.extract_document
+    data_source.extract_document = lambda *args: calls.append(args) or original(*args)
+    try:
+        load_document_folder(folder, tokenize, cache)
+        load_document_folder(folder, tokenize, cache)
+        assert len(calls) == 1
+        documents = load_document_folder(folder, tokenize, cache, pdf_backend=UpperBackend())
+        assert len(calls) == 2
+        assert documents[0][0]['content'] == documents[0][0]['content'].upper()
+    finally:
+        data_source.extract_document = original
+
+
+def test_benchmark_reports_speed_memory_and_recall():
+    data = open(PDF_FILE, 'rb').read()
+    reference = "\n".join(extract_pdf_pages(data))
+    results = benchmark_backends(
+        [PDF_FILE], tokenize, backends=['pypdf2', EmptyBackend()],
+        references={PDF_FILE: reference}, isolate=False
+    )
+    by_name = {r['backend']: r for r in results}
+    assert by_name['pypdf2']['token_recall'] == 1.0
+    assert by_name['empty']['token_recall'] == 0.0
+    pages = len(extract_pdf_pages(data))
+    for r in results:
+        assert r['pages'] == pages and r['pages_per_sec'] > 0 and r['heap_peak_mb'] >= 0
+        assert 'texts' not in r and r['errors'] == {}
+
+
+if __name__ == "__main__":
+    test_default_backend_matches_pypdf2()
+    test_pool_uses_configured_backend()
+    test_folder_reextracts_when_backend_changes()
+    test_benchmark_reports_speed_memory_and_recall()
+    print("✅ PDF ব্যাকএন্ড টেস্ট সম্পন্ন!")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - ভার্সনড কোয়েরি রেজাল্ট ক্যাশ
+"""
+
+import io
+import tempfile
+
+import medicine_chatbot
+from medicine_chatbot import MedicineChatbot
+from medicine_engine import QueryCache
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+
+
+def test_lru_eviction_and_counters():
+    cache = QueryCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1          # 'a' সম্প্রতি ব্যবহৃত
+    cache.put('c', 3)                   # 'b' বাদ পড়ে
+    assert cache.get('b') is None
+    assert cache.get_or_compute('c', lambda: 99) == 3
+    assert cache.stats()['hits'] == 2 and cache.stats()['misses'] == 1
+    assert len(cache) == 2
+
+
+def test_repeat_query_skips_retrieval_and_formatting():
+    chatbot = MedicineChatbot(REAL_EXCEL, cache=QueryCache())
+    calls = []
+    original = chatbot.search_medicines
+    chatbot.search_medicines = lambda q, top_k=5: calls.append(q) or original(q, top_k=top_k)
+
+    first = chatbot.answer('ডায়াবেটিস', 'expert')
+    second = chatbot.answer('  ডায়াবেটিস ', 'expert')
+    assert first == second
+    assert calls == ['ডায়াবেটিস']
+    assert chatbot.cache.stats()['hits'] == 1
+
+    # মোড আলাদা হলে আলাদা কী
+    chatbot.answer('ডায়াবেটিস', 'structured')
+    assert len(calls) == 2
+
+
+def test_adding_sources_changes_version():
+    cache = QueryCache()
+    chatbot = MedicineChatbot(REAL_EXCEL, cache=cache)
+    other = MedicineChatbot(REAL_EXCEL, cache=cache)
+    before = chatbot.answer('Dibedex', 'full')
+    assert other.answer('Dibedex', 'full') == before   # আপলোড ছাড়া সেশনগুলো ক্যাশ শেয়ার করে
+    version = chatbot.data_version
+
+    upload = io.BytesIO(open(REAL_EXCEL, 'rb').read())
+    upload.name = 'extra.xlsx'
+    assert chatbot.add_file(upload, "Excel")
+    assert chatbot.data_version != version
+    after = chatbot.answer('Dibedex', 'full')
+    assert after != before
+    assert other.answer('Dibedex', 'full') == before
+
+    chatbot.clear_uploaded_files()
+    assert chatbot.data_version == version
+    assert chatbot.answer('Dibedex', 'full') == before
+
+
+if __name__ == "__main__":
+    # pytest ছাড়া চালালে আপলোড আসল 'data source' ফোল্ডারে সেভ হবে না
+    medicine_chatbot.DATA_SOURCE_DIR = tempfile.mkdtemp()
+    test_lru_eviction_and_counters()
+    test_repeat_query_skips_retrieval_and_formatting()
+    test_adding_sources_changes_version()
+    print("✅ কোয়েরি ক্যাশ টেস্ট সম্পন্ন!")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - একটি প্রশ্নের রিট্রিভাল একবারই, সব ফরম্যাটার শেয়ার করে
+"""
+
+import tempfile
+
+import medicine_chatbot
+from medicine_chatbot import (
+    MedicineChatbot, QueryPipeline, format_expert_response,
+    format_strict_response, format_structured_response
+)
+from medicine_engine import QueryCache
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+
+
+def count_calls(chatbot):
+    calls = {'search_medicines': 0, 'search_all_sources': 0, 'get_medicine_details': 0}
+    for name in calls:
+        original = getattr(chatbot, name)
+
+        def wrapper(*args, _name=name, _original=original, **kwargs):
+            calls[_name] += 1
+            return _original(*args, **kwargs)
+        setattr(chatbot, name, wrapper)
+    return calls
+
+
+def test_each_retrieval_runs_once():
+    chatbot = MedicineChatbot(REAL_EXCEL, cache=QueryCache())
+    calls = count_calls(chatbot)
+    pipeline = chatbot.pipeline('Dibedex')
+
+    structured = format_structured_response(pipeline)
+    expert = format_expert_response(pipeline)
+    strict = format_strict_response(pipeline)
+    full = chatbot.build_full_info_response(pipeline)
+    assert all(isinstance(r, str) and r for r in (structured, expert, strict, full))
+
+    assert calls['search_medicines'] == 1
+    assert calls['search_all_sources'] == 2        # top-k একবার, সব ম্যাচ একবার
+    assert calls['get_medicine_details'] == 0       # নামের ইনডেক্স সরাসরি
+    assert pipeline.medicine_details is not None
+
+
+def test_top_sources_reuse_all_matches():
+    chatbot = MedicineChatbot(REAL_EXCEL, cache=QueryCache())
+    calls = count_calls(chatbot)
+    pipeline = chatbot.pipeline('ডায়াবেটিস', source_top_k=3)
+    everything = pipeline.all_source_results
+    assert pipeline.source_results == everything[:3]
+    assert calls['search_all_sources'] == 1
+
+
+def test_legacy_lists_still_work():
+    excel = [{'Medicine Name': 'Dibedex', 'Price': '100', 'similarity_score': 0.9}]
+    sources = [{'source': 'PDF', 'filename': 'a.pdf', 'score': 1.0,
+                'context': 'Dibedex ডায়াবেটিস এর ওষুধ', 'full_content': 'Dibedex ডায়াবেটিস এর ওষুধ'}]
+    assert 'Dibedex' in format_expert_response('Dibedex', excel, sources)
+    assert 'Dibedex' in format_structured_response('Dibedex', excel, sources)
+    pipeline = QueryPipeline(None, 'Dibedex', excel_results=excel, source_results=sources)
+    assert pipeline.matches_all_tokens(sources[0])
+    assert 'ডায়াবেটিস এর ওষুধ' in format_strict_response(pipeline)
+
+
+if __name__ == "__main__":
+    # pytest ছাড়া চালালে আপলোড আসল 'data source' ফোল্ডারে সেভ হবে না
+    medicine_chatbot.DATA_SOURCE_DIR = tempfile.mkdtemp()
+    test_each_retrieval_runs_once()
+    test_top_sources_reuse_all_matches()
+    test_legacy_lists_still_work()
+    print("✅ কোয়েরি পাইপলাইন টেস্ট সম্পন্ন!")
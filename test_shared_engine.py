@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - প্রসেস-ব্যাপী শেয়ার্ড সার্চ ইঞ্জিন
+"""
+
+import io
+import os
+import shutil
+import tempfile
+
+from medicine_chatbot import MedicineChatbot, get_shared_engine
+from medicine_engine import SharedEngineRegistry, file_fingerprint
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+
+
+def test_sessions_share_one_engine():
+    first = MedicineChatbot(REAL_EXCEL)
+    second = MedicineChatbot(REAL_EXCEL)
+    assert first.engine is second.engine
+    assert first.tfidf_matrix is second.tfidf_matrix
+
+
+def test_uploads_stay_in_session():
+    first = MedicineChatbot(REAL_EXCEL)
+    second = MedicineChatbot(REAL_EXCEL)
+
+    upload = io.BytesIO(open(REAL_EXCEL, 'rb').read())
+    upload.name = 'session_upload.xlsx'
+    assert first.add_file(upload, "Excel")
+
+    first_sources = {r['source'] for r in first.search_all_sources('Dibedex', return_all=True)}
+    second_sources = {r['source'] for r in second.search_all_sources('Dibedex', return_all=True)}
+    assert 'Uploaded Excel' in first_sources
+    assert second_sources == {'Main Excel'}
+    assert len(second.all_sources) == len(second.engine.records)
+
+
+def test_changed_file_builds_new_engine():
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp_dir, 'medicine_data.xlsx')
+        shutil.copy(REAL_EXCEL, path)
+        chatbot = MedicineChatbot(path)
+        old_engine = chatbot.engine
+        assert get_shared_engine(path) is old_engine
+
+        with open(path, 'ab') as f:
+            f.write(b'\0')
+        os.utime(path, ns=(0, 0))
+        assert chatbot.refresh_engine() is not old_engine
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_registry_keys_on_fingerprint():
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp_dir, 'data.txt')
+        with open(path, 'w') as f:
+            f.write('a')
+        builds = []
+        registry = SharedEngineRegistry()
+        factory = lambda p: builds.append(p) or object()
+
+        engine = registry.get(path, factory)
+        assert registry.get(path, factory) is engine
+        assert file_fingerprint(path)[2] is not None
+
+        with open(path, 'w') as f:
+            f.write('b')
+        os.utime(path, ns=(1, 1))
+        assert registry.get(path, factory) is not engine
+        assert len(builds) == 2 and len(registry) == 1
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    test_sessions_share_one_engine()
+    test_uploads_stay_in_session()
+    test_changed_file_builds_new_engine()
+    test_registry_keys_on_fingerprint()
+    print("✅ শেয়ার্ড ইঞ্জিন টেস্ট সম্পন্ন!")
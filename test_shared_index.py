@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - মাল্টি-প্রসেস সার্ভিংয়ের শেয়ার্ড (memory-mapped) ইনডেক্স
+"""
+
+import io
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+from openpyxl import Workbook
+
+import medicine_chatbot
+from medicine_chatbot import MedicineChatbot, MedicineSearchEngine
+from medicine_engine import (
+    FrozenIndex, FrozenMap, FrozenPairs, InvertedIndex, NameIndex, RecordTable, SharedIndex, SymSpellIndex, get_scorer
+)
+from medicine_engine.shared_index import attach_fuzzy_index, attach_name_index
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+
+QUERIES = ['Dibedex capsules', 'ডায়াবেটিস', 'Seclo 20', 'Index Laboratories ayurvedic', 'nothing-matches-this']
+
+
+def build(shared_dir):
+    medicine_chatbot.SHARED_INDEX_DIR = shared_dir
+    try:
+        return MedicineSearchEngine(REAL_EXCEL, data_source_dir=tempfile.mkdtemp())
+    finally:
+        medicine_chatbot.SHARED_INDEX_DIR = None
+
+
+def count_excel_reads(func):
+    calls = []
+    original = pd.read_excel
+    pd.read_excel = lambda *args, **kwargs: calls.append(args) or original(*args, **kwargs)
+    try:
+        return func(), len(calls)
+    finally:
+        pd.read_excel = original
+
+
+def without_nan(value):
+    """NaN != NaN, তাই তুলনার আগে None"""
+    if isinstance(value, list):
+        return [without_nan(item) for item in value]
+    if isinstance(value, dict):
+        return {key: None if isinstance(item, float) and item != item else item for key, item in value.items()}
+    return value
+
+
+def all_sources(engine, query, scorer):
+    chatbot = MedicineChatbot(REAL_EXCEL, engine=engine, scorer=scorer)
+    return [(r['filename'], r['score'], r['context'], sorted(r['terms'])) for r in chatbot.search_all_sources(query, 10)]
+
+
+def test_attach_matches_private_engine():
+    medicine_chatbot.SNAPSHOT_CACHE_DIR = tempfile.mkdtemp()
+    shared_dir = tempfile.mkdtemp()
+    private = build(None)
+    builder, builder_reads = count_excel_reads(lambda: build(shared_dir))
+    worker, worker_reads = count_excel_reads(lambda: build(shared_dir))
+    # স্ন্যাপশট থেকে বিল্ড, পরের প্রসেস শুধু attach করে
+    assert builder_reads == 0 and worker_reads == 0
+    assert builder.shared_index is not None and worker.shared_index is not None
+
+    # অ্যারেগুলো ফাইল থেকে read-only map করা, DataFrame এখনো লোড হয়নি
+    for part in (worker.tfidf_matrix.data, worker.tfidf_matrix.indices, worker.vectorizer.idf_,
+                 worker.main_index.postings_docs):
+        assert not part.flags.owndata and not part.flags.writeable
+    assert isinstance(worker.records, RecordTable) and worker._data is None
+    # নামের ইনডেক্স, SymSpell ও vocabulary ও memory-mapped - attach এ কোনো dict তৈরি হয় না
+    assert isinstance(worker.name_index.exact_map, FrozenMap) and isinstance(worker.name_index.sorted_words, FrozenPairs)
+    assert isinstance(worker.fuzzy_index.deletes, FrozenMap) and isinstance(worker.vectorizer.vocabulary_, FrozenMap)
+    assert not (worker.shared_index.folder / 'names.pkl').exists()
+    assert len(worker.records) == len(private.records)
+
+    assert without_nan(worker.search_medicines_batch(QUERIES)) == without_nan(private.search_medicines_batch(QUERIES))
+    for name in ('Dibedex 60 capsules', 'dibedx', 'Bhidex'):
+        assert without_nan(worker.get_medicine_details(name)) == without_nan(private.get_medicine_details(name))
+    for scorer in ('keyword', 'bm25'):
+        for query in QUERIES:
+            assert all_sources(worker, query, scorer) == all_sources(private, query, scorer)
+    assert worker.suggest_medicine_names('Dibedx') == private.suggest_medicine_names('Dibedx')
+    # ভ্যারিয়েন্ট UI এর কলাম, ফিল্টার ও পেজ সারির টেবিল থেকে আসে
+    assert worker.record_columns() == private.record_columns() and worker.record_columns()[0] == 'Name'
+    assert 'cleaned_text' not in worker.record_columns()
+    dibedex = without_nan(worker.filter_records('Name', 'DIBEDEX'))
+    assert len(dibedex) == 2 and dibedex == without_nan(private.filter_records('Name', 'DIBEDEX'))
+    assert worker.filter_records('missing column', 'x') == []
+    assert worker.record_frame(0, 5).equals(private.record_frame(0, 5))
+    assert len(worker.record_frame()) == len(private.records)
+    assert worker._data is None
+
+    # কেউ DataFrame চাইলে তখনই লোড হয়
+    assert worker.data.equals(private.data)
+
+
+def test_frozen_index_matches_inverted_index():
+    texts = ['napa jor byatha', 'napa extra', 'seclo gastric', 'napa napa syrup', '']
+    index = InvertedIndex(str.split)
+    for row, text in enumerate(texts):
+        index.add_document({'content': text, 'row_index': row, 'source': 'Main Excel'})
+    folder = tempfile.mkdtemp()
+    SharedIndex._write_index(Path(folder), index)
+    frozen = FrozenIndex(folder, lambda row: {'content': texts[row], 'row_index': row})
+
+    assert len(frozen) == len(index) and frozen.total_length == index.total_length
+    for query in (['napa'], ['napa', 'syrup', 'napa'], ['missing'], []):
+        assert frozen.match(query) == index.match(query)
+        for scorer in ('keyword', 'bm25'):
+            assert get_scorer(scorer).rank([frozen], query) == get_scorer(scorer).rank([index], query)
+    assert frozen.doc_terms[3] == index.doc_terms[3] and frozen.documents[1]['content'] == 'napa extra'
+    doc_ids, tfs = frozen.term_arrays('napa')
+    assert doc_ids.tolist() == [0, 1, 3] and tfs.tolist() == [1.0, 1.0, 2.0]
+    assert frozen.document_frequency('gastric') == 1 and frozen.document_frequency('zzz') == 0
+
+
+def test_frozen_names_match_memory():
+    names = ['Dibedex 60 capsules', 'Dibedex 30 capsules', 'Napa Extra', 'নাপা এক্সট্রা', 'Seclo 20', None, 'napa extra']
+    name_index = NameIndex.from_columns([names])
+    fuzzy_index = SymSpellIndex.from_columns([names])
+    folder = Path(tempfile.mkdtemp())
+    SharedIndex._write_names(folder, name_index, fuzzy_index)
+    frozen_names = attach_name_index(folder)
+    frozen_fuzzy = attach_fuzzy_index(folder, fuzzy_index.max_distance, fuzzy_index.prefix_length)
+
+    assert len(frozen_names) == len(name_index) and len(frozen_fuzzy) == len(fuzzy_index)
+    for query in ('napa extra', 'NAPA', 'dibedex', 'capsules', 'নাপা', 'এক্সট্রা', 'seclo 2', 'zzz', ''):
+        assert frozen_names.exact(query) == name_index.exact(query)
+        assert frozen_names.prefix(query) == name_index.prefix(query)
+        assert frozen_names.word_prefix(query) == name_index.word_prefix(query)
+        assert frozen_names.search(query) == name_index.search(query)
+    for query in ('Dibedx', 'dibedex capsuls', 'Napa Extre', 'নাপা এক্সট্র', 'Secol 20', 'qqq'):
+        assert frozen_fuzzy.lookup(query, limit=None) == fuzzy_index.lookup(query, limit=None)
+        assert frozen_fuzzy.best_row(query) == fuzzy_index.best_row(query)
+        assert frozen_fuzzy.suggest(query) == fuzzy_index.suggest(query)
+
+
+def test_uploads_stay_in_their_session():
+    medicine_chatbot.SNAPSHOT_CACHE_DIR = tempfile.mkdtemp()
+    shared_dir = tempfile.mkdtemp()
+    build(shared_dir)
+    engine = build(shared_dir)
+    rows = len(engine.records)
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(['Name', 'Uses'])
+    sheet.append(['Dibedex 90 capsules', 'ডায়াবেটিস'])
+    upload = io.BytesIO()
+    workbook.save(upload)
+    upload.seek(0)
+    upload.name = 'session.xlsx'
+
+    session = MedicineChatbot(REAL_EXCEL, engine=engine)
+    assert session.add_file(upload, "Excel")
+    assert 'Dibedex 90 capsules' in [hit.get('Name') for hit in session.search_medicines('Dibedex')]
+    # শেয়ার্ড ইঞ্জিন বদলায়নি - অন্য সেশন আপলোড দেখে না
+    assert engine.shared_index is not None and len(engine.records) == rows
+    other = MedicineChatbot(REAL_EXCEL, engine=engine)
+    assert 'Dibedex 90 capsules' not in [hit.get('Name') for hit in other.search_medicines('Dibedex')]
+
+def test_other_process_attaches_without_building():
+    medicine_chatbot.SNAPSHOT_CACHE_DIR = tempfile.mkdtemp()
+    shared_dir = tempfile.mkdtemp()
+    engine = build(shared_dir)
+    script = (
+        "import sys, tempfile, pandas as pd, medicine_chatbot as m\n"
+        "pd.read_excel = None\n"
+        "m.SNAPSHOT_CACHE_DIR = tempfile.mkdtemp()\n"
+        "m.SHARED_INDEX_DIR = sys.argv[1]\n"
+        "e = m.MedicineSearchEngine(sys.argv[2], data_source_dir=tempfile.mkdtemp())\n"
+        "print(e.shared_index is not None, e.search_medicines('Dibedex capsules', 1)[0]['Name'])\n"
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', script, shared_dir, REAL_EXCEL],
+        capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__))
+    ).stdout.strip().splitlines()[-1]
+    assert output == f"True {engine.search_medicines('Dibedex capsules', 1)[0]['Name']}"
+
+
+if __name__ == "__main__":
+    test_attach_matches_private_engine()
+    test_frozen_index_matches_inverted_index()
+    test_frozen_names_match_memory()
+    test_uploads_stay_in_their_session()
+    test_other_process_attaches_without_building()
+    print("✅ শেয়ার্ড ইনডেক্স টেস্ট সম্পন্ন!")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - স্পার্স top-k রিট্রিভাল ও ব্যাচ সার্চ
+"""
+
+import numpy as np
+from scipy import sparse
+from sklearn.metrics.pairwise import cosine_similarity
+
+from medicine_chatbot import MedicineChatbot
+from medicine_engine import sparse_top_k, top_k_rows
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+QUERIES = ['ডায়াবেটিস', 'Dibedex capsules', 'হারবাল ঔষধ দুর্বলতা', 'গ্যাস পেটে ব্যথা', 'zzz']
+
+
+def reference_search(chatbot, query, top_k):
+    """আগের cosine_similarity + argsort পদ্ধতি"""
+    query_vector = chatbot.vectorizer.transform([chatbot.clean_text(query)])
+    similarities = cosine_similarity(query_vector, chatbot.tfidf_matrix).flatten()
+    top_indices = similarities.argsort()[-top_k:][::-1]
+    return {int(idx): similarities[idx] for idx in top_indices if similarities[idx] > 0.05}
+
+
+def test_search_matches_cosine_reference():
+    chatbot = MedicineChatbot(REAL_EXCEL)
+    for query in QUERIES:
+        results = chatbot.search_medicines(query, top_k=5)
+        expected = reference_search(chatbot, query, 5)
+        got = sorted(r['similarity_score'] for r in results)
+        assert np.allclose(got, sorted(expected.values()))
+
+
+def test_batch_equals_single_queries():
+    chatbot = MedicineChatbot(REAL_EXCEL)
+    batch = chatbot.search_medicines_batch(QUERIES, top_k=5)
+    assert len(batch) == len(QUERIES)
+    for query, results in zip(QUERIES, batch):
+        single = chatbot.search_medicines(query, top_k=5)
+        assert [r['Name'] for r in results] == [r['Name'] for r in single]
+
+
+def test_results_do_not_share_row_dicts():
+    chatbot = MedicineChatbot(REAL_EXCEL)
+    first = chatbot.search_medicines('Dibedex', top_k=1)[0]
+    first['Name'] = 'changed'
+    assert chatbot.search_medicines('Dibedex', top_k=1)[0]['Name'] != 'changed'
+
+
+def test_top_k_rows_order_and_threshold():
+    row = sparse.csr_matrix(np.array([[0.0, 0.3, 0.9, 0.3, 0.01, 0.5]]))
+    assert top_k_rows(row, 3, threshold=0.05) == [(2, 0.9), (5, 0.5), (1, 0.3)]
+    assert [idx for idx, _ in top_k_rows(row, 10, threshold=0.05)] == [2, 5, 1, 3]
+
+    docs = sparse.identity(4, format='csr')
+    assert sparse_top_k(docs[[1, 3]], docs, 2) == [[(1, 1.0)], [(3, 1.0)]]
+
+
+if __name__ == "__main__":
+    test_search_matches_cosine_reference()
+    test_batch_equals_single_queries()
+    test_results_do_not_share_row_dicts()
+    test_top_k_rows_order_and_threshold()
+    print("✅ স্পার্স রিট্রিভাল টেস্ট সম্পন্ন!")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - টেবিল ফাইলের ফরম্যাট শনাক্তকরণ (একবারেই সঠিক রিডার)
+"""
+
+import io
+import zipfile
+
+import pandas as pd
+
+from medicine_engine import read_table, sniff_table_format
+from medicine_engine import table_format
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+
+
+def ods_bytes():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('mimetype', table_format.ODS_MIMETYPE)
+        archive.writestr('content.xml', '<office:document-content/>')
+    return buffer.getvalue()
+
+
+def test_sniff_formats():
+    with open(REAL_EXCEL, 'rb') as f:
+        assert sniff_table_format(f.read()) == 'xlsx'
+    assert sniff_table_format(REAL_EXCEL) == 'xlsx'
+    assert sniff_table_format(ods_bytes()) == 'ods'
+    assert sniff_table_format(table_format.OLE2_MAGIC + b'\x00' * 512) == 'xls'
+    assert sniff_table_format('নাম,দাম\nনাপা,১০\n'.encode('utf-8-sig')) == 'csv'
+    assert sniff_table_format(b'\x89PNG\r\n\x1a\n\x00\x00') is None
+    assert sniff_table_format(b'') is None
+
+    # সীমায় কেটে যাওয়া বাংলা অক্ষর থাকলেও CSV
+    text = ('ক' * table_format.SNIFF_BYTES).encode('utf-8')
+    assert sniff_table_format(text) == 'csv'
+
+
+def test_file_position_is_kept():
+    buffer = io.BytesIO(b'a,b\n1,2\n')
+    assert sniff_table_format(buffer) == 'csv'
+    assert buffer.tell() == 0
+
+    # ZIP এর ভেতরটা দেখার পরেও আগের অবস্থানেই ফেরে (শুরুতে নয়)
+    with open(REAL_EXCEL, 'rb') as f:
+        assert sniff_table_format(f) == 'xlsx' and f.tell() == 0
+    buffer = io.BytesIO(b'prefix' + ods_bytes())
+    buffer.seek(6)
+    assert sniff_table_format(buffer) == 'ods'
+    assert buffer.tell() == 6
+
+
+def test_misnamed_csv_parsed_once():
+    # medicine_data.xlsx আসলে CSV - কোনো Excel engine চেষ্টা না করেই পড়া হয়
+    calls = []
+    original = pd.read_excel
+    pd.read_excel = lambda *args, **kwargs: calls.append(kwargs) or original(*args, **kwargs)
+    try:
+        df = read_table('medicine_data.xlsx')
+    finally:
+        pd.read_excel = original
+    assert calls == []
+    assert sniff_table_format('medicine_data.xlsx') == 'csv'
+    assert df.columns[0] == 'Medicine Name' and len(df) > 0
+
+
+def test_excel_read_from_buffer():
+    with open(REAL_EXCEL, 'rb') as f:
+        df = read_table(f.read())
+    pd.testing.assert_frame_equal(df, pd.read_excel(REAL_EXCEL))
+
+
+def test_legacy_encoded_csv():
+    # পুরনো Windows এক্সপোর্ট (cp1252) - UTF-8 নয়, তবুও CSV
+    data = 'Name,Price\nCafé Ñapa,10\nAce “Plus”,5\n'.encode('cp1252')
+    assert sniff_table_format(data) == 'csv'
+    df = read_table(data)
+    assert df['Name'].tolist() == ['Café Ñapa', 'Ace “Plus”']
+
+    # শুরুর SNIFF_BYTES UTF-8, পরে cp1252 - ডিকোড ব্যর্থ হলে একই অবস্থান থেকে আবার পড়া হয়
+    rows = ''.join(f'Napa {i},{i}\n' for i in range(table_format.SNIFF_BYTES // 8))
+    buffer = io.BytesIO(b'xx' + ('Name,Price\n' + rows + 'Café,1\n').encode('cp1252'))
+    buffer.seek(2)
+    df = read_table(buffer)
+    assert df['Name'].iloc[-1] == 'Café' and len(df) == table_format.SNIFF_BYTES // 8 + 1
+
+
+def test_unknown_format_raises():
+    try:
+        read_table(b'\x89PNG\r\n\x1a\n\x00\x00')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("ValueError আশা করা হয়েছিল")
+
+
+if __name__ == "__main__":
+    test_sniff_formats()
+    test_file_position_is_kept()
+    test_misnamed_csv_parsed_once()
+    test_excel_read_from_buffer()
+    test_legacy_encoded_csv()
+    test_unknown_format_raises()
+    print("✅ টেবিল ফরম্যাট টেস্ট সম্পন্ন!")
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - শেয়ার্ড memory-mapped টেক্সট স্টোর (প্যাসেজ টেক্সট নয়, offset রাখে)
+"""
+
+import glob
+import io
+import os
+import subprocess
+import sys
+import tempfile
+
+import medicine_chatbot
+from medicine_chatbot import MedicineChatbot
+from medicine_engine import StoredPassage, TextStore, byte_spans, split_passages, store_passages
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+
+TEXT = "নাপা (Paracetamol) জ্বর ও ব্যথায়।\nদিনে ৩ বার খাবারের পরে।\n" * 40
+
+
+def test_put_read_and_dedup():
+    store = TextStore(tempfile.mkdtemp())
+    first = store.put(TEXT)
+    second = store.put("Seclo 20 mg")
+    assert store.put(TEXT) == first and len(store) == 2
+    assert store.read(first) == TEXT and store.read(second) == "Seclo 20 mg"
+    assert os.path.getsize(store.data_path) == len(TEXT.encode('utf-8')) + len("Seclo 20 mg")
+    assert store.read(store.put('')) == ''
+
+
+def test_byte_spans_match_passages():
+    passages = split_passages(TEXT, passage_chars=300, overlap=60)
+    spans = byte_spans(TEXT, [(p['offset'], p['length']) for p in passages])
+    data = TEXT.encode('utf-8')
+    for passage, (offset, length) in zip(passages, spans):
+        assert data[offset:offset + length].decode('utf-8') == passage['text']
+
+
+def test_stored_passages_read_lazily():
+    store = TextStore(tempfile.mkdtemp())
+    passages = split_passages(TEXT, passage_chars=300, overlap=60)
+    file = {'source': 'PDF', 'filename': 'napa.pdf', 'upload_time': '2025-01-01 00:00:00'}
+    sources = store_passages(store, TEXT, passages, file)
+    assert len(store) == 1 and all(isinstance(s, StoredPassage) for s in sources)
+    assert [s['content'] for s in sources] == [p['text'] for p in passages]
+    assert sources[1]['passage_index'] == 1 and sources[1]['filename'] == 'napa.pdf'
+    assert 'sha256' not in sources[0] and sources[0].get('page') is None
+    assert set(dict(sources[0])) == {*file, 'doc_id', 'offset', 'length', 'page', 'passage_index', 'content'}
+
+
+def test_other_process_appends_are_visible():
+    folder = tempfile.mkdtemp()
+    store = TextStore(folder)
+    store.put(TEXT)
+    script = (
+        "import sys; from medicine_engine import TextStore; "
+        "s = TextStore(sys.argv[1]); print(s.put(sys.argv[2]), s.put(sys.argv[3]))"
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', script, folder, 'Brufen ব্যথা', TEXT],
+        capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__))
+    ).stdout.split()
+    # অন্য প্রসেস একই টেক্সটের জন্য নতুন doc_id তৈরি করেনি
+    assert output == ['1', '0']
+    assert store.read(1) == 'Brufen ব্যথা'
+    assert store.put('Brufen ব্যথা') == 1
+
+
+def test_sessions_share_uploaded_text():
+    medicine_chatbot._text_store = TextStore(tempfile.mkdtemp())
+    pdf_path = sorted(glob.glob('data source/*.pdf'))[0]
+    with open(pdf_path, 'rb') as f:
+        data = f.read()
+
+    first, second = MedicineChatbot(REAL_EXCEL), MedicineChatbot(REAL_EXCEL)
+    for chatbot in (first, second):
+        upload = io.BytesIO(data)
+        upload.name = 'kidney.pdf'
+        upload.getvalue = lambda data=data: data
+        assert chatbot.add_file(upload, "PDF")
+
+    store = medicine_chatbot.get_text_store()
+    items = [chatbot.uploaded_files[0] for chatbot in (first, second)]
+    assert all('content' not in item for item in items)
+    assert items[0]['text_id'] == items[1]['text_id'] and len(store) == 1
+
+    passages = [s for s in first.source_index.documents.values() if s['source'] == 'PDF']
+    assert passages and all(isinstance(s, StoredPassage) for s in passages)
+    query = passages[0]['content'].split()[0]
+    assert any(r['source'] == 'PDF' for r in second.search_all_sources(query, return_all=True))
+
+
+if __name__ == "__main__":
+    # pytest ছাড়া চালালে আপলোড আসল 'data source' ফোল্ডারে সেভ হবে না
+    medicine_chatbot.DATA_SOURCE_DIR = tempfile.mkdtemp()
+    test_put_read_and_dedup()
+    test_byte_spans_match_passages()
+    test_stored_passages_read_lazily()
+    test_other_process_appends_are_visible()
+    test_sessions_share_uploaded_text()
+    print("✅ টেক্সট স্টোর টেস্ট সম্পন্ন!")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+টেস্ট স্ক্রিপ্ট - সব চ্যাটবট ভ্যারিয়েন্ট একটি শেয়ার্ড ইঞ্জিন (লোডার, নরমালাইজার, ইনডেক্স, ক্যাশ) ব্যবহার করে
+"""
+
+import io
+import tempfile
+
+import medicine_chatbot
+from medicine_chatbot import MedicineChatbot, get_shared_engine, query_cache
+
+import advanced_ai_chatbot
+import chatgpt_style_medicine_chatbot
+import super_advanced_ai_chatbot
+from advanced_medicine_chatbot import AdvancedMedicineChatbot
+from improved_medicine_chatbot import ImprovedMedicineChatbot
+from medicine_chatbot_advanced import AdvancedMedicineChatbot as CategoryMedicineChatbot
+from professional_medicine_chatbot import ProfessionalMedicineChatbot
+from unified_medicine_chatbot import UnifiedMedicineChatbot
+
+REAL_EXCEL = 'uploads/data_files/20250822_173326_All_Medicine_Name_and_Price_List.xlsx'
+
+VARIANTS = (AdvancedMedicineChatbot, CategoryMedicineChatbot, ImprovedMedicineChatbot,
+            ProfessionalMedicineChatbot, UnifiedMedicineChatbot)
+
+
+def test_variants_share_one_engine():
+    engine = get_shared_engine(REAL_EXCEL)
+    reference = MedicineChatbot(REAL_EXCEL)
+    for variant in VARIANTS:
+        chatbot = variant(REAL_EXCEL)
+        assert chatbot.engine is engine and chatbot.cache is query_cache
+        assert chatbot.search_medicines('Dibedex capsules', top_k=3) == reference.search_medicines('Dibedex capsules', top_k=3)
+        assert chatbot.get_medicine_details('Seclo 20')['Name'] == reference.get_medicine_details('Seclo 20')['Name']
+        assert chatbot.clean_text('Napa, এবং জ্বর!') == engine.clean_text('Napa, এবং জ্বর!')
+
+
+def test_legacy_upload_interface():
+    chatbot = AdvancedMedicineChatbot(REAL_EXCEL)
+    upload = io.BytesIO(open(REAL_EXCEL, 'rb').read())
+    upload.name = 'legacy_upload.xlsx'
+    assert chatbot.add_excel_file(upload)
+    assert [item['filename'] for item in chatbot.excel_data] == ['legacy_upload.xlsx']
+    assert chatbot.pdf_data == [] and chatbot.word_data == [] and chatbot.api_data == []
+    assert 'Uploaded Excel' in {r['source'] for r in chatbot.search_all_sources('Dibedex', return_all=True)}
+
+    chatbot.clear_uploaded_files()
+    assert chatbot.excel_data == []
+    assert {r['source'] for r in chatbot.search_all_sources('Dibedex', return_all=True)} == {'Main Excel'}
+
+
+def test_category_filter():
+    chatbot = CategoryMedicineChatbot(REAL_EXCEL)
+    assert chatbot.get_medicine_categories()[0] == 'Name'
+    assert 'cleaned_text' not in chatbot.get_medicine_categories()
+    assert all('Dibedex' in row['Name'] for row in chatbot.filter_by_category('Name', 'dibedex'))
+    assert chatbot.filter_by_category('missing column', 'x') == []
+
+
+def test_formatting_variants_use_shared_index():
+    engine = get_shared_engine(REAL_EXCEL)
+    for module in (advanced_ai_chatbot, super_advanced_ai_chatbot, chatgpt_style_medicine_chatbot):
+        module.DATA_FILE = REAL_EXCEL
+    ai_chatbot = advanced_ai_chatbot.AdvancedMedicineChatbot()
+    super_chatbot = super_advanced_ai_chatbot.SuperAdvancedMedicineChatbot()
+    assert ai_chatbot.retriever.engine is engine and super_chatbot.retriever.engine is engine
+
+    info = super_chatbot.find_medicine_info('Dibedex capsules')
+    assert info['found'] and info['data'][0]['Name'].startswith('Dibedex')
+    # ফাঁকা দাম NaN নয়, '' (উত্তর সাজানোর সময় সত্যি/মিথ্যা যাচাই হয়)
+    assert info['data'][0]['Discount Price'] == ''
+    assert super_chatbot.search_analytics == {engine.clean_text('Dibedex capsules'): 1}
+    assert ai_chatbot.find_medicine_info('Dibedex capsules')['found']
+    assert not ai_chatbot.find_medicine_info('nothing-matches-this')['found']
+
+    # এই ডেটায় ChatGPT স্টাইলের কলাম নেই, তাই স্যাম্পল ডেটা
+    chatgpt_chatbot = chatgpt_style_medicine_chatbot.ChatGPTStyleMedicineChatbot()
+    assert chatgpt_chatbot.retriever.engine is engine
+    assert chatgpt_chatbot.medicine_data is not None
+    assert chatgpt_chatbot.find_medicine_info('Paracetamol')[0]['Medicine Name'] == 'Paracetamol'
+
+
+if __name__ == "__main__":
+    # pytest ছাড়া চালালে আপলোড আসল 'data source' ফোল্ডারে সেভ হবে না
+    medicine_chatbot.DATA_SOURCE_DIR = tempfile.mkdtemp()
+    test_variants_share_one_engine()
+    test_legacy_upload_interface()
+    test_category_filter()
+    test_formatting_variants_use_shared_index()
+    print("✅ ভ্যারিয়েন্ট শেয়ার্ড ইঞ্জিন টেস্ট সম্পন্ন!")